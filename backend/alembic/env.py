@@ -1,13 +1,17 @@
 """Alembic migration environment configuration."""
 
+import asyncio
 import os
 from logging.config import fileConfig
 
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
 from alembic import context
-from sqlalchemy import create_engine, pool
 
 # Import your models' Base for autogenerate support
-from app.database import Base
+from app.database import Base, tenant_shards, to_async_database_url, to_sync_database_url
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -28,9 +32,6 @@ def get_url() -> str:
     # Priority: environment variable > alembic.ini
     url = os.getenv("DATABASE_URL")
     if url:
-        # Remove async driver prefix for sync migrations
-        if "+aiosqlite" in url:
-            url = url.replace("+aiosqlite", "")
         return url
     return config.get_main_option("sqlalchemy.url", "sqlite:///./plex_dashboard.db")
 
@@ -46,7 +47,8 @@ def run_migrations_offline() -> None:
     Calls to context.execute() here emit the given string to the
     script output.
     """
-    url = get_url()
+    # Offline mode only renders SQL, so no driver is needed
+    url = to_sync_database_url(get_url())
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -58,27 +60,43 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
+def do_run_migrations(connection: Connection) -> None:
+    """Run migrations on a (sync-facing) connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
-    """
-    url = get_url()
+    with context.begin_transaction():
+        context.run_migrations()
 
-    connectable = create_engine(
-        url,
+
+async def run_async_migrations(url: str) -> None:
+    """Run migrations through the app's async driver (aiosqlite / asyncpg)."""
+    connectable = create_async_engine(
+        to_async_database_url(url),
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-        )
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await connectable.dispose()
+
 
-        with context.begin_transaction():
-            context.run_migrations()
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    In this scenario we need to create an Engine
+    and associate a connection with the context. The async engine is used so
+    SQLite and PostgreSQL deployments only need the app's drivers.
+
+    With TENANT_SHARD_DIR set, every tenant shard is migrated as well.
+    """
+    asyncio.run(run_async_migrations(get_url()))
+    if tenant_shards is not None:
+        for path in tenant_shards.paths():
+            asyncio.run(run_async_migrations(f"sqlite:///{path}"))
 
 
 if context.is_offline_mode():
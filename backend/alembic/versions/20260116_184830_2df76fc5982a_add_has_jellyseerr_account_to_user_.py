@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     # Add column with server_default=False to handle existing rows
-    op.add_column('user_nicknames', sa.Column('has_jellyseerr_account', sa.Boolean(), nullable=False, server_default=sa.text('0')))
+    op.add_column('user_nicknames', sa.Column('has_jellyseerr_account', sa.Boolean(), nullable=False, server_default=sa.false()))
     # ### end Alembic commands ###
 
 
@@ -0,0 +1,46 @@
+"""use_jsonb_on_postgresql
+
+Revision ID: c52d7e1f8a90
+Revises: a3f1c9e2b7d4
+Create Date: 2026-10-18 14:02:33.617204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c52d7e1f8a90"
+down_revision: str | None = "a3f1c9e2b7d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column) pairs stored as JSONB on PostgreSQL
+JSONB_COLUMNS = [
+    ("cached_media_items", "raw_data"),
+    ("cached_media_items", "language_check_result"),
+    ("cached_media_items", "problematic_episodes"),
+    ("cached_jellyseerr_requests", "raw_data"),
+]
+
+
+def upgrade() -> None:
+    # SQLite keeps its JSON (text) columns; nothing to do there
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb")
+    # TMDB ID lookups on cached media use JSONB containment (raw_data @> ...)
+    op.execute(
+        "CREATE INDEX ix_cached_media_items_raw_data_gin "
+        "ON cached_media_items USING gin (raw_data jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_cached_media_items_raw_data_gin")
+    for table, column in JSONB_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSON USING {column}::json")
@@ -6,6 +6,7 @@ import logging
 from celery import Celery
 from celery.schedules import crontab
 from celery.signals import worker_process_init
+from kombu import Queue
 
 from app.config import get_settings
 
@@ -16,6 +17,14 @@ settings = get_settings()
 broker_url = settings.celery_broker_url or settings.redis_url
 result_backend = settings.celery_result_backend or settings.redis_url
 
+# Queues: user-triggered syncs never wait behind the nightly fan-out.
+# Run one worker per queue group to size each pool independently, e.g.
+#   celery -A app.celery_app worker -Q interactive,light --concurrency=2
+#   celery -A app.celery_app worker -Q bulk --concurrency=4
+QUEUE_INTERACTIVE = "interactive"  # Syncs started from the dashboard (POST /api/sync)
+QUEUE_BULK = "bulk"  # Scheduled syncs queued by sync_all_users
+QUEUE_LIGHT = "light"  # Short tasks (fan-out planning, diagnostics)
+
 celery_app = Celery(
     "plex-dashboard",
     broker=broker_url,
@@ -28,8 +37,9 @@ celery_app = Celery(
 def init_worker(**kwargs: object) -> None:
     """Initialize database settings when Celery worker starts.
 
-    This ensures SQLite WAL mode and busy_timeout are set for Celery connections,
-    matching the FastAPI backend configuration.
+    This ensures SQLite WAL mode is set before the worker writes, matching the
+    FastAPI backend configuration. Per-connection PRAGMAs (busy_timeout,
+    synchronous, cache) are applied by the engine's connect event.
     """
     from app.database import init_db_settings
 
@@ -38,7 +48,7 @@ def init_worker(**kwargs: object) -> None:
         asyncio.set_event_loop(loop)
         try:
             loop.run_until_complete(init_db_settings())
-            logger.info("Celery worker: SQLite WAL mode and busy_timeout initialized")
+            logger.info("Celery worker: SQLite WAL mode initialized")
         finally:
             loop.close()
     except Exception as e:
@@ -55,6 +65,15 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes max per task
     worker_prefetch_multiplier=1,  # One task at a time per worker
+    task_queues=(Queue(QUEUE_INTERACTIVE), Queue(QUEUE_BULK), Queue(QUEUE_LIGHT)),
+    task_default_queue=QUEUE_BULK,
+    task_routes={
+        # sync_user is routed to QUEUE_INTERACTIVE explicitly by the API
+        "sync_user": {"queue": QUEUE_BULK},
+        "sync_user_group": {"queue": QUEUE_BULK},
+        "sync_all_users": {"queue": QUEUE_LIGHT},
+        "test_task": {"queue": QUEUE_LIGHT},
+    },
     # Celery Beat schedule for periodic tasks
     beat_schedule={
         "sync-all-users-daily": {
@@ -1,25 +1,45 @@
 """Database setup and models using SQLAlchemy."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 from sqlalchemy import (
     JSON,
     BigInteger,
+    BindParameter,
     Boolean,
+    Column,
     DateTime,
+    Engine,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Table,
     Text,
     UniqueConstraint,
     create_engine,
+    event,
+    inspect,
     text,
 )
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, ORMExecuteState, Session, mapped_column
+from sqlalchemy.orm.attributes import instance_state
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, ClauseElement
+from sqlalchemy.sql.util import find_tables
 
 from app.config import get_settings
 
@@ -30,6 +50,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# JSON on SQLite, JSONB on PostgreSQL (binary storage, GIN-indexable)
+JSONType = JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
 class User(Base):
     """User model for authentication."""
 
@@ -105,6 +129,15 @@ class CachedMediaItem(Base):
     """Cached media item from Jellyfin (movies and series)."""
 
     __tablename__ = "cached_media_items"
+    __table_args__ = (
+        # TMDB ID lookups use JSONB containment; PostgreSQL only (SQLite stores JSON as text)
+        Index(
+            "ix_cached_media_items_raw_data_gin",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -123,14 +156,19 @@ class CachedMediaItem(Base):
     largest_season_size_bytes: Mapped[int | None] = mapped_column(
         BigInteger, nullable=True
     )  # For series only
-    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSONType, nullable=True)
     cached_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     # Language check results (populated during sync)
     # Structure: {has_english, has_french, has_french_subs, checked_at, missing_languages}
-    language_check_result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    language_check_result: Mapped[dict[str, Any] | None] = mapped_column(JSONType, nullable=True)
     # List of episodes with language issues (for series only)
     # Structure: [{identifier, name, season, episode, missing_languages}]
-    problematic_episodes: Mapped[list[dict[str, Any]] | None] = mapped_column(JSON, nullable=True)
+    problematic_episodes: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSONType, nullable=True
+    )
+    # Series only: fingerprint the deep-scan columns above were computed for
+    # (see app.services.sync.series_scan_fingerprint)
+    scan_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
 class CachedJellyseerrRequest(Base):
@@ -158,7 +196,7 @@ class CachedJellyseerrRequest(Base):
     release_date: Mapped[str | None] = mapped_column(
         String(50), nullable=True
     )  # Movie releaseDate or TV firstAirDate
-    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    raw_data: Mapped[dict[str, Any] | None] = mapped_column(JSONType, nullable=True)
     cached_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
 
@@ -266,6 +304,28 @@ class EpisodeLanguageExempt(Base):
     expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)  # NULL = permanent
 
 
+class ArrIndexEntry(Base):
+    """Sonarr/Radarr ID index per user, rebuilt during sync (TMDB ID -> *arr ID)."""
+
+    __tablename__ = "arr_index"
+    __table_args__ = (
+        # Unique constraint: one entry per TMDB ID per service per user (also the lookup index)
+        UniqueConstraint("user_id", "service", "tmdb_id", name="uq_arr_index_entry"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+    service: Mapped[str] = mapped_column(String(20), nullable=False)  # "sonarr" or "radarr"
+    tmdb_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    arr_id: Mapped[int] = mapped_column(Integer, nullable=False)  # Sonarr series / Radarr movie ID
+    title_slug: Mapped[str | None] = mapped_column(
+        String(500), nullable=True
+    )  # Sonarr titleSlug for web UI links
+    cached_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class SyncStatus(Base):
     """Track sync status per user."""
 
@@ -293,6 +353,16 @@ class SyncStatus(Base):
     )  # e.g., user 3 of 10
     current_step_total: Mapped[int | None] = mapped_column(Integer, nullable=True)
     current_user_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Cost history used to order the nightly fan-out (see app.services.sync_cost)
+    last_sync_duration_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    last_sync_api_calls: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    expected_sync_seconds: Mapped[float | None] = mapped_column(
+        Float, nullable=True
+    )  # Moving average of successful syncs
+    # Resume point of an interrupted stage (see app.services.sync_checkpoint)
+    checkpoint_stage: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    checkpoint_snapshot: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    checkpoint_position: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
 
 class RefreshToken(Base):
@@ -346,46 +416,346 @@ class PasswordResetToken(Base):
 # Database engine and session
 settings = get_settings()
 
-# Use aiosqlite for async support
+
+def to_async_database_url(url: str) -> str:
+    """Map a plain database URL to its async driver (aiosqlite / asyncpg)."""
+    if url.startswith("sqlite:///"):
+        return url.replace("sqlite:///", "sqlite+aiosqlite:///", 1)
+    for prefix in ("postgres://", "postgresql://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix) :]
+    return url
+
+
+def to_sync_database_url(url: str) -> str:
+    """Map a database URL to a sync driver (for migrations and scripts)."""
+    return to_async_database_url(url).replace("+aiosqlite", "").replace("+asyncpg", "")
+
+
 DATABASE_URL = settings.database_url
-if DATABASE_URL.startswith("sqlite:///"):
-    ASYNC_DATABASE_URL = DATABASE_URL.replace("sqlite:///", "sqlite+aiosqlite:///")
-else:
-    ASYNC_DATABASE_URL = DATABASE_URL
+ASYNC_DATABASE_URL = to_async_database_url(DATABASE_URL)
+IS_SQLITE = ASYNC_DATABASE_URL.startswith("sqlite")
+IS_POSTGRES = ASYNC_DATABASE_URL.startswith("postgresql")
 
 # Configure SQLite for better concurrency
-connect_args = {}
-if ASYNC_DATABASE_URL.startswith("sqlite"):
-    # Enable WAL mode for concurrent read/write access
+connect_args: dict[str, Any] = {}
+if IS_SQLITE:
     # Set timeout to 30 seconds for lock acquisition
     connect_args = {
         "check_same_thread": False,
         "timeout": 30.0,
     }
 
-async_engine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    echo=False,
-    connect_args=connect_args,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Max number of connections in pool
-    max_overflow=20,  # Allow up to 20 additional connections beyond pool_size
+
+def sqlite_connection_pragmas(read_only: bool = False) -> list[str]:
+    """PRAGMAs applied to every new SQLite connection.
+
+    These settings are per connection, so they are set from a connect event
+    rather than once at startup. journal_mode=WAL is persistent in the
+    database file and is set by init_db_settings().
+    """
+    pragmas = [
+        "PRAGMA busy_timeout=30000",
+        # Safe with WAL: a crash can only lose the last transactions, never corrupt
+        "PRAGMA synchronous=NORMAL",
+        # Negative value = size in KiB
+        f"PRAGMA cache_size=-{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size_mb * 1024 * 1024}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def _install_sqlite_pragmas(engine: AsyncEngine, read_only: bool = False) -> None:
+    """Apply sqlite_connection_pragmas() to each connection the engine opens."""
+    pragmas = sqlite_connection_pragmas(read_only)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _engine_options(read_only: bool = False) -> dict[str, Any]:
+    """create_async_engine() options for the configured backend."""
+    options: dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_size": settings.database_pool_size,  # Max number of connections in pool
+        "max_overflow": settings.database_max_overflow,  # Extra connections beyond pool_size
+    }
+    if IS_SQLITE:
+        options["connect_args"] = connect_args
+    elif IS_POSTGRES:
+        # Drop connections before server/proxy idle timeouts close them
+        options["pool_recycle"] = settings.database_pool_recycle_seconds
+        if read_only:
+            options["connect_args"] = {"server_settings": {"default_transaction_read_only": "on"}}
+    return options
+
+
+# Per-tenant cache data. With TENANT_SHARD_DIR set (SQLite only), these tables
+# live in one database file per user, so a large sync rewrite for one user does
+# not hold the write lock of the shared database for everyone else.
+TENANT_TABLES: frozenset[Table] = frozenset(
+    Base.metadata.tables[name]
+    for name in ("cached_media_items", "cached_jellyseerr_requests", "arr_index")
+)
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+
+
+class TenantShards:
+    """One SQLite database file per tenant for the TENANT_TABLES.
+
+    Users, settings, auth and whitelists stay in the shared database. Each
+    shard holds the full schema (only the tenant tables are used) and is
+    stamped with the current Alembic head on creation, so `alembic upgrade
+    head` migrates shards like the shared database (see alembic/env.py).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._engines: dict[tuple[int, bool], AsyncEngine] = {}
+        self._created: set[int] = set()
+
+    def path(self, user_id: int) -> Path:
+        """Database file of a tenant's shard."""
+        return self.directory / f"tenant_{user_id}.db"
+
+    def paths(self) -> list[Path]:
+        """Database files of all existing shards."""
+        return sorted(self.directory.glob("tenant_*.db"))
+
+    def engine(self, user_id: int, read_only: bool = False) -> AsyncEngine:
+        """Engine for a tenant's shard, creating the shard on first use.
+
+        Must run inside SQLAlchemy's async bridge (e.g. from Session.get_bind()),
+        since the shard is created through the engine's sync facade.
+        """
+        if user_id not in self._created:
+            self._create_shard(user_id)
+            self._created.add(user_id)
+        return self._get_engine(user_id, read_only)
+
+    async def dispose(self) -> None:
+        """Close the connection pools of all shard engines."""
+        for engine in self._engines.values():
+            await engine.dispose()
+        self._engines.clear()
+
+    def _get_engine(self, user_id: int, read_only: bool = False) -> AsyncEngine:
+        key = (user_id, read_only)
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = create_async_engine(
+                f"sqlite+aiosqlite:///{self.path(user_id)}", **_engine_options(read_only)
+            )
+            _install_sqlite_pragmas(engine, read_only=read_only)
+            self._engines[key] = engine
+        return engine
+
+    def _create_shard(self, user_id: int) -> None:
+        from alembic.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._get_engine(user_id).sync_engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            Base.metadata.create_all(conn)
+            migration_context = MigrationContext.configure(conn)
+            if migration_context.get_current_revision() is None and ALEMBIC_DIR.is_dir():
+                migration_context.stamp(ScriptDirectory(str(ALEMBIC_DIR)), "head")
+
+
+def _statement_tenant(clause: ClauseElement) -> int | None:
+    """User ID of a `<tenant table>.user_id == value` criterion in a statement."""
+    user_ids: set[Any] = {
+        element.right.effective_value
+        for element in visitors.iterate(clause)
+        if isinstance(element, BinaryExpression)
+        and element.operator is operators.eq
+        and isinstance(element.left, Column)
+        and element.left.key == "user_id"
+        and element.left.table in TENANT_TABLES
+        and isinstance(element.right, BindParameter)
+    }
+    if len(user_ids) > 1:
+        raise RuntimeError("A statement may only read or write one tenant shard")
+    return user_ids.pop() if user_ids else None
+
+
+class TenantRoutingSession(Session):
+    """Session sending statements on the TENANT_TABLES to the tenant's shard.
+
+    Sharding is enabled by a TenantShards in Session.info["tenant_shards"].
+    The shard is picked from the statement's `user_id == value` criterion, or
+    from each object's user_id when flushing. Other statements (bulk inserts,
+    lazy loads) use the tenant set with bind_tenant(), else the only tenant
+    the session has used so far.
+
+    Shards number their rows independently, so loaded objects carry their
+    tenant as identity token: equal primary keys of two tenants never share
+    an identity map entry.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        tenant_id: int | None = None,
+        **kw: Any,
+    ) -> Engine | Connection:
+        shards: TenantShards | None = self.info.get("tenant_shards")
+        if shards is None or not self._uses_tenant_tables(mapper, clause):
+            return super().get_bind(mapper, clause=clause, **kw)
+        user_id = self._resolve_tenant(clause, tenant_id)
+        return shards.engine(user_id, read_only=self.info.get("read_only", False)).sync_engine
+
+    def flush(self, objects: Sequence[Any] | None = None) -> None:
+        if self.info.get("tenant_shards") is None:
+            return super().flush(objects)
+        # Route each flushed object by its user_id. Only set during flushes:
+        # ORM bulk INSERT statements refuse to run with a connection_callable.
+        self.connection_callable = self._connection_for_object
+        try:
+            super().flush(objects)
+        finally:
+            self.connection_callable = None
+
+    def _uses_tenant_tables(self, mapper: Any, clause: Any) -> bool:
+        tables: set[Any] = set()
+        if mapper is not None:
+            tables.add(inspect(mapper).local_table)
+        if clause is not None:
+            tables.update(find_tables(clause, include_crud=True))
+        if not tables & TENANT_TABLES:
+            return False
+        if tables - TENANT_TABLES:
+            raise RuntimeError("A statement cannot mix tenant tables with shared tables")
+        return True
+
+    def _resolve_tenant(self, clause: Any, tenant_id: int | None) -> int:
+        used: set[int] = self.info.setdefault("tenant_ids", set())
+        user_id = _statement_tenant(clause) if clause is not None else None
+        if user_id is None:
+            user_id = tenant_id if tenant_id is not None else self.info.get("tenant_id")
+        if user_id is None and len(used) == 1:
+            user_id = next(iter(used))
+        if user_id is None:
+            raise RuntimeError("No tenant for a statement on tenant tables; use bind_tenant()")
+        used.add(user_id)
+        return user_id
+
+    def _connection_for_object(
+        self, mapper: Any = None, instance: object | None = None, **kw: Any
+    ) -> Connection:
+        tenant_id = None
+        if instance is not None and inspect(mapper).local_table in TENANT_TABLES:
+            state = instance_state(instance)
+            tenant_id = state.key[2] if state.key else getattr(instance, "user_id", None)
+            state.identity_token = tenant_id
+        return self.connection(bind_arguments={"mapper": mapper, "tenant_id": tenant_id})
+
+
+@event.listens_for(TenantRoutingSession, "do_orm_execute")
+def _route_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Pick the shard of ORM statements and tag loaded objects with it."""
+    session = orm_execute_state.session
+    if not isinstance(session, TenantRoutingSession) or session.info.get("tenant_shards") is None:
+        return
+    if not session._uses_tenant_tables(orm_execute_state.bind_mapper, orm_execute_state.statement):
+        return
+
+    # Refreshes and lazy loads target the shard the object was loaded from
+    token: Any = None
+    if orm_execute_state.is_select:
+        token = orm_execute_state.load_options._identity_token
+        if token is None and orm_execute_state.lazy_loaded_from is not None:
+            token = orm_execute_state.lazy_loaded_from.identity_token
+
+    user_id = session._resolve_tenant(orm_execute_state.statement, token)
+    orm_execute_state.bind_arguments["tenant_id"] = user_id
+    if orm_execute_state.is_select:
+        orm_execute_state.update_execution_options(identity_token=user_id)
+
+
+def bind_tenant(db: AsyncSession, user_id: int) -> None:
+    """Route the session's tenant-table statements without user criteria to user_id."""
+    db.info["tenant_id"] = user_id
+
+
+def fork_session(db: AsyncSession) -> AsyncSession:
+    """New session on the same engine and tenant routing as db."""
+    routing_keys = ("tenant_shards", "read_only", "tenant_id")
+    info = {key: db.info[key] for key in routing_keys if key in db.info}
+    return AsyncSession(
+        db.bind,
+        expire_on_commit=False,
+        sync_session_class=db.sync_session_class,
+        info=info,
+    )
+
+
+tenant_shards = (
+    TenantShards(Path(settings.tenant_shard_dir))
+    if IS_SQLITE and settings.tenant_shard_dir
+    else None
+)
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options())
+
+async_session_maker = async_sessionmaker(
+    async_engine,
+    expire_on_commit=False,
+    sync_session_class=TenantRoutingSession,
+    info={"tenant_shards": tenant_shards},
+)
+
+# Read-only engine for GET endpoints: its connections never take the write lock,
+# so dashboard reads don't contend with the sync writer
+read_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(read_only=True))
+
+read_session_maker = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
+    sync_session_class=TenantRoutingSession,
+    info={"tenant_shards": tenant_shards, "read_only": True},
 )
 
-async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
+if IS_SQLITE:
+    _install_sqlite_pragmas(async_engine)
+    _install_sqlite_pragmas(read_engine, read_only=True)
+
+
+@lru_cache
+def get_sync_engine() -> Engine:
+    """Sync engine for scripts (created lazily: PostgreSQL needs psycopg2 here)."""
+    return create_engine(to_sync_database_url(DATABASE_URL), echo=False)
 
-# Sync engine for migrations/seeding
-sync_engine = create_engine(DATABASE_URL.replace("+aiosqlite", ""), echo=False)
+
+def dialect_insert(db: AsyncSession, model: type[Base]) -> postgresql.Insert | sqlite.Insert:
+    """INSERT statement supporting ON CONFLICT clauses on the session's backend."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
 
 
 async def init_db_settings() -> None:
-    """Initialize database settings (e.g., WAL mode for SQLite)."""
-    if ASYNC_DATABASE_URL.startswith("sqlite"):
+    """Initialize database settings (WAL mode for SQLite).
+
+    Per-connection settings (busy_timeout, synchronous, cache...) are applied
+    by a connect event on every pooled connection.
+    """
+    if IS_SQLITE:
         async with async_engine.begin() as conn:
-            # Enable WAL mode for better concurrency
+            # Enable WAL mode for better concurrency (persists in the database file)
             await conn.execute(text("PRAGMA journal_mode=WAL;"))
-            # Set busy timeout to 30 seconds
-            await conn.execute(text("PRAGMA busy_timeout=30000;"))
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -399,6 +769,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for read-only database sessions (GET endpoints).
+
+    Nothing is committed; the transaction is rolled back when the session
+    closes. Writes are rejected by the database itself: SQLite connections run
+    with query_only, PostgreSQL ones with default_transaction_read_only.
+    """
+    async with read_session_maker() as session:
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with async_engine.begin() as conn:
@@ -407,4 +788,4 @@ async def init_db() -> None:
 
 def init_db_sync() -> None:
     """Initialize database tables synchronously (for scripts)."""
-    Base.metadata.create_all(sync_engine)
+    Base.metadata.create_all(get_sync_engine())
@@ -13,7 +13,11 @@ from sqlalchemy import text
 
 from app.config import get_settings
 from app.database import async_session_maker, init_db, init_db_settings
+from app.middleware import CompressionMiddleware
+from app.responses import ORJSONResponse
 from app.routers import auth, content, info, library, settings, sync, whitelist
+from app.services.cpu_pool import shutdown_cpu_executor
+from app.services.host_resilience import host_resilience_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +28,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await init_db_settings()  # Configure WAL mode before creating tables
     await init_db()
     yield
+    shutdown_cpu_executor()
 
 
 app = FastAPI(
@@ -31,6 +36,7 @@ app = FastAPI(
     description="API for managing Plex/Jellyfin media server content",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware for frontend
@@ -46,6 +52,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (e.g. /api/content/issues); small responses pass through
+app.add_middleware(CompressionMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(content.router)
@@ -109,6 +118,9 @@ async def health() -> JSONResponse:
     - Database (executes SELECT 1)
     - Redis (sends PING if configured)
 
+    Also reports the circuit breaker state and concurrency of every integration
+    host this process has called (informational, does not affect the status).
+
     Returns 200 if all dependencies are healthy, 503 otherwise.
     """
     dependencies: dict[str, Any] = {}
@@ -129,6 +141,7 @@ async def health() -> JSONResponse:
     response_data = {
         "status": "healthy" if is_healthy else "unhealthy",
         "dependencies": dependencies,
+        "integration_hosts": host_resilience_snapshot(),
     }
 
     status_code = 200 if is_healthy else 503
@@ -1,8 +1,9 @@
 """Pydantic models for content analysis endpoints."""
 
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class OldUnwatchedItem(BaseModel):
@@ -282,6 +283,52 @@ class DeleteRequestResponse(BaseModel):
     message: str
 
 
+# Bulk deletion models
+
+BULK_DELETE_MAX_ITEMS = 500
+
+
+class BulkDeleteTarget(BaseModel):
+    """One item of a bulk deletion."""
+
+    media_type: Literal["movie", "series"]
+    tmdb_id: int
+
+
+class BulkDeleteRequest(BaseModel):
+    """Request model for deleting many movies/series at once."""
+
+    items: list[BulkDeleteTarget] = Field(min_length=1, max_length=BULK_DELETE_MAX_ITEMS)
+    delete_from_arr: bool = True  # Delete from Radarr/Sonarr
+    delete_from_jellyseerr: bool = True  # Also delete Jellyseerr media if it exists
+
+
+class BulkDeleteItemResult(BaseModel):
+    """Progress and result of one item in a bulk deletion job."""
+
+    media_type: Literal["movie", "series"]
+    tmdb_id: int
+    status: Literal["pending", "done"] = "pending"
+    success: bool | None = None  # None until the item is processed
+    message: str = ""
+    arr_deleted: bool = False
+    jellyseerr_deleted: bool = False
+
+
+class BulkDeleteJobResponse(BaseModel):
+    """Response model for a bulk deletion job."""
+
+    job_id: str
+    status: Literal["pending", "running", "completed"]
+    total: int
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    items: list[BulkDeleteItemResult]
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
 # US-22.1: Library API models
 
 
@@ -0,0 +1,18 @@
+"""Fast JSON response class used as the application default."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    FastAPI validates and serializes the return value through the route's
+    Pydantic response_model first, so this only replaces the final encoding
+    step, which dominates for large payloads like /api/content/issues.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
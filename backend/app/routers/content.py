@@ -3,11 +3,23 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import User, get_db
+from app.database import User, get_db, get_read_db
 from app.models.content import (
+    BulkDeleteJobResponse,
+    BulkDeleteRequest,
     ContentIssueItem,
     ContentIssuesResponse,
     ContentSummaryResponse,
@@ -17,7 +29,20 @@ from app.models.content import (
     OldUnwatchedResponse,
     ServiceUrls,
 )
+from app.services.arr_index import (
+    ARR_SERVICE_RADARR,
+    ARR_SERVICE_SONARR,
+    get_sonarr_slug_map,
+    lookup_arr_id,
+    remove_arr_index_entry,
+)
 from app.services.auth import get_current_user
+from app.services.bulk_delete import (
+    create_bulk_delete_job,
+    get_bulk_delete_job,
+    prepare_bulk_delete,
+    run_bulk_delete_job,
+)
 from app.services.content import (
     get_content_issues,
     get_content_summary,
@@ -28,23 +53,29 @@ from app.services.content_cache import (
     delete_cached_jellyseerr_request_by_id,
     delete_cached_jellyseerr_request_by_tmdb_id,
     delete_cached_media_by_tmdb_id,
-    get_user_settings,
     lookup_jellyseerr_media_by_request_id,
     lookup_jellyseerr_media_by_tmdb,
 )
-from app.services.jellyseerr import (
-    delete_jellyseerr_media,
-    get_decrypted_jellyseerr_api_key,
+from app.services.content_export import (
+    EXPORT_MEDIA_TYPES,
+    ISSUES_EXPORT_FIELDS,
+    encode_export,
+    iter_issue_export_rows,
 )
-from app.services.radarr import (
-    delete_movie_by_tmdb_id,
-    get_decrypted_radarr_api_key,
+from app.services.etag import (
+    compute_etag,
+    etag_matches,
+    not_modified_response,
+    set_etag_headers,
 )
-from app.services.sonarr import (
-    delete_series_by_tmdb_id,
-    get_decrypted_sonarr_api_key,
-    get_sonarr_tmdb_to_slug_map,
+from app.services.jellyseerr import delete_jellyseerr_media
+from app.services.radarr import delete_movie_by_tmdb_id
+from app.services.settings_snapshot import (
+    SettingsSnapshot,
+    get_request_settings_snapshot,
+    get_settings_snapshot,
 )
+from app.services.sonarr import delete_series_by_tmdb_id
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +84,12 @@ router = APIRouter(prefix="/api/content", tags=["content"])
 
 @router.get("/summary", response_model=ContentSummaryResponse)
 async def get_summary(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> ContentSummaryResponse:
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ContentSummaryResponse | Response:
     """Get summary counts for all issue types.
 
     Returns counts for:
@@ -63,14 +97,21 @@ async def get_summary(
     - large_movies: Large movies (>13GB) count and total size
     - language_issues: Content with language issues (placeholder)
     - unavailable_requests: Unavailable Jellyseerr requests (placeholder)
+
+    Supports conditional GET: returns 304 when If-None-Match matches the current ETag.
     """
+    etag = await compute_etag(db, current_user.id, request)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+
     return await get_content_summary(db, current_user.id)
 
 
 @router.get("/old-unwatched", response_model=OldUnwatchedResponse)
 async def get_old_unwatched(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
 ) -> OldUnwatchedResponse:
     """Get list of old/unwatched content for the current user.
 
@@ -86,13 +127,17 @@ async def get_old_unwatched(
 
 @router.get("/issues", response_model=ContentIssuesResponse)
 async def get_issues(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    snapshot: Annotated[SettingsSnapshot, Depends(get_request_settings_snapshot)],
     filter: Annotated[
         str | None,
         Query(description="Filter by issue type: old, large, language, requests"),
     ] = None,
-) -> ContentIssuesResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> ContentIssuesResponse | Response:
     """Get unified list of all content with issues for the current user.
 
     Supports filtering by issue type:
@@ -103,9 +148,17 @@ async def get_issues(
 
     Each item includes a list of all applicable issues.
     Results are sorted by size (largest first) for content, by request date for requests.
+
+    Supports conditional GET: returns 304 when If-None-Match matches the current ETag.
     """
+    # Request items show nickname display names, so nicknames are part of the version
+    etag = await compute_etag(db, current_user.id, request, include_nicknames=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+
     # Get user settings for service URLs
-    settings = await get_user_settings(db, current_user.id)
+    settings = snapshot.settings
     service_urls = ServiceUrls(
         jellyfin_url=settings.jellyfin_server_url if settings else None,
         jellyseerr_url=settings.jellyseerr_server_url if settings else None,
@@ -117,14 +170,10 @@ async def get_issues(
     if filter == "requests":
         request_items = await get_unavailable_requests(db, current_user.id)
 
-        # Build Sonarr TMDB -> titleSlug map for TV show requests
+        # Sonarr TMDB -> titleSlug map for TV show requests, from the arr index
         sonarr_slug_map: dict[int, str] = {}
-        if settings and settings.sonarr_server_url and settings.sonarr_api_key_encrypted:
-            sonarr_api_key = get_decrypted_sonarr_api_key(settings)
-            if sonarr_api_key:
-                sonarr_slug_map = await get_sonarr_tmdb_to_slug_map(
-                    settings.sonarr_server_url, sonarr_api_key
-                )
+        if settings and settings.sonarr_server_url:
+            sonarr_slug_map = await get_sonarr_slug_map(db, current_user.id)
 
         # Convert request items to ContentIssueItem format
         unified_items = []
@@ -163,14 +212,80 @@ async def get_issues(
             service_urls=service_urls,
         )
 
-    response = await get_content_issues(db, current_user.id, filter)
-    response.service_urls = service_urls
-    return response
+    issues_response = await get_content_issues(db, current_user.id, filter)
+    issues_response.service_urls = service_urls
+    return issues_response
 
 
 # US-15.4, US-15.5, US-15.6: Delete content endpoints
 
 
+@router.get("/issues/export", response_class=StreamingResponse)
+async def export_issues(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    format: Annotated[
+        str,
+        Query(description="Export format: ndjson (default) or csv", pattern="^(ndjson|csv)$"),
+    ] = "ndjson",
+    filter: Annotated[
+        str | None,
+        Query(
+            description="Filter by issue type: old, large, language",
+            pattern="^(old|large|language)$",
+        ),
+    ] = None,
+) -> StreamingResponse:
+    """Stream all content items with issues as NDJSON or CSV.
+
+    Rows are read with a server-side cursor and streamed in chunks, so memory use
+    does not grow with library size. Sorted by size (largest first).
+    Unavailable requests are not included (use /issues?filter=requests).
+    """
+    rows = iter_issue_export_rows(db, current_user.id, filter)
+    return StreamingResponse(
+        encode_export(rows, format, ISSUES_EXPORT_FIELDS),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="issues.{format}"'},
+    )
+
+
+@router.post("/bulk-delete", response_model=BulkDeleteJobResponse, status_code=202)
+async def start_bulk_delete(
+    bulk_request: BulkDeleteRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> BulkDeleteJobResponse:
+    """Delete many movies/series from Radarr/Sonarr (and Jellyseerr) as a background job.
+
+    *arr and Jellyseerr calls run concurrently (capped per host) and cache rows
+    are removed in batched statements. Poll GET /bulk-delete/{job_id} for
+    per-item progress and results.
+    """
+    snapshot = await get_settings_snapshot(db, current_user.id)
+    try:
+        plan = await prepare_bulk_delete(db, current_user.id, snapshot, bulk_request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    job = create_bulk_delete_job(current_user.id, bulk_request)
+    background_tasks.add_task(run_bulk_delete_job, job.job_id, plan)
+    return job
+
+
+@router.get("/bulk-delete/{job_id}", response_model=BulkDeleteJobResponse)
+async def get_bulk_delete_status(
+    job_id: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> BulkDeleteJobResponse:
+    """Get progress and per-item results of a bulk deletion job."""
+    job = get_bulk_delete_job(current_user.id, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Bulk delete job not found")
+    return job
+
+
 @router.delete("/movie/{tmdb_id}", response_model=DeleteContentResponse)
 async def delete_movie(
     tmdb_id: int,
@@ -182,7 +297,8 @@ async def delete_movie(
 
     Optionally also deletes the associated Jellyseerr request.
     """
-    settings = await get_user_settings(db, current_user.id)
+    snapshot = await get_settings_snapshot(db, current_user.id)
+    settings = snapshot.settings
 
     if not settings or not settings.radarr_server_url or not settings.radarr_api_key_encrypted:
         raise HTTPException(
@@ -190,7 +306,7 @@ async def delete_movie(
             detail="Radarr is not configured. Please configure Radarr in Settings.",
         )
 
-    radarr_api_key = get_decrypted_radarr_api_key(settings)
+    radarr_api_key = snapshot.api_key("radarr")
     if not radarr_api_key:
         raise HTTPException(status_code=400, detail="Radarr API key not configured")
 
@@ -200,8 +316,10 @@ async def delete_movie(
     delete_from_arr = delete_request.delete_from_arr if delete_request else True
 
     if delete_from_arr:
+        # Radarr movie ID from the arr index (falls back to a lookup for items added since sync)
+        radarr_id = await lookup_arr_id(db, current_user.id, ARR_SERVICE_RADARR, tmdb_id)
         success, message = await delete_movie_by_tmdb_id(
-            settings.radarr_server_url, radarr_api_key, tmdb_id
+            settings.radarr_server_url, radarr_api_key, tmdb_id, radarr_id=radarr_id
         )
         arr_deleted = success
         arr_message = message
@@ -222,7 +340,7 @@ async def delete_movie(
 
         if jellyseerr_media_id:
             if settings.jellyseerr_server_url and settings.jellyseerr_api_key_encrypted:
-                jellyseerr_api_key = get_decrypted_jellyseerr_api_key(settings)
+                jellyseerr_api_key = snapshot.api_key("jellyseerr")
                 if jellyseerr_api_key:
                     success, message = await delete_jellyseerr_media(
                         settings.jellyseerr_server_url, jellyseerr_api_key, jellyseerr_media_id
@@ -237,6 +355,7 @@ async def delete_movie(
     if arr_deleted:
         await delete_cached_media_by_tmdb_id(db, current_user.id, tmdb_id)
         await delete_cached_jellyseerr_request_by_tmdb_id(db, current_user.id, tmdb_id, "movie")
+        await remove_arr_index_entry(db, current_user.id, ARR_SERVICE_RADARR, tmdb_id)
 
     # Compose response message
     messages = []
@@ -273,7 +392,8 @@ async def delete_series(
 
     Optionally also deletes the associated Jellyseerr request.
     """
-    settings = await get_user_settings(db, current_user.id)
+    snapshot = await get_settings_snapshot(db, current_user.id)
+    settings = snapshot.settings
 
     if not settings or not settings.sonarr_server_url or not settings.sonarr_api_key_encrypted:
         raise HTTPException(
@@ -281,7 +401,7 @@ async def delete_series(
             detail="Sonarr is not configured. Please configure Sonarr in Settings.",
         )
 
-    sonarr_api_key = get_decrypted_sonarr_api_key(settings)
+    sonarr_api_key = snapshot.api_key("sonarr")
     if not sonarr_api_key:
         raise HTTPException(status_code=400, detail="Sonarr API key not configured")
 
@@ -291,8 +411,10 @@ async def delete_series(
     delete_from_arr = delete_request.delete_from_arr if delete_request else True
 
     if delete_from_arr:
+        # Sonarr series ID from the arr index (falls back to a lookup for items added since sync)
+        sonarr_id = await lookup_arr_id(db, current_user.id, ARR_SERVICE_SONARR, tmdb_id)
         success, message = await delete_series_by_tmdb_id(
-            settings.sonarr_server_url, sonarr_api_key, tmdb_id
+            settings.sonarr_server_url, sonarr_api_key, tmdb_id, sonarr_id=sonarr_id
         )
         arr_deleted = success
         arr_message = message
@@ -313,7 +435,7 @@ async def delete_series(
 
         if jellyseerr_media_id:
             if settings.jellyseerr_server_url and settings.jellyseerr_api_key_encrypted:
-                jellyseerr_api_key = get_decrypted_jellyseerr_api_key(settings)
+                jellyseerr_api_key = snapshot.api_key("jellyseerr")
                 if jellyseerr_api_key:
                     success, message = await delete_jellyseerr_media(
                         settings.jellyseerr_server_url, jellyseerr_api_key, jellyseerr_media_id
@@ -328,6 +450,7 @@ async def delete_series(
     if arr_deleted:
         await delete_cached_media_by_tmdb_id(db, current_user.id, tmdb_id)
         await delete_cached_jellyseerr_request_by_tmdb_id(db, current_user.id, tmdb_id, "tv")
+        await remove_arr_index_entry(db, current_user.id, ARR_SERVICE_SONARR, tmdb_id)
 
     # Compose response message
     messages = []
@@ -365,7 +488,8 @@ async def delete_request_endpoint(
     the media entry (not the request), which properly removes the item
     from Jellyseerr's tracking.
     """
-    settings = await get_user_settings(db, current_user.id)
+    snapshot = await get_settings_snapshot(db, current_user.id)
+    settings = snapshot.settings
 
     if (
         not settings
@@ -377,7 +501,7 @@ async def delete_request_endpoint(
             detail="Jellyseerr is not configured. Please configure Jellyseerr in Settings.",
         )
 
-    jellyseerr_api_key = get_decrypted_jellyseerr_api_key(settings)
+    jellyseerr_api_key = snapshot.api_key("jellyseerr")
     if not jellyseerr_api_key:
         raise HTTPException(status_code=400, detail="Jellyseerr API key not configured")
 
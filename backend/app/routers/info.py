@@ -2,10 +2,10 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import User, get_db
+from app.database import User, get_read_db
 from app.models.content import (
     RecentlyAvailableResponse,
 )
@@ -13,17 +13,32 @@ from app.services.auth import get_current_user
 from app.services.content import (
     get_recently_available,
 )
+from app.services.etag import (
+    compute_etag,
+    etag_matches,
+    not_modified_response,
+    set_etag_headers,
+)
 
 router = APIRouter(prefix="/api/info", tags=["info"])
 
 
 @router.get("/recent", response_model=RecentlyAvailableResponse)
 async def get_recent(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> RecentlyAvailableResponse:
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> RecentlyAvailableResponse | Response:
     """Get content that became available in the past 7 days.
 
     Returns items sorted by date, newest first.
+    Supports conditional GET: returns 304 when If-None-Match matches the current ETag.
     """
+    etag = await compute_etag(db, current_user.id, request, include_nicknames=True)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+
     return await get_recently_available(db, current_user.id)
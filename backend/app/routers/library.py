@@ -2,28 +2,37 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import User, UserSettings, get_db
+from app.database import User, get_read_db
 from app.models.content import LibraryResponse, ServiceUrls
 from app.services.auth import get_current_user
 from app.services.content import get_library
+from app.services.content_export import (
+    EXPORT_MEDIA_TYPES,
+    LIBRARY_EXPORT_FIELDS,
+    encode_export,
+    iter_library_export_rows,
+)
+from app.services.etag import (
+    compute_etag,
+    etag_matches,
+    not_modified_response,
+    set_etag_headers,
+)
+from app.services.settings_snapshot import get_settings_snapshot
 
 router = APIRouter(prefix="/api/library", tags=["library"])
 
 
-async def _get_user_settings(db: AsyncSession, user_id: int) -> UserSettings | None:
-    """Get user settings from database."""
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    return result.scalar_one_or_none()
-
-
 @router.get("", response_model=LibraryResponse)
 async def get_library_endpoint(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     type: Annotated[
         str | None,
         Query(description="Filter by type: movie, series, or all (default)"),
@@ -68,7 +77,8 @@ async def get_library_endpoint(
         int,
         Query(description="Items per page (1-100), default 50", ge=1, le=100),
     ] = 50,
-) -> LibraryResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> LibraryResponse | Response:
     """Get cached media items for the current user with pagination.
 
     Supports filtering by:
@@ -88,9 +98,16 @@ async def get_library_endpoint(
 
     Returns paginated items, total_count (all matching), total_size (all matching),
     pagination info, and service URLs.
+
+    Supports conditional GET: returns 304 when If-None-Match matches the current ETag.
     """
+    etag = await compute_etag(db, current_user.id, request)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+    set_etag_headers(response, etag)
+
     # Get library items with filters, sorting, and pagination
-    response = await get_library(
+    library_response = await get_library(
         db=db,
         user_id=current_user.id,
         media_type=type,
@@ -106,13 +123,84 @@ async def get_library_endpoint(
         page_size=page_size,
     )
 
-    # Add service URLs from user settings
-    settings = await _get_user_settings(db, current_user.id)
-    response.service_urls = ServiceUrls(
+    # Add service URLs from user settings (snapshot already loaded by get_library)
+    settings = (await get_settings_snapshot(db, current_user.id)).settings
+    library_response.service_urls = ServiceUrls(
         jellyfin_url=settings.jellyfin_server_url if settings else None,
         jellyseerr_url=settings.jellyseerr_server_url if settings else None,
         radarr_url=settings.radarr_server_url if settings else None,
         sonarr_url=settings.sonarr_server_url if settings else None,
     )
 
-    return response
+    return library_response
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_library(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    format: Annotated[
+        str,
+        Query(description="Export format: ndjson (default) or csv", pattern="^(ndjson|csv)$"),
+    ] = "ndjson",
+    type: Annotated[
+        str | None,
+        Query(description="Filter by type: movie, series, or all (default)"),
+    ] = None,
+    search: Annotated[
+        str | None,
+        Query(description="Search by name (case-insensitive)"),
+    ] = None,
+    watched: Annotated[
+        str | None,
+        Query(description="Filter by watched status: true, false, or all (default)"),
+    ] = None,
+    sort: Annotated[
+        str,
+        Query(description="Sort by: name (default), year, size, date_added, last_watched"),
+    ] = "name",
+    order: Annotated[
+        str,
+        Query(description="Sort order: asc (default), desc"),
+    ] = "asc",
+    min_year: Annotated[
+        int | None,
+        Query(description="Minimum production year filter"),
+    ] = None,
+    max_year: Annotated[
+        int | None,
+        Query(description="Maximum production year filter"),
+    ] = None,
+    min_size_gb: Annotated[
+        float | None,
+        Query(description="Minimum size in GB filter"),
+    ] = None,
+    max_size_gb: Annotated[
+        float | None,
+        Query(description="Maximum size in GB filter"),
+    ] = None,
+) -> StreamingResponse:
+    """Stream the whole filtered library as NDJSON or CSV (no pagination).
+
+    Accepts the same filters and sorting as GET /api/library. Rows are read with a
+    server-side cursor and streamed in chunks, so memory use does not grow with
+    library size.
+    """
+    rows = iter_library_export_rows(
+        db=db,
+        user_id=current_user.id,
+        media_type=type,
+        search=search,
+        watched=watched,
+        sort=sort,
+        order=order,
+        min_year=min_year,
+        max_year=max_year,
+        min_size_gb=min_size_gb,
+        max_size_gb=max_size_gb,
+    )
+    return StreamingResponse(
+        encode_export(rows, format, LIBRARY_EXPORT_FIELDS),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="library.{format}"'},
+    )
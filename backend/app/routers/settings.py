@@ -60,8 +60,8 @@ from app.services.sonarr import (
     validate_sonarr_connection,
 )
 from app.services.sync import (
-    fetch_jellyfin_users,
-    fetch_jellyseerr_users,
+    get_cached_jellyfin_users,
+    get_cached_jellyseerr_users,
     prefill_user_nicknames,
 )
 from app.services.ultra import (
@@ -702,7 +702,7 @@ async def refresh_nicknames_from_jellyfin(
 
     try:
         # Fetch Jellyfin users
-        jellyfin_users = await fetch_jellyfin_users(
+        jellyfin_users = await get_cached_jellyfin_users(
             settings.jellyfin_server_url,
             jellyfin_api_key,
         )
@@ -716,7 +716,7 @@ async def refresh_nicknames_from_jellyfin(
     jellyseerr_users: list[dict[str, Any]] = []
     if settings.jellyseerr_server_url and settings.jellyseerr_api_key_encrypted:
         jellyseerr_api_key = decrypt_value(settings.jellyseerr_api_key_encrypted)
-        jellyseerr_users = await fetch_jellyseerr_users(
+        jellyseerr_users = await get_cached_jellyseerr_users(
             settings.jellyseerr_server_url,
             jellyseerr_api_key,
         )
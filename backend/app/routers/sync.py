@@ -1,31 +1,41 @@
 """Sync router for data sync endpoints."""
 
+import logging
+import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import User, get_db
+from app.celery_app import QUEUE_INTERACTIVE
+from app.database import SyncStatus, User, get_db
 from app.services.auth import get_current_user
 from app.services.jellyfin import get_user_jellyfin_settings
 from app.services.sync import get_sync_status, update_sync_status
+from app.services.sync_events import (
+    EVENT_COMPLETED,
+    EVENT_STATUS,
+    SyncEventSubscription,
+    format_sse,
+)
+from app.services.sync_lock import get_sync_lock_holder
+from app.services.sync_progress import get_sync_progress
 from app.tasks import sync_user
 
+logger = logging.getLogger(__name__)
+
 # Rate limit: max 1 sync per 5 minutes per user
 SYNC_RATE_LIMIT_MINUTES = 5
 
-router = APIRouter(prefix="/api/sync", tags=["sync"])
-
+# SSE: keep-alive comment interval, and max stream lifetime (Celery task time limit)
+SSE_HEARTBEAT_SECONDS = 15
+SSE_MAX_STREAM_SECONDS = 30 * 60
 
-class SyncResponse(BaseModel):
-    """Response model for sync operation."""
-
-    status: str
-    media_items_synced: int
-    requests_synced: int
-    error: str | None = None
+router = APIRouter(prefix="/api/sync", tags=["sync"])
 
 
 class SyncProgressInfo(BaseModel):
@@ -35,7 +45,18 @@ class SyncProgressInfo(BaseModel):
     total_steps: int | None = None  # 1 or 2 (Jellyfin only, or Jellyfin + Jellyseerr)
     current_step_progress: int | None = None  # e.g., user 3 of 10
     current_step_total: int | None = None  # e.g., 10 total users
-    current_user_name: str | None = None  # e.g., "John"
+    current_user_name: str | None = None  # Last user whose library was fetched, e.g. "John"
+    eta_seconds: int | None = None  # Estimated time left in current step (live events only)
+
+
+class SyncResponse(BaseModel):
+    """Response model for sync operation."""
+
+    status: str  # "sync_started" or "already_syncing"
+    media_items_synced: int
+    requests_synced: int
+    error: str | None = None
+    progress: SyncProgressInfo | None = None  # Running sync's progress when already_syncing
 
 
 class SyncStatusResponse(BaseModel):
@@ -70,7 +91,18 @@ async def trigger_sync(
 
     Rate limited to 1 sync per 5 minutes per user.
     First sync (when user has never synced) bypasses rate limit when force=True.
+    If a sync of the user is already running, no new one is queued and the
+    running sync's progress is returned instead.
     """
+    if await get_sync_lock_holder(current_user.id):
+        live_progress = await get_sync_progress(current_user.id)
+        return SyncResponse(
+            status="already_syncing",
+            media_items_synced=0,
+            requests_synced=0,
+            progress=_build_progress_info(live_progress),
+        )
+
     # Check rate limit (bypass if force=True and user has never synced)
     sync_status = await get_sync_status(db, current_user.id)
     is_first_sync = sync_status is None or sync_status.last_sync_completed is None
@@ -98,8 +130,9 @@ async def trigger_sync(
     # Mark sync as started (for rate limiting and status tracking)
     await update_sync_status(db, current_user.id, status="syncing", started=True)
 
-    # Dispatch sync to Celery worker (async, returns immediately)
-    sync_user.delay(current_user.id)
+    # Dispatch sync to Celery worker (async, returns immediately) on the
+    # interactive queue so it doesn't wait behind scheduled syncs
+    sync_user.apply_async((current_user.id,), queue=QUEUE_INTERACTIVE)
 
     return SyncResponse(
         status="sync_started",
@@ -118,27 +151,62 @@ async def get_user_sync_status(
 
     Returns progress info when a sync is in progress, allowing
     the frontend to poll for updates and display progress.
+    Live progress is read from the Redis progress store first, falling back
+    to the SyncStatus columns when Redis is unavailable.
     """
+    live_progress = await get_sync_progress(current_user.id)
     sync_status = await get_sync_status(db, current_user.id)
+    return _build_sync_status_response(sync_status, live_progress)
+
+
+def _build_progress_info(live_progress: dict[str, Any] | None) -> SyncProgressInfo | None:
+    """Build progress info from live progress fields, if a step is running."""
+    if not live_progress or live_progress.get("current_step") is None:
+        return None
+    return SyncProgressInfo(
+        current_step=live_progress["current_step"],
+        total_steps=live_progress["total_steps"],
+        current_step_progress=live_progress["current_step_progress"],
+        current_step_total=live_progress["current_step_total"],
+        current_user_name=live_progress["current_user_name"],
+    )
 
+
+def _build_sync_status_response(
+    sync_status: SyncStatus | None,
+    live_progress: dict[str, Any] | None = None,
+) -> SyncStatusResponse:
+    """Build the sync status response from the SyncStatus row and live progress."""
     if not sync_status:
         return SyncStatusResponse(
             last_synced=None,
             status=None,
         )
 
+    # Live progress (Redis) takes precedence over the persisted columns
+    if live_progress and live_progress.get("current_step") is not None:
+        progress_fields = live_progress
+    else:
+        progress_fields = {
+            "current_step": sync_status.current_step,
+            "total_steps": sync_status.total_steps,
+            "current_step_progress": sync_status.current_step_progress,
+            "current_step_total": sync_status.current_step_total,
+            "current_user_name": sync_status.current_user_name,
+        }
+
     # Check if sync is currently in progress
-    is_syncing = sync_status.current_step is not None
+    is_syncing = progress_fields["current_step"] is not None
 
     # Build progress info if syncing
     progress = None
     if is_syncing:
         progress = SyncProgressInfo(
-            current_step=sync_status.current_step,
-            total_steps=sync_status.total_steps,
-            current_step_progress=sync_status.current_step_progress,
-            current_step_total=sync_status.current_step_total,
-            current_user_name=sync_status.current_user_name,
+            current_step=progress_fields["current_step"],
+            total_steps=progress_fields["total_steps"],
+            current_step_progress=progress_fields["current_step_progress"],
+            current_step_total=progress_fields["current_step_total"],
+            current_user_name=progress_fields["current_user_name"],
         )
 
     return SyncStatusResponse(
@@ -152,3 +220,64 @@ async def get_user_sync_status(
         error=sync_status.last_sync_error,
         progress=progress,
     )
+
+
+async def _stream_sync_events(
+    subscription: SyncEventSubscription,
+    snapshot: dict[str, Any],
+) -> AsyncIterator[bytes]:
+    """Relay a user's sync events as SSE until the sync completes."""
+    deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+    try:
+        yield format_sse(snapshot)
+        while time.monotonic() < deadline:
+            event = await subscription.get_event(timeout=SSE_HEARTBEAT_SECONDS)
+            if event is None:
+                # SSE comment line keeps proxies from closing an idle connection
+                yield b": keepalive\n\n"
+                continue
+            yield format_sse(event)
+            if event.get("type") == EVENT_COMPLETED:
+                break
+    finally:
+        await subscription.close()
+
+
+@router.get("/events")
+async def stream_sync_events(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> StreamingResponse:
+    """Stream live sync progress for the current user as Server-Sent Events.
+
+    Sends a "status" snapshot first (same shape as GET /status), then a
+    "progress" event for each step/progress change published by the sync worker
+    (including an ETA for the current step), and a final "completed" event after
+    which the stream closes.
+
+    Returns 503 when live events are unavailable (Redis down); clients should
+    fall back to polling GET /status.
+    """
+    subscription = SyncEventSubscription(current_user.id)
+    try:
+        # Subscribe before reading the snapshot so no event is missed in between
+        await subscription.subscribe()
+    except Exception as e:
+        await subscription.close()
+        logger.warning(f"Live sync events unavailable: {e}")
+        raise HTTPException(status_code=503, detail="Live sync events unavailable") from e
+
+    live_progress = await get_sync_progress(current_user.id)
+    sync_status = await get_sync_status(db, current_user.id)
+    snapshot = {
+        "type": EVENT_STATUS,
+        **_build_sync_status_response(sync_status, live_progress).model_dump(),
+    }
+    # End the read transaction so the stream does not hold a pooled connection
+    await db.commit()
+
+    return StreamingResponse(
+        _stream_sync_events(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
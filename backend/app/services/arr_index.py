@@ -0,0 +1,208 @@
+"""Persisted Sonarr/Radarr ID index.
+
+The sync downloads the Sonarr series list and the Radarr movie list once and
+stores TMDB ID -> *arr ID (plus Sonarr's titleSlug for web UI links) per user.
+Library/issues pages and delete endpoints then use indexed lookups instead of
+calling Sonarr/Radarr on every request.
+"""
+
+import logging
+from collections.abc import Collection
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import ArrIndexEntry, UserSettings, bind_tenant, dialect_insert
+from app.services.radarr import get_decrypted_radarr_api_key, get_radarr_movie_index
+from app.services.sonarr import get_decrypted_sonarr_api_key, get_sonarr_series_index
+
+logger = logging.getLogger(__name__)
+
+ARR_SERVICE_SONARR = "sonarr"
+ARR_SERVICE_RADARR = "radarr"
+
+
+async def _replace_service_index(
+    db: AsyncSession,
+    user_id: int,
+    service: str,
+    entries: dict[int, tuple[int, str | None]],
+) -> int:
+    """Replace a user's index entries for one service (caller commits).
+
+    Entries are upserted (INSERT ... ON CONFLICT DO UPDATE) with a common
+    cached_at, then entries not part of this refresh are deleted. Unchanged
+    keys are updated in place instead of being deleted and re-inserted.
+    """
+    bind_tenant(db, user_id)
+    refreshed_at = datetime.now(UTC).replace(tzinfo=None)
+    if entries:
+        stmt = dialect_insert(db, ArrIndexEntry)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "service", "tmdb_id"],
+            set_={
+                "arr_id": stmt.excluded.arr_id,
+                "title_slug": stmt.excluded.title_slug,
+                "cached_at": stmt.excluded.cached_at,
+            },
+        )
+        await db.execute(
+            stmt,
+            [
+                {
+                    "user_id": user_id,
+                    "service": service,
+                    "tmdb_id": tmdb_id,
+                    "arr_id": arr_id,
+                    "title_slug": title_slug,
+                    "cached_at": refreshed_at,
+                }
+                for tmdb_id, (arr_id, title_slug) in entries.items()
+            ],
+        )
+    await db.execute(
+        delete(ArrIndexEntry).where(
+            ArrIndexEntry.user_id == user_id,
+            ArrIndexEntry.service == service,
+            ArrIndexEntry.cached_at != refreshed_at,
+        )
+    )
+    return len(entries)
+
+
+async def refresh_arr_index(
+    db: AsyncSession, user_id: int, settings: UserSettings
+) -> dict[str, int]:
+    """Rebuild a user's Sonarr/Radarr index from the *arr APIs.
+
+    A service whose API call fails keeps its previous index; a service that is
+    no longer configured has its index cleared.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        settings: User settings with the *arr credentials
+
+    Returns:
+        Number of entries stored per refreshed service
+    """
+    counts: dict[str, int] = {}
+
+    # Not configured -> empty index (clears stale entries); fetch failed -> None
+    sonarr_index: dict[int, tuple[int, str | None]] | None = {}
+    if settings.sonarr_server_url and settings.sonarr_api_key_encrypted:
+        sonarr_index = None
+        sonarr_api_key = get_decrypted_sonarr_api_key(settings)
+        if sonarr_api_key:
+            sonarr_index = await get_sonarr_series_index(settings.sonarr_server_url, sonarr_api_key)
+    if sonarr_index is not None:
+        counts[ARR_SERVICE_SONARR] = await _replace_service_index(
+            db, user_id, ARR_SERVICE_SONARR, sonarr_index
+        )
+    else:
+        logger.warning(f"Could not fetch Sonarr series for user {user_id}, keeping previous index")
+
+    radarr_index: dict[int, tuple[int, str | None]] | None = {}
+    if settings.radarr_server_url and settings.radarr_api_key_encrypted:
+        radarr_index = None
+        radarr_api_key = get_decrypted_radarr_api_key(settings)
+        if radarr_api_key:
+            movie_ids = await get_radarr_movie_index(settings.radarr_server_url, radarr_api_key)
+            if movie_ids is not None:
+                radarr_index = {
+                    tmdb_id: (movie_id, None) for tmdb_id, movie_id in movie_ids.items()
+                }
+    if radarr_index is not None:
+        counts[ARR_SERVICE_RADARR] = await _replace_service_index(
+            db, user_id, ARR_SERVICE_RADARR, radarr_index
+        )
+    else:
+        logger.warning(f"Could not fetch Radarr movies for user {user_id}, keeping previous index")
+
+    await db.commit()
+    return counts
+
+
+async def get_sonarr_slug_map(db: AsyncSession, user_id: int) -> dict[int, str]:
+    """Get the TMDB ID -> Sonarr titleSlug map from the index.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Dict mapping tmdb_id -> titleSlug (series without a slug are omitted)
+    """
+    result = await db.execute(
+        select(ArrIndexEntry.tmdb_id, ArrIndexEntry.title_slug).where(
+            ArrIndexEntry.user_id == user_id,
+            ArrIndexEntry.service == ARR_SERVICE_SONARR,
+            ArrIndexEntry.title_slug.is_not(None),
+        )
+    )
+    return {tmdb_id: title_slug for tmdb_id, title_slug in result.all()}
+
+
+async def lookup_arr_id(db: AsyncSession, user_id: int, service: str, tmdb_id: int) -> int | None:
+    """Look up a Sonarr series ID or Radarr movie ID by TMDB ID.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        service: "sonarr" or "radarr"
+        tmdb_id: TMDB ID to search for
+
+    Returns:
+        The *arr ID if indexed, None otherwise
+    """
+    result = await db.execute(
+        select(ArrIndexEntry.arr_id).where(
+            ArrIndexEntry.user_id == user_id,
+            ArrIndexEntry.service == service,
+            ArrIndexEntry.tmdb_id == tmdb_id,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def lookup_arr_ids(
+    db: AsyncSession, user_id: int, service: str, tmdb_ids: Collection[int]
+) -> dict[int, int]:
+    """Look up many Sonarr series IDs or Radarr movie IDs in one query.
+
+    Returns:
+        Dict mapping tmdb_id -> *arr ID for the indexed TMDB IDs
+    """
+    if not tmdb_ids:
+        return {}
+    result = await db.execute(
+        select(ArrIndexEntry.tmdb_id, ArrIndexEntry.arr_id).where(
+            ArrIndexEntry.user_id == user_id,
+            ArrIndexEntry.service == service,
+            ArrIndexEntry.tmdb_id.in_(tmdb_ids),
+        )
+    )
+    return {tmdb_id: arr_id for tmdb_id, arr_id in result.all()}
+
+
+async def remove_arr_index_entry(
+    db: AsyncSession, user_id: int, service: str, tmdb_id: int
+) -> None:
+    """Remove an index entry after the item was deleted from Sonarr/Radarr."""
+    await remove_arr_index_entries(db, user_id, service, [tmdb_id])
+
+
+async def remove_arr_index_entries(
+    db: AsyncSession, user_id: int, service: str, tmdb_ids: Collection[int]
+) -> None:
+    """Remove index entries for items deleted from Sonarr/Radarr (caller commits)."""
+    if not tmdb_ids:
+        return
+    await db.execute(
+        delete(ArrIndexEntry).where(
+            ArrIndexEntry.user_id == user_id,
+            ArrIndexEntry.service == service,
+            ArrIndexEntry.tmdb_id.in_(tmdb_ids),
+        )
+    )
@@ -0,0 +1,281 @@
+"""Bulk deletion of movies/series with concurrent *arr/Jellyseerr calls.
+
+A bulk deletion is prepared inside the request (settings, credentials and all
+ID lookups are resolved with a few batched queries), then executed as a job:
+Radarr/Sonarr/Jellyseerr calls run concurrently, capped per host, and cache
+rows of deleted items are removed with one statement per table at the end.
+
+Jobs live in this process and are kept for BULK_DELETE_JOB_TTL_SECONDS so the
+frontend can poll per-item progress.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from urllib.parse import urlparse
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session_maker
+from app.models.content import BulkDeleteItemResult, BulkDeleteJobResponse, BulkDeleteRequest
+from app.services.arr_index import (
+    ARR_SERVICE_RADARR,
+    ARR_SERVICE_SONARR,
+    lookup_arr_ids,
+    remove_arr_index_entries,
+)
+from app.services.content_cache import (
+    delete_cached_jellyseerr_requests_by_tmdb_ids,
+    delete_cached_media_by_tmdb_ids,
+    lookup_jellyseerr_media_ids_by_tmdb,
+)
+from app.services.jellyseerr import delete_jellyseerr_media
+from app.services.radarr import delete_movie_by_tmdb_id
+from app.services.settings_snapshot import SettingsSnapshot
+from app.services.sonarr import delete_series_by_tmdb_id
+
+logger = logging.getLogger(__name__)
+
+# Max concurrent calls per remote host (seedboxes don't like bursts)
+BULK_DELETE_HOST_CONCURRENCY = 4
+# How long finished jobs stay available for polling
+BULK_DELETE_JOB_TTL_SECONDS = 60 * 60
+
+# Jellyseerr media type for each bulk target media type
+_JELLYSEERR_MEDIA_TYPES = {"movie": "movie", "series": "tv"}
+
+
+@dataclass
+class _ServiceCredentials:
+    server_url: str
+    api_key: str
+
+
+@dataclass
+class BulkDeletePlan:
+    """Everything a bulk deletion job needs, resolved before the job starts."""
+
+    user_id: int
+    delete_from_arr: bool
+    delete_from_jellyseerr: bool
+    radarr: _ServiceCredentials | None = None
+    sonarr: _ServiceCredentials | None = None
+    jellyseerr: _ServiceCredentials | None = None
+    # (media_type, tmdb_id) -> Radarr/Sonarr ID from the arr index
+    arr_ids: dict[tuple[str, int], int] = field(default_factory=dict)
+    # (media_type, tmdb_id) -> Jellyseerr media ID
+    jellyseerr_media_ids: dict[tuple[str, int], int] = field(default_factory=dict)
+
+
+@dataclass
+class _JobRecord:
+    user_id: int
+    job: BulkDeleteJobResponse
+    updated_at: float
+
+
+_jobs: dict[str, _JobRecord] = {}
+
+
+def _prune_jobs() -> None:
+    """Forget finished jobs older than the TTL."""
+    cutoff = time.monotonic() - BULK_DELETE_JOB_TTL_SECONDS
+    for job_id, record in list(_jobs.items()):
+        if record.job.status == "completed" and record.updated_at < cutoff:
+            del _jobs[job_id]
+
+
+def create_bulk_delete_job(user_id: int, request: BulkDeleteRequest) -> BulkDeleteJobResponse:
+    """Register a new job with one pending result per (deduplicated) target."""
+    _prune_jobs()
+    targets = list(dict.fromkeys((item.media_type, item.tmdb_id) for item in request.items))
+    job = BulkDeleteJobResponse(
+        job_id=uuid.uuid4().hex,
+        status="pending",
+        total=len(targets),
+        items=[
+            BulkDeleteItemResult(media_type=media_type, tmdb_id=tmdb_id)
+            for media_type, tmdb_id in targets
+        ],
+        created_at=datetime.now(UTC),
+    )
+    _jobs[job.job_id] = _JobRecord(user_id=user_id, job=job, updated_at=time.monotonic())
+    return job
+
+
+def get_bulk_delete_job(user_id: int, job_id: str) -> BulkDeleteJobResponse | None:
+    """Get a job by ID, only if it belongs to the user."""
+    record = _jobs.get(job_id)
+    if record is None or record.user_id != user_id:
+        return None
+    return record.job
+
+
+async def prepare_bulk_delete(
+    db: AsyncSession,
+    user_id: int,
+    snapshot: SettingsSnapshot,
+    request: BulkDeleteRequest,
+) -> BulkDeletePlan:
+    """Resolve credentials and all *arr / Jellyseerr IDs with batched lookups.
+
+    Raises:
+        ValueError: If deleting from *arr is requested but the service a
+            target needs (Radarr for movies, Sonarr for series) is not configured
+    """
+    plan = BulkDeletePlan(
+        user_id=user_id,
+        delete_from_arr=request.delete_from_arr,
+        delete_from_jellyseerr=request.delete_from_jellyseerr,
+    )
+    settings = snapshot.settings
+    movie_ids = {item.tmdb_id for item in request.items if item.media_type == "movie"}
+    series_ids = {item.tmdb_id for item in request.items if item.media_type == "series"}
+
+    if request.delete_from_arr:
+        if movie_ids:
+            radarr_api_key = snapshot.api_key("radarr")
+            if not settings or not settings.radarr_server_url or not radarr_api_key:
+                raise ValueError("Radarr is not configured. Please configure Radarr in Settings.")
+            plan.radarr = _ServiceCredentials(settings.radarr_server_url, radarr_api_key)
+            radarr_ids = await lookup_arr_ids(db, user_id, ARR_SERVICE_RADARR, movie_ids)
+            plan.arr_ids.update((("movie", k), v) for k, v in radarr_ids.items())
+        if series_ids:
+            sonarr_api_key = snapshot.api_key("sonarr")
+            if not settings or not settings.sonarr_server_url or not sonarr_api_key:
+                raise ValueError("Sonarr is not configured. Please configure Sonarr in Settings.")
+            plan.sonarr = _ServiceCredentials(settings.sonarr_server_url, sonarr_api_key)
+            sonarr_ids = await lookup_arr_ids(db, user_id, ARR_SERVICE_SONARR, series_ids)
+            plan.arr_ids.update((("series", k), v) for k, v in sonarr_ids.items())
+
+    if request.delete_from_jellyseerr:
+        jellyseerr_api_key = snapshot.api_key("jellyseerr")
+        if settings and settings.jellyseerr_server_url and jellyseerr_api_key:
+            plan.jellyseerr = _ServiceCredentials(
+                settings.jellyseerr_server_url, jellyseerr_api_key
+            )
+        for media_type, tmdb_ids in (("movie", movie_ids), ("series", series_ids)):
+            media_ids = await lookup_jellyseerr_media_ids_by_tmdb(
+                db, user_id, tmdb_ids, _JELLYSEERR_MEDIA_TYPES[media_type]
+            )
+            plan.jellyseerr_media_ids.update(((media_type, k), v) for k, v in media_ids.items())
+
+    return plan
+
+
+class _HostLimiter:
+    """One semaphore per remote host."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def for_url(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc or url
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.limit)
+        return self._semaphores[host]
+
+
+async def _delete_item(
+    plan: BulkDeletePlan, item: BulkDeleteItemResult, limiter: _HostLimiter
+) -> None:
+    """Delete one item from *arr and Jellyseerr, recording the result on item."""
+    key = (item.media_type, item.tmdb_id)
+    messages: list[str] = []
+
+    if plan.delete_from_arr:
+        arr_id = plan.arr_ids.get(key)
+        if item.media_type == "movie" and plan.radarr:
+            async with limiter.for_url(plan.radarr.server_url):
+                success, message = await delete_movie_by_tmdb_id(
+                    plan.radarr.server_url, plan.radarr.api_key, item.tmdb_id, radarr_id=arr_id
+                )
+        elif item.media_type == "series" and plan.sonarr:
+            async with limiter.for_url(plan.sonarr.server_url):
+                success, message = await delete_series_by_tmdb_id(
+                    plan.sonarr.server_url, plan.sonarr.api_key, item.tmdb_id, sonarr_id=arr_id
+                )
+        else:
+            success, message = False, "Radarr/Sonarr is not configured"
+        item.arr_deleted = success
+        messages.append(message)
+
+    jellyseerr_media_id = plan.jellyseerr_media_ids.get(key)
+    if plan.delete_from_jellyseerr:
+        if not jellyseerr_media_id:
+            messages.append("No media found for this TMDB ID")
+        elif plan.jellyseerr:
+            async with limiter.for_url(plan.jellyseerr.server_url):
+                success, message = await delete_jellyseerr_media(
+                    plan.jellyseerr.server_url, plan.jellyseerr.api_key, jellyseerr_media_id
+                )
+            item.jellyseerr_deleted = success
+            messages.append(message)
+        else:
+            messages.append("Jellyseerr not configured")
+
+    item.success = (not plan.delete_from_arr or item.arr_deleted) and (
+        not plan.delete_from_jellyseerr or not jellyseerr_media_id or item.jellyseerr_deleted
+    )
+    item.message = "; ".join(messages) if messages else "No actions performed"
+
+
+async def _delete_cached_rows(plan: BulkDeletePlan, items: list[BulkDeleteItemResult]) -> None:
+    """Remove cache rows of items deleted from *arr, batched per table."""
+    deleted_movies = [i.tmdb_id for i in items if i.arr_deleted and i.media_type == "movie"]
+    deleted_series = [i.tmdb_id for i in items if i.arr_deleted and i.media_type == "series"]
+    if not deleted_movies and not deleted_series:
+        return
+
+    async with async_session_maker() as db:
+        await delete_cached_media_by_tmdb_ids(db, plan.user_id, deleted_movies + deleted_series)
+        await delete_cached_jellyseerr_requests_by_tmdb_ids(
+            db, plan.user_id, deleted_movies, "movie"
+        )
+        await delete_cached_jellyseerr_requests_by_tmdb_ids(db, plan.user_id, deleted_series, "tv")
+        await remove_arr_index_entries(db, plan.user_id, ARR_SERVICE_RADARR, deleted_movies)
+        await remove_arr_index_entries(db, plan.user_id, ARR_SERVICE_SONARR, deleted_series)
+        await db.commit()
+
+
+async def run_bulk_delete_job(job_id: str, plan: BulkDeletePlan) -> None:
+    """Execute a prepared bulk deletion job, updating per-item progress."""
+    record = _jobs.get(job_id)
+    if record is None:
+        return
+    job = record.job
+    job.status = "running"
+    limiter = _HostLimiter(BULK_DELETE_HOST_CONCURRENCY)
+
+    async def process(item: BulkDeleteItemResult) -> None:
+        try:
+            await _delete_item(plan, item, limiter)
+        except Exception as e:
+            logger.error(f"Bulk delete failed for {item.media_type} {item.tmdb_id}: {e}")
+            item.success = False
+            item.message = f"Unexpected error: {e}"
+        item.status = "done"
+        job.completed += 1
+        if item.success:
+            job.succeeded += 1
+        else:
+            job.failed += 1
+        record.updated_at = time.monotonic()
+
+    await asyncio.gather(*(process(item) for item in job.items))
+
+    try:
+        await _delete_cached_rows(plan, job.items)
+    except Exception as e:
+        logger.error(f"Bulk delete cache cleanup failed for job {job_id}: {e}")
+
+    job.status = "completed"
+    job.finished_at = datetime.now(UTC)
+    record.updated_at = time.monotonic()
+    logger.info(
+        f"Bulk delete job {job_id} finished: {job.succeeded} succeeded, {job.failed} failed"
+    )
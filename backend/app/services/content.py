@@ -55,8 +55,6 @@ from app.services.content_cache import (
 
 # Re-export query functions
 from app.services.content_queries import (
-    # Constants
-    DEFAULT_RECENTLY_AVAILABLE_DAYS,
     # Internal types (used by some callers)
     EpisodeAddition,
     SeasonEpisodeDetails,
@@ -84,6 +82,9 @@ from app.services.content_queries import (
     resolve_display_name,
 )
 
+# Re-export settings defaults
+from app.services.settings_snapshot import DEFAULT_RECENTLY_AVAILABLE_DAYS
+
 # Re-export all whitelist functions
 from app.services.whitelist import (
     # Episode language exempt
@@ -2,9 +2,8 @@
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from typing import Any, TypedDict
+from typing import Any, NamedTuple, TypedDict
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import CachedJellyseerrRequest, CachedMediaItem, UserSettings
@@ -20,6 +19,38 @@ class LanguageCheckResult(TypedDict):
     missing_languages: list[str]
 
 
+class MediaItemRow(NamedTuple):
+    """Scalar fields of a CachedMediaItem, selected as plain columns.
+
+    Analysis endpoints read these instead of full ORM entities, which would
+    decode raw_data and problematic_episodes for every row. The defaulted
+    fields are only loaded for the rows that need them (see
+    content_queries.load_media_item_rows() and with_result_details()):
+    raw_data holds just MediaSources, for rows without a language_check_result.
+    """
+
+    id: int
+    jellyfin_id: str
+    name: str
+    media_type: str
+    production_year: int | None
+    date_created: str | None
+    path: str | None
+    size_bytes: int | None
+    played: bool
+    last_played_date: str | None
+    largest_season_size_bytes: int | None
+    language_check_result: dict[str, Any] | None
+    raw_data: dict[str, Any] | None = None
+    tmdb_id: str | None = None
+    imdb_id: str | None = None
+    problematic_episodes: list[dict[str, Any]] | None = None
+
+
+# Anything the analysis functions accept
+MediaItemLike = CachedMediaItem | MediaItemRow
+
+
 @dataclass
 class UserThresholds:
     """User's analysis thresholds."""
@@ -89,16 +120,21 @@ def parse_jellyfin_datetime(date_str: str | None) -> datetime | None:
         return None
 
 
-def extract_provider_ids(item: CachedMediaItem) -> tuple[str | None, str | None]:
+def extract_provider_ids(item: MediaItemLike) -> tuple[str | None, str | None]:
     """Extract TMDB and IMDB IDs from a media item's raw_data.
 
     Jellyfin stores provider IDs in ProviderIds dict with keys like:
     - "Tmdb": "12345"
     - "Imdb": "tt1234567"
 
+    MediaItemRow records carry the IDs already extracted by the query.
+
     Returns:
         Tuple of (tmdb_id, imdb_id) - strings or None if not present
     """
+    if isinstance(item, MediaItemRow):
+        return item.tmdb_id, item.imdb_id
+
     raw_data = item.raw_data
     if not raw_data:
         return None, None
@@ -118,11 +154,8 @@ def extract_provider_ids(item: CachedMediaItem) -> tuple[str | None, str | None]
 # ============================================================================
 
 
-async def get_user_thresholds(db: AsyncSession, user_id: int) -> UserThresholds:
-    """Get user's analysis thresholds, falling back to defaults if not configured."""
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    settings = result.scalar_one_or_none()
-
+def build_user_thresholds(settings: UserSettings | None) -> UserThresholds:
+    """Build analysis thresholds from a settings row, falling back to defaults."""
     return UserThresholds(
         old_content_months=(
             settings.old_content_months
@@ -147,13 +180,21 @@ async def get_user_thresholds(db: AsyncSession, user_id: int) -> UserThresholds:
     )
 
 
+async def get_user_thresholds(db: AsyncSession, user_id: int) -> UserThresholds:
+    """Get user's analysis thresholds, falling back to defaults if not configured."""
+    from app.services.settings_snapshot import get_settings_snapshot
+
+    snapshot = await get_settings_snapshot(db, user_id)
+    return snapshot.thresholds
+
+
 # ============================================================================
 # Old/Unwatched Content Analysis
 # ============================================================================
 
 
 def is_old_or_unwatched(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     months_cutoff: int = OLD_CONTENT_MONTHS_CUTOFF,
     min_age_months: int = MIN_AGE_MONTHS,
 ) -> bool:
@@ -208,7 +249,7 @@ def is_old_or_unwatched(
 
 
 def is_large_movie(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     threshold_gb: int = LARGE_MOVIE_SIZE_THRESHOLD_GB,
 ) -> bool:
     """Check if an item is a large movie.
@@ -234,7 +275,7 @@ def is_large_movie(
 
 
 def is_large_series(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     threshold_gb: int = LARGE_SEASON_SIZE_THRESHOLD_GB,
 ) -> bool:
     """Check if an item is a large series (based on largest season size).
@@ -264,7 +305,7 @@ def is_large_series(
 # ============================================================================
 
 
-def check_audio_languages(item: CachedMediaItem) -> LanguageCheckResult:
+def check_audio_languages(item: MediaItemLike) -> LanguageCheckResult:
     """Check if item has English and French audio tracks.
 
     Based on original_script.py:check_audio_languages
@@ -344,7 +385,7 @@ def check_audio_languages(item: CachedMediaItem) -> LanguageCheckResult:
 
 
 def has_language_issues(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     is_french_only: bool = False,
 ) -> bool:
     """Check if an item has language issues (missing EN or FR audio).
@@ -366,7 +407,7 @@ def has_language_issues(
 
 
 def get_language_issues_list(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     is_french_only: bool = False,
 ) -> list[str]:
     """Get list of specific language issues for an item.
@@ -582,7 +623,7 @@ def is_unavailable_request(
 
 
 def get_item_issues(
-    item: CachedMediaItem,
+    item: MediaItemLike,
     whitelisted_ids: set[str],
     french_only_ids: set[str] | None = None,
     language_exempt_ids: set[str] | None = None,
@@ -642,7 +683,7 @@ def get_item_issues(
 
 
 def get_problematic_episodes(
-    item: CachedMediaItem, issues: list[str]
+    item: MediaItemLike, issues: list[str]
 ) -> list[ProblematicEpisode] | None:
     """Get list of problematic episodes for a series with language issues.
 
@@ -4,11 +4,14 @@ Functions for managing cached media items and Jellyseerr requests.
 """
 
 import logging
+from collections.abc import Collection
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, delete, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import CachedJellyseerrRequest, CachedMediaItem, UserSettings
+from app.services.settings_snapshot import get_settings_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +26,7 @@ async def get_user_settings(db: AsyncSession, user_id: int) -> UserSettings | No
     Returns:
         UserSettings if found, None otherwise
     """
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    return result.scalar_one_or_none()
+    return (await get_settings_snapshot(db, user_id)).settings
 
 
 async def lookup_jellyseerr_media_by_tmdb(
@@ -76,6 +78,32 @@ async def lookup_jellyseerr_media_by_request_id(
     return row
 
 
+def _tmdb_id_match(db: AsyncSession, tmdb_id_strs: Collection[str]) -> ColumnElement[bool]:
+    """Match raw_data.ProviderIds.Tmdb (stored as a string) against TMDB IDs."""
+    if db.get_bind().dialect.name == "postgresql":
+        # JSONB containment, served by the GIN index on raw_data
+        return or_(
+            *(
+                CachedMediaItem.raw_data.op("@>")(literal({"ProviderIds": {"Tmdb": s}}, JSONB))
+                for s in tmdb_id_strs
+            )
+        )
+    tmdb_id: ColumnElement[str] = CachedMediaItem.raw_data[("ProviderIds", "Tmdb")].as_string()
+    return tmdb_id.in_(tmdb_id_strs)
+
+
+async def _delete_cached_media_matching(
+    db: AsyncSession, user_id: int, tmdb_id_strs: Collection[str]
+) -> int:
+    """Delete a user's CachedMediaItems whose TMDB ID is in tmdb_id_strs."""
+    result = await db.execute(
+        delete(CachedMediaItem).where(
+            CachedMediaItem.user_id == user_id, _tmdb_id_match(db, tmdb_id_strs)
+        )
+    )
+    return int(getattr(result, "rowcount", 0) or 0)
+
+
 async def delete_cached_media_by_tmdb_id(db: AsyncSession, user_id: int, tmdb_id: int) -> int:
     """Delete CachedMediaItem by TMDB ID stored in raw_data.ProviderIds.Tmdb.
 
@@ -87,32 +115,86 @@ async def delete_cached_media_by_tmdb_id(db: AsyncSession, user_id: int, tmdb_id
     Returns:
         Number of items deleted
     """
-    # First, find all matching media items (TMDB ID is stored as string in JSON)
-    tmdb_id_str = str(tmdb_id)
+    deleted = await _delete_cached_media_matching(db, user_id, {str(tmdb_id)})
+    if not deleted:
+        logger.debug(f"No CachedMediaItem found for TMDB ID {tmdb_id}")
+        return 0
+
+    logger.info(f"Deleted {deleted} CachedMediaItem(s) for TMDB ID {tmdb_id}")
+    return deleted
+
+
+async def lookup_jellyseerr_media_ids_by_tmdb(
+    db: AsyncSession, user_id: int, tmdb_ids: Collection[int], media_type: str
+) -> dict[int, int]:
+    """Look up Jellyseerr media IDs for many TMDB IDs in one query.
+
+    Args:
+        db: Database session
+        user_id: User ID to filter by
+        tmdb_ids: TMDB IDs to search for
+        media_type: "movie" or "tv" (lowercase)
+
+    Returns:
+        Dict mapping tmdb_id -> Jellyseerr media ID (media.id, NOT request.id)
+    """
+    if not tmdb_ids:
+        return {}
     result = await db.execute(
-        select(CachedMediaItem)
-        .where(CachedMediaItem.user_id == user_id)
-        .where(CachedMediaItem.raw_data.isnot(None))
+        select(CachedJellyseerrRequest.tmdb_id, CachedJellyseerrRequest.jellyseerr_media_id)
+        .where(CachedJellyseerrRequest.user_id == user_id)
+        .where(CachedJellyseerrRequest.tmdb_id.in_(tmdb_ids))
+        .where(CachedJellyseerrRequest.media_type == media_type)
+        .where(CachedJellyseerrRequest.jellyseerr_media_id.isnot(None))
     )
-    items = result.scalars().all()
+    return {tmdb_id: media_id for tmdb_id, media_id in result.all()}
 
-    # Filter items by TMDB ID in raw_data
-    items_to_delete = []
-    for item in items:
-        raw_data = item.raw_data or {}
-        provider_ids = raw_data.get("ProviderIds", {})
-        if provider_ids.get("Tmdb") == tmdb_id_str:
-            items_to_delete.append(item.id)
 
-    if not items_to_delete:
-        logger.debug(f"No CachedMediaItem found for TMDB ID {tmdb_id}")
+async def delete_cached_media_by_tmdb_ids(
+    db: AsyncSession, user_id: int, tmdb_ids: Collection[int]
+) -> int:
+    """Delete CachedMediaItems for many TMDB IDs in one statement.
+
+    Batch version of delete_cached_media_by_tmdb_id for bulk deletions.
+
+    Args:
+        db: Database session
+        user_id: User ID to filter by
+        tmdb_ids: TMDB IDs to match in raw_data.ProviderIds.Tmdb
+
+    Returns:
+        Number of items deleted
+    """
+    if not tmdb_ids:
         return 0
+    deleted = await _delete_cached_media_matching(
+        db, user_id, {str(tmdb_id) for tmdb_id in tmdb_ids}
+    )
+    if deleted:
+        logger.info(f"Deleted {deleted} CachedMediaItem(s) for {len(tmdb_ids)} TMDB IDs")
+    return deleted
 
-    # Delete the matching items
-    await db.execute(delete(CachedMediaItem).where(CachedMediaItem.id.in_(items_to_delete)))
 
-    logger.info(f"Deleted {len(items_to_delete)} CachedMediaItem(s) for TMDB ID {tmdb_id}")
-    return len(items_to_delete)
+async def delete_cached_jellyseerr_requests_by_tmdb_ids(
+    db: AsyncSession, user_id: int, tmdb_ids: Collection[int], media_type: str
+) -> None:
+    """Delete CachedJellyseerrRequests for many TMDB IDs in one statement.
+
+    Args:
+        db: Database session
+        user_id: User ID to filter by
+        tmdb_ids: TMDB IDs to match
+        media_type: "movie" or "tv" (lowercase)
+    """
+    if not tmdb_ids:
+        return
+    await db.execute(
+        delete(CachedJellyseerrRequest)
+        .where(CachedJellyseerrRequest.user_id == user_id)
+        .where(CachedJellyseerrRequest.tmdb_id.in_(tmdb_ids))
+        .where(CachedJellyseerrRequest.media_type == media_type)
+    )
+    logger.debug(f"Deleted CachedJellyseerrRequest(s) for {len(tmdb_ids)} TMDB IDs")
 
 
 async def delete_cached_jellyseerr_request_by_tmdb_id(
@@ -0,0 +1,281 @@
+"""Streaming export of library and issue lists (NDJSON / CSV).
+
+Rows are read as MediaItemRow projections with a server-side cursor
+(`stream` + `yield_per`) and encoded batch by batch, so memory use stays flat
+regardless of library size. JSON fields (provider IDs, episodes) are looked up
+per batch for the exported rows only. Only small per-user lookups (whitelists,
+thresholds, request map) are loaded up front.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import CachedJellyseerrRequest, CachedMediaItem
+from app.models.content import ContentIssueItem, LibraryItem
+from app.services.content_analysis import (
+    MediaItemRow,
+    extract_provider_ids,
+    format_size,
+    get_item_issues,
+    get_problematic_episodes,
+    get_user_thresholds,
+)
+from app.services.content_queries import (
+    build_library_filters,
+    build_library_order_by,
+    media_item_rows_query,
+    with_legacy_media_sources,
+    with_result_details,
+)
+from app.services.parallel_reads import run_parallel_reads
+from app.services.whitelist import (
+    get_french_only_ids,
+    get_language_exempt_ids,
+    get_large_whitelist_ids,
+    get_whitelist_ids,
+)
+
+EXPORT_FORMATS = ("ndjson", "csv")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+# Rows fetched per cursor round-trip (and encoded per yielded chunk)
+EXPORT_BATCH_SIZE = 500
+
+LIBRARY_EXPORT_FIELDS = list(LibraryItem.model_fields)
+# Nested episode details don't fit a flat CSV row; they are kept in NDJSON only
+ISSUES_EXPORT_FIELDS = [
+    name for name in ContentIssueItem.model_fields if name != "problematic_episodes"
+]
+
+
+async def iter_library_export_rows(
+    db: AsyncSession,
+    user_id: int,
+    media_type: str | None = None,
+    search: str | None = None,
+    watched: str | None = None,
+    sort: str = "name",
+    order: str = "asc",
+    min_year: int | None = None,
+    max_year: int | None = None,
+    min_size_gb: float | None = None,
+    max_size_gb: float | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream library items matching the same filters as the library endpoint.
+
+    Sonarr links are not resolved (no external calls during an export).
+
+    Yields:
+        LibraryItem dicts in the requested sort order
+    """
+    filters = build_library_filters(
+        user_id,
+        media_type=media_type,
+        search=search,
+        watched=watched,
+        min_year=min_year,
+        max_year=max_year,
+        min_size_gb=min_size_gb,
+        max_size_gb=max_size_gb,
+    )
+    query = (
+        media_item_rows_query(*filters)
+        .order_by(build_library_order_by(sort, order))
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        batch = [MediaItemRow(*row) for row in partition]
+        for item in await with_result_details(db, user_id, batch, with_episodes=False):
+            tmdb_id, _ = extract_provider_ids(item)
+            yield LibraryItem(
+                jellyfin_id=item.jellyfin_id,
+                name=item.name,
+                media_type=item.media_type,
+                production_year=item.production_year,
+                size_bytes=item.size_bytes,
+                size_formatted=format_size(item.size_bytes),
+                played=item.played,
+                last_played_date=item.last_played_date,
+                date_created=item.date_created,
+                tmdb_id=tmdb_id,
+            ).model_dump()
+
+
+async def iter_issue_export_rows(
+    db: AsyncSession,
+    user_id: int,
+    filter_type: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Stream content items with issues, largest first.
+
+    Applies the same analysis as get_content_issues() one row at a time.
+    Unavailable requests are not part of the export.
+
+    Args:
+        db: Database session
+        user_id: User ID from JWT
+        filter_type: Optional filter - "old", "large", "language"
+
+    Yields:
+        ContentIssueItem dicts
+    """
+    thresholds = await get_user_thresholds(db, user_id)
+    (
+        whitelisted_ids,
+        french_only_ids,
+        language_exempt_ids,
+        large_whitelist_ids,
+    ) = await run_parallel_reads(
+        db,
+        lambda session: get_whitelist_ids(session, user_id),
+        lambda session: get_french_only_ids(session, user_id),
+        lambda session: get_language_exempt_ids(session, user_id),
+        lambda session: get_large_whitelist_ids(session, user_id),
+    )
+
+    # Reconciliation map: (tmdb_id, media_type) -> jellyseerr_request_id
+    jellyseerr_map: dict[tuple[int, str], int] = {}
+    requests_result = await db.execute(
+        select(
+            CachedJellyseerrRequest.tmdb_id,
+            CachedJellyseerrRequest.media_type,
+            CachedJellyseerrRequest.jellyseerr_id,
+        )
+        .where(CachedJellyseerrRequest.user_id == user_id)
+        .where(CachedJellyseerrRequest.tmdb_id.isnot(None))
+    )
+    for row in requests_result:
+        jellyseerr_map[(row.tmdb_id, row.media_type)] = row.jellyseerr_id
+
+    query = (
+        media_item_rows_query(CachedMediaItem.user_id == user_id)
+        .order_by(desc(func.coalesce(CachedMediaItem.size_bytes, 0)), CachedMediaItem.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        batch = await with_legacy_media_sources(
+            db, user_id, [MediaItemRow(*row) for row in partition]
+        )
+        issue_rows: list[tuple[MediaItemRow, list[str], list[str]]] = []
+        for item in batch:
+            issues, language_issues_detail = get_item_issues(
+                item,
+                whitelisted_ids,
+                french_only_ids,
+                language_exempt_ids,
+                large_whitelist_ids,
+                thresholds,
+            )
+            if issues and not (filter_type and filter_type not in issues):
+                issue_rows.append((item, issues, language_issues_detail))
+
+        detailed_items = await with_result_details(db, user_id, [item for item, _, _ in issue_rows])
+        for item, (_, issues, language_issues_detail) in zip(
+            detailed_items, issue_rows, strict=True
+        ):
+            yield _issue_export_row(item, issues, language_issues_detail, jellyseerr_map)
+
+
+def _issue_export_row(
+    item: MediaItemRow,
+    issues: list[str],
+    language_issues_detail: list[str],
+    jellyseerr_map: dict[tuple[int, str], int],
+) -> dict[str, Any]:
+    """Build the ContentIssueItem dict of one exported item."""
+    tmdb_id, imdb_id = extract_provider_ids(item)
+    jellyseerr_request_id = None
+    if tmdb_id:
+        try:
+            normalized_media_type = "movie" if item.media_type == "Movie" else "tv"
+            jellyseerr_request_id = jellyseerr_map.get((int(tmdb_id), normalized_media_type))
+        except (ValueError, TypeError):
+            pass
+
+    largest_season_size_bytes = (
+        item.largest_season_size_bytes if item.media_type == "Series" else None
+    )
+    return ContentIssueItem(
+        jellyfin_id=item.jellyfin_id,
+        name=item.name,
+        media_type=item.media_type,
+        production_year=item.production_year,
+        size_bytes=item.size_bytes,
+        size_formatted=format_size(item.size_bytes),
+        last_played_date=item.last_played_date,
+        played=item.played,
+        path=item.path,
+        date_created=item.date_created,
+        issues=issues,
+        language_issues=language_issues_detail if language_issues_detail else None,
+        tmdb_id=tmdb_id,
+        imdb_id=imdb_id,
+        jellyseerr_request_id=jellyseerr_request_id,
+        largest_season_size_bytes=largest_season_size_bytes,
+        largest_season_size_formatted=(
+            format_size(largest_season_size_bytes) if largest_season_size_bytes else None
+        ),
+        problematic_episodes=get_problematic_episodes(item, issues),
+    ).model_dump()
+
+
+def _csv_value(value: Any) -> Any:
+    """Flatten list values into a single CSV cell."""
+    if isinstance(value, list):
+        return ";".join(str(v) for v in value)
+    return value
+
+
+async def encode_ndjson(rows: AsyncIterator[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode rows as newline-delimited JSON, one chunk per batch."""
+    chunk: list[bytes] = []
+    async for row in rows:
+        chunk.append(orjson.dumps(row))
+        if len(chunk) >= EXPORT_BATCH_SIZE:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+async def encode_csv(
+    rows: AsyncIterator[dict[str, Any]],
+    fieldnames: list[str],
+) -> AsyncIterator[bytes]:
+    """Encode rows as CSV with a header line, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+
+    count = 0
+    async for row in rows:
+        writer.writerow({key: _csv_value(value) for key, value in row.items()})
+        count += 1
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    # Always flush so an empty export still returns the header line
+    yield buffer.getvalue().encode("utf-8")
+
+
+def encode_export(
+    rows: AsyncIterator[dict[str, Any]],
+    export_format: str,
+    fieldnames: list[str],
+) -> AsyncIterator[bytes]:
+    """Encode streamed rows in the requested export format ("ndjson" or "csv")."""
+    if export_format == "csv":
+        return encode_csv(rows, fieldnames)
+    return encode_ndjson(rows)
@@ -3,7 +3,7 @@
 from datetime import UTC, datetime, timedelta
 from typing import Any, TypedDict
 
-from sqlalchemy import or_, select
+from sqlalchemy import ColumnElement, Row, Select, asc, desc, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import (
@@ -29,6 +29,7 @@ from app.models.content import (
     UnavailableRequestItem,
 )
 from app.services.content_analysis import (
+    MediaItemRow,
     _get_missing_seasons,
     _parse_release_date,
     extract_provider_ids,
@@ -43,39 +44,32 @@ from app.services.content_analysis import (
     is_unavailable_request,
     parse_jellyfin_datetime,
 )
+from app.services.parallel_reads import run_parallel_reads
+from app.services.settings_snapshot import get_settings_snapshot
 from app.services.whitelist import (
     get_french_only_ids,
     get_language_exempt_ids,
     get_large_whitelist_ids,
     get_request_whitelist_ids,
+    get_whitelist_ids,
 )
 
-# Constants for info endpoints
-DEFAULT_RECENTLY_AVAILABLE_DAYS = 7  # Content available in past 7 days
-
-
 # ============================================================================
 # User Settings Helpers
 # ============================================================================
 
 
 async def _get_user_settings(db: AsyncSession, user_id: int) -> UserSettings | None:
-    """Get user settings from database.
+    """Get user settings from the request's settings snapshot.
 
     Returns None if no settings exist for this user.
     """
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    return result.scalar_one_or_none()
+    return (await get_settings_snapshot(db, user_id)).settings
 
 
 async def get_user_recently_available_days(db: AsyncSession, user_id: int) -> int:
     """Get user's recently_available_days setting, falling back to default."""
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    settings = result.scalar_one_or_none()
-
-    if settings and settings.recently_available_days is not None:
-        return settings.recently_available_days
-    return DEFAULT_RECENTLY_AVAILABLE_DAYS
+    return (await get_settings_snapshot(db, user_id)).recently_available_days
 
 
 async def get_user_show_unreleased_setting(db: AsyncSession, user_id: int) -> bool:
@@ -83,9 +77,7 @@ async def get_user_show_unreleased_setting(db: AsyncSession, user_id: int) -> bo
 
     Returns False (default) if not configured.
     """
-    result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    settings = result.scalar_one_or_none()
-    return settings.show_unreleased_requests if settings else False
+    return (await get_settings_snapshot(db, user_id)).show_unreleased_requests
 
 
 # ============================================================================
@@ -126,6 +118,143 @@ def resolve_display_name(
     return nickname_map.get(requested_by, requested_by)
 
 
+# ============================================================================
+# Media Item Projections
+# ============================================================================
+
+# Columns selected into MediaItemRow, in field order (JSON-heavy columns excluded)
+MEDIA_ITEM_ROW_COLUMNS: tuple[Any, ...] = (
+    CachedMediaItem.id,
+    CachedMediaItem.jellyfin_id,
+    CachedMediaItem.name,
+    CachedMediaItem.media_type,
+    CachedMediaItem.production_year,
+    CachedMediaItem.date_created,
+    CachedMediaItem.path,
+    CachedMediaItem.size_bytes,
+    CachedMediaItem.played,
+    CachedMediaItem.last_played_date,
+    CachedMediaItem.largest_season_size_bytes,
+    CachedMediaItem.language_check_result,
+)
+
+# Item IDs per "id IN (...)" lookup of JSON fields
+MEDIA_ITEM_LOOKUP_BATCH_SIZE = 500
+
+
+def media_item_rows_query(*filters: ColumnElement[bool]) -> Select[Any]:
+    """SELECT of the MediaItemRow columns for cached media items matching filters."""
+    return select(*MEDIA_ITEM_ROW_COLUMNS).where(*filters)
+
+
+async def _select_by_item_ids(
+    db: AsyncSession,
+    user_id: int,
+    item_ids: list[int],
+    *columns: Any,
+) -> dict[int, Row[Any]]:
+    """Select columns for the given cached media item IDs, in batches.
+
+    Returns:
+        Dict of item ID -> row of the requested columns
+    """
+    rows: dict[int, Row[Any]] = {}
+    for start in range(0, len(item_ids), MEDIA_ITEM_LOOKUP_BATCH_SIZE):
+        batch = item_ids[start : start + MEDIA_ITEM_LOOKUP_BATCH_SIZE]
+        result = await db.execute(
+            select(CachedMediaItem.id, *columns).where(
+                CachedMediaItem.user_id == user_id,
+                CachedMediaItem.id.in_(batch),
+            )
+        )
+        for row in result:
+            rows[row[0]] = row
+    return rows
+
+
+async def with_legacy_media_sources(
+    db: AsyncSession,
+    user_id: int,
+    rows: list[MediaItemRow],
+) -> list[MediaItemRow]:
+    """Attach raw_data.MediaSources to rows without a language_check_result.
+
+    check_audio_languages() falls back to MediaSources for items synced before
+    language checks were cached; only those rows pay for reading raw_data.
+    """
+    legacy_ids = [row.id for row in rows if not row.language_check_result]
+    if not legacy_ids:
+        return rows
+
+    sources = await _select_by_item_ids(
+        db, user_id, legacy_ids, CachedMediaItem.raw_data["MediaSources"]
+    )
+    return [
+        row._replace(raw_data={"MediaSources": sources[row.id][1]})
+        if row.id in sources and sources[row.id][1]
+        else row
+        for row in rows
+    ]
+
+
+async def load_media_item_rows(
+    db: AsyncSession,
+    user_id: int,
+    with_media_sources: bool = True,
+) -> list[MediaItemRow]:
+    """Load a user's cached media items as MediaItemRow records.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        with_media_sources: Attach MediaSources for the language check fallback
+            (not needed when language issues are not analyzed)
+    """
+    result = await db.execute(media_item_rows_query(CachedMediaItem.user_id == user_id))
+    rows = [MediaItemRow(*row) for row in result]
+    if with_media_sources:
+        rows = await with_legacy_media_sources(db, user_id, rows)
+    return rows
+
+
+async def with_result_details(
+    db: AsyncSession,
+    user_id: int,
+    rows: list[MediaItemRow],
+    with_episodes: bool = True,
+) -> list[MediaItemRow]:
+    """Attach provider IDs (and problematic episodes) to the rows being returned.
+
+    Read with JSON path lookups for the final result rows only, instead of
+    decoding raw_data for every item during filtering.
+    """
+    if not rows:
+        return rows
+
+    columns: list[Any] = [
+        CachedMediaItem.raw_data[("ProviderIds", "Tmdb")].as_string(),
+        CachedMediaItem.raw_data[("ProviderIds", "Imdb")].as_string(),
+    ]
+    if with_episodes:
+        columns.append(CachedMediaItem.problematic_episodes)
+    details = await _select_by_item_ids(db, user_id, [row.id for row in rows], *columns)
+
+    detailed_rows = []
+    for row in rows:
+        detail = details.get(row.id)
+        if detail is None:
+            detailed_rows.append(row)
+            continue
+        detailed_rows.append(
+            row._replace(
+                tmdb_id=detail[1],
+                imdb_id=detail[2],
+                problematic_episodes=detail[3] if with_episodes else None,
+            )
+        )
+    return detailed_rows
+
+
 # ============================================================================
 # Old/Unwatched Content Queries
 # ============================================================================
@@ -142,9 +271,8 @@ async def get_old_unwatched_content(
     # Get user's thresholds
     thresholds = await get_user_thresholds(db, user_id)
 
-    # Get user's cached media items
-    result = await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == user_id))
-    all_items = result.scalars().all()
+    # Get user's cached media items (scalar columns only)
+    all_items = await load_media_item_rows(db, user_id, with_media_sources=False)
 
     # Get user's whitelist (only non-expired entries)
     now = datetime.now(UTC)
@@ -160,7 +288,7 @@ async def get_old_unwatched_content(
     whitelisted_ids = set(whitelist_result.scalars().all())
 
     # Filter items
-    filtered_items: list[CachedMediaItem] = []
+    filtered_items: list[MediaItemRow] = []
     for item in all_items:
         # Skip whitelisted content
         if item.jellyfin_id in whitelisted_ids:
@@ -220,47 +348,34 @@ async def get_content_summary(
     - language_issues: Content with language issues
     - unavailable_requests: Unavailable Jellyseerr requests
 
-    Uses asyncio.gather() to parallelize independent whitelist queries (US-59.1).
+    Independent lookups run in parallel on separate read sessions (US-59.1).
     """
-    import asyncio
-
     # Get user's thresholds
     thresholds = await get_user_thresholds(db, user_id)
 
-    # Get user's cached media items
-    result = await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == user_id))
-    all_items = result.scalars().all()
-
-    # Get user's whitelist (only non-expired entries)
-    now = datetime.now(UTC)
-    whitelist_result = await db.execute(
-        select(ContentWhitelist.jellyfin_id).where(
-            ContentWhitelist.user_id == user_id,
-            or_(
-                ContentWhitelist.expires_at.is_(None),
-                ContentWhitelist.expires_at > now,
-            ),
-        )
-    )
-    whitelisted_ids = set(whitelist_result.scalars().all())
+    # Get user's cached media items as lightweight rows
+    all_items = await load_media_item_rows(db, user_id)
 
-    # Parallelize independent whitelist queries (US-59.1)
+    # Parallelize independent whitelist and count queries (US-59.1)
     (
+        whitelisted_ids,
         large_whitelist_ids,
         french_only_ids,
         language_exempt_ids,
         unavailable_requests_count,
         recently_available_count,
-    ) = await asyncio.gather(
-        get_large_whitelist_ids(db, user_id),
-        get_french_only_ids(db, user_id),
-        get_language_exempt_ids(db, user_id),
-        get_unavailable_requests_count(db, user_id),
-        get_recently_available_count(db, user_id),
+    ) = await run_parallel_reads(
+        db,
+        lambda session: get_whitelist_ids(session, user_id),
+        lambda session: get_large_whitelist_ids(session, user_id),
+        lambda session: get_french_only_ids(session, user_id),
+        lambda session: get_language_exempt_ids(session, user_id),
+        lambda session: get_unavailable_requests_count(session, user_id),
+        lambda session: get_recently_available_count(session, user_id),
     )
 
     # Calculate old content (excluding whitelisted)
-    old_content_items: list[CachedMediaItem] = []
+    old_content_items: list[MediaItemRow] = []
     for item in all_items:
         if item.jellyfin_id in whitelisted_ids:
             continue
@@ -274,7 +389,7 @@ async def get_content_summary(
     old_content_size = sum(item.size_bytes or 0 for item in old_content_items)
 
     # Calculate large content (movies + series), excluding whitelisted
-    large_content_items: list[CachedMediaItem] = []
+    large_content_items: list[MediaItemRow] = []
     for item in all_items:
         if item.jellyfin_id in large_whitelist_ids:
             continue
@@ -286,7 +401,7 @@ async def get_content_summary(
     large_content_size = sum(item.size_bytes or 0 for item in large_content_items)
 
     # Calculate language issues (respecting french-only and language-exempt whitelists)
-    language_issues_items: list[CachedMediaItem] = []
+    language_issues_items: list[MediaItemRow] = []
     for item in all_items:
         # Skip items exempt from all language checks
         if item.jellyfin_id in language_exempt_ids:
@@ -347,57 +462,40 @@ async def get_content_issues(
         filter_type: Optional filter - "old", "large", "language", "requests"
 
     Returns items sorted by size (largest first).
-    Uses asyncio.gather() to parallelize independent queries (US-59.2).
+    Independent whitelist queries run in parallel on separate read sessions (US-59.2).
     """
-    import asyncio
+    from app.services.arr_index import get_sonarr_slug_map
 
-    from app.services.sonarr import get_decrypted_sonarr_api_key, get_sonarr_tmdb_to_slug_map
+    snapshot = await get_settings_snapshot(db, user_id)
 
     # Parallelize independent queries (US-59.2)
     (
-        thresholds,
-        user_settings,
+        whitelisted_ids,
         french_only_ids,
         language_exempt_ids,
         large_whitelist_ids,
-    ) = await asyncio.gather(
-        get_user_thresholds(db, user_id),
-        _get_user_settings(db, user_id),
-        get_french_only_ids(db, user_id),
-        get_language_exempt_ids(db, user_id),
-        get_large_whitelist_ids(db, user_id),
+    ) = await run_parallel_reads(
+        db,
+        lambda session: get_whitelist_ids(session, user_id),
+        lambda session: get_french_only_ids(session, user_id),
+        lambda session: get_language_exempt_ids(session, user_id),
+        lambda session: get_large_whitelist_ids(session, user_id),
     )
+    thresholds = snapshot.thresholds
+    user_settings = snapshot.settings
 
-    # Build Sonarr TMDB -> titleSlug map for enriching series items
-    # This depends on user_settings, so it runs after the first gather
+    # Sonarr TMDB -> titleSlug map for enriching series items, from the arr index
+    # built during sync
     sonarr_slug_map: dict[int, str] = {}
-    if user_settings and user_settings.sonarr_server_url and user_settings.sonarr_api_key_encrypted:
-        sonarr_api_key = get_decrypted_sonarr_api_key(user_settings)
-        if sonarr_api_key:
-            sonarr_slug_map = await get_sonarr_tmdb_to_slug_map(
-                user_settings.sonarr_server_url, sonarr_api_key
-            )
-
-    # Get user's cached media items
-    result = await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == user_id))
-    all_items = result.scalars().all()
+    if user_settings and user_settings.sonarr_server_url:
+        sonarr_slug_map = await get_sonarr_slug_map(db, user_id)
 
-    # Get user's whitelist (only non-expired entries)
-    now = datetime.now(UTC)
-    whitelist_result = await db.execute(
-        select(ContentWhitelist.jellyfin_id).where(
-            ContentWhitelist.user_id == user_id,
-            or_(
-                ContentWhitelist.expires_at.is_(None),
-                ContentWhitelist.expires_at > now,
-            ),
-        )
-    )
-    whitelisted_ids = set(whitelist_result.scalars().all())
+    # Get user's cached media items as lightweight rows
+    all_items = await load_media_item_rows(db, user_id)
 
     # Build list of items with issues
     # Store tuple of (item, issues_list, language_issues_detail)
-    items_with_issues: list[tuple[CachedMediaItem, list[str], list[str]]] = []
+    items_with_issues: list[tuple[MediaItemRow, list[str], list[str]]] = []
 
     for item in all_items:
         issues, language_issues_detail = get_item_issues(
@@ -429,6 +527,17 @@ async def get_content_issues(
     # Calculate totals
     total_size_bytes = sum(item.size_bytes or 0 for item, _, _ in items_with_issues)
 
+    # Provider IDs and problematic episodes are only read for the returned items
+    detailed_items = await with_result_details(
+        db, user_id, [item for item, _, _ in items_with_issues]
+    )
+    items_with_issues = [
+        (detailed_item, issues, language_issues_detail)
+        for detailed_item, (_, issues, language_issues_detail) in zip(
+            detailed_items, items_with_issues, strict=True
+        )
+    ]
+
     # Build reconciliation map: (tmdb_id, media_type) -> jellyseerr_request_id
     # This allows us to link Jellyfin items with their Jellyseerr requests
     jellyseerr_map: dict[tuple[int, str], int] = {}
@@ -1193,6 +1302,81 @@ async def get_unavailable_requests(
 # ============================================================================
 
 
+def build_library_filters(
+    user_id: int,
+    media_type: str | None = None,
+    search: str | None = None,
+    watched: str | None = None,
+    min_year: int | None = None,
+    max_year: int | None = None,
+    min_size_gb: float | None = None,
+    max_size_gb: float | None = None,
+) -> list[ColumnElement[bool]]:
+    """Build SQL WHERE clauses for library filters.
+
+    Shared by the paginated library endpoint and the streaming export so both
+    select exactly the same items.
+    """
+    filters: list[ColumnElement[bool]] = [CachedMediaItem.user_id == user_id]
+
+    # Apply media type filter
+    if media_type:
+        if media_type.lower() == "movie":
+            filters.append(CachedMediaItem.media_type == "Movie")
+        elif media_type.lower() == "series":
+            filters.append(CachedMediaItem.media_type == "Series")
+
+    # Apply search filter (case-insensitive LIKE)
+    if search:
+        # Use LIKE with wildcards for case-insensitive search
+        # SQLite LIKE is case-insensitive by default for ASCII
+        search_pattern = f"%{search}%"
+        filters.append(CachedMediaItem.name.ilike(search_pattern))
+
+    # Apply watched filter
+    if watched is not None:
+        if watched.lower() == "true":
+            filters.append(CachedMediaItem.played == True)  # noqa: E712
+        elif watched.lower() == "false":
+            filters.append(CachedMediaItem.played == False)  # noqa: E712
+
+    # Apply year range filters
+    if min_year is not None:
+        filters.append(CachedMediaItem.production_year >= min_year)
+    if max_year is not None:
+        filters.append(CachedMediaItem.production_year <= max_year)
+
+    # Apply size range filters (convert GB to bytes)
+    if min_size_gb is not None:
+        min_bytes = int(min_size_gb * 1024 * 1024 * 1024)
+        filters.append(CachedMediaItem.size_bytes >= min_bytes)
+    if max_size_gb is not None:
+        max_bytes = int(max_size_gb * 1024 * 1024 * 1024)
+        filters.append(CachedMediaItem.size_bytes <= max_bytes)
+
+    return filters
+
+
+def build_library_order_by(sort: str = "name", order: str = "asc") -> Any:
+    """Build the ORDER BY clause for library sorting.
+
+    Uses NULLS LAST to handle null values consistently.
+    """
+    sort_column: Any = CachedMediaItem.name  # Default
+    if sort == "year":
+        sort_column = CachedMediaItem.production_year
+    elif sort == "size":
+        sort_column = CachedMediaItem.size_bytes
+    elif sort == "date_added":
+        sort_column = CachedMediaItem.date_created
+    elif sort == "last_watched":
+        sort_column = CachedMediaItem.last_played_date
+
+    if order.lower() == "desc":
+        return desc(sort_column).nulls_last()
+    return asc(sort_column).nulls_last()
+
+
 async def get_library(
     db: AsyncSession,
     user_id: int,
@@ -1230,94 +1414,37 @@ async def get_library(
     """
     from math import ceil
 
-    from sqlalchemy import asc, desc, func
+    from sqlalchemy import func
 
-    from app.services.sonarr import get_decrypted_sonarr_api_key, get_sonarr_tmdb_to_slug_map
+    from app.services.arr_index import get_sonarr_slug_map
 
     # Clamp page_size to valid range (1-100)
     page_size = max(1, min(100, page_size))
     # Ensure page is at least 1
     page = max(1, page)
 
-    # Build Sonarr TMDB -> titleSlug map for enriching series items
+    # Sonarr TMDB -> titleSlug map for enriching series items, from the arr index
     sonarr_slug_map: dict[int, str] = {}
-    settings_result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
-    user_settings = settings_result.scalar_one_or_none()
-    if user_settings and user_settings.sonarr_server_url and user_settings.sonarr_api_key_encrypted:
-        sonarr_api_key = get_decrypted_sonarr_api_key(user_settings)
-        if sonarr_api_key:
-            sonarr_slug_map = await get_sonarr_tmdb_to_slug_map(
-                user_settings.sonarr_server_url, sonarr_api_key
-            )
-
-    # Build base query with SQL WHERE clauses for filtering
-    query = select(CachedMediaItem).where(CachedMediaItem.user_id == user_id)
-
-    # Apply media type filter
-    if media_type:
-        if media_type.lower() == "movie":
-            query = query.where(CachedMediaItem.media_type == "Movie")
-        elif media_type.lower() == "series":
-            query = query.where(CachedMediaItem.media_type == "Series")
-
-    # Apply search filter (case-insensitive LIKE)
-    if search:
-        # Use LIKE with wildcards for case-insensitive search
-        # SQLite LIKE is case-insensitive by default for ASCII
-        search_pattern = f"%{search}%"
-        query = query.where(CachedMediaItem.name.ilike(search_pattern))
-
-    # Apply watched filter
-    if watched is not None:
-        if watched.lower() == "true":
-            query = query.where(CachedMediaItem.played == True)  # noqa: E712
-        elif watched.lower() == "false":
-            query = query.where(CachedMediaItem.played == False)  # noqa: E712
-
-    # Apply year range filters
-    if min_year is not None:
-        query = query.where(CachedMediaItem.production_year >= min_year)
-    if max_year is not None:
-        query = query.where(CachedMediaItem.production_year <= max_year)
-
-    # Apply size range filters (convert GB to bytes)
-    if min_size_gb is not None:
-        min_bytes = int(min_size_gb * 1024 * 1024 * 1024)
-        query = query.where(CachedMediaItem.size_bytes >= min_bytes)
-    if max_size_gb is not None:
-        max_bytes = int(max_size_gb * 1024 * 1024 * 1024)
-        query = query.where(CachedMediaItem.size_bytes <= max_bytes)
+    user_settings = await _get_user_settings(db, user_id)
+    if user_settings and user_settings.sonarr_server_url:
+        sonarr_slug_map = await get_sonarr_slug_map(db, user_id)
+
+    filters = build_library_filters(
+        user_id,
+        media_type=media_type,
+        search=search,
+        watched=watched,
+        min_year=min_year,
+        max_year=max_year,
+        min_size_gb=min_size_gb,
+        max_size_gb=max_size_gb,
+    )
 
     # Get total count and total size for ALL matching items (before pagination)
     count_query = select(
         func.count(CachedMediaItem.id),
         func.coalesce(func.sum(CachedMediaItem.size_bytes), 0),
-    ).where(CachedMediaItem.user_id == user_id)
-
-    # Apply the same filters to count query
-    if media_type:
-        if media_type.lower() == "movie":
-            count_query = count_query.where(CachedMediaItem.media_type == "Movie")
-        elif media_type.lower() == "series":
-            count_query = count_query.where(CachedMediaItem.media_type == "Series")
-    if search:
-        search_pattern = f"%{search}%"
-        count_query = count_query.where(CachedMediaItem.name.ilike(search_pattern))
-    if watched is not None:
-        if watched.lower() == "true":
-            count_query = count_query.where(CachedMediaItem.played == True)  # noqa: E712
-        elif watched.lower() == "false":
-            count_query = count_query.where(CachedMediaItem.played == False)  # noqa: E712
-    if min_year is not None:
-        count_query = count_query.where(CachedMediaItem.production_year >= min_year)
-    if max_year is not None:
-        count_query = count_query.where(CachedMediaItem.production_year <= max_year)
-    if min_size_gb is not None:
-        min_bytes = int(min_size_gb * 1024 * 1024 * 1024)
-        count_query = count_query.where(CachedMediaItem.size_bytes >= min_bytes)
-    if max_size_gb is not None:
-        max_bytes = int(max_size_gb * 1024 * 1024 * 1024)
-        count_query = count_query.where(CachedMediaItem.size_bytes <= max_bytes)
+    ).where(*filters)
 
     count_result = await db.execute(count_query)
     total_count, total_size_bytes = count_result.one()
@@ -1326,22 +1453,7 @@ async def get_library(
     # Calculate pagination info
     total_pages = max(1, ceil(total_count / page_size))
 
-    # Apply sorting
-    # Use NULLS LAST to handle null values consistently
-    sort_column: Any = CachedMediaItem.name  # Default
-    if sort == "year":
-        sort_column = CachedMediaItem.production_year
-    elif sort == "size":
-        sort_column = CachedMediaItem.size_bytes
-    elif sort == "date_added":
-        sort_column = CachedMediaItem.date_created
-    elif sort == "last_watched":
-        sort_column = CachedMediaItem.last_played_date
-
-    if order.lower() == "desc":
-        query = query.order_by(desc(sort_column).nulls_last())
-    else:
-        query = query.order_by(asc(sort_column).nulls_last())
+    query = media_item_rows_query(*filters).order_by(build_library_order_by(sort, order))
 
     # Apply pagination with LIMIT and OFFSET
     offset = (page - 1) * page_size
@@ -1349,7 +1461,9 @@ async def get_library(
 
     # Execute paginated query
     result = await db.execute(query)
-    paginated_items = list(result.scalars().all())
+    paginated_items = await with_result_details(
+        db, user_id, [MediaItemRow(*row) for row in result], with_episodes=False
+    )
 
     # Convert to response models
     response_items = []
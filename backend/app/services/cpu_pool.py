@@ -0,0 +1,122 @@
+"""Run CPU-heavy sync work off the event loop.
+
+Merging the per-user Jellyfin libraries, checking episode audio tracks and
+decoding multi-megabyte JSON responses are pure CPU work. Run inline they block
+the event loop for the whole computation, stalling concurrent HTTP requests,
+progress updates and heartbeats. run_cpu_bound() hands such work to a shared
+executor instead.
+
+The executor is chosen by the CPU_POOL setting:
+- "thread" (default): a thread pool. Cheap hand-off, but the work still holds
+  the GIL, so it only keeps the loop responsive rather than adding throughput.
+- "process": a process pool. Real parallelism, at the cost of pickling the
+  arguments and the result. Needs a host that may fork children (not the
+  daemonic Celery prefork children).
+- "inline": run on the calling thread, for debugging.
+
+Data-passing boundary: functions given to run_cpu_bound() must be module-level
+and take and return plain data (dicts, lists, strings, numbers, sets) - never
+ORM objects, sessions, clients or closures - so that every executor kind can
+run them.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+import httpx
+import orjson
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CPU_POOL_KINDS = ("thread", "process", "inline")
+
+# Responses smaller than this are decoded inline: the executor hand-off costs
+# more than decoding them
+JSON_OFFLOAD_MIN_BYTES = 256 * 1024
+
+_executor: Executor | None = None
+
+
+def _worker_count() -> int:
+    configured = get_settings().cpu_pool_workers
+    if configured > 0:
+        return configured
+    return min(4, os.cpu_count() or 1)
+
+
+def get_cpu_executor() -> Executor | None:
+    """Get the shared CPU executor, creating it on first use.
+
+    Returns:
+        The executor, or None when CPU_POOL is "inline"
+    """
+    global _executor
+
+    kind = get_settings().cpu_pool
+    if kind not in CPU_POOL_KINDS:
+        raise ValueError(f"CPU_POOL must be one of {', '.join(CPU_POOL_KINDS)}, got {kind!r}")
+    if kind == "inline":
+        return None
+
+    if _executor is None:
+        workers = _worker_count()
+        if kind == "process":
+            _executor = ProcessPoolExecutor(max_workers=workers)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cpu")
+        logger.info(f"Started {kind} CPU pool with {workers} workers")
+    return _executor
+
+
+def shutdown_cpu_executor() -> None:
+    """Shut down the shared CPU executor (the next call starts a new one)."""
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+async def run_cpu_bound(fn: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound function on the shared executor.
+
+    Args:
+        fn: Module-level function taking and returning plain data
+        args: Positional arguments for fn
+
+    Returns:
+        The return value of fn
+    """
+    executor = get_cpu_executor()
+    if executor is None:
+        return fn(*args)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args))
+
+
+async def decode_json_response(
+    response: httpx.Response, decode: Callable[[bytes], T] = orjson.loads
+) -> T:
+    """Decode a JSON response body, off the event loop when it is large.
+
+    Args:
+        response: A response whose body has been read
+        decode: Module-level function decoding the raw body
+
+    Returns:
+        The decoded value
+    """
+    content = response.content
+    if len(content) < JSON_OFFLOAD_MIN_BYTES:
+        return decode(content)
+    return await run_cpu_bound(decode, content)
@@ -1,24 +1,30 @@
 """Encryption service for securing sensitive data like API keys."""
 
 import base64
+from functools import lru_cache
 
 from cryptography.fernet import Fernet
 
 from app.config import get_settings
 
 
-def _get_fernet() -> Fernet:
-    """Get Fernet cipher using the app's secret key."""
-    settings = get_settings()
+@lru_cache(maxsize=4)
+def _fernet_for_key(secret_key: str) -> Fernet:
+    """Build the Fernet cipher for a secret key (cached, key derivation runs once)."""
     # Derive a valid Fernet key from the secret key
     # Fernet requires a 32-byte base64-encoded key
-    key_bytes = settings.secret_key.encode("utf-8")
+    key_bytes = secret_key.encode("utf-8")
     # Pad or truncate to 32 bytes
     key_bytes = (key_bytes * 2)[:32]
     fernet_key = base64.urlsafe_b64encode(key_bytes)
     return Fernet(fernet_key)
 
 
+def _get_fernet() -> Fernet:
+    """Get Fernet cipher using the app's secret key."""
+    return _fernet_for_key(get_settings().secret_key)
+
+
 def encrypt_value(value: str) -> str:
     """Encrypt a string value and return base64-encoded ciphertext."""
     fernet = _get_fernet()
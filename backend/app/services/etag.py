@@ -0,0 +1,169 @@
+"""ETag / conditional GET support for read-heavy content endpoints.
+
+The dashboard re-polls summary, issues, library and recently-available endpoints.
+Their payloads only change when one of the user's inputs changes:
+
+- cache generation: a sync (or a deletion) rewrites cached media/request rows
+- whitelist version: an entry is added, removed or expires
+- settings version: thresholds and display preferences (UserSettings.updated_at)
+
+All of these are folded into a single aggregate query that is much cheaper than
+the analysis itself, so a matching If-None-Match can short-circuit to 304 before
+any item is loaded.
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import (
+    CachedJellyseerrRequest,
+    CachedMediaItem,
+    ContentWhitelist,
+    EpisodeLanguageExempt,
+    FrenchOnlyWhitelist,
+    JellyseerrRequestWhitelist,
+    LanguageExemptWhitelist,
+    LargeContentWhitelist,
+    SyncStatus,
+    UserNickname,
+    UserSettings,
+)
+
+# Browsers must revalidate on every use, but may keep the body for a 304
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+_CACHE_MODELS: tuple[Any, ...] = (CachedMediaItem, CachedJellyseerrRequest)
+_WHITELIST_MODELS: tuple[Any, ...] = (
+    ContentWhitelist,
+    FrenchOnlyWhitelist,
+    LanguageExemptWhitelist,
+    LargeContentWhitelist,
+    JellyseerrRequestWhitelist,
+    EpisodeLanguageExempt,
+)
+
+
+async def get_user_data_version(
+    db: AsyncSession,
+    user_id: int,
+    include_nicknames: bool = False,
+) -> list[Any]:
+    """Get the values that identify the current version of a user's analysis inputs.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        include_nicknames: Also include nickname mappings (used by display names)
+
+    Returns:
+        List of opaque values; any change means cached responses are stale.
+    """
+    now = datetime.now(UTC)
+    columns: list[Any] = [
+        select(SyncStatus.last_sync_completed)
+        .where(SyncStatus.user_id == user_id)
+        .scalar_subquery(),
+        select(UserSettings.updated_at).where(UserSettings.user_id == user_id).scalar_subquery(),
+    ]
+
+    # Whitelist version: only non-expired entries count, so expiry changes the version
+    for model in _WHITELIST_MODELS:
+        active = [
+            model.user_id == user_id,
+            or_(model.expires_at.is_(None), model.expires_at > now),
+        ]
+        columns.append(select(func.count(model.id)).where(*active).scalar_subquery())
+        columns.append(select(func.max(model.id)).where(*active).scalar_subquery())
+
+    result = await db.execute(select(*columns))
+    version: list[Any] = list(result.one())
+
+    # Cache generation: row count, highest ID and latest cached_at per cache table.
+    # Queried separately: cache tables may live in the user's tenant shard.
+    cache_columns = [
+        select(aggregate).where(model.user_id == user_id).scalar_subquery()
+        for model in _CACHE_MODELS
+        for aggregate in (func.count(model.id), func.max(model.id), func.max(model.cached_at))
+    ]
+    cache_result = await db.execute(select(*cache_columns))
+    version.extend(cache_result.one())
+
+    if include_nicknames:
+        nickname_result = await db.execute(
+            select(UserNickname.jellyseerr_username, UserNickname.display_name)
+            .where(UserNickname.user_id == user_id)
+            .order_by(UserNickname.jellyseerr_username)
+        )
+        version.extend(tuple(row) for row in nickname_result.all())
+
+    return version
+
+
+def build_etag(user_id: int, request: Request, version: list[Any]) -> str:
+    """Build a strong ETag from the data version, endpoint and query parameters.
+
+    The current hour is included because age-based rules (old content, recently
+    available) change over time even when no row does.
+    """
+    hasher = hashlib.sha256()
+    hour_bucket = datetime.now(UTC).strftime("%Y-%m-%dT%H")
+    parts: list[Any] = [
+        user_id,
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        hour_bucket,
+        version,
+    ]
+    hasher.update(repr(parts).encode("utf-8"))
+    return f'"{hasher.hexdigest()[:32]}"'
+
+
+async def compute_etag(
+    db: AsyncSession,
+    user_id: int,
+    request: Request,
+    include_nicknames: bool = False,
+) -> str:
+    """Compute the ETag for a user's GET request."""
+    version = await get_user_data_version(db, user_id, include_nicknames=include_nicknames)
+    return build_etag(user_id, request, version)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches the given ETag.
+
+    Uses weak comparison as required for If-None-Match (RFC 9110), so a
+    W/-prefixed tag sent back by a proxy still matches.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL},
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """Attach ETag and revalidation headers to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
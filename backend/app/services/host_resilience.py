@@ -0,0 +1,210 @@
+"""Per-host circuit breaker and adaptive concurrency for integration calls.
+
+retry_with_backoff used to retry every call on its own: when a Jellyfin server
+went down mid-sync, each pending call still burned all its attempts before
+failing. Calls that name their host now go through that host's
+HostResilience:
+
+- circuit breaker: after BREAKER_FAILURE_THRESHOLD consecutive transient
+  failures (timeouts, connection errors, 5xx) the circuit opens and calls fail
+  fast with CircuitOpenError. After BREAKER_RESET_SECONDS one probe call is let
+  through (half-open); its outcome closes or reopens the circuit. Any response
+  from the server, even a 4xx, proves it is up;
+- adaptive concurrency (AIMD): at most `limit` calls to the host run at once.
+  The limit grows by one per `limit` successful calls and is halved on
+  overload (timeouts, 5xx, 429), at most once per LIMIT_DECREASE_INTERVAL.
+
+State is kept per process, like the integration cache: a worker that found a
+host down fails the next syncs against it fast too. Breaker transitions are
+logged, and host_resilience_snapshot() reports the state of every host (it is
+part of the /health response).
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from app.services.sync_schedule import sync_host
+
+logger = logging.getLogger(__name__)
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 30.0
+
+INITIAL_CONCURRENCY_LIMIT = 8.0
+MIN_CONCURRENCY_LIMIT = 1.0
+MAX_CONCURRENCY_LIMIT = 32.0
+# Concurrent failures of one overload episode only halve the limit once
+LIMIT_DECREASE_INTERVAL = 1.0
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in_seconds: float) -> None:
+        self.host = host
+        self.retry_in_seconds = retry_in_seconds
+        super().__init__(
+            f"Circuit open for {host}: server considered down, "
+            f"next attempt in {retry_in_seconds:.0f}s"
+        )
+
+
+class HostResilience:
+    """Breaker and concurrency limit of one host."""
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.probe_started_at = 0.0
+        self.limit = INITIAL_CONCURRENCY_LIMIT
+        self.in_flight = 0
+        self.last_decrease_at = 0.0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        log = logger.warning if state == STATE_OPEN else logger.info
+        log(
+            f"Circuit for {self.host}: {self.state} -> {state} "
+            f"({self.consecutive_failures} consecutive failures)"
+        )
+        self.state = state
+
+    def before_call(self) -> None:
+        """Admit a call through the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its probe running
+        """
+        if self.state == STATE_CLOSED:
+            return
+        now = time.monotonic()
+        retry_in = self.opened_at + BREAKER_RESET_SECONDS - now
+        if self.state == STATE_OPEN and retry_in <= 0:
+            self._set_state(STATE_HALF_OPEN)
+        # A probe that never reported back (cancelled) is replaced after a reset period
+        probe_stale = now - self.probe_started_at >= BREAKER_RESET_SECONDS
+        if self.state == STATE_HALF_OPEN and (not self.probe_in_flight or probe_stale):
+            self.probe_in_flight = True
+            self.probe_started_at = now
+            return
+        raise CircuitOpenError(self.host, max(retry_in, 0.0))
+
+    def _decrease_limit(self) -> None:
+        now = time.monotonic()
+        if now - self.last_decrease_at >= LIMIT_DECREASE_INTERVAL:
+            self.limit = max(self.limit / 2, MIN_CONCURRENCY_LIMIT)
+            self.last_decrease_at = now
+
+    def record_success(self) -> None:
+        """Record a call the server answered (successfully or with a client error)."""
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self._set_state(STATE_CLOSED)
+        self.limit = min(self.limit + 1 / self.limit, MAX_CONCURRENCY_LIMIT)
+
+    def record_throttled(self) -> None:
+        """Record a 429: the server is up but wants fewer calls."""
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self._set_state(STATE_CLOSED)
+        self._decrease_limit()
+
+    def record_failure(self, overloaded: bool) -> None:
+        """Record a transient failure.
+
+        Args:
+            overloaded: True for timeouts and 5xx (shrinks the concurrency limit),
+                False for connection errors
+        """
+        if overloaded:
+            self._decrease_limit()
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= BREAKER_FAILURE_THRESHOLD:
+            self.probe_in_flight = False
+            self.opened_at = time.monotonic()
+            self._set_state(STATE_OPEN)
+
+    async def acquire(self) -> None:
+        """Wait for one of the host's concurrent call slots."""
+        if self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Give back a slot taken with acquire and hand free slots to waiters."""
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            # Skip waiters of cancelled tasks or of a finished task's event loop
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the host's concurrent call slots for the duration of a call.
+
+        The slot is given back however the call ends, cancellation included, so
+        an abandoned call can't shrink the host's concurrency for good.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current breaker state and concurrency of the host."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "concurrency_limit": int(self.limit),
+            "in_flight": self.in_flight,
+        }
+
+
+_hosts: dict[str, HostResilience] = {}
+
+
+def get_host_resilience(server_url: str) -> HostResilience:
+    """Get the resilience state of the host serving a URL (see sync_host)."""
+    host = sync_host(server_url)
+    if host not in _hosts:
+        _hosts[host] = HostResilience(host)
+    return _hosts[host]
+
+
+def host_resilience_snapshot() -> dict[str, dict[str, Any]]:
+    """Breaker state and concurrency of every host called by this process."""
+    return {host: resilience.snapshot() for host, resilience in _hosts.items()}
+
+
+def clear_host_resilience() -> None:
+    """Forget the state of every host."""
+    _hosts.clear()
@@ -0,0 +1,255 @@
+"""In-process cache for read-only integration calls (Jellyfin, Jellyseerr, Ultra).
+
+Entries are keyed by (integration, base URL, endpoint, params, credential hash)
+and follow a per-endpoint policy:
+
+- fresh (age < ttl): served from cache
+- stale (ttl <= age < ttl + stale): served from cache while one background
+  task refreshes it (stale-while-revalidate)
+- expired: fetched inline; concurrent misses for the same key share one call
+
+The cache is a size-bounded LRU. Results rejected by should_cache (e.g. the
+empty list a fetcher returns on error) are returned but not stored.
+
+shared_read_window() opens a separate, short-lived cache for reads that are
+only shared on purpose: while several tenants pointing at the same server are
+synced one after another, shared_server_read() runs each server-level read
+(library scans, full libraries, series statistics) once for the whole group.
+Outside a window it just calls the fetcher.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, NamedTuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CacheKey = tuple[str, str, str, str, str]
+
+
+class CachePolicy(NamedTuple):
+    """Freshness policy for one integration endpoint."""
+
+    ttl_seconds: float
+    stale_seconds: float
+
+
+# Per-endpoint policies, keyed by (integration, endpoint)
+CACHE_POLICIES: dict[tuple[str, str], CachePolicy] = {
+    ("jellyfin", "/Users"): CachePolicy(ttl_seconds=300, stale_seconds=1800),
+    ("jellyseerr", "/api/v1/user"): CachePolicy(ttl_seconds=300, stale_seconds=1800),
+    ("ultra", "/total-stats"): CachePolicy(ttl_seconds=120, stale_seconds=900),
+}
+DEFAULT_CACHE_POLICY = CachePolicy(ttl_seconds=60, stale_seconds=300)
+DEFAULT_MAX_ENTRIES = 512
+# Shared reads cache one entry per series, so the window holds many more entries
+SHARED_READ_MAX_ENTRIES = 50_000
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    fetched_at: float
+
+
+def make_cache_key(
+    integration: str,
+    base_url: str,
+    endpoint: str,
+    credential: str,
+    params: dict[str, Any] | None = None,
+) -> CacheKey:
+    """Build a cache key; the credential is hashed so keys never hold secrets."""
+    params_part = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return (
+        integration,
+        base_url.rstrip("/"),
+        endpoint,
+        params_part,
+        credential_fingerprint(credential),
+    )
+
+
+def credential_fingerprint(credential: str) -> str:
+    """Short hash identifying a credential without revealing it."""
+    return hashlib.sha256(credential.encode()).hexdigest()[:16]
+
+
+class IntegrationCache:
+    """Size-bounded LRU cache with stale-while-revalidate for integration reads."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all entries (in-flight fetches finish but are not awaited)."""
+        self._entries.clear()
+        self._inflight.clear()
+
+    def invalidate(self, integration: str, base_url: str | None = None) -> None:
+        """Drop entries for an integration, optionally only for one server."""
+        for key in list(self._entries):
+            if key[0] == integration and (base_url is None or key[1] == base_url.rstrip("/")):
+                del self._entries[key]
+
+    async def get_or_fetch(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[T]],
+        policy: CachePolicy,
+        should_cache: Callable[[T], bool] | None = None,
+    ) -> T:
+        """Return the cached value for key, fetching or revalidating as the policy requires."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < policy.ttl_seconds + policy.stale_seconds:
+                self._entries.move_to_end(key)
+                if age >= policy.ttl_seconds:
+                    self._start_fetch(key, fetch, should_cache)
+                value: T = entry.value
+                return value
+            del self._entries[key]
+
+        # Shield so a cancelled caller doesn't cancel a fetch shared with others
+        result: T = await asyncio.shield(self._start_fetch(key, fetch, should_cache))
+        return result
+
+    def _start_fetch(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None,
+    ) -> "asyncio.Task[T]":
+        """Start (or join) the single in-flight fetch for key on the running loop."""
+        task = self._inflight.get(key)
+        # Celery tasks run each sync in a fresh event loop; never reuse another loop's task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return task
+
+        task = asyncio.ensure_future(self._fetch_and_store(key, fetch, should_cache))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._on_fetch_done(key, done))
+        return task
+
+    async def _fetch_and_store(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[T]],
+        should_cache: Callable[[T], bool] | None,
+    ) -> T:
+        value = await fetch()
+        if should_cache is None or should_cache(value):
+            self._entries[key] = _CacheEntry(value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def _on_fetch_done(self, key: CacheKey, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Callers awaiting the task get the exception; background refreshes only log it
+            logger.debug(f"Integration fetch failed for {key[0]} {key[2]}: {task.exception()}")
+
+
+integration_cache = IntegrationCache()
+
+
+async def cached_integration_read(
+    integration: str,
+    base_url: str,
+    endpoint: str,
+    fetch: Callable[[], Awaitable[T]],
+    *,
+    credential: str,
+    params: dict[str, Any] | None = None,
+    should_cache: Callable[[T], bool] | None = None,
+) -> T:
+    """Read an integration endpoint through the shared cache.
+
+    Args:
+        integration: Integration name ("jellyfin", "jellyseerr", "ultra")
+        base_url: Server base URL
+        endpoint: Endpoint path, also used to look up the CachePolicy
+        fetch: Coroutine function performing the actual call
+        credential: API key used for the call (hashed into the key)
+        params: Query parameters that change the response
+        should_cache: Return False for results that must not be cached
+
+    Returns:
+        The cached or freshly fetched result
+    """
+    key = make_cache_key(integration, base_url, endpoint, credential, params)
+    policy = CACHE_POLICIES.get((integration, endpoint), DEFAULT_CACHE_POLICY)
+    return await integration_cache.get_or_fetch(key, fetch, policy, should_cache)
+
+
+class _SharedReads(NamedTuple):
+    cache: IntegrationCache
+    policy: CachePolicy
+
+
+_shared_reads: ContextVar[_SharedReads | None] = ContextVar("shared_reads", default=None)
+
+
+@contextmanager
+def shared_read_window(ttl_seconds: float) -> Iterator[None]:
+    """Share server-level reads made inside the block.
+
+    Args:
+        ttl_seconds: How long a shared result may be reused
+    """
+    shared = _SharedReads(
+        IntegrationCache(SHARED_READ_MAX_ENTRIES),
+        CachePolicy(ttl_seconds=ttl_seconds, stale_seconds=0),
+    )
+    token = _shared_reads.set(shared)
+    try:
+        yield
+    finally:
+        _shared_reads.reset(token)
+
+
+async def shared_server_read(
+    integration: str,
+    base_url: str,
+    endpoint: str,
+    fetch: Callable[[], Awaitable[T]],
+    *,
+    credential: str,
+    params: dict[str, Any] | None = None,
+    should_cache: Callable[[T], bool] | None = None,
+) -> T:
+    """Run a server-level read once per shared_read_window().
+
+    Args:
+        integration: Integration name ("jellyfin", "jellyseerr")
+        base_url: Server base URL
+        endpoint: Name of the read (endpoint path or derived statistic)
+        fetch: Coroutine function performing the read
+        credential: API key used for the read (hashed into the key)
+        params: Parameters that change the result
+        should_cache: Return False for results the next tenant must fetch again
+
+    Returns:
+        The shared or freshly fetched result
+    """
+    shared = _shared_reads.get()
+    if shared is None:
+        return await fetch()
+    key = make_cache_key(integration, base_url, endpoint, credential, params)
+    return await shared.cache.get_or_fetch(key, fetch, shared.policy, should_cache)
@@ -0,0 +1,86 @@
+"""Schema-driven decoding of the Jellyfin item payloads used by the sync.
+
+Jellyfin item responses are dominated by fields the sync never reads (People,
+Overview, Studios, every attribute of every media stream...). Decoding them
+into dicts builds all of those objects only to throw them away later, and the
+cached raw_data keeps them forever.
+
+The Structs below declare the fields the sync does read. msgspec decodes
+straight into them, skipping everything else without allocating it, and the
+result is handed on as plain dicts with Jellyfin's key names, so the rest of
+the pipeline (and the CPU pool boundary) is unchanged. Fields left at their
+default are omitted, matching Jellyfin leaving them out.
+"""
+
+from typing import Any
+
+import msgspec
+
+
+class _Payload(msgspec.Struct, rename="pascal", omit_defaults=True):
+    """Base for Jellyfin payloads: PascalCase keys, defaults left out."""
+
+
+class MediaStream(_Payload):
+    """Audio, video or subtitle stream; only what the language checks need."""
+
+    type: str | None = None
+    language: str | None = None
+
+
+class MediaSource(_Payload):
+    """File backing an item."""
+
+    size: int | None = None
+    media_streams: list[MediaStream] = []
+
+
+class UserData(_Payload):
+    """Watch data of the requesting Jellyfin user."""
+
+    played: bool = False
+    play_count: int = 0
+    last_played_date: str | None = None
+
+
+class JellyfinItem(_Payload):
+    """Movie, series or episode."""
+
+    id: str | None = None
+    name: str | None = None
+    type: str | None = None
+    production_year: int | None = None
+    date_created: str | None = None
+    path: str | None = None
+    provider_ids: dict[str, str] = {}
+    user_data: UserData | None = None
+    media_sources: list[MediaSource] = []
+    # Series only: change detection for the per-series deep scan
+    date_last_media_added: str | None = None
+    child_count: int | None = None
+    # Episodes only
+    parent_index_number: int | None = None
+    index_number: int | None = None
+
+
+class ItemsPage(_Payload):
+    """Response of the /Items and /Users/{id}/Items endpoints."""
+
+    items: list[JellyfinItem] = []
+
+
+_items_page_decoder = msgspec.json.Decoder(ItemsPage)
+
+
+def decode_items_page(content: bytes) -> list[dict[str, Any]]:
+    """Decode an items response into trimmed item dicts.
+
+    Args:
+        content: Raw JSON body of an /Items or /Users/{id}/Items response
+
+    Returns:
+        The Items, keeping only the fields declared on JellyfinItem
+    """
+    page = _items_page_decoder.decode(content)
+    items: list[dict[str, Any]] = msgspec.to_builtins(page.items)
+    return items
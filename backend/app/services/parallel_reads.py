@@ -0,0 +1,51 @@
+"""Run independent read queries concurrently on separate sessions.
+
+An AsyncSession must not be used by two coroutines at once, so gathering
+several queries over one session serializes them at best. run_parallel_reads()
+gives each query its own short-lived session bound to the caller's engine (and
+tenant shards), so the queries really run in parallel on separate pooled
+connections.
+
+Engines that hand out a single shared connection (StaticPool, e.g. in-memory
+SQLite in tests) cannot serve concurrent sessions; there the queries run one
+after another on the caller's session.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from app.database import fork_session
+
+ReadQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def supports_parallel_sessions(db: AsyncSession) -> bool:
+    """Whether concurrent sessions on db's engine get distinct connections."""
+    bind = db.bind
+    return isinstance(bind, AsyncEngine) and not isinstance(bind.pool, StaticPool)
+
+
+async def run_parallel_reads(db: AsyncSession, *queries: ReadQuery) -> list[Any]:
+    """Run read-only queries concurrently, each on its own session.
+
+    Args:
+        db: The caller's session; its engine is used for the parallel sessions
+        queries: Coroutine functions taking a session and returning a result.
+            They must only read, and must not return ORM objects that lazy-load
+            after their session is closed.
+
+    Returns:
+        The query results, in the order of queries
+    """
+    if not supports_parallel_sessions(db):
+        return [await query(db) for query in queries]
+
+    async def run(query: ReadQuery) -> Any:
+        async with fork_session(db) as session:
+            return await query(session)
+
+    return list(await asyncio.gather(*(run(query) for query in queries)))
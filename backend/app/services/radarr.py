@@ -99,6 +99,37 @@ async def get_radarr_movie_by_tmdb_id(server_url: str, api_key: str, tmdb_id: in
         return None
 
 
+async def get_radarr_movie_index(server_url: str, api_key: str) -> dict[int, int] | None:
+    """
+    Build the TMDB ID -> Radarr movie ID index from one movie list call.
+
+    Used by the sync to persist the arr index, so deletions don't need a
+    lookup call per movie.
+
+    Returns None on any error so callers can keep the previous index.
+    """
+    server_url = server_url.rstrip("/")
+
+    try:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(
+                f"{server_url}/api/v3/movie",
+                headers={"X-Api-Key": api_key},
+            )
+            if response.status_code != 200:
+                return None
+
+            index: dict[int, int] = {}
+            for movie in response.json():
+                tmdb_id = movie.get("tmdbId")
+                movie_id = movie.get("id")
+                if tmdb_id and movie_id is not None:
+                    index[int(tmdb_id)] = int(movie_id)
+            return index
+    except (httpx.RequestError, httpx.TimeoutException):
+        return None
+
+
 async def delete_radarr_movie(
     server_url: str, api_key: str, radarr_id: int, delete_files: bool = True
 ) -> bool:
@@ -129,7 +160,11 @@ async def delete_radarr_movie(
 
 
 async def delete_movie_by_tmdb_id(
-    server_url: str, api_key: str, tmdb_id: int, delete_files: bool = True
+    server_url: str,
+    api_key: str,
+    tmdb_id: int,
+    delete_files: bool = True,
+    radarr_id: int | None = None,
 ) -> tuple[bool, str]:
     """
     Delete a movie from Radarr by TMDB ID.
@@ -139,11 +174,13 @@ async def delete_movie_by_tmdb_id(
         api_key: Radarr API key
         tmdb_id: The TMDB ID of the movie
         delete_files: Whether to delete files on disk (default: True)
+        radarr_id: Radarr movie ID from the arr index; skips the lookup call
 
     Returns a tuple of (success: bool, message: str).
     """
-    # First, find the Radarr movie ID
-    radarr_id = await get_radarr_movie_by_tmdb_id(server_url, api_key, tmdb_id)
+    # First, find the Radarr movie ID (unless already known from the arr index)
+    if radarr_id is None:
+        radarr_id = await get_radarr_movie_by_tmdb_id(server_url, api_key, tmdb_id)
     if radarr_id is None:
         return False, f"Movie with TMDB ID {tmdb_id} not found in Radarr"
 
@@ -0,0 +1,21 @@
+"""Shared Redis client factory for API and worker processes."""
+
+import redis.asyncio as aioredis
+
+from app.config import get_settings
+
+REDIS_CONNECT_TIMEOUT_SECONDS = 1
+
+
+def get_redis_client(decode_responses: bool = False) -> aioredis.Redis:
+    """Create a Redis client from the configured redis_url.
+
+    A new client is created per call because Celery tasks run each sync in a
+    fresh event loop, and redis.asyncio clients are bound to the loop they were
+    created in. Callers must close it with `await client.aclose()`.
+    """
+    return aioredis.from_url(  # type: ignore[no-untyped-call,no-any-return]
+        get_settings().redis_url,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT_SECONDS,
+        decode_responses=decode_responses,
+    )
@@ -1,17 +1,32 @@
-"""Retry utility with exponential backoff for transient API failures."""
+"""Retry utility with exponential backoff for transient API failures.
+
+Delays use full jitter (a random delay up to the exponential cap) so calls
+that failed together don't retry together, and honour Retry-After on 429 and
+503 responses. Calls given their host also go through the host's circuit
+breaker and adaptive concurrency limit (see app.services.host_resilience).
+"""
 
 import asyncio
 import logging
+import random
+import time
 from collections.abc import Callable, Coroutine
+from contextlib import nullcontext
+from email.utils import parsedate_to_datetime
 from typing import Any, TypeVar
 
 import httpx
 
+from app.services.host_resilience import get_host_resilience
+from app.services.sync_cost import record_api_call
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
 MAX_RETRIES = 3  # 3 retries = 4 total attempts
 INITIAL_DELAY = 1  # Initial delay in seconds (doubles each retry: 1, 2, 4)
+MAX_DELAY = 30  # Cap of the exponential delay
+MAX_RETRY_AFTER = 60  # Longest Retry-After honoured, in seconds
 
 T = TypeVar("T")
 
@@ -24,6 +39,7 @@ def is_transient_error(error: Exception) -> bool:
     - Timeout errors
     - Connection errors (ConnectError, ReadError)
     - 5xx HTTP status errors (server-side issues)
+    - 429 Too Many Requests (rate limited)
 
     Permanent errors (should NOT retry):
     - 401 Unauthorized (auth failed)
@@ -49,66 +65,142 @@ def is_transient_error(error: Exception) -> bool:
     # HTTP status errors - check status code
     if isinstance(error, httpx.HTTPStatusError):
         status_code = error.response.status_code
-        # 5xx errors are server-side and transient
-        return status_code >= 500
+        # 5xx errors are server-side and transient, 429 asks to come back later
+        return status_code >= 500 or status_code == 429
 
     return False
 
 
+def get_retry_after(error: Exception) -> float | None:
+    """
+    Get the delay requested by a 429 or 503 response's Retry-After header.
+
+    Args:
+        error: The exception to check
+
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER), or None if not requested
+    """
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    if error.response.status_code not in (429, 503):
+        return None
+    value = error.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        # HTTP-date form
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def backoff_delay(attempt: int, initial_delay: float) -> float:
+    """
+    Full-jitter delay before retry number attempt + 1.
+
+    Returns:
+        A random delay between 0 and min(MAX_DELAY, initial_delay * 2**attempt)
+    """
+    return random.uniform(0, min(MAX_DELAY, initial_delay * 2**attempt))
+
+
+def _is_overload(error: Exception) -> bool:
+    """Whether a transient error means the server is struggling (not just unreachable)."""
+    if isinstance(error, httpx.TimeoutException):
+        return True
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code >= 500
+
+
 async def retry_with_backoff(
     func: Callable[[], Coroutine[Any, Any, T]],
     service_name: str,
     max_retries: int = MAX_RETRIES,
     initial_delay: float = INITIAL_DELAY,
+    host: str | None = None,
 ) -> T:
     """
     Execute an async function with retry logic and exponential backoff.
 
-    Retries only on transient errors (timeouts, 5xx, connection errors).
+    Retries only on transient errors (timeouts, 5xx, 429, connection errors).
     Does NOT retry on permanent errors (401, 404, 400, etc.).
 
+    With a host, each attempt waits for one of the host's concurrent call slots
+    and is refused with CircuitOpenError while the host's circuit is open.
+
     Args:
         func: Async function to execute (no arguments, use partial/closure for params)
         service_name: Name of service for logging (e.g., "Jellyfin", "Jellyseerr")
         max_retries: Maximum number of retry attempts (default: 3)
-        initial_delay: Initial delay in seconds (doubles each retry)
+        initial_delay: Initial delay cap in seconds (doubles each retry)
+        host: Server URL the function calls, to apply its breaker and concurrency limit
 
     Returns:
         The result of the function if successful
 
     Raises:
+        CircuitOpenError: If the host's circuit is open
         The last exception if all retries are exhausted or if error is not transient
     """
     last_error: Exception | None = None
-    delay = initial_delay
+    resilience = get_host_resilience(host) if host else None
 
     for attempt in range(max_retries + 1):  # +1 for initial attempt
-        try:
-            return await func()
-        except Exception as e:
-            last_error = e
-
-            # Check if error is retryable
-            if not is_transient_error(e):
-                # Permanent error - raise immediately without retry
-                raise
-
-            # Check if we have retries left
-            retries_remaining = max_retries - attempt
-            if retries_remaining <= 0:
-                # All retries exhausted
-                logger.error(f"{service_name} API failed after {max_retries + 1} attempts: {e}")
-                raise
-
-            # Log retry attempt
-            logger.warning(
-                f"Retry {attempt + 1}/{max_retries} for {service_name} API after {delay}s... "
-                f"(Error: {type(e).__name__}: {e})"
-            )
-
-            # Wait with exponential backoff
-            await asyncio.sleep(delay)
-            delay *= 2  # Double delay for next retry
+        if resilience is not None:
+            resilience.before_call()
+        async with resilience.slot() if resilience is not None else nullcontext():
+            record_api_call()
+            try:
+                result = await func()
+            except Exception as e:
+                last_error = e
+
+                # Check if error is retryable
+                if not is_transient_error(e):
+                    if resilience is not None:
+                        if isinstance(e, httpx.HTTPStatusError):
+                            # The server answered: it is up
+                            resilience.record_success()
+                        else:
+                            resilience.record_failure(overloaded=False)
+                    # Permanent error - raise immediately without retry
+                    raise
+
+                retry_after = get_retry_after(e)
+                if resilience is not None:
+                    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                        resilience.record_throttled()
+                    else:
+                        resilience.record_failure(overloaded=_is_overload(e))
+
+                # Check if we have retries left
+                retries_remaining = max_retries - attempt
+                if retries_remaining <= 0:
+                    # All retries exhausted
+                    logger.error(f"{service_name} API failed after {max_retries + 1} attempts: {e}")
+                    raise
+
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = backoff_delay(attempt, initial_delay)
+
+                # Log retry attempt
+                logger.warning(
+                    f"Retry {attempt + 1}/{max_retries} for {service_name} API "
+                    f"after {delay:.1f}s... (Error: {type(e).__name__}: {e})"
+                )
+            else:
+                if resilience is not None:
+                    resilience.record_success()
+                return result
+
+        # Wait without holding a concurrency slot
+        await asyncio.sleep(delay)
 
     # Should never reach here, but satisfy type checker
     if last_error:
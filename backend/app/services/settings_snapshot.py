@@ -0,0 +1,91 @@
+"""Request-scoped snapshot of a user's settings.
+
+A request often needs the same UserSettings row several times (thresholds,
+display toggles, service credentials). The snapshot loads the row once per
+database session and memoizes what is derived from it, so one request runs a
+single settings query and decrypts each API key at most once.
+
+Snapshots are stored in the session's info dict; since get_db() and
+get_read_db() open one session per request, they never outlive the request.
+"""
+
+from functools import cached_property
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import User, UserSettings, get_read_db
+from app.services.auth import get_current_user
+from app.services.content_analysis import UserThresholds, build_user_thresholds
+from app.services.encryption import decrypt_value
+
+# Key of the snapshot dict in AsyncSession.info
+_SESSION_INFO_KEY = "settings_snapshots"
+
+DEFAULT_RECENTLY_AVAILABLE_DAYS = 7  # Content available in past 7 days
+
+
+class SettingsSnapshot:
+    """A user's settings row plus values derived from it, computed at most once."""
+
+    def __init__(self, user_id: int, settings: UserSettings | None) -> None:
+        self.user_id = user_id
+        self.settings = settings
+        self._decrypted: dict[str, str] = {}
+
+    @cached_property
+    def thresholds(self) -> UserThresholds:
+        """Analysis thresholds, falling back to defaults if not configured."""
+        return build_user_thresholds(self.settings)
+
+    @property
+    def recently_available_days(self) -> int:
+        """recently_available_days setting, falling back to default."""
+        if self.settings and self.settings.recently_available_days is not None:
+            return self.settings.recently_available_days
+        return DEFAULT_RECENTLY_AVAILABLE_DAYS
+
+    @property
+    def show_unreleased_requests(self) -> bool:
+        """show_unreleased_requests setting (False if not configured)."""
+        return self.settings.show_unreleased_requests if self.settings else False
+
+    def api_key(self, service: str) -> str | None:
+        """Decrypted API key of a service ("jellyfin", "radarr", ...), or None if unset.
+
+        Decryption is memoized on the ciphertext, so updating the key in the
+        same session is picked up.
+        """
+        if self.settings is None:
+            return None
+        encrypted: str | None = getattr(self.settings, f"{service}_api_key_encrypted", None)
+        if not encrypted:
+            return None
+        if encrypted not in self._decrypted:
+            self._decrypted[encrypted] = decrypt_value(encrypted)
+        return self._decrypted[encrypted]
+
+
+async def get_settings_snapshot(db: AsyncSession, user_id: int) -> SettingsSnapshot:
+    """Get the user's settings snapshot, loading it once per session."""
+    snapshots: dict[int, SettingsSnapshot] = db.info.setdefault(_SESSION_INFO_KEY, {})
+    snapshot = snapshots.get(user_id)
+    if snapshot is None:
+        result = await db.execute(select(UserSettings).where(UserSettings.user_id == user_id))
+        snapshot = snapshots.setdefault(
+            user_id, SettingsSnapshot(user_id, result.scalar_one_or_none())
+        )
+    return snapshot
+
+
+async def get_request_settings_snapshot(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> SettingsSnapshot:
+    """FastAPI dependency returning the current user's settings snapshot.
+
+    Bound to the request's read-only session (get_read_db).
+    """
+    return await get_settings_snapshot(db, current_user.id)
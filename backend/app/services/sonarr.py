@@ -146,6 +146,40 @@ async def get_sonarr_tmdb_to_slug_map(server_url: str, api_key: str) -> dict[int
         return {}
 
 
+async def get_sonarr_series_index(
+    server_url: str, api_key: str
+) -> dict[int, tuple[int, str | None]] | None:
+    """
+    Build the TMDB ID -> (Sonarr series ID, titleSlug) index from one series list call.
+
+    Used by the sync to persist the arr index, so page views and deletions
+    never need to download the full series list.
+
+    Returns None on any error so callers can keep the previous index.
+    """
+    server_url = server_url.rstrip("/")
+
+    try:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(
+                f"{server_url}/api/v3/series",
+                headers={"X-Api-Key": api_key},
+            )
+            if response.status_code != 200:
+                return None
+
+            index: dict[int, tuple[int, str | None]] = {}
+            for series in response.json():
+                tmdb_id = series.get("tmdbId")
+                series_id = series.get("id")
+                if tmdb_id and series_id is not None:
+                    title_slug = series.get("titleSlug")
+                    index[int(tmdb_id)] = (int(series_id), str(title_slug) if title_slug else None)
+            return index
+    except (httpx.RequestError, httpx.TimeoutException):
+        return None
+
+
 async def delete_sonarr_series(
     server_url: str, api_key: str, sonarr_id: int, delete_files: bool = True
 ) -> bool:
@@ -176,7 +210,11 @@ async def delete_sonarr_series(
 
 
 async def delete_series_by_tmdb_id(
-    server_url: str, api_key: str, tmdb_id: int, delete_files: bool = True
+    server_url: str,
+    api_key: str,
+    tmdb_id: int,
+    delete_files: bool = True,
+    sonarr_id: int | None = None,
 ) -> tuple[bool, str]:
     """
     Delete a series from Sonarr by TMDB ID.
@@ -186,11 +224,13 @@ async def delete_series_by_tmdb_id(
         api_key: Sonarr API key
         tmdb_id: The TMDB ID of the series
         delete_files: Whether to delete files on disk (default: True)
+        sonarr_id: Sonarr series ID from the arr index; skips the series list lookup
 
     Returns a tuple of (success: bool, message: str).
     """
-    # First, find the Sonarr series ID
-    sonarr_id = await get_sonarr_series_by_tmdb_id(server_url, api_key, tmdb_id)
+    # First, find the Sonarr series ID (unless already known from the arr index)
+    if sonarr_id is None:
+        sonarr_id = await get_sonarr_series_by_tmdb_id(server_url, api_key, tmdb_id)
     if sonarr_id is None:
         return False, f"Series with TMDB ID {tmdb_id} not found in Sonarr"
 
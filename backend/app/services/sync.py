@@ -1,12 +1,14 @@
 """Sync service for fetching and caching data from Jellyfin and Jellyseerr."""
 
 import asyncio
+import hashlib
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
-from typing import Any, TypedDict, cast
+from typing import Any, NamedTuple, TypedDict, cast
 
 import httpx
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -17,12 +19,39 @@ from app.database import (
     User,
     UserNickname,
     UserSettings,
+    bind_tenant,
 )
+from app.services.arr_index import refresh_arr_index
+from app.services.cpu_pool import decode_json_response, run_cpu_bound
 from app.services.encryption import decrypt_value
+from app.services.integration_cache import cached_integration_read, shared_server_read
+from app.services.jellyfin_payloads import decode_items_page
 from app.services.retry import retry_with_backoff
 from app.services.slack import send_slack_message
 from app.services.sonarr import get_decrypted_sonarr_api_key, get_sonarr_history_since
-from app.services.ultra import fetch_ultra_stats, get_decrypted_ultra_api_key
+from app.services.sync_checkpoint import (
+    STAGE_CALCULATING_SIZES,
+    clear_sync_checkpoint,
+    get_sync_checkpoint,
+    set_sync_checkpoint,
+    snapshot_fingerprint,
+)
+from app.services.sync_cost import (
+    current_api_call_count,
+    start_api_call_count,
+    update_expected_duration,
+)
+from app.services.sync_events import (
+    build_completed_event,
+    build_progress_event,
+    publish_sync_event,
+)
+from app.services.sync_progress import (
+    clear_sync_progress,
+    start_sync_progress,
+    update_sync_progress_fields,
+)
+from app.services.ultra import get_cached_ultra_stats, get_decrypted_ultra_api_key
 
 logger = logging.getLogger(__name__)
 
@@ -377,7 +406,7 @@ async def fetch_jellyfin_users(server_url: str, api_key: str) -> list[dict[str,
             users: list[dict[str, Any]] = response.json()
             return users
 
-    return await retry_with_backoff(_fetch, "Jellyfin")
+    return await retry_with_backoff(_fetch, "Jellyfin", host=server_url)
 
 
 async def fetch_jellyseerr_users(server_url: str, api_key: str) -> list[dict[str, Any]]:
@@ -410,6 +439,107 @@ async def fetch_jellyseerr_users(server_url: str, api_key: str) -> list[dict[str
         return []
 
 
+async def get_cached_jellyfin_users(server_url: str, api_key: str) -> list[dict[str, Any]]:
+    """
+    Fetch Jellyfin users through the integration cache.
+
+    The users list is read by several sync stages and the nickname refresh
+    endpoint; a recent answer is reused instead of calling Jellyfin again.
+    """
+    return await cached_integration_read(
+        "jellyfin",
+        server_url,
+        "/Users",
+        lambda: fetch_jellyfin_users(server_url, api_key),
+        credential=api_key,
+    )
+
+
+async def get_cached_jellyseerr_users(server_url: str, api_key: str) -> list[dict[str, Any]]:
+    """
+    Fetch Jellyseerr users through the integration cache.
+
+    Empty results (returned on error) are not cached.
+    """
+    return await cached_integration_read(
+        "jellyseerr",
+        server_url,
+        "/api/v1/user",
+        lambda: fetch_jellyseerr_users(server_url, api_key),
+        credential=api_key,
+        should_cache=bool,
+    )
+
+
+class UserItemsMerger:
+    """
+    Fold the libraries of several Jellyfin users into one list of items.
+
+    Each user's items are folded in as soon as they arrive, so the raw
+    response can be dropped right away: only one copy of each item is kept,
+    with UserData holding the running aggregate across users (same rules as
+    aggregate_user_watch_data).
+
+    Libraries arrive in order of completion, which changes from one sync to
+    the next, so items() returns the items sorted by Id: the same library
+    always merges to the same list (see app.services.sync_checkpoint).
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[str, dict[str, Any]] = {}
+
+    def add(self, user_items: list[dict[str, Any]]) -> None:
+        """
+        Fold one user's items into the aggregate.
+
+        Args:
+            user_items: Items with that user's UserData (left unchanged)
+        """
+        for item in user_items:
+            item_id = item.get("Id")
+            if not item_id:
+                continue
+
+            merged = self._items.get(item_id)
+            # First time seeing this item - store it with empty watch data
+            if merged is None:
+                merged = item.copy()
+                merged["UserData"] = {"Played": False, "PlayCount": 0, "LastPlayedDate": None}
+                self._items[item_id] = merged
+
+            # Fold in this user's watch data
+            user_data = item.get("UserData", {})
+            if user_data.get("PlayCount", 0) > 0 or user_data.get("Played", False):
+                aggregate = merged["UserData"]
+                aggregate["Played"] = aggregate["Played"] or user_data.get("Played", False)
+                aggregate["PlayCount"] += user_data.get("PlayCount", 0)
+                last_played = user_data.get("LastPlayedDate")
+                if last_played and (
+                    aggregate["LastPlayedDate"] is None or last_played > aggregate["LastPlayedDate"]
+                ):
+                    aggregate["LastPlayedDate"] = last_played
+
+    def items(self) -> list[dict[str, Any]]:
+        """Media items with aggregated UserData, sorted by Id."""
+        return [self._items[item_id] for item_id in sorted(self._items)]
+
+
+def merge_user_items(user_item_lists: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """
+    Merge the libraries fetched for each Jellyfin user into one list of items.
+
+    Args:
+        user_item_lists: One list of items (with that user's UserData) per user
+
+    Returns:
+        Media items with aggregated UserData, sorted by Id
+    """
+    merger = UserItemsMerger()
+    for user_items in user_item_lists:
+        merger.add(user_items)
+    return merger.items()
+
+
 async def fetch_user_items(
     client: httpx.AsyncClient,
     server_url: str,
@@ -438,17 +568,14 @@ async def fetch_user_items(
     fields = ",".join(
         [
             "DateCreated",
-            "DateLastSaved",
             "UserData",
             "Path",
-            "Overview",
-            "Genres",
-            "Studios",
-            "People",
             "ProductionYear",
-            "DateLastMediaAdded",
             "MediaSources",
             "ProviderIds",
+            # Series change detection (see series_scan_fingerprint)
+            "DateLastMediaAdded",
+            "ChildCount",
         ]
     )
     params: dict[str, str | int] = {
@@ -469,20 +596,79 @@ async def fetch_user_items(
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
-        items: list[dict[str, Any]] = data.get("Items", [])
-        return items
+        # Full libraries are several MB of JSON: decode only the fields the sync
+        # uses (see app.services.jellyfin_payloads), off the event loop
+        return await decode_json_response(response, decode_items_page)
 
-    items = await retry_with_backoff(_fetch, "Jellyfin")
+    items = await retry_with_backoff(_fetch, "Jellyfin", host=server_url)
     logger.info(f"User {user_name}: {len(items)} items")
     return items
 
 
+# Jellyfin users whose libraries are fetched at the same time
+USER_FETCH_CONCURRENCY = 3
+
+
+async def stream_user_libraries(
+    client: httpx.AsyncClient,
+    server_url: str,
+    api_key: str,
+    users: list[dict[str, Any]],
+) -> AsyncIterator[tuple[dict[str, Any], list[dict[str, Any]] | Exception]]:
+    """
+    Fetch each Jellyfin user's library, yielding them in order of completion.
+
+    At most USER_FETCH_CONCURRENCY fetches run at once; a new one starts as
+    soon as any finishes, so one slow user does not hold back the others.
+    Fetches still running when the caller stops iterating are cancelled.
+
+    Args:
+        client: Shared httpx client
+        server_url: Jellyfin server URL
+        api_key: Jellyfin API key
+        users: Jellyfin users (with Id and Name)
+
+    Yields:
+        (user, items) pairs, or (user, exception) when the fetch failed
+    """
+    semaphore = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+
+    async def _fetch(
+        idx: int, user: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[dict[str, Any]] | Exception]:
+        async with semaphore:
+            try:
+                items = await fetch_user_items(
+                    client,
+                    server_url,
+                    api_key,
+                    user["Id"],
+                    user.get("Name", "Unknown"),
+                    idx + 1,
+                    len(users),
+                )
+            except Exception as e:
+                return user, e
+            return user, items
+
+    tasks = [asyncio.create_task(_fetch(idx, user)) for idx, user in enumerate(users)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def fetch_all_users_media(server_url: str, api_key: str) -> list[dict[str, Any]]:
     """
     Fetch media from all Jellyfin users and aggregate watch data.
 
-    Uses asyncio.gather() to parallelize user fetches (6-15 users expected).
+    User libraries are fetched concurrently through stream_user_libraries: at
+    most USER_FETCH_CONCURRENCY requests run at once, and each library is
+    folded into a UserItemsMerger as soon as it completes, so only the merged
+    result and the in-flight responses are held in memory. The merged items
+    are returned sorted by Id, whatever order the fetches finish in.
 
     Watch data aggregation:
     - played = True if ANY user has watched
@@ -494,7 +680,7 @@ async def fetch_all_users_media(server_url: str, api_key: str) -> list[dict[str,
     server_url = server_url.rstrip("/")
 
     # Fetch list of users
-    users = await fetch_jellyfin_users(server_url, api_key)
+    users = await get_cached_jellyfin_users(server_url, api_key)
 
     if not users:
         logger.warning("No users found in Jellyfin")
@@ -502,75 +688,16 @@ async def fetch_all_users_media(server_url: str, api_key: str) -> list[dict[str,
 
     logger.info(f"Found {len(users)} Jellyfin users, fetching items for each...")
 
-    # Dictionary to store items by ID with watch data from all users
-    items_dict: dict[str, dict[str, Any]] = {}
-
+    merger = UserItemsMerger()
     async with httpx.AsyncClient(timeout=60.0) as client:
-        # Create tasks for all users
-        tasks = [
-            fetch_user_items(
-                client,
-                server_url,
-                api_key,
-                user["Id"],
-                user.get("Name", "Unknown"),
-                idx + 1,
-                len(users),
-            )
-            for idx, user in enumerate(users)
-        ]
-
-        # Execute all user fetches in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results from each user
-        for user, result in zip(users, results):
+        async for user, result in stream_user_libraries(client, server_url, api_key, users):
             if isinstance(result, Exception):
-                logger.warning(
-                    f"Failed to fetch items for user {user.get('Name', 'Unknown')}: {result}"
-                )
+                user_name = user.get("Name", "Unknown")
+                logger.warning(f"Failed to fetch items for user {user_name}: {result}")
                 continue
+            merger.add(result)
 
-            user_items = cast(list[dict[str, Any]], result)
-
-            for item in user_items:
-                item_id = item.get("Id")
-                if not item_id:
-                    continue
-
-                # First time seeing this item - store it
-                if item_id not in items_dict:
-                    # Create a copy without UserData (we'll aggregate UserData separately)
-                    item_copy = item.copy()
-                    item_copy.pop("UserData", None)
-                    items_dict[item_id] = {
-                        "item": item_copy,
-                        "user_data_list": [],
-                    }
-
-                # Add this user's watch data
-                user_data = item.get("UserData", {})
-                if user_data.get("PlayCount", 0) > 0 or user_data.get("Played", False):
-                    items_dict[item_id]["user_data_list"].append(user_data)
-
-    # Convert back to list with aggregated UserData
-    result_items: list[dict[str, Any]] = []
-    for item_id, data in items_dict.items():
-        item = data["item"].copy()
-        user_data_list = data["user_data_list"]
-
-        # Aggregate watch data from all users
-        aggregated = aggregate_user_watch_data(user_data_list)
-
-        # Create aggregated UserData in Jellyfin format
-        item["UserData"] = {
-            "Played": aggregated["played"],
-            "PlayCount": aggregated["play_count"],
-            "LastPlayedDate": aggregated["last_played_date"],
-        }
-
-        result_items.append(item)
-
+    result_items = merger.items()
     logger.info(f"Aggregated {len(result_items)} media items from {len(users)} users")
     return result_items
 
@@ -651,7 +778,7 @@ async def fetch_jellyfin_media_with_progress(
 
     try:
         # Fetch list of users
-        users = await fetch_jellyfin_users(server_url, api_key)
+        users = await get_cached_jellyfin_users(server_url, api_key)
 
         if not users:
             logger.warning("No users found in Jellyfin")
@@ -670,90 +797,28 @@ async def fetch_jellyfin_media_with_progress(
             current_user_name=None,
         )
 
-        # Dictionary to store items by ID with watch data from all users
-        items_dict: dict[str, dict[str, Any]] = {}
+        merger = UserItemsMerger()
+        completed = 0
 
         async with httpx.AsyncClient(timeout=60.0) as client:
-            # Process users sequentially to update progress (with some parallelism)
-            # Batch users in groups of 3 for better progress visibility
-            batch_size = 3
-            for batch_start in range(0, total_users, batch_size):
-                batch_end = min(batch_start + batch_size, total_users)
-                batch_users = users[batch_start:batch_end]
-
-                # Update progress to show first user in current batch
-                first_user_name = batch_users[0].get("Name", "Unknown")
+            async for user, result in stream_user_libraries(client, server_url, api_key, users):
+                completed += 1
+                user_name = user.get("Name", "Unknown")
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to fetch items for {user_name}: {result}")
+                else:
+                    # Fold in right away so the user's response can be released
+                    merger.add(result)
+
+                # Progress counts fetched libraries (they finish in any order)
                 await update_sync_progress(
                     db,
                     user_id,
-                    current_step_progress=batch_start + 1,
-                    current_user_name=first_user_name,
+                    current_step_progress=completed,
+                    current_user_name=user_name,
                 )
 
-                # Create tasks for this batch
-                tasks = [
-                    fetch_user_items(
-                        client,
-                        server_url,
-                        api_key,
-                        user["Id"],
-                        user.get("Name", "Unknown"),
-                        batch_start + idx + 1,
-                        total_users,
-                    )
-                    for idx, user in enumerate(batch_users)
-                ]
-
-                # Execute batch in parallel
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results from this batch
-                for user, result in zip(batch_users, results):
-                    if isinstance(result, Exception):
-                        user_name = user.get("Name", "Unknown")
-                        logger.warning(f"Failed to fetch items for {user_name}: {result}")
-                        continue
-
-                    user_items = cast(list[dict[str, Any]], result)
-
-                    for item in user_items:
-                        item_id = item.get("Id")
-                        if not item_id:
-                            continue
-
-                        # First time seeing this item - store it
-                        if item_id not in items_dict:
-                            # Create a copy without UserData (we'll aggregate UserData separately)
-                            item_copy = item.copy()
-                            item_copy.pop("UserData", None)
-                            items_dict[item_id] = {
-                                "item": item_copy,
-                                "user_data_list": [],
-                            }
-
-                        # Add this user's watch data
-                        user_data = item.get("UserData", {})
-                        if user_data.get("PlayCount", 0) > 0 or user_data.get("Played", False):
-                            items_dict[item_id]["user_data_list"].append(user_data)
-
-        # Convert back to list with aggregated UserData
-        result_items: list[dict[str, Any]] = []
-        for item_id, data in items_dict.items():
-            item = data["item"].copy()
-            user_data_list = data["user_data_list"]
-
-            # Aggregate watch data from all users
-            aggregated = aggregate_user_watch_data(user_data_list)
-
-            # Create aggregated UserData in Jellyfin format
-            item["UserData"] = {
-                "Played": aggregated["played"],
-                "PlayCount": aggregated["play_count"],
-                "LastPlayedDate": aggregated["last_played_date"],
-            }
-
-            result_items.append(item)
-
+        result_items = merger.items()
         logger.info(f"Aggregated {len(result_items)} media items from {total_users} users")
         return result_items
 
@@ -914,7 +979,7 @@ async def fetch_jellyseerr_requests(server_url: str, api_key: str) -> list[dict[
                     result: dict[str, Any] = response.json()
                     return result
 
-                data = await retry_with_backoff(_fetch_page, "Jellyseerr")
+                data = await retry_with_backoff(_fetch_page, "Jellyseerr", host=server_url)
                 page_results = data.get("results", [])
                 page_info = data.get("pageInfo", {})
 
@@ -1244,7 +1309,7 @@ async def fetch_series_seasons(
         seasons: list[dict[str, Any]] = data.get("Items", [])
         return seasons
 
-    return await retry_with_backoff(_fetch, "Jellyfin")
+    return await retry_with_backoff(_fetch, "Jellyfin", host=server_url)
 
 
 async def fetch_season_episodes(
@@ -1285,11 +1350,9 @@ async def fetch_season_episodes(
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
-        episodes: list[dict[str, Any]] = data.get("Items", [])
-        return episodes
+        return await decode_json_response(response, decode_items_page)
 
-    return await retry_with_backoff(_fetch, "Jellyfin")
+    return await retry_with_backoff(_fetch, "Jellyfin", host=server_url)
 
 
 async def fetch_series_episodes(
@@ -1334,11 +1397,9 @@ async def fetch_series_episodes(
             params=params,
         )
         response.raise_for_status()
-        data = response.json()
-        episodes: list[dict[str, Any]] = data.get("Items", [])
-        return episodes
+        return await decode_json_response(response, decode_items_page)
 
-    return await retry_with_backoff(_fetch, "Jellyfin")
+    return await retry_with_backoff(_fetch, "Jellyfin", host=server_url)
 
 
 def calculate_season_total_size(episodes: list[dict[str, Any]]) -> int:
@@ -1465,11 +1526,169 @@ def check_episodes_languages(
     return result
 
 
+class SeriesStats(TypedDict):
+    """Server-level data of a series, independent of the tenant."""
+
+    largest_season_size: int
+    total_size: int
+    episodes: list[dict[str, Any]]  # All episodes, for the language checks
+    last_played_date: str | None  # Most recent play across all Jellyfin users
+
+
+async def fetch_series_stats(
+    client: httpx.AsyncClient,
+    server_url: str,
+    api_key: str,
+    series_id: str,
+    jellyfin_users: list[dict[str, Any]],
+) -> SeriesStats | None:
+    """
+    Fetch the episodes of a series and derive its sizes and last played date.
+
+    Optimized (US-59.4): seasons and episodes are fetched once and reused for
+    size calculation and language checks; watch data is fetched with one call
+    per Jellyfin user at series level.
+
+    Args:
+        client: httpx client
+        server_url: Jellyfin server URL
+        api_key: Jellyfin API key
+        series_id: Jellyfin series ID
+        jellyfin_users: Jellyfin users whose watch data is aggregated
+
+    Returns:
+        SeriesStats, or None if the series has no seasons
+    """
+    # Fetch seasons for this series (ONCE - reused for size + language)
+    seasons = await fetch_series_seasons(client, server_url, api_key, series_id)
+    if not seasons:
+        return None
+
+    # Collect all episodes per season (ONCE - reused for size + language)
+    largest_season_size = 0
+    total_series_size = 0
+    all_episodes: list[dict[str, Any]] = []
+
+    for season in seasons:
+        season_id = season.get("Id")
+        if not season_id:
+            continue
+
+        # Fetch episodes ONCE per season (reused for size AND language)
+        episodes = await fetch_season_episodes(client, server_url, api_key, season_id)
+        all_episodes.extend(episodes)
+
+        # Calculate season size from fetched data
+        season_size = calculate_season_total_size(episodes)
+        total_series_size += season_size
+
+        if season_size > largest_season_size:
+            largest_season_size = season_size
+
+    # Fetch episode watch data from each Jellyfin user
+    # OPTIMIZED: One call per user per series (not per season per user)
+    all_episodes_watch_data: list[dict[str, Any]] = []
+    for jf_user in jellyfin_users:
+        jf_user_id = jf_user.get("Id")
+        if not jf_user_id:
+            continue
+
+        # Fetch ALL episodes for this user at series level (1 call instead of N)
+        user_episodes = await fetch_series_episodes(
+            client, server_url, api_key, series_id, jf_user_id
+        )
+        all_episodes_watch_data.extend(user_episodes)
+
+    return {
+        "largest_season_size": largest_season_size,
+        "total_size": total_series_size,
+        "episodes": all_episodes,
+        # Aggregate last_played_date from all users' episode data
+        "last_played_date": get_most_recent_episode_played_date(all_episodes_watch_data),
+    }
+
+
+# Series processed between commits (and checkpoints) of calculate_season_sizes
+SEASON_SIZES_COMMIT_CHUNK = 50
+
+
+class SeriesScan(NamedTuple):
+    """Deep-scan results of a series, carried forward while it is unchanged."""
+
+    fingerprint: str
+    size_bytes: int | None
+    largest_season_size_bytes: int | None
+    last_played_date: str | None
+    language_check_result: dict[str, Any] | None
+    problematic_episodes: list[dict[str, Any]] | None
+
+
+def series_scan_fingerprint(
+    item: dict[str, Any], exempt_episodes: list[tuple[int, int]] | None = None
+) -> str:
+    """
+    Fingerprint what a series' deep scan depends on.
+
+    Built from the top-level library fetch: DateLastMediaAdded and ChildCount
+    change when episodes or seasons are added, and the aggregated UserData
+    when anyone watches an episode. The user's exempt episodes of the series
+    are included because they change the language check result.
+
+    Args:
+        item: Series item (raw_data) with aggregated UserData
+        exempt_episodes: (season, episode) pairs exempt from language checks
+
+    Returns:
+        Hex digest identifying the series state
+    """
+    user_data = item.get("UserData") or {}
+    state = (
+        item.get("DateLastMediaAdded"),
+        item.get("ChildCount"),
+        user_data.get("Played", False),
+        user_data.get("PlayCount", 0),
+        user_data.get("LastPlayedDate"),
+        sorted(exempt_episodes or []),
+    )
+    return hashlib.sha256(repr(state).encode()).hexdigest()
+
+
+async def load_series_scans(db: AsyncSession, user_id: int) -> dict[str, SeriesScan]:
+    """
+    Load the deep-scan results of the user's cached series.
+
+    cache_media_items carries these results over to the rows it re-creates,
+    so they also survive a sync interrupted before its series were scanned.
+
+    Returns:
+        SeriesScan per Jellyfin series ID, for series scanned by a previous sync
+    """
+    result = await db.execute(
+        select(
+            CachedMediaItem.jellyfin_id,
+            CachedMediaItem.scan_fingerprint,
+            CachedMediaItem.size_bytes,
+            CachedMediaItem.largest_season_size_bytes,
+            CachedMediaItem.last_played_date,
+            CachedMediaItem.language_check_result,
+            CachedMediaItem.problematic_episodes,
+        ).where(
+            CachedMediaItem.user_id == user_id,
+            CachedMediaItem.media_type == "Series",
+            CachedMediaItem.scan_fingerprint.isnot(None),
+        )
+    )
+    return {row[0]: SeriesScan(*row[1:]) for row in result.all()}
+
+
 async def calculate_season_sizes(
     db: AsyncSession,
     user_id: int,
     server_url: str,
     api_key: str,
+    resume_after: str | None = None,
+    checkpoint_snapshot: str | None = None,
+    previous_scans: dict[str, SeriesScan] | None = None,
 ) -> None:
     """
     Calculate and store season sizes, total series size, last_played_date,
@@ -1483,28 +1702,42 @@ async def calculate_season_sizes(
     This function:
     1. Fetches all series from cached_media_items for the user
     2. Fetches all Jellyfin users (to aggregate watch data across users)
-    3. For each series:
+    3. Skips series whose series_scan_fingerprint matches their previous scan,
+       carrying forward sizes, last_played_date and language results
+    4. For each other series, gets its SeriesStats (see fetch_series_stats), shared
+       by the tenants of one server during a group sync:
        a. Fetches seasons once (reused for size + language)
        b. Fetches episodes once per season (reused for size + language)
        c. Fetches episodes once per user (batched at series level)
-    4. Stores largest_season_size_bytes, size_bytes, last_played_date,
-       language_check_result, problematic_episodes
+    5. Checks languages against the user's own episode exemptions
+    6. Stores largest_season_size_bytes, size_bytes, last_played_date,
+       language_check_result, problematic_episodes and scan_fingerprint
+
+    Series are visited in jellyfin_id order and committed every
+    SEASON_SIZES_COMMIT_CHUNK series. With a checkpoint_snapshot, each commit
+    also records the last series as the checkpoint (see
+    app.services.sync_checkpoint) so an interrupted run can resume after it.
 
     Args:
         db: Database session
         user_id: User ID
         server_url: Jellyfin server URL
         api_key: Decrypted Jellyfin API key
+        resume_after: Skip series up to this jellyfin_id (already committed)
+        checkpoint_snapshot: Fingerprint of the library, to record checkpoints
+        previous_scans: Results of the previous sync (see load_series_scans)
     """
     server_url = server_url.rstrip("/")
 
     # Fetch all series from cache
-    result = await db.execute(
-        select(CachedMediaItem).where(
-            CachedMediaItem.user_id == user_id,
-            CachedMediaItem.media_type == "Series",
-        )
+    query = select(CachedMediaItem).where(
+        CachedMediaItem.user_id == user_id,
+        CachedMediaItem.media_type == "Series",
     )
+    if resume_after is not None:
+        query = query.where(CachedMediaItem.jellyfin_id > resume_after)
+        logger.info(f"Resuming season size calculation for user {user_id} after {resume_after}")
+    result = await db.execute(query.order_by(CachedMediaItem.jellyfin_id))
     series_items = result.scalars().all()
 
     if not series_items:
@@ -1517,52 +1750,71 @@ async def calculate_season_sizes(
     exempt_episodes = await get_episode_exempt_set(db, user_id)
     if exempt_episodes:
         logger.debug(f"Found {len(exempt_episodes)} exempt episodes for user {user_id}")
+    exempt_by_series: dict[str, list[tuple[int, int]]] = {}
+    for series_id, season_num, episode_num in exempt_episodes or ():
+        exempt_by_series.setdefault(series_id, []).append((season_num, episode_num))
+    previous_scans = previous_scans or {}
+    unchanged_count = 0
 
     # Fetch Jellyfin users to aggregate watch data
-    jellyfin_users = await fetch_jellyfin_users(server_url, api_key)
+    jellyfin_users = await get_cached_jellyfin_users(server_url, api_key)
     if not jellyfin_users:
         logger.warning("No Jellyfin users found, episode watch data will not be aggregated")
 
     logger.info(f"Calculating season sizes for {len(series_items)} series...")
 
+    async def _commit_chunk(last_series_id: str) -> None:
+        if checkpoint_snapshot is not None:
+            await set_sync_checkpoint(
+                db, user_id, STAGE_CALCULATING_SIZES, checkpoint_snapshot, last_series_id
+            )
+        # Commit to release database locks and keep the work done so far
+        await db.commit()
+
     async with httpx.AsyncClient(timeout=60.0) as client:
-        for series in series_items:
+        for index, series in enumerate(series_items, start=1):
+            if index > 1 and (index - 1) % SEASON_SIZES_COMMIT_CHUNK == 0:
+                await _commit_chunk(series_items[index - 2].jellyfin_id)
+
+            fingerprint = series_scan_fingerprint(
+                series.raw_data or {}, exempt_by_series.get(series.jellyfin_id)
+            )
+            previous = previous_scans.get(series.jellyfin_id)
+            if previous is not None and previous.fingerprint == fingerprint:
+                # Nothing changed since the last scan: carry its results forward
+                series.size_bytes = previous.size_bytes
+                series.largest_season_size_bytes = previous.largest_season_size_bytes
+                series.last_played_date = previous.last_played_date
+                series.language_check_result = previous.language_check_result
+                series.problematic_episodes = previous.problematic_episodes
+                series.scan_fingerprint = fingerprint
+                unchanged_count += 1
+                continue
+
             try:
-                # Fetch seasons for this series (ONCE - reused for size + language)
-                seasons = await fetch_series_seasons(
-                    client, server_url, api_key, series.jellyfin_id
+                # Server-level statistics are shared by tenants of the same server
+                stats = await shared_server_read(
+                    "jellyfin",
+                    server_url,
+                    "series_stats",
+                    lambda: fetch_series_stats(
+                        client, server_url, api_key, series.jellyfin_id, jellyfin_users
+                    ),
+                    credential=api_key,
+                    params={"SeriesId": series.jellyfin_id},
                 )
 
-                if not seasons:
+                if stats is None:
                     logger.debug(f"No seasons found for series '{series.name}'")
+                    series.scan_fingerprint = fingerprint
                     continue
 
-                # Collect all episodes per season (ONCE - reused for size + language)
-                largest_season_size = 0
-                total_series_size = 0
-                all_episodes: list[dict[str, Any]] = []
-
-                for season in seasons:
-                    season_id = season.get("Id")
-                    if not season_id:
-                        continue
-
-                    # Fetch episodes ONCE per season (reused for size AND language)
-                    episodes = await fetch_season_episodes(client, server_url, api_key, season_id)
-                    all_episodes.extend(episodes)
-
-                    # Calculate season size from fetched data
-                    season_size = calculate_season_total_size(episodes)
-                    total_series_size += season_size
-
-                    if season_size > largest_season_size:
-                        largest_season_size = season_size
-
                 # Check language tracks using already-fetched episode data (no extra API calls)
-                lang_result = check_episodes_languages(
-                    all_episodes,
+                lang_result = await run_cpu_bound(
+                    check_episodes_languages,
+                    stats["episodes"],
                     series.jellyfin_id,
-                    exempt_episodes=exempt_episodes if exempt_episodes else None,
+                    exempt_episodes if exempt_episodes else None,
                 )
                 series.language_check_result = dict(lang_result["language_check_result"])
                 series.problematic_episodes = [
@@ -1575,21 +1827,9 @@ async def calculate_season_sizes(
                         f"episodes with language issues"
                     )
 
-                # Fetch episode watch data from each Jellyfin user
-                # OPTIMIZED: One call per user per series (not per season per user)
-                all_episodes_watch_data: list[dict[str, Any]] = []
-                for jf_user in jellyfin_users:
-                    jf_user_id = jf_user.get("Id")
-                    if not jf_user_id:
-                        continue
-
-                    # Fetch ALL episodes for this user at series level (1 call instead of N)
-                    user_episodes = await fetch_series_episodes(
-                        client, server_url, api_key, series.jellyfin_id, jf_user_id
-                    )
-                    all_episodes_watch_data.extend(user_episodes)
-
                 # Update the series with sizes
+                largest_season_size = stats["largest_season_size"]
+                total_series_size = stats["total_size"]
                 if largest_season_size > 0:
                     series.largest_season_size_bytes = largest_season_size
                 if total_series_size > 0:
@@ -1600,19 +1840,24 @@ async def calculate_season_sizes(
                         f"largest season = {largest_season_size / (1024**3):.2f} GB"
                     )
 
-                # Aggregate last_played_date from all users' episode data
-                series_last_played = get_most_recent_episode_played_date(all_episodes_watch_data)
+                series_last_played = stats["last_played_date"]
                 if series_last_played:
                     series.last_played_date = series_last_played
                     logger.debug(f"Series '{series.name}': last_played_date = {series_last_played}")
 
+                series.scan_fingerprint = fingerprint
+
             except (httpx.RequestError, httpx.HTTPStatusError) as e:
                 logger.warning(f"Failed to calculate season sizes for series '{series.name}': {e}")
                 # Continue to next series on error
                 continue
 
-    # Commit to release database locks
-    await db.commit()
+    await _commit_chunk(series_items[-1].jellyfin_id)
+    if unchanged_count:
+        logger.info(
+            f"Skipped deep scan of {unchanged_count}/{len(series_items)} unchanged series "
+            f"for user {user_id}"
+        )
 
 
 def check_movie_audio_languages(item: dict[str, Any]) -> LanguageCheckResult:
@@ -1634,12 +1879,20 @@ async def cache_media_items(db: AsyncSession, user_id: int, items: list[dict[str
 
     Commits immediately after caching to release database locks.
     For movies, also checks and stores language_check_result from raw_data.MediaSources.
+    Series keep the deep-scan results of their previous row (see load_series_scans):
+    calculate_season_sizes decides from scan_fingerprint whether to rescan them,
+    including when it resumes from a checkpoint and never visits the earlier series.
     """
+    # Bulk INSERTs carry no user criteria: route them to the user's shard explicitly
+    bind_tenant(db, user_id)
+
+    previous_scans = await load_series_scans(db, user_id)
+
     # Delete existing cached items for this user
     await db.execute(delete(CachedMediaItem).where(CachedMediaItem.user_id == user_id))
 
-    # Insert new items
-    cached_count = 0
+    # Insert new items with one multi-row INSERT (executemany) instead of ORM units of work
+    rows: list[dict[str, Any]] = []
     for item in items:
         user_data = item.get("UserData", {})
         media_type = item.get("Type", "Unknown")
@@ -1649,23 +1902,36 @@ async def cache_media_items(db: AsyncSession, user_id: int, items: list[dict[str
         if media_type == "Movie":
             language_check_result = check_movie_audio_languages(item)
 
-        cached_item = CachedMediaItem(
-            user_id=user_id,
-            jellyfin_id=item.get("Id", ""),
-            name=item.get("Name", "Unknown"),
-            media_type=media_type,
-            production_year=item.get("ProductionYear"),
-            date_created=item.get("DateCreated"),
-            path=item.get("Path"),
-            size_bytes=extract_size_from_item(item),
-            played=user_data.get("Played", False),
-            play_count=user_data.get("PlayCount", 0),
-            last_played_date=user_data.get("LastPlayedDate"),
-            raw_data=item,
-            language_check_result=language_check_result,  # Store movie language check
+        rows.append(
+            {
+                "user_id": user_id,
+                "jellyfin_id": item.get("Id", ""),
+                "name": item.get("Name", "Unknown"),
+                "media_type": media_type,
+                "production_year": item.get("ProductionYear"),
+                "date_created": item.get("DateCreated"),
+                "path": item.get("Path"),
+                "size_bytes": extract_size_from_item(item),
+                "played": user_data.get("Played", False),
+                "play_count": user_data.get("PlayCount", 0),
+                "last_played_date": user_data.get("LastPlayedDate"),
+                "raw_data": item,
+                "language_check_result": language_check_result,  # Store movie language check
+            }
         )
-        db.add(cached_item)
-        cached_count += 1
+        previous = previous_scans.get(rows[-1]["jellyfin_id"]) if media_type == "Series" else None
+        if previous is not None:
+            rows[-1].update(
+                scan_fingerprint=previous.fingerprint,
+                size_bytes=previous.size_bytes,
+                largest_season_size_bytes=previous.largest_season_size_bytes,
+                last_played_date=previous.last_played_date,
+                language_check_result=previous.language_check_result,
+                problematic_episodes=previous.problematic_episodes,
+            )
+    if rows:
+        await db.execute(insert(CachedMediaItem), rows)
+    cached_count = len(rows)
 
     # Commit to release database locks (important for SQLite concurrency)
     await db.commit()
@@ -1689,13 +1955,15 @@ async def cache_jellyseerr_requests(
         sonarr_history: Optional dict mapping TMDB ID to list of episode additions.
             If provided, TV show requests will have sonarr_history added to raw_data.
     """
+    bind_tenant(db, user_id)
+
     # Delete existing cached requests for this user
     await db.execute(
         delete(CachedJellyseerrRequest).where(CachedJellyseerrRequest.user_id == user_id)
     )
 
-    # Insert new requests
-    cached_count = 0
+    # Insert new requests with one multi-row INSERT (executemany)
+    rows: list[dict[str, Any]] = []
     for req in requests:
         media = req.get("media", {})
         requested_by = req.get("requestedBy", {})
@@ -1718,22 +1986,26 @@ async def cache_jellyseerr_requests(
         if sonarr_history and media_type == "tv" and tmdb_id and tmdb_id in sonarr_history:
             raw_data["sonarr_history"] = sonarr_history[tmdb_id]
 
-        cached_request = CachedJellyseerrRequest(
-            user_id=user_id,
-            jellyseerr_id=req.get("id", 0),
-            jellyseerr_media_id=media.get("id"),  # media.id for deletion (distinct from request.id)
-            tmdb_id=tmdb_id,
-            media_type=media_type,
-            status=req.get("status", 0),
-            title=title,
-            title_fr=title_fr,
-            requested_by=requested_by.get("displayName"),
-            created_at_source=req.get("createdAt"),
-            release_date=release_date,
-            raw_data=raw_data,
+        rows.append(
+            {
+                "user_id": user_id,
+                "jellyseerr_id": req.get("id", 0),
+                # media.id for deletion (distinct from request.id)
+                "jellyseerr_media_id": media.get("id"),
+                "tmdb_id": tmdb_id,
+                "media_type": media_type,
+                "status": req.get("status", 0),
+                "title": title,
+                "title_fr": title_fr,
+                "requested_by": requested_by.get("displayName"),
+                "created_at_source": req.get("createdAt"),
+                "release_date": release_date,
+                "raw_data": raw_data,
+            }
         )
-        db.add(cached_request)
-        cached_count += 1
+    if rows:
+        await db.execute(insert(CachedJellyseerrRequest), rows)
+    cached_count = len(rows)
 
     # Commit to release database locks (important for SQLite concurrency)
     await db.commit()
@@ -1809,6 +2081,23 @@ async def prefill_user_nicknames(
     return created_count
 
 
+def _record_sync_cost(sync_status: SyncStatus, status: str, completed: datetime) -> None:
+    """Store the duration and API calls of the sync that just finished."""
+    started = sync_status.last_sync_started
+    if started is None:
+        return
+    if started.tzinfo is None:
+        started = started.replace(tzinfo=UTC)  # SQLite returns naive datetimes
+    duration = max((completed - started).total_seconds(), 0.0)
+    sync_status.last_sync_duration_seconds = duration
+    sync_status.last_sync_api_calls = current_api_call_count()
+    # Failed and partial syncs stop early and would underestimate the next one
+    if status == "success":
+        sync_status.expected_sync_seconds = update_expected_duration(
+            sync_status.expected_sync_seconds, duration
+        )
+
+
 async def update_sync_status(
     db: AsyncSession,
     user_id: int,
@@ -1825,8 +2114,24 @@ async def update_sync_status(
 ) -> None:
     """Update sync status for a user.
 
+    Only the start and terminal states are persisted to SyncStatus. Progress
+    fields live in the Redis progress store (falling back to the SyncStatus
+    columns when Redis is unavailable).
+
+    Terminal updates also record the sync's duration and API call count, and
+    fold successful durations into expected_sync_seconds (see app.services.sync_cost).
+
     Commits immediately to release database locks and make status visible to other connections.
     """
+    # Keep progress fields out of the database when the Redis store is available
+    db_current_step = current_step
+    db_total_steps = total_steps
+    if started:
+        start_api_call_count()
+        if await start_sync_progress(user_id, current_step, total_steps):
+            db_current_step = None
+            db_total_steps = None
+
     result = await db.execute(select(SyncStatus).where(SyncStatus.user_id == user_id))
     sync_status = result.scalar_one_or_none()
 
@@ -1836,8 +2141,8 @@ async def update_sync_status(
         if started:
             sync_status.last_sync_started = now
             # Reset progress fields when starting
-            sync_status.current_step = current_step
-            sync_status.total_steps = total_steps
+            sync_status.current_step = db_current_step
+            sync_status.total_steps = db_total_steps
             sync_status.current_step_progress = None
             sync_status.current_step_total = None
             sync_status.current_user_name = None
@@ -1847,6 +2152,7 @@ async def update_sync_status(
             sync_status.last_sync_error = error
             sync_status.media_items_count = media_count
             sync_status.requests_count = requests_count
+            _record_sync_cost(sync_status, status, now)
             # Clear progress fields when complete
             sync_status.current_step = None
             sync_status.total_steps = None
@@ -1862,8 +2168,8 @@ async def update_sync_status(
             last_sync_error=error,
             media_items_count=media_count,
             requests_count=requests_count,
-            current_step=current_step if started else None,
-            total_steps=total_steps if started else None,
+            current_step=db_current_step if started else None,
+            total_steps=db_total_steps if started else None,
             current_step_progress=None,
             current_step_total=None,
             current_user_name=None,
@@ -1873,6 +2179,14 @@ async def update_sync_status(
     # Commit to release database locks
     await db.commit()
 
+    # Push to live dashboards (SSE) after the row is visible to other connections
+    if started:
+        progress = {"current_step": current_step, "total_steps": total_steps}
+        await publish_sync_event(user_id, build_progress_event(user_id, progress))
+    else:
+        await clear_sync_progress(user_id)
+        await publish_sync_event(user_id, build_completed_event(sync_status))
+
 
 async def update_sync_progress(
     db: AsyncSession,
@@ -1884,12 +2198,27 @@ async def update_sync_progress(
 ) -> None:
     """Update sync progress for a user (without changing overall status).
 
-    Commits immediately to release database locks and make progress visible to other connections.
+    Writes to the Redis progress store; only falls back to a SyncStatus
+    SELECT + COMMIT when Redis is unavailable. None values are left unchanged.
     """
-    result = await db.execute(select(SyncStatus).where(SyncStatus.user_id == user_id))
-    sync_status = result.scalar_one_or_none()
+    fields: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("current_step", current_step),
+            ("current_step_progress", current_step_progress),
+            ("current_step_total", current_step_total),
+            ("current_user_name", current_user_name),
+        )
+        if value is not None
+    }
+
+    progress = await update_sync_progress_fields(user_id, fields)
+    if progress is None:
+        result = await db.execute(select(SyncStatus).where(SyncStatus.user_id == user_id))
+        sync_status = result.scalar_one_or_none()
+        if not sync_status:
+            return
 
-    if sync_status:
         if current_step is not None:
             sync_status.current_step = current_step
         if current_step_progress is not None:
@@ -1900,6 +2229,15 @@ async def update_sync_progress(
             sync_status.current_user_name = current_user_name
         # Commit to release database locks
         await db.commit()
+        progress = {
+            "current_step": sync_status.current_step,
+            "total_steps": sync_status.total_steps,
+            "current_step_progress": sync_status.current_step_progress,
+            "current_step_total": sync_status.current_step_total,
+            "current_user_name": sync_status.current_user_name,
+        }
+
+    await publish_sync_event(user_id, build_progress_event(user_id, progress))
 
 
 async def get_sync_status(db: AsyncSession, user_id: int) -> SyncStatus | None:
@@ -1915,7 +2253,8 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
     Fetches data from Jellyfin and Jellyseerr (if configured),
     and caches it in the database.
 
-    Updates progress in sync_status table for frontend polling.
+    Updates progress in sync_status table for frontend polling and publishes
+    each update as a live sync event (SSE).
     Sends Slack notifications on sync failures.
     """
     # Get user settings
@@ -1967,27 +2306,48 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
         current_step="refreshing_libraries",
     )
 
-    jellyfin_refresh_success = await trigger_jellyfin_library_refresh(
-        settings.jellyfin_server_url, jellyfin_api_key
-    )
-    if jellyfin_refresh_success:
+    jellyfin_server_url = settings.jellyfin_server_url
+
+    async def _refresh_jellyfin_library() -> bool:
+        if not await trigger_jellyfin_library_refresh(jellyfin_server_url, jellyfin_api_key):
+            return False
         # Wait for scan to complete (non-blocking on timeout)
-        await wait_for_jellyfin_scan_completion(settings.jellyfin_server_url, jellyfin_api_key)
-    else:
+        await wait_for_jellyfin_scan_completion(jellyfin_server_url, jellyfin_api_key)
+        return True
+
+    # Tenants of the same server synced together scan the library only once
+    jellyfin_refresh_success = await shared_server_read(
+        "jellyfin",
+        jellyfin_server_url,
+        "/Library/Refresh",
+        _refresh_jellyfin_library,
+        credential=jellyfin_api_key,
+        should_cache=bool,
+    )
+    if not jellyfin_refresh_success:
         logger.warning(f"Jellyfin library refresh failed for user {user_id}, continuing with sync")
 
     # Trigger Jellyseerr library sync if configured
     if has_jellyseerr and settings.jellyseerr_server_url and settings.jellyseerr_api_key_encrypted:
         jellyseerr_api_key = decrypt_value(settings.jellyseerr_api_key_encrypted)
-        jellyseerr_sync_success = await trigger_jellyseerr_library_sync(
-            settings.jellyseerr_server_url, jellyseerr_api_key
-        )
-        if jellyseerr_sync_success:
+        jellyseerr_server_url = settings.jellyseerr_server_url
+
+        async def _sync_jellyseerr_library() -> bool:
+            if not await trigger_jellyseerr_library_sync(jellyseerr_server_url, jellyseerr_api_key):
+                return False
             # Wait for sync to complete (non-blocking on timeout)
-            await wait_for_jellyseerr_sync_completion(
-                settings.jellyseerr_server_url, jellyseerr_api_key
-            )
-        else:
+            await wait_for_jellyseerr_sync_completion(jellyseerr_server_url, jellyseerr_api_key)
+            return True
+
+        jellyseerr_sync_success = await shared_server_read(
+            "jellyseerr",
+            jellyseerr_server_url,
+            "/api/v1/settings/jellyfin/sync",
+            _sync_jellyseerr_library,
+            credential=jellyseerr_api_key,
+            should_cache=bool,
+        )
+        if not jellyseerr_sync_success:
             logger.warning(
                 f"Jellyseerr library sync failed for user {user_id}, continuing with sync"
             )
@@ -1999,11 +2359,36 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
             user_id,
             current_step="syncing_media",
         )
-        items = await fetch_jellyfin_media_with_progress(
-            settings.jellyfin_server_url, jellyfin_api_key, db, user_id
+        items = await shared_server_read(
+            "jellyfin",
+            jellyfin_server_url,
+            "/Users/Items",
+            lambda: fetch_jellyfin_media_with_progress(
+                jellyfin_server_url, jellyfin_api_key, db, user_id
+            ),
+            credential=jellyfin_api_key,
         )
-        media_count = await cache_media_items(db, user_id, items)
-        logger.info(f"Cached {media_count} media items for user {user_id}")
+        # Deep-scan results of the previous syncs, for series that didn't change
+        previous_scans = await load_series_scans(db, user_id)
+
+        # Resume an interrupted size calculation if the library didn't change since
+        snapshot = await run_cpu_bound(snapshot_fingerprint, items)
+        checkpoint = await get_sync_checkpoint(db, user_id)
+        resume_after: str | None = None
+        if (
+            checkpoint
+            and checkpoint.stage == STAGE_CALCULATING_SIZES
+            and checkpoint.snapshot == snapshot
+        ):
+            # Cached rows already match this library and hold the sizes committed so far
+            media_count = len(items)
+            resume_after = checkpoint.position
+            logger.info(f"Library unchanged for user {user_id}, resuming from checkpoint")
+        else:
+            media_count = await cache_media_items(db, user_id, items)
+            logger.info(f"Cached {media_count} media items for user {user_id}")
+            await set_sync_checkpoint(db, user_id, STAGE_CALCULATING_SIZES, snapshot, None)
+            await db.commit()
 
         # Calculate season sizes for series (background task after main sync)
         await update_sync_progress(
@@ -2014,16 +2399,28 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
             current_step_total=None,
             current_user_name=None,
         )
-        await calculate_season_sizes(db, user_id, settings.jellyfin_server_url, jellyfin_api_key)
+        await calculate_season_sizes(
+            db,
+            user_id,
+            settings.jellyfin_server_url,
+            jellyfin_api_key,
+            resume_after=resume_after,
+            checkpoint_snapshot=snapshot,
+            previous_scans=previous_scans,
+        )
+        await clear_sync_checkpoint(db, user_id)
+        await db.commit()
 
         # Prefill user nicknames from Jellyfin users
-        jellyfin_users = await fetch_jellyfin_users(settings.jellyfin_server_url, jellyfin_api_key)
+        jellyfin_users = await get_cached_jellyfin_users(
+            settings.jellyfin_server_url, jellyfin_api_key
+        )
 
         # Fetch Jellyseerr users if configured (to mark has_jellyseerr_account)
         jellyseerr_users: list[dict[str, Any]] = []
         if settings.jellyseerr_server_url and settings.jellyseerr_api_key_encrypted:
             jellyseerr_api_key = decrypt_value(settings.jellyseerr_api_key_encrypted)
-            jellyseerr_users = await fetch_jellyseerr_users(
+            jellyseerr_users = await get_cached_jellyseerr_users(
                 settings.jellyseerr_server_url, jellyseerr_api_key
             )
 
@@ -2065,8 +2462,13 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
             )
 
             jellyseerr_api_key = decrypt_value(settings.jellyseerr_api_key_encrypted)
-            requests_data = await fetch_jellyseerr_requests(
-                settings.jellyseerr_server_url, jellyseerr_api_key
+            jellyseerr_server_url = settings.jellyseerr_server_url
+            requests_data = await shared_server_read(
+                "jellyseerr",
+                jellyseerr_server_url,
+                "/api/v1/request",
+                lambda: fetch_jellyseerr_requests(jellyseerr_server_url, jellyseerr_api_key),
+                credential=jellyseerr_api_key,
             )
 
             # Fetch Sonarr history if Sonarr is configured (US-63.1)
@@ -2111,12 +2513,23 @@ async def run_user_sync(db: AsyncSession, user_id: int) -> dict[str, Any]:
         except Exception:
             pass  # Don't let notification failure affect sync error handling
 
+    # Rebuild the Sonarr/Radarr ID index (if configured) - non-blocking
+    # Library/issues pages and deletions read it instead of calling *arr per request
+    try:
+        arr_counts = await refresh_arr_index(db, user_id, settings)
+        if arr_counts:
+            logger.info(f"Refreshed arr index for user {user_id}: {arr_counts}")
+    except Exception as e:
+        # Index failure is not critical - links and deletions fall back gracefully
+        await db.rollback()
+        logger.warning(f"Arr index refresh failed for user {user_id}: {str(e)}")
+
     # Fetch Ultra.cc stats (if configured) - non-blocking
     try:
         if settings.ultra_api_url and settings.ultra_api_key_encrypted:
             ultra_api_key = get_decrypted_ultra_api_key(settings)
             if ultra_api_key:
-                ultra_stats = await fetch_ultra_stats(settings.ultra_api_url, ultra_api_key)
+                ultra_stats = await get_cached_ultra_stats(settings.ultra_api_url, ultra_api_key)
                 if ultra_stats:
                     # Store stats in UserSettings
                     settings.ultra_free_storage_gb = ultra_stats["free_storage_gb"]
@@ -0,0 +1,91 @@
+"""Resumable sync checkpoints.
+
+Season size calculation visits every series of the library, several API calls
+each; on huge libraries it can run into the 30-minute task time limit. It now
+commits in chunks and records a checkpoint on the user's SyncStatus row:
+
+- checkpoint_stage: the stage being resumed ("calculating_sizes");
+- checkpoint_snapshot: fingerprint of the Jellyfin items the stage started from;
+- checkpoint_position: the last series committed (series are visited in
+  jellyfin_id order).
+
+The next sync fetches the library again. If its fingerprint matches the
+checkpoint, the cached rows (with the sizes already committed) are kept and
+the stage resumes after checkpoint_position; otherwise the library is cached
+from scratch and the checkpoint starts over.
+
+Checkpoint helpers only stage changes; callers commit them together with the
+work they describe.
+"""
+
+import hashlib
+from typing import Any, NamedTuple
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import SyncStatus
+
+STAGE_CALCULATING_SIZES = "calculating_sizes"
+
+
+class SyncCheckpoint(NamedTuple):
+    """Where an interrupted stage stopped."""
+
+    stage: str
+    snapshot: str
+    position: str | None  # Last processed item, None if nothing was committed yet
+
+
+def snapshot_fingerprint(items: list[dict[str, Any]]) -> str:
+    """Fingerprint the Jellyfin items a sync works from.
+
+    Items are hashed in Id order: the merged library's order depends on which
+    user's library arrived first, and must not invalidate the checkpoint.
+    """
+    ordered = sorted(items, key=lambda item: str(item.get("Id") or ""))
+    return hashlib.sha256(orjson.dumps(ordered, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+async def _get_sync_status_row(db: AsyncSession, user_id: int) -> SyncStatus | None:
+    result = await db.execute(select(SyncStatus).where(SyncStatus.user_id == user_id))
+    return result.scalar_one_or_none()
+
+
+async def get_sync_checkpoint(db: AsyncSession, user_id: int) -> SyncCheckpoint | None:
+    """Get the user's checkpoint, if a stage was interrupted."""
+    sync_status = await _get_sync_status_row(db, user_id)
+    if not sync_status or not sync_status.checkpoint_stage or not sync_status.checkpoint_snapshot:
+        return None
+    return SyncCheckpoint(
+        sync_status.checkpoint_stage,
+        sync_status.checkpoint_snapshot,
+        sync_status.checkpoint_position,
+    )
+
+
+async def set_sync_checkpoint(
+    db: AsyncSession,
+    user_id: int,
+    stage: str,
+    snapshot: str,
+    position: str | None,
+) -> None:
+    """Record progress of a stage (committed with the caller's next commit)."""
+    sync_status = await _get_sync_status_row(db, user_id)
+    if sync_status is None:
+        return
+    sync_status.checkpoint_stage = stage
+    sync_status.checkpoint_snapshot = snapshot
+    sync_status.checkpoint_position = position
+
+
+async def clear_sync_checkpoint(db: AsyncSession, user_id: int) -> None:
+    """Forget the checkpoint once its stage completed."""
+    sync_status = await _get_sync_status_row(db, user_id)
+    if sync_status is None:
+        return
+    sync_status.checkpoint_stage = None
+    sync_status.checkpoint_snapshot = None
+    sync_status.checkpoint_position = None
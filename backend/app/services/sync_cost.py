@@ -0,0 +1,56 @@
+"""Per-user sync cost history used to plan the nightly fan-out.
+
+Each sync records its duration and the number of integration API calls it
+made on SyncStatus. The expected duration is an exponentially weighted moving
+average of successful syncs, so one slow night doesn't reorder everything;
+sync_all_users dispatches the longest expected jobs first (see
+app.services.sync_schedule).
+
+API calls are counted per sync through a context variable: update_sync_status
+starts a count when a sync starts, retry_with_backoff records every attempt,
+and the terminal update_sync_status stores the total.
+"""
+
+from contextvars import ContextVar
+
+# Weight of the latest observation in the expected duration
+EXPECTED_DURATION_ALPHA = 0.3
+
+# A list so tasks spawned by gather() (which copy the context) add to the same count
+_api_calls: ContextVar[list[int] | None] = ContextVar("sync_api_calls", default=None)
+
+
+def start_api_call_count() -> None:
+    """Start counting API calls for the sync running in this context."""
+    _api_calls.set([0])
+
+
+def record_api_call() -> None:
+    """Count one API call towards the current sync, if any."""
+    counter = _api_calls.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def current_api_call_count() -> int | None:
+    """Get the number of API calls made by the current sync (None outside a sync)."""
+    counter = _api_calls.get()
+    return counter[0] if counter is not None else None
+
+
+def update_expected_duration(expected_seconds: float | None, observed_seconds: float) -> float:
+    """Blend an observed sync duration into the expected duration.
+
+    Args:
+        expected_seconds: Current expected duration, None without history
+        observed_seconds: Duration of the sync that just finished
+
+    Returns:
+        The new expected duration in seconds
+    """
+    if expected_seconds is None:
+        return observed_seconds
+    return (
+        EXPECTED_DURATION_ALPHA * observed_seconds
+        + (1 - EXPECTED_DURATION_ALPHA) * expected_seconds
+    )
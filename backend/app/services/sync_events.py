@@ -0,0 +1,163 @@
+"""Push-based sync progress events over Redis pub/sub.
+
+The Celery worker publishes a progress event every time run_user_sync reports
+progress; the API relays them to the browser as Server-Sent Events.
+Open dashboards therefore cost no database polling and see each step as soon
+as the worker reports it.
+
+Publishing is best-effort: if Redis is unreachable the sync carries on and the
+frontend falls back to polling /api/sync/status.
+"""
+
+import logging
+import time
+from typing import Any
+
+import orjson
+
+from app.config import get_settings
+from app.database import SyncStatus
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+SYNC_EVENTS_CHANNEL_PREFIX = "sync:events:"
+
+# Event types sent to the browser
+EVENT_STATUS = "status"  # Snapshot sent once when the stream opens
+EVENT_PROGRESS = "progress"  # Step / progress change during a sync
+EVENT_COMPLETED = "completed"  # Terminal status (success, partial, failed)
+
+# (current_step, monotonic start time) per user, kept in the worker process
+_step_clocks: dict[int, tuple[str | None, float]] = {}
+
+
+def sync_events_channel(user_id: int) -> str:
+    """Get the Redis pub/sub channel for a user's sync events."""
+    return f"{SYNC_EVENTS_CHANNEL_PREFIX}{user_id}"
+
+
+def estimate_eta_seconds(
+    elapsed_seconds: float,
+    current_step_progress: int | None,
+    current_step_total: int | None,
+) -> int | None:
+    """Estimate seconds remaining in the current step from its average pace.
+
+    current_step_progress is the number of completed items (e.g. user libraries
+    fetched, in whatever order they finish).
+
+    Returns:
+        Rounded seconds remaining, or None when there is nothing to extrapolate from
+    """
+    if not current_step_progress or not current_step_total:
+        return None
+    remaining = max(current_step_total - current_step_progress, 0)
+    return round(elapsed_seconds / current_step_progress * remaining)
+
+
+def build_progress_event(user_id: int, progress: dict[str, Any]) -> dict[str, Any]:
+    """Build a progress event from the user's current progress fields.
+
+    Also tracks when each step started (per user) to compute the ETA.
+
+    Args:
+        user_id: User ID
+        progress: current_step, total_steps, current_step_progress,
+            current_step_total and current_user_name
+    """
+    now = time.monotonic()
+    current_step = progress.get("current_step")
+    step, started_at = _step_clocks.get(user_id, (None, now))
+    if step != current_step:
+        started_at = now
+        _step_clocks[user_id] = (current_step, started_at)
+
+    return {
+        "type": EVENT_PROGRESS,
+        "is_syncing": current_step is not None,
+        "progress": {
+            "current_step": current_step,
+            "total_steps": progress.get("total_steps"),
+            "current_step_progress": progress.get("current_step_progress"),
+            "current_step_total": progress.get("current_step_total"),
+            "current_user_name": progress.get("current_user_name"),
+            "eta_seconds": estimate_eta_seconds(
+                now - started_at,
+                progress.get("current_step_progress"),
+                progress.get("current_step_total"),
+            ),
+        },
+    }
+
+
+def build_completed_event(sync_status: SyncStatus) -> dict[str, Any]:
+    """Build the terminal event sent when a sync finishes."""
+    _step_clocks.pop(sync_status.user_id, None)
+    return {
+        "type": EVENT_COMPLETED,
+        "is_syncing": False,
+        "status": sync_status.last_sync_status,
+        "error": sync_status.last_sync_error,
+        "media_items_count": sync_status.media_items_count,
+        "requests_count": sync_status.requests_count,
+    }
+
+
+async def publish_sync_event(user_id: int, event: dict[str, Any]) -> None:
+    """Publish a sync event for a user. Never raises."""
+    if not get_settings().redis_url:
+        return
+
+    try:
+        client = get_redis_client()
+        try:
+            await client.publish(sync_events_channel(user_id), orjson.dumps(event))
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Could not publish sync event for user {user_id}: {e}")
+
+
+class SyncEventSubscription:
+    """A subscription to one user's sync events.
+
+    Call subscribe() before reading any snapshot from the database so that no
+    event published in between is missed, then call get_event() in a loop.
+    """
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self._client = get_redis_client()
+        self._pubsub = self._client.pubsub()
+
+    async def subscribe(self) -> None:
+        """Subscribe to the user's channel. Raises if Redis is unreachable."""
+        await self._pubsub.subscribe(sync_events_channel(self.user_id))
+
+    async def get_event(self, timeout: float) -> dict[str, Any] | None:
+        """Wait up to timeout seconds for the next event.
+
+        Returns:
+            The event dict, or None if nothing (valid) arrived in time
+        """
+        message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if not message or message.get("type") != "message":
+            return None
+        try:
+            event: dict[str, Any] = orjson.loads(message["data"])
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring malformed sync event for user {self.user_id}")
+            return None
+        return event
+
+    async def close(self) -> None:
+        """Unsubscribe and release the Redis connection."""
+        await self._pubsub.aclose()  # type: ignore[no-untyped-call]
+        await self._client.aclose()
+
+
+def format_sse(event: dict[str, Any]) -> bytes:
+    """Format an event as a Server-Sent Events message."""
+    event_type: str = event["type"]
+    return f"event: {event_type}\ndata: ".encode() + orjson.dumps(event) + b"\n\n"
@@ -0,0 +1,152 @@
+"""Per-user sync lease lock in Redis.
+
+Two syncs of the same user (a manual sync overlapping the nightly one, a
+retried task) would delete and re-insert the same cache rows and double the
+load on the user's servers. A sync therefore holds a lease on its user:
+
+- the lease is a Redis key set with NX and a short TTL, holding a unique
+  holder ID;
+- a heartbeat renews it while the sync runs, so a crashed worker's lease
+  expires within SYNC_LOCK_TTL_SECONDS instead of blocking the user;
+- renew and release only touch the key when it still holds our ID.
+
+A sync that can't take the lease is coalesced onto the running one: it is
+skipped and reports "already_syncing". POST /api/sync checks the lease first
+and returns the running sync's progress instead of queueing another.
+
+Like the progress store, the lock degrades gracefully: when Redis is
+unreachable every lease is granted.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOCK_KEY_PREFIX = "sync:lock:"
+SYNC_LOCK_TTL_SECONDS = 60
+SYNC_LOCK_HEARTBEAT_SECONDS = 20
+
+# KEYS[1] = lock key, ARGV[1] = holder, ARGV[2] = TTL in seconds
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def sync_lock_key(user_id: int) -> str:
+    """Get the Redis key holding a user's sync lease."""
+    return f"{SYNC_LOCK_KEY_PREFIX}{user_id}"
+
+
+async def acquire_sync_lock(user_id: int, holder: str) -> bool:
+    """Take the user's sync lease.
+
+    Returns:
+        True if taken (or Redis is unavailable), False if another sync holds it
+    """
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            acquired = await client.set(
+                sync_lock_key(user_id), holder, nx=True, ex=SYNC_LOCK_TTL_SECONDS
+            )
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync lock store unavailable for user {user_id}: {e}")
+        return True
+    return bool(acquired)
+
+
+async def renew_sync_lock(user_id: int, holder: str) -> bool:
+    """Extend the lease if it is still ours.
+
+    Returns:
+        True if renewed, False if the lease was lost or Redis is unavailable
+    """
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            renewed = await client.eval(  # type: ignore[misc]
+                _RENEW_SCRIPT, 1, sync_lock_key(user_id), holder, str(SYNC_LOCK_TTL_SECONDS)
+            )
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync lock store unavailable for user {user_id}: {e}")
+        return False
+    return bool(renewed)
+
+
+async def release_sync_lock(user_id: int, holder: str) -> None:
+    """Release the lease if it is still ours."""
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            await client.eval(  # type: ignore[misc]
+                _RELEASE_SCRIPT, 1, sync_lock_key(user_id), holder
+            )
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync lock store unavailable for user {user_id}: {e}")
+
+
+async def get_sync_lock_holder(user_id: int) -> str | None:
+    """Get the holder of the user's sync lease.
+
+    Returns:
+        Holder ID, or None if no sync holds it or Redis is unavailable
+    """
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            holder: str | None = await client.get(sync_lock_key(user_id))
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync lock store unavailable for user {user_id}: {e}")
+        return None
+    return holder
+
+
+async def _heartbeat(user_id: int, holder: str) -> None:
+    """Renew the lease until cancelled."""
+    while True:
+        await asyncio.sleep(SYNC_LOCK_HEARTBEAT_SECONDS)
+        if not await renew_sync_lock(user_id, holder):
+            logger.warning(f"Could not renew sync lock for user {user_id}")
+
+
+@contextlib.asynccontextmanager
+async def sync_lease(user_id: int, holder: str) -> AsyncIterator[bool]:
+    """Hold the user's sync lease for the duration of the block.
+
+    Yields:
+        True if the lease was taken; False if another sync holds it (the block
+        should then skip the sync)
+    """
+    if not await acquire_sync_lock(user_id, holder):
+        yield False
+        return
+    heartbeat = asyncio.create_task(_heartbeat(user_id, holder))
+    try:
+        yield True
+    finally:
+        heartbeat.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await heartbeat
+        await release_sync_lock(user_id, holder)
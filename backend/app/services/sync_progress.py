@@ -0,0 +1,141 @@
+"""Ephemeral sync progress store backed by Redis hashes.
+
+Progress fields change on every step and every batch of Jellyfin users. Writing
+them to SyncStatus meant a SELECT + COMMIT each time, competing with the cache
+writes and API readers for SQLite's single writer lock. They now live in a
+per-user Redis hash with a TTL; only start/terminal states are persisted.
+
+Every function degrades gracefully: when Redis is unreachable, writes return
+False / reads return None and callers fall back to the SyncStatus columns.
+"""
+
+import logging
+from typing import Any
+
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+SYNC_PROGRESS_KEY_PREFIX = "sync:progress:"
+# Safety net for crashed workers; syncs are capped at 30 minutes (Celery time limit)
+SYNC_PROGRESS_TTL_SECONDS = 60 * 60
+
+PROGRESS_FIELDS = (
+    "current_step",
+    "total_steps",
+    "current_step_progress",
+    "current_step_total",
+    "current_user_name",
+)
+_INT_FIELDS = {"total_steps", "current_step_progress", "current_step_total"}
+
+
+def sync_progress_key(user_id: int) -> str:
+    """Get the Redis key holding a user's sync progress."""
+    return f"{SYNC_PROGRESS_KEY_PREFIX}{user_id}"
+
+
+def _encode_progress(progress: dict[str, Any]) -> dict[str, str]:
+    """Encode progress fields for a Redis hash ("" stands for None)."""
+    return {key: "" if value is None else str(value) for key, value in progress.items()}
+
+
+def _decode_progress(raw: dict[str, str]) -> dict[str, Any]:
+    """Decode a Redis hash back into typed progress fields."""
+    progress: dict[str, Any] = {}
+    for key in PROGRESS_FIELDS:
+        value = raw.get(key) or None
+        progress[key] = int(value) if value is not None and key in _INT_FIELDS else value
+    return progress
+
+
+async def start_sync_progress(
+    user_id: int,
+    current_step: str | None = None,
+    total_steps: int | None = None,
+) -> bool:
+    """Reset a user's progress at the start of a sync.
+
+    Returns:
+        True if stored in Redis, False if Redis is unavailable
+    """
+    progress = dict.fromkeys(PROGRESS_FIELDS)
+    progress.update(current_step=current_step, total_steps=total_steps)
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            key = sync_progress_key(user_id)
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=_encode_progress(progress))
+                pipe.expire(key, SYNC_PROGRESS_TTL_SECONDS)
+                await pipe.execute()
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync progress store unavailable for user {user_id}: {e}")
+        return False
+    return True
+
+
+async def update_sync_progress_fields(
+    user_id: int,
+    fields: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Merge progress fields into a user's progress hash.
+
+    Args:
+        user_id: User ID
+        fields: Progress fields to set (None values are stored as cleared)
+
+    Returns:
+        The full progress after the update, or None if Redis is unavailable
+    """
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            key = sync_progress_key(user_id)
+            async with client.pipeline(transaction=True) as pipe:
+                if fields:
+                    pipe.hset(key, mapping=_encode_progress(fields))
+                pipe.expire(key, SYNC_PROGRESS_TTL_SECONDS)
+                pipe.hgetall(key)
+                results = await pipe.execute()
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync progress store unavailable for user {user_id}: {e}")
+        return None
+    return _decode_progress(results[-1])
+
+
+async def get_sync_progress(user_id: int) -> dict[str, Any] | None:
+    """Get a user's live sync progress.
+
+    Returns:
+        Progress fields, or None if no sync is tracked or Redis is unavailable
+    """
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            raw: dict[str, str] = await client.hgetall(sync_progress_key(user_id))  # type: ignore[misc]
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync progress store unavailable for user {user_id}: {e}")
+        return None
+    if not raw:
+        return None
+    return _decode_progress(raw)
+
+
+async def clear_sync_progress(user_id: int) -> None:
+    """Remove a user's live progress once the sync reached a terminal state."""
+    try:
+        client = get_redis_client(decode_responses=True)
+        try:
+            await client.delete(sync_progress_key(user_id))
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync progress store unavailable for user {user_id}: {e}")
@@ -0,0 +1,228 @@
+"""Host-aware scheduling of the nightly sync fan-out.
+
+sync_all_users used to queue every user's sync at exactly 03:00 UTC, so every
+worker hit Redis, the database and any Jellyfin server shared by several
+tenants at the same moment. The fan-out is now planned up front:
+
+- syncs are spread across a window (sync_schedule_window_seconds) with jitter;
+- syncs against one Jellyfin host run in waves of at most
+  sync_max_concurrent_per_host, and hosts are staggered within a wave;
+- longest expected jobs go first (LPT): hosts with the most expected work
+  take the earliest offsets, each host's longest jobs take its first wave, and
+  jobs due together are queued longest first. Expected durations come from
+  each user's sync history (see app.services.sync_cost);
+- the planned schedule and its estimated makespan are stored in Redis
+  under SYNC_SCHEDULE_KEY for inspection.
+
+The plan assumes a wave finishes before the next one starts. The cap itself is
+enforced at run time with a per-host slot counter in Redis (acquire_host_slot):
+a scheduled sync that finds its host full is retried later by the task.
+
+Redis access degrades gracefully like the progress store: without Redis every
+slot is granted and the schedule is simply not stored.
+"""
+
+import heapq
+import logging
+import math
+import random
+import time
+from typing import NamedTuple
+from urllib.parse import urlsplit
+
+import orjson
+
+from app.services.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+SYNC_SCHEDULE_KEY = "sync:schedule"
+SYNC_SCHEDULE_TTL_SECONDS = 24 * 60 * 60
+HOST_SLOTS_KEY_PREFIX = "sync:host-slots:"
+# A slot held longer than the Celery task time limit belongs to a crashed worker
+HOST_SLOT_TTL_SECONDS = 30 * 60
+
+
+class SyncJob(NamedTuple):
+    """Users synced by one task, and the Jellyfin host they read from."""
+
+    host: str
+    user_ids: list[int]
+    expected_seconds: float = 0.0
+
+
+class ScheduledSync(NamedTuple):
+    """A sync job and the delay before it is started."""
+
+    host: str
+    user_ids: list[int]
+    countdown_seconds: float
+    expected_seconds: float = 0.0
+
+
+def sync_host(server_url: str) -> str:
+    """Get the host a sync talks to ("host:port", lowercased)."""
+    url = server_url.strip()
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    host = parts.hostname or ""
+    return f"{host}:{parts.port}" if parts.port else host
+
+
+def build_sync_schedule(
+    jobs: list[SyncJob],
+    window_seconds: float,
+    max_per_host: int,
+    jitter_seconds: float = 0,
+    rng: random.Random | None = None,
+) -> list[ScheduledSync]:
+    """Plan when each sync job starts.
+
+    Jobs of a host are split into waves of at most max_per_host jobs, spread
+    evenly over the window, longest expected jobs first. Each host's waves are
+    shifted by a share of the wave spacing so that different hosts don't start
+    together either; hosts with the most expected work get the smallest shift.
+
+    Args:
+        jobs: Sync jobs to schedule
+        window_seconds: Every job starts within this many seconds
+        max_per_host: Maximum number of jobs started together against one host
+        jitter_seconds: Random delay added to each job (bounded by its wave)
+        rng: Random generator, for reproducible schedules
+
+    Returns:
+        Scheduled jobs ordered by countdown, longest first among equal countdowns
+    """
+    rng = rng or random.Random()
+    max_per_host = max(max_per_host, 1)
+    window_seconds = max(window_seconds, 0)
+
+    by_host: dict[str, list[SyncJob]] = {}
+    for job in jobs:
+        by_host.setdefault(job.host, []).append(job)
+    hosts = sorted(
+        by_host, key=lambda host: (-sum(job.expected_seconds for job in by_host[host]), host)
+    )
+
+    schedule: list[ScheduledSync] = []
+    host_count = len(hosts)
+    for host_index, host in enumerate(hosts):
+        host_jobs = sorted(by_host[host], key=lambda job: -job.expected_seconds)
+        waves = math.ceil(len(host_jobs) / max_per_host)
+        spacing = window_seconds / waves
+        host_offset = spacing * host_index / host_count
+        # Jitter must not push a job into the next wave of its host
+        jitter = min(jitter_seconds, spacing - host_offset) if spacing else 0
+        for job_index, job in enumerate(host_jobs):
+            wave = job_index // max_per_host
+            countdown = wave * spacing + host_offset
+            if jitter > 0:
+                countdown += rng.uniform(0, jitter)
+            schedule.append(
+                ScheduledSync(host, job.user_ids, round(countdown, 1), job.expected_seconds)
+            )
+
+    schedule.sort(key=lambda entry: (entry.countdown_seconds, -entry.expected_seconds, entry.host))
+    return schedule
+
+
+def estimate_makespan(schedule: list[ScheduledSync], workers: int) -> float:
+    """Estimate when the last scheduled sync finishes.
+
+    Simulates the queue: each job, in schedule order, starts on the first
+    worker to become free, but not before its countdown.
+
+    Args:
+        schedule: Planned syncs (see build_sync_schedule)
+        workers: Number of Celery worker processes consuming sync tasks
+
+    Returns:
+        Seconds from dispatch until every sync is expected to be done
+    """
+    free_at = [0.0] * max(workers, 1)
+    makespan = 0.0
+    for entry in schedule:
+        start = max(entry.countdown_seconds, heapq.heappop(free_at))
+        end = start + entry.expected_seconds
+        heapq.heappush(free_at, end)
+        makespan = max(makespan, end)
+    return round(makespan, 1)
+
+
+async def store_sync_schedule(
+    schedule: list[ScheduledSync], estimated_makespan_seconds: float
+) -> bool:
+    """Store the planned schedule for inspection.
+
+    Returns:
+        True if stored in Redis, False if Redis is unavailable
+    """
+    payload = orjson.dumps(
+        {
+            "planned_at": time.time(),
+            "estimated_makespan_seconds": estimated_makespan_seconds,
+            "syncs": [entry._asdict() for entry in schedule],
+        }
+    )
+    try:
+        client = get_redis_client()
+        try:
+            await client.set(SYNC_SCHEDULE_KEY, payload, ex=SYNC_SCHEDULE_TTL_SECONDS)
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Sync schedule store unavailable: {e}")
+        return False
+    return True
+
+
+def host_slots_key(host: str) -> str:
+    """Get the Redis key counting running syncs against a host."""
+    return f"{HOST_SLOTS_KEY_PREFIX}{host}"
+
+
+async def acquire_host_slot(host: str, holder: str, limit: int) -> bool:
+    """Take one of the host's concurrent sync slots.
+
+    Slots are members of a sorted set scored by acquisition time; entries older
+    than HOST_SLOT_TTL_SECONDS are dropped so crashed workers free their slot.
+
+    Args:
+        host: Jellyfin host (see sync_host)
+        holder: Unique holder ID (the Celery task ID)
+        limit: Maximum number of concurrent holders
+
+    Returns:
+        True if the slot was taken (or Redis is unavailable), False if the host is full
+    """
+    key = host_slots_key(host)
+    now = time.time()
+    try:
+        client = get_redis_client()
+        try:
+            async with client.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(key, 0, now - HOST_SLOT_TTL_SECONDS)
+                pipe.zadd(key, {holder: now})
+                pipe.zrank(key, holder)
+                pipe.expire(key, HOST_SLOT_TTL_SECONDS)
+                _, _, rank, _ = await pipe.execute()
+            if rank is not None and rank < limit:
+                return True
+            await client.zrem(key, holder)
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Host slot store unavailable for {host}: {e}")
+        return True
+    return False
+
+
+async def release_host_slot(host: str, holder: str) -> None:
+    """Give back a slot taken with acquire_host_slot."""
+    try:
+        client = get_redis_client()
+        try:
+            await client.zrem(host_slots_key(host), holder)
+        finally:
+            await client.aclose()
+    except Exception as e:
+        logger.debug(f"Host slot store unavailable for {host}: {e}")
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import UserSettings
 from app.services.encryption import decrypt_value, encrypt_value
+from app.services.integration_cache import cached_integration_read
 
 logger = logging.getLogger(__name__)
 
@@ -113,3 +114,19 @@ async def fetch_ultra_stats(url: str, api_key: str) -> UltraStatsResult | None:
     except (ValueError, KeyError, TypeError) as e:
         logger.warning(f"Ultra API response parsing error: {e}")
         return None
+
+
+async def get_cached_ultra_stats(url: str, api_key: str) -> UltraStatsResult | None:
+    """
+    Fetch Ultra.cc stats through the integration cache.
+
+    Failed calls (None) are not cached.
+    """
+    return await cached_integration_read(
+        "ultra",
+        url,
+        "/total-stats",
+        lambda: fetch_ultra_stats(url, api_key),
+        credential=api_key,
+        should_cache=lambda stats: stats is not None,
+    )
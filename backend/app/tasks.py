@@ -2,46 +2,154 @@
 
 import asyncio
 import logging
-from typing import Any
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from sqlalchemy import select
 
 from app.celery_app import celery_app
-from app.database import User, UserSettings, async_session_maker
+from app.config import get_settings
+from app.database import SyncStatus, User, UserSettings, async_session_maker
+from app.services.encryption import decrypt_value
+from app.services.integration_cache import credential_fingerprint, shared_read_window
 from app.services.sync import run_user_sync, send_sync_failure_notification
+from app.services.sync_lock import sync_lease
+from app.services.sync_schedule import (
+    ScheduledSync,
+    SyncJob,
+    acquire_host_slot,
+    build_sync_schedule,
+    estimate_makespan,
+    release_host_slot,
+    store_sync_schedule,
+    sync_host,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def get_configured_user_ids() -> list[int]:
-    """Get list of user IDs that have Jellyfin configured.
 
-    Runs synchronously for use in Celery tasks.
+class HostBusyError(Exception):
+    """Raised when a scheduled sync's Jellyfin host has no free slot."""
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        super().__init__(f"Jellyfin host {host} has no free sync slot")
+
+
+async def _run_sync_for_user(user_id: int) -> dict[str, Any]:
+    """Run sync for a single user (async helper).
+
+    Holds the user's sync lease; if another sync of the user is running, this
+    one is coalesced onto it and skipped.
+    """
+    async with sync_lease(user_id, uuid.uuid4().hex) as acquired:
+        if not acquired:
+            logger.info(f"Sync already running for user {user_id}, skipping duplicate")
+            return {"status": "already_syncing", "user_id": user_id}
+        async with async_session_maker() as session:
+            return await run_user_sync(session, user_id)
+
+
+def get_configured_sync_groups() -> list[SyncJob]:
+    """Group users with Jellyfin configured by the server they sync from.
+
+    Users whose settings point at the same Jellyfin URL with the same API key
+    (e.g. household members who each signed up) download the same library, so
+    they are synced together. Runs synchronously for use in Celery tasks.
+
+    Each job's expected duration is the sum of its users' expected sync
+    durations (sync_default_expected_seconds for users without history).
+
+    Returns:
+        One SyncJob per (server URL, credential fingerprint)
     """
+    default_expected = float(get_settings().sync_default_expected_seconds)
 
-    async def _get_users() -> list[int]:
+    async def _get_groups() -> list[SyncJob]:
         async with async_session_maker() as session:
             result = await session.execute(
-                select(UserSettings.user_id).where(
+                select(
+                    UserSettings.user_id,
+                    UserSettings.jellyfin_server_url,
+                    UserSettings.jellyfin_api_key_encrypted,
+                    SyncStatus.expected_sync_seconds,
+                )
+                .outerjoin(SyncStatus, SyncStatus.user_id == UserSettings.user_id)
+                .where(
                     UserSettings.jellyfin_server_url.isnot(None),
                     UserSettings.jellyfin_api_key_encrypted.isnot(None),
                 )
+                .order_by(UserSettings.user_id)
             )
-            return [row[0] for row in result.fetchall()]
+            groups: dict[tuple[str, str], SyncJob] = {}
+            for user_id, server_url, api_key_encrypted, expected in result.all():
+                try:
+                    fingerprint = credential_fingerprint(decrypt_value(api_key_encrypted))
+                except Exception:
+                    # Undecryptable key: sync alone so the failure is reported for this user
+                    fingerprint = f"user:{user_id}"
+                key = (server_url.rstrip("/").lower(), fingerprint)
+                job = groups.get(key) or SyncJob(sync_host(server_url), [])
+                job.user_ids.append(user_id)
+                groups[key] = job._replace(
+                    expected_seconds=job.expected_seconds + (expected or default_expected)
+                )
+            return list(groups.values())
 
-    # Create a new event loop to avoid "Event loop is closed" errors
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
-        return loop.run_until_complete(_get_users())
+        return loop.run_until_complete(_get_groups())
     finally:
         loop.close()
 
 
-async def _run_sync_for_user(user_id: int) -> dict[str, Any]:
-    """Run sync for a single user (async helper)."""
-    async with async_session_maker() as session:
-        return await run_user_sync(session, user_id)
+async def _run_sync_for_group(user_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """Sync users sharing a server one after another, reading the server once.
+
+    Server-level reads (library scans, libraries, series statistics, requests)
+    are shared within the window; each user still gets their own cache,
+    thresholds and whitelists.
+    """
+    results: dict[int, dict[str, Any]] = {}
+    with shared_read_window(get_settings().shared_sync_window_seconds):
+        for user_id in user_ids:
+            try:
+                results[user_id] = await _run_sync_for_user(user_id)
+            except Exception as e:
+                logger.error(f"Sync failed for user {user_id}: {e}")
+                user_email = await _get_user_email(user_id) or f"user_{user_id}"
+                await send_sync_failure_notification(
+                    user_email=user_email,
+                    service="Scheduled Sync",
+                    error_message=str(e),
+                )
+                results[user_id] = {"status": "failed", "error": str(e), "user_id": user_id}
+    return results
+
+
+async def _run_with_host_slot(host: str | None, holder: str, run: Callable[[], Awaitable[T]]) -> T:
+    """Run a sync while holding one of its host's concurrent slots.
+
+    Args:
+        host: Jellyfin host of a scheduled sync, or None to run unconditionally
+        holder: Unique slot holder ID (the Celery task ID)
+        run: Coroutine function performing the sync
+
+    Raises:
+        HostBusyError: If the host already runs its maximum number of syncs
+    """
+    if host is None:
+        return await run()
+    if not await acquire_host_slot(host, holder, get_settings().sync_max_concurrent_per_host):
+        raise HostBusyError(host)
+    try:
+        return await run()
+    finally:
+        await release_host_slot(host, holder)
 
 
 async def _get_user_email(user_id: int) -> str | None:
@@ -89,6 +197,42 @@ def send_sync_failure_notification_for_celery(
         logger.warning(f"Failed to send sync failure notification for user {user_id}: {e}")
 
 
+@celery_app.task(bind=True, name="sync_user_group")  # type: ignore[untyped-decorator]
+def sync_user_group(self: Any, user_ids: list[int], host: str | None = None) -> dict[str, Any]:
+    """Sync users sharing a Jellyfin server, fetching the server's data once.
+
+    Args:
+        user_ids: IDs of users configured with the same server and API key
+        host: Jellyfin host when scheduled by sync_all_users (caps concurrency)
+
+    Returns:
+        Dict with the sync result of each user
+    """
+    logger.info(f"Starting group sync for users {user_ids}")
+    holder = self.request.id or uuid.uuid4().hex
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        results = loop.run_until_complete(
+            _run_with_host_slot(host, holder, lambda: _run_sync_for_group(user_ids))
+        )
+    except HostBusyError as e:
+        settings = get_settings()
+        if self.request.retries >= settings.sync_host_busy_max_retries:
+            logger.error(f"Host {host} still busy, giving up group sync for users {user_ids}")
+            return {"status": "failed", "error": str(e), "user_ids": user_ids}
+        logger.info(f"Host {host} is busy, postponing group sync for users {user_ids}")
+        raise self.retry(
+            countdown=settings.sync_host_busy_retry_seconds,
+            max_retries=settings.sync_host_busy_max_retries,
+        ) from None
+    finally:
+        loop.close()
+
+    logger.info(f"Group sync completed for users {user_ids}")
+    return {"status": "completed", "results": results}
+
+
 @celery_app.task(bind=True, name="test_task")  # type: ignore[untyped-decorator]
 def test_task(self: Any, value: str) -> dict[str, str]:
     """Test task to verify Celery is working.
@@ -108,27 +252,64 @@ def sync_all_users(self: Any) -> dict[str, Any]:
 
     This task is scheduled to run daily at 3 AM UTC via Celery Beat.
     Each user's sync is run independently - failures don't block others.
+    Syncs are spread over a window and capped per Jellyfin host
+    (see app.services.sync_schedule).
 
     Returns:
-        Dict with number of users synced and status
+        Dict with number of users synced, status, the planned schedule and its
+        estimated makespan
     """
     logger.info("Starting daily sync for all users")
-    user_ids = get_configured_user_ids()
-    logger.info(f"Found {len(user_ids)} users with configured Jellyfin settings")
+    jobs = get_configured_sync_groups()
+    user_count = sum(len(job.user_ids) for job in jobs)
+    logger.info(f"Found {user_count} users with configured Jellyfin settings")
+
+    settings = get_settings()
+    schedule = build_sync_schedule(
+        jobs,
+        window_seconds=settings.sync_schedule_window_seconds,
+        max_per_host=settings.sync_max_concurrent_per_host,
+        jitter_seconds=settings.sync_schedule_jitter_seconds,
+    )
+    makespan = estimate_makespan(schedule, settings.sync_worker_count)
+    logger.info(f"Scheduled {len(schedule)} sync jobs, estimated makespan {makespan:.0f}s")
+    for entry in schedule:
+        # Queue each user's sync as a separate task; users sharing a server sync together
+        if len(entry.user_ids) == 1:
+            sync_user.apply_async(
+                (entry.user_ids[0],), {"host": entry.host}, countdown=entry.countdown_seconds
+            )
+        else:
+            sync_user_group.apply_async(
+                (entry.user_ids,), {"host": entry.host}, countdown=entry.countdown_seconds
+            )
+    _store_schedule_for_celery(schedule, makespan)
 
-    for user_id in user_ids:
-        # Queue each user's sync as a separate task
-        sync_user.delay(user_id)
+    return {
+        "users_synced": user_count,
+        "status": "completed",
+        "estimated_makespan_seconds": makespan,
+        "schedule": [entry._asdict() for entry in schedule],
+    }
 
-    return {"users_synced": len(user_ids), "status": "completed"}
+
+def _store_schedule_for_celery(schedule: list[ScheduledSync], makespan: float) -> None:
+    """Store the planned schedule for inspection (best-effort)."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(store_sync_schedule(schedule, makespan))
+    finally:
+        loop.close()
 
 
 @celery_app.task(bind=True, name="sync_user")  # type: ignore[untyped-decorator]
-def sync_user(self: Any, user_id: int) -> dict[str, Any]:
+def sync_user(self: Any, user_id: int, host: str | None = None) -> dict[str, Any]:
     """Sync data for a single user.
 
     Args:
         user_id: The user ID to sync data for
+        host: Jellyfin host when scheduled by sync_all_users (caps concurrency)
 
     Returns:
         Dict with sync status and results
@@ -139,12 +320,28 @@ def sync_user(self: Any, user_id: int) -> dict[str, Any]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            result = loop.run_until_complete(_run_sync_for_user(user_id))
+            result = loop.run_until_complete(
+                _run_with_host_slot(
+                    host,
+                    self.request.id or uuid.uuid4().hex,
+                    lambda: _run_sync_for_user(user_id),
+                )
+            )
         finally:
             loop.close()
 
         logger.info(f"Sync completed for user {user_id}: {result}")
         return result
+    except HostBusyError as e:
+        settings = get_settings()
+        if self.request.retries >= settings.sync_host_busy_max_retries:
+            logger.error(f"Host {host} still busy, giving up sync for user {user_id}")
+            return {"status": "failed", "error": str(e), "user_id": user_id}
+        logger.info(f"Host {host} is busy, postponing sync for user {user_id}")
+        raise self.retry(
+            countdown=settings.sync_host_busy_retry_seconds,
+            max_retries=settings.sync_host_busy_max_retries,
+        ) from None
     except Exception as e:
         logger.error(f"Sync failed for user {user_id}: {e}")
         # Send sync failure notification (fire-and-forget)
@@ -0,0 +1,269 @@
+"""Tests for the persisted Sonarr/Radarr ID index."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.database import ArrIndexEntry, User, UserSettings
+from app.services.arr_index import (
+    get_sonarr_slug_map,
+    lookup_arr_id,
+    refresh_arr_index,
+    remove_arr_index_entry,
+)
+from app.services.encryption import encrypt_value
+from app.services.radarr import get_radarr_movie_index
+from app.services.sonarr import get_sonarr_series_index
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def _mock_list_response(mock_client_class: MagicMock, payload: list[dict[str, object]]) -> None:
+    """Make the patched httpx.AsyncClient return payload for GET requests."""
+    mock_client = AsyncMock()
+    mock_client_class.return_value.__aenter__.return_value = mock_client
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = payload
+    mock_client.get.return_value = mock_response
+
+
+class TestArrListIndexes:
+    """Tests for the *arr list calls used to build the index."""
+
+    @pytest.mark.asyncio
+    async def test_sonarr_series_index(self) -> None:
+        """Maps TMDB ID to (series ID, titleSlug), skipping series without TMDB ID."""
+        with patch("app.services.sonarr.httpx.AsyncClient") as mock_client_class:
+            _mock_list_response(
+                mock_client_class,
+                [
+                    {"id": 1, "tmdbId": 94605, "titleSlug": "arcane"},
+                    {"id": 2, "tmdbId": 0, "titleSlug": "no-tmdb"},
+                    {"id": 3, "tmdbId": 1399},
+                ],
+            )
+            result = await get_sonarr_series_index("https://sonarr.example.com/", "key")
+
+        assert result == {94605: (1, "arcane"), 1399: (3, None)}
+
+    @pytest.mark.asyncio
+    async def test_radarr_movie_index(self) -> None:
+        """Maps TMDB ID to Radarr movie ID from a single list call."""
+        with patch("app.services.radarr.httpx.AsyncClient") as mock_client_class:
+            _mock_list_response(mock_client_class, [{"id": 10, "tmdbId": 550}, {"id": 11}])
+            result = await get_radarr_movie_index("https://radarr.example.com", "key")
+
+        assert result == {550: 10}
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_error(self) -> None:
+        """Errors return None (not an empty index) so the previous index is kept."""
+        with patch("app.services.radarr.httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client.get.return_value = MagicMock(status_code=401)
+            result = await get_radarr_movie_index("https://radarr.example.com", "key")
+
+        assert result is None
+
+
+class TestRefreshArrIndex:
+    """Tests for rebuilding and reading the index."""
+
+    async def _create_user_with_arr(self, email: str) -> tuple[int, UserSettings]:
+        async with TestingAsyncSessionLocal() as session:
+            user = User(email=email, hashed_password="fakehash")
+            session.add(user)
+            await session.flush()
+            settings = UserSettings(
+                user_id=user.id,
+                sonarr_server_url="https://sonarr.example.com",
+                sonarr_api_key_encrypted=encrypt_value("sonarr-key"),
+                radarr_server_url="https://radarr.example.com",
+                radarr_api_key_encrypted=encrypt_value("radarr-key"),
+            )
+            session.add(settings)
+            await session.commit()
+            return user.id, settings
+
+    @pytest.mark.asyncio
+    async def test_refresh_builds_index(self, client: TestClient) -> None:
+        """Refresh stores both services and lookups read from the index."""
+        user_id, settings = await self._create_user_with_arr("arr_index_build@example.com")
+
+        with (
+            patch(
+                "app.services.arr_index.get_sonarr_series_index",
+                new_callable=AsyncMock,
+                return_value={94605: (1, "arcane"), 1399: (3, None)},
+            ),
+            patch(
+                "app.services.arr_index.get_radarr_movie_index",
+                new_callable=AsyncMock,
+                return_value={550: 10},
+            ),
+        ):
+            async with TestingAsyncSessionLocal() as session:
+                counts = await refresh_arr_index(session, user_id, settings)
+
+        assert counts == {"sonarr": 2, "radarr": 1}
+        async with TestingAsyncSessionLocal() as session:
+            assert await get_sonarr_slug_map(session, user_id) == {94605: "arcane"}
+            assert await lookup_arr_id(session, user_id, "sonarr", 1399) == 3
+            assert await lookup_arr_id(session, user_id, "radarr", 550) == 10
+            assert await lookup_arr_id(session, user_id, "radarr", 94605) is None
+
+            await remove_arr_index_entry(session, user_id, "radarr", 550)
+            assert await lookup_arr_id(session, user_id, "radarr", 550) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_previous_index(self, client: TestClient) -> None:
+        """A failed *arr call keeps that service's entries and replaces the other."""
+        user_id, settings = await self._create_user_with_arr("arr_index_keep@example.com")
+        async with TestingAsyncSessionLocal() as session:
+            session.add_all(
+                [
+                    ArrIndexEntry(
+                        user_id=user_id, service="sonarr", tmdb_id=1, arr_id=1, title_slug="old"
+                    ),
+                    ArrIndexEntry(user_id=user_id, service="radarr", tmdb_id=2, arr_id=2),
+                ]
+            )
+            await session.commit()
+
+        with (
+            patch(
+                "app.services.arr_index.get_sonarr_series_index",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "app.services.arr_index.get_radarr_movie_index",
+                new_callable=AsyncMock,
+                return_value={3: 30},
+            ),
+        ):
+            async with TestingAsyncSessionLocal() as session:
+                counts = await refresh_arr_index(session, user_id, settings)
+
+        assert counts == {"radarr": 1}
+        async with TestingAsyncSessionLocal() as session:
+            assert await get_sonarr_slug_map(session, user_id) == {1: "old"}
+            assert await lookup_arr_id(session, user_id, "radarr", 2) is None
+            assert await lookup_arr_id(session, user_id, "radarr", 3) == 30
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_service_clears_index(self, client: TestClient) -> None:
+        """Removing a service's settings clears its entries on the next refresh."""
+        user_id, _ = await self._create_user_with_arr("arr_index_clear@example.com")
+        async with TestingAsyncSessionLocal() as session:
+            session.add(ArrIndexEntry(user_id=user_id, service="radarr", tmdb_id=2, arr_id=2))
+            await session.commit()
+
+        with patch(
+            "app.services.arr_index.get_radarr_movie_index", new_callable=AsyncMock
+        ) as mock_radarr:
+            async with TestingAsyncSessionLocal() as session:
+                await refresh_arr_index(session, user_id, UserSettings(user_id=user_id))
+
+        mock_radarr.assert_not_called()
+        async with TestingAsyncSessionLocal() as session:
+            result = await session.execute(
+                select(ArrIndexEntry).where(ArrIndexEntry.user_id == user_id)
+            )
+            assert result.scalars().all() == []
+
+
+class TestDeleteUsesArrIndex:
+    """Delete endpoints pass the indexed *arr ID instead of looking it up."""
+
+    def _setup_user(self, client: TestClient, email: str) -> tuple[dict[str, str], int]:
+        client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+        login_response = client.post(
+            "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        with (
+            patch(
+                "app.routers.settings.validate_radarr_connection",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch(
+                "app.routers.settings.validate_sonarr_connection",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+        ):
+            for service in ("radarr", "sonarr"):
+                client.post(
+                    f"/api/settings/{service}",
+                    json={"server_url": f"https://{service}.example.com", "api_key": "key"},
+                    headers=headers,
+                )
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+        return headers, user_id
+
+    def test_delete_movie_uses_indexed_radarr_id(self, client: TestClient) -> None:
+        """The Radarr ID comes from the index and the entry is removed on success."""
+        headers, user_id = self._setup_user(client, "arr_index_delete_movie@example.com")
+
+        async def seed() -> None:
+            async with TestingAsyncSessionLocal() as session:
+                session.add(ArrIndexEntry(user_id=user_id, service="radarr", tmdb_id=550, arr_id=9))
+                await session.commit()
+
+        client.portal.call(seed)  # type: ignore[union-attr]
+
+        with (
+            patch("app.services.radarr.get_radarr_movie_by_tmdb_id") as mock_lookup,
+            patch("app.services.radarr.delete_radarr_movie", new_callable=AsyncMock) as mock_delete,
+        ):
+            mock_delete.return_value = True
+            response = client.delete("/api/content/movie/550", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["arr_deleted"] is True
+        mock_lookup.assert_not_called()
+        assert mock_delete.call_args.args[2] == 9
+
+        async def lookup() -> int | None:
+            async with TestingAsyncSessionLocal() as session:
+                return await lookup_arr_id(session, user_id, "radarr", 550)
+
+        assert client.portal.call(lookup) is None  # type: ignore[union-attr]
+
+    def test_delete_series_uses_indexed_sonarr_id(self, client: TestClient) -> None:
+        """The Sonarr ID comes from the index, so the series list is not downloaded."""
+        headers, user_id = self._setup_user(client, "arr_index_delete_series@example.com")
+
+        async def seed() -> None:
+            async with TestingAsyncSessionLocal() as session:
+                session.add(
+                    ArrIndexEntry(
+                        user_id=user_id,
+                        service="sonarr",
+                        tmdb_id=94605,
+                        arr_id=4,
+                        title_slug="arcane",
+                    )
+                )
+                await session.commit()
+
+        client.portal.call(seed)  # type: ignore[union-attr]
+
+        with (
+            patch("app.services.sonarr.get_sonarr_series_by_tmdb_id") as mock_lookup,
+            patch(
+                "app.services.sonarr.delete_sonarr_series", new_callable=AsyncMock
+            ) as mock_delete,
+        ):
+            mock_delete.return_value = True
+            response = client.delete("/api/content/series/94605", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["arr_deleted"] is True
+        mock_lookup.assert_not_called()
+        assert mock_delete.call_args.args[2] == 4
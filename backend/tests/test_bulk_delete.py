@@ -0,0 +1,254 @@
+"""Tests for bulk deletion jobs (POST/GET /api/content/bulk-delete)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.database import ArrIndexEntry, CachedJellyseerrRequest, CachedMediaItem, UserSettings
+from app.models.content import BulkDeleteRequest, BulkDeleteTarget
+from app.services.bulk_delete import (
+    BulkDeletePlan,
+    _ServiceCredentials,
+    create_bulk_delete_job,
+    get_bulk_delete_job,
+    run_bulk_delete_job,
+)
+from app.services.encryption import encrypt_value
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def _register(client: TestClient, email: str) -> tuple[dict[str, str], int]:
+    client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+    login_response = client.post(
+        "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+    return headers, user_id
+
+
+class TestBulkDeleteEndpoint:
+    """Test the bulk deletion API."""
+
+    def _seed(self, client: TestClient, user_id: int) -> None:
+        async def seed() -> None:
+            async with TestingAsyncSessionLocal() as session:
+                session.add_all(
+                    [
+                        UserSettings(
+                            user_id=user_id,
+                            radarr_server_url="https://radarr.example.com",
+                            radarr_api_key_encrypted=encrypt_value("radarr-key"),
+                            sonarr_server_url="https://sonarr.example.com",
+                            sonarr_api_key_encrypted=encrypt_value("sonarr-key"),
+                            jellyseerr_server_url="https://jellyseerr.example.com",
+                            jellyseerr_api_key_encrypted=encrypt_value("jellyseerr-key"),
+                        ),
+                        ArrIndexEntry(user_id=user_id, service="radarr", tmdb_id=550, arr_id=5),
+                        ArrIndexEntry(
+                            user_id=user_id,
+                            service="sonarr",
+                            tmdb_id=94605,
+                            arr_id=8,
+                            title_slug="arcane",
+                        ),
+                        CachedMediaItem(
+                            user_id=user_id,
+                            jellyfin_id="movie-550",
+                            name="Fight Club",
+                            media_type="Movie",
+                            raw_data={"ProviderIds": {"Tmdb": "550"}},
+                        ),
+                        CachedMediaItem(
+                            user_id=user_id,
+                            jellyfin_id="movie-600",
+                            name="Kept Movie",
+                            media_type="Movie",
+                            raw_data={"ProviderIds": {"Tmdb": "600"}},
+                        ),
+                        CachedMediaItem(
+                            user_id=user_id,
+                            jellyfin_id="series-94605",
+                            name="Arcane",
+                            media_type="Series",
+                            raw_data={"ProviderIds": {"Tmdb": "94605"}},
+                        ),
+                        CachedJellyseerrRequest(
+                            user_id=user_id,
+                            jellyseerr_id=1,
+                            jellyseerr_media_id=101,
+                            tmdb_id=550,
+                            media_type="movie",
+                            status=2,
+                        ),
+                    ]
+                )
+                await session.commit()
+
+        client.portal.call(seed)  # type: ignore[union-attr]
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Bulk deletion requires authentication."""
+        response = client.post(
+            "/api/content/bulk-delete", json={"items": [{"media_type": "movie", "tmdb_id": 1}]}
+        )
+        assert response.status_code == 401
+
+    def test_rejects_empty_items(self, client: TestClient) -> None:
+        """At least one item is required."""
+        headers, _ = _register(client, "bulk_empty@example.com")
+        response = client.post("/api/content/bulk-delete", json={"items": []}, headers=headers)
+        assert response.status_code == 422
+
+    def test_requires_arr_configuration(self, client: TestClient) -> None:
+        """Movies need Radarr configured when deleting from *arr."""
+        headers, _ = _register(client, "bulk_no_radarr@example.com")
+        response = client.post(
+            "/api/content/bulk-delete",
+            json={"items": [{"media_type": "movie", "tmdb_id": 550}]},
+            headers=headers,
+        )
+        assert response.status_code == 400
+        assert "radarr" in response.json()["detail"].lower()
+
+    def test_bulk_delete_runs_job_and_batches_cache_cleanup(self, client: TestClient) -> None:
+        """Items are deleted with indexed IDs and results are available by job ID."""
+        headers, user_id = _register(client, "bulk_run@example.com")
+        self._seed(client, user_id)
+
+        with (
+            patch("app.services.bulk_delete.async_session_maker", TestingAsyncSessionLocal),
+            patch(
+                "app.services.bulk_delete.delete_movie_by_tmdb_id",
+                new_callable=AsyncMock,
+                side_effect=[
+                    (True, "Movie deleted successfully from Radarr"),
+                    (False, "Movie with TMDB ID 999 not found in Radarr"),
+                ],
+            ) as mock_movie,
+            patch(
+                "app.services.bulk_delete.delete_series_by_tmdb_id",
+                new_callable=AsyncMock,
+                return_value=(True, "Series deleted successfully from Sonarr"),
+            ) as mock_series,
+            patch(
+                "app.services.bulk_delete.delete_jellyseerr_media",
+                new_callable=AsyncMock,
+                return_value=(True, "Media deleted successfully from Jellyseerr"),
+            ) as mock_jellyseerr,
+        ):
+            response = client.post(
+                "/api/content/bulk-delete",
+                json={
+                    "items": [
+                        {"media_type": "movie", "tmdb_id": 550},
+                        {"media_type": "movie", "tmdb_id": 999},
+                        {"media_type": "series", "tmdb_id": 94605},
+                        {"media_type": "movie", "tmdb_id": 550},  # duplicate
+                    ]
+                },
+                headers=headers,
+            )
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            assert response.json()["total"] == 3
+
+            status_response = client.get(f"/api/content/bulk-delete/{job_id}", headers=headers)
+
+        assert status_response.status_code == 200
+        job = status_response.json()
+        assert job["status"] == "completed"
+        assert job["completed"] == 3
+        assert job["succeeded"] == 2
+        assert job["failed"] == 1
+        results = {(item["media_type"], item["tmdb_id"]): item for item in job["items"]}
+        assert results[("movie", 550)]["arr_deleted"] is True
+        assert results[("movie", 550)]["jellyseerr_deleted"] is True
+        assert results[("movie", 999)]["success"] is False
+        assert "not found" in results[("movie", 999)]["message"]
+
+        # Indexed IDs are passed through (no lookup call), unknown ones fall back
+        radarr_ids = {c.args[2]: c.kwargs["radarr_id"] for c in mock_movie.call_args_list}
+        assert radarr_ids == {550: 5, 999: None}
+        assert mock_series.call_args.kwargs["sonarr_id"] == 8
+        assert mock_jellyseerr.call_args.args[2] == 101
+
+        async def remaining() -> tuple[list[str], int, int]:
+            async with TestingAsyncSessionLocal() as session:
+                media = await session.execute(
+                    select(CachedMediaItem.name).where(CachedMediaItem.user_id == user_id)
+                )
+                requests = await session.execute(
+                    select(CachedJellyseerrRequest).where(
+                        CachedJellyseerrRequest.user_id == user_id
+                    )
+                )
+                index = await session.execute(
+                    select(ArrIndexEntry).where(ArrIndexEntry.user_id == user_id)
+                )
+                return (
+                    list(media.scalars().all()),
+                    len(requests.scalars().all()),
+                    len(index.scalars().all()),
+                )
+
+        media_names, request_count, index_count = client.portal.call(remaining)  # type: ignore[union-attr]
+        assert media_names == ["Kept Movie"]
+        assert request_count == 0
+        assert index_count == 0
+
+    def test_job_is_private_to_its_user(self, client: TestClient) -> None:
+        """Other users cannot read a job."""
+        _, owner_id = _register(client, "bulk_owner@example.com")
+        other_headers, _ = _register(client, "bulk_other@example.com")
+        job = create_bulk_delete_job(
+            owner_id,
+            BulkDeleteRequest(items=[BulkDeleteTarget(media_type="movie", tmdb_id=1)]),
+        )
+
+        response = client.get(f"/api/content/bulk-delete/{job.job_id}", headers=other_headers)
+        assert response.status_code == 404
+
+
+class TestBulkDeleteConcurrency:
+    """Test concurrent execution of a bulk deletion job."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_under_host_limit(self) -> None:
+        """Radarr calls overlap but never exceed the per-host limit."""
+        request = BulkDeleteRequest(
+            items=[BulkDeleteTarget(media_type="movie", tmdb_id=i) for i in range(1, 11)],
+            delete_from_jellyseerr=False,
+        )
+        job = create_bulk_delete_job(user_id=1, request=request)
+        plan = BulkDeletePlan(
+            user_id=1,
+            delete_from_arr=True,
+            delete_from_jellyseerr=False,
+            radarr=_ServiceCredentials("https://radarr.example.com", "key"),
+        )
+        active = 0
+        max_active = 0
+
+        async def slow_delete(*args: object, **kwargs: object) -> tuple[bool, str]:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return False, "Movie not found in Radarr"
+
+        with (
+            patch("app.services.bulk_delete.BULK_DELETE_HOST_CONCURRENCY", 3),
+            patch("app.services.bulk_delete.delete_movie_by_tmdb_id", slow_delete),
+        ):
+            await run_bulk_delete_job(job.job_id, plan)
+
+        assert max_active == 3
+        finished = get_bulk_delete_job(1, job.job_id)
+        assert finished is not None
+        assert finished.status == "completed"
+        assert finished.failed == 10
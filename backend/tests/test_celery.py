@@ -95,12 +95,33 @@ class TestCeleryBeatSchedule:
         assert hasattr(sync_all_users, "delay")
 
 
+class TestCeleryQueues:
+    """Tests for queue routing."""
+
+    def test_queues_are_declared(self) -> None:
+        """Interactive, bulk and light queues exist; bulk is the default."""
+        from app.celery_app import celery_app
+
+        queue_names = {queue.name for queue in celery_app.conf.task_queues}
+        assert queue_names == {"interactive", "bulk", "light"}
+        assert celery_app.conf.task_default_queue == "bulk"
+
+    def test_tasks_are_routed(self) -> None:
+        """Scheduled syncs go to bulk, short tasks to light."""
+        from app.celery_app import celery_app
+
+        routes = celery_app.conf.task_routes
+        assert routes["sync_user_group"] == {"queue": "bulk"}
+        assert routes["sync_all_users"] == {"queue": "light"}
+
+
 class TestSyncAllUsersTask:
     """Tests for the sync_all_users task."""
 
     def test_sync_all_users_iterates_configured_users(self) -> None:
         """Test that sync_all_users task calls sync for each configured user."""
         from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
         from app.tasks import sync_all_users, sync_user
 
         # Set eager mode for testing
@@ -110,18 +131,23 @@ class TestSyncAllUsersTask:
         try:
             # Mock the database query and sync_user task
             with (
-                patch("app.tasks.get_configured_user_ids") as mock_get_users,
-                patch.object(sync_user, "delay") as mock_sync,
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async") as mock_sync,
             ):
-                mock_get_users.return_value = [1, 2, 3]
+                mock_get_groups.return_value = [
+                    SyncJob("jf1.local", [1]),
+                    SyncJob("jf2.local", [2]),
+                    SyncJob("jf3.local", [3]),
+                ]
 
                 result = sync_all_users()
 
                 assert mock_sync.call_count == 3
-                mock_sync.assert_any_call(1)
-                mock_sync.assert_any_call(2)
-                mock_sync.assert_any_call(3)
-                assert result == {"users_synced": 3, "status": "completed"}
+                queued = {call.args[0] for call in mock_sync.call_args_list}
+                assert queued == {(1,), (2,), (3,)}
+                assert result["users_synced"] == 3
+                assert result["status"] == "completed"
         finally:
             celery_app.conf.task_always_eager = False
             celery_app.conf.task_eager_propagates = False
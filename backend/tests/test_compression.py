@@ -0,0 +1,182 @@
+"""Tests for orjson default responses and negotiated compression."""
+
+import gzip
+from collections.abc import AsyncIterator
+
+import brotli
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.database import CachedMediaItem
+from app.middleware import CompressionMiddleware, parse_accept_encoding, select_encoding
+from app.responses import ORJSONResponse
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class TestAcceptEncoding:
+    """Test Accept-Encoding negotiation."""
+
+    def test_parse_quality_values(self) -> None:
+        """Quality values are parsed, defaulting to 1."""
+        assert parse_accept_encoding("gzip, br;q=0.5, *;q=0") == {
+            "gzip": 1.0,
+            "br": 0.5,
+            "*": 0.0,
+        }
+
+    def test_prefers_brotli(self) -> None:
+        """Brotli wins over gzip when both are accepted."""
+        assert select_encoding("gzip, deflate, br") == "br"
+
+    def test_falls_back_to_gzip(self) -> None:
+        """Gzip is used when brotli is unavailable or refused."""
+        assert select_encoding("gzip, br", brotli_available=False) == "gzip"
+        assert select_encoding("gzip, br;q=0") == "gzip"
+
+    def test_identity_when_nothing_accepted(self) -> None:
+        """No supported coding means no compression."""
+        assert select_encoding("") is None
+        assert select_encoding("deflate") is None
+        assert select_encoding("gzip;q=0, br;q=0") is None
+
+
+class TestORJSONResponse:
+    """Test the default orjson response class."""
+
+    def test_renders_compact_json(self) -> None:
+        """Content is rendered as compact UTF-8 JSON."""
+        response = ORJSONResponse({"name": "Amélie", "sizes": [1, 2]})
+        assert response.body == '{"name":"Amélie","sizes":[1,2]}'.encode()
+        assert response.headers["content-type"] == "application/json"
+
+    def test_app_uses_orjson_by_default(self, client: TestClient) -> None:
+        """Endpoints without an explicit response class render compact JSON."""
+        response = client.get("/")
+        assert response.content == b'{"message":"Plex Dashboard API","status":"running"}'
+
+
+class TestCompressionMiddleware:
+    """Test compression of API responses."""
+
+    async def _get_large_library_headers(self, client: TestClient) -> dict[str, str]:
+        """Helper to create a user with enough cached items for a large response."""
+        email = "compression@example.com"
+        client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+        login_response = client.post(
+            "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+
+        async with TestingAsyncSessionLocal() as session:
+            session.add_all(
+                CachedMediaItem(
+                    user_id=user_id,
+                    jellyfin_id=f"movie-{i}",
+                    name=f"Compressible Movie {i}",
+                    media_type="Movie",
+                    production_year=2020,
+                    date_created="2024-01-15T00:00:00Z",
+                    path=f"/media/movies/Compressible Movie {i}",
+                    size_bytes=1_000_000_000,
+                    played=False,
+                    play_count=0,
+                )
+                for i in range(30)
+            )
+            await session.commit()
+        return headers
+
+    async def test_gzip_compresses_large_response(self, client: TestClient) -> None:
+        """Large responses are gzip-compressed when only gzip is accepted."""
+        headers = await self._get_large_library_headers(client)
+
+        response = client.get("/api/library", headers={**headers, "Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json()["total_count"] == 30
+
+    async def test_brotli_preferred_for_large_response(self, client: TestClient) -> None:
+        """Brotli is used when the client accepts it."""
+        headers = await self._get_large_library_headers(client)
+
+        response = client.get("/api/library", headers={**headers, "Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "br"
+        assert response.json()["total_count"] == 30
+
+    async def test_no_compression_without_accept_encoding(self, client: TestClient) -> None:
+        """Responses stay uncompressed when the client does not ask for it."""
+        headers = await self._get_large_library_headers(client)
+
+        response = client.get("/api/library", headers={**headers, "Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_small_response_not_compressed(self, client: TestClient) -> None:
+        """Responses under the size threshold are sent as-is."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+
+def _streaming_app() -> FastAPI:
+    """Minimal app with streamed, event-stream and pre-encoded responses."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for i in range(3):
+            yield f"chunk {i} ".encode() * 200
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/events")
+    async def events() -> StreamingResponse:
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/encoded")
+    async def encoded() -> PlainTextResponse:
+        return PlainTextResponse(gzip.compress(b"x" * 2000), headers={"Content-Encoding": "gzip"})
+
+    return app
+
+
+class TestCompressionResponder:
+    """Test the compressing send wrapper on streamed and pre-encoded responses."""
+
+    def test_streamed_body_is_compressed_chunk_by_chunk(self) -> None:
+        """A streamed response is compressed without a Content-Length."""
+        expected = b"".join(f"chunk {i} ".encode() * 200 for i in range(3))
+        with TestClient(_streaming_app()) as client:
+            for coding, decompress in (("br", brotli.decompress), ("gzip", gzip.decompress)):
+                with client.stream("GET", "/stream", headers={"Accept-Encoding": coding}) as r:
+                    raw = b"".join(r.iter_raw())
+
+                assert r.headers["content-encoding"] == coding
+                assert "content-length" not in r.headers
+                assert decompress(raw) == expected
+
+    def test_event_stream_is_not_compressed(self) -> None:
+        """Server-sent events pass through untouched."""
+        with TestClient(_streaming_app()) as client:
+            response = client.get("/events", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text.startswith("chunk 0")
+
+    def test_pre_encoded_response_is_not_compressed_again(self) -> None:
+        """A response that sets its own Content-Encoding is sent as-is."""
+        with TestClient(_streaming_app()) as client:
+            response = client.get("/encoded", headers={"Accept-Encoding": "br"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == b"x" * 2000
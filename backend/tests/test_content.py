@@ -3843,9 +3843,7 @@ class TestUnavailableRequests:
 
     @pytest.mark.asyncio
     async def test_tv_request_includes_sonarr_title_slug(self, client: TestClient) -> None:
-        """TV requests should include sonarr_title_slug when Sonarr is configured."""
-        from unittest.mock import AsyncMock
-
+        """TV requests should include sonarr_title_slug from the arr index built during sync."""
         token = self._get_auth_token(client, "sonarr-slug@example.com")
         headers = {"Authorization": f"Bearer {token}"}
 
@@ -3854,7 +3852,7 @@ class TestUnavailableRequests:
 
         from datetime import datetime, timedelta
 
-        from app.database import CachedJellyseerrRequest, UserSettings
+        from app.database import ArrIndexEntry, CachedJellyseerrRequest, UserSettings
         from app.services.encryption import encrypt_value
 
         past_date = (datetime.now() - timedelta(days=180)).strftime("%Y-%m-%d")
@@ -3882,16 +3880,22 @@ class TestUnavailableRequests:
                 },
             )
             session.add(request)
+            # Sonarr index entry (built during sync)
+            session.add(
+                ArrIndexEntry(
+                    user_id=user_id,
+                    service="sonarr",
+                    tmdb_id=44444,
+                    arr_id=12,
+                    title_slug="fallout",
+                )
+            )
             await session.commit()
 
-        # Mock the Sonarr API to return a titleSlug map
-        mock_slug_map = {44444: "fallout"}
-        with patch(
-            "app.routers.content.get_sonarr_tmdb_to_slug_map",
-            new_callable=AsyncMock,
-            return_value=mock_slug_map,
-        ):
+        # Served from the index without calling Sonarr
+        with patch("app.services.sonarr.httpx.AsyncClient") as mock_client:
             response = client.get("/api/content/issues?filter=requests", headers=headers)
+        mock_client.assert_not_called()
 
         assert response.status_code == 200
         data = response.json()
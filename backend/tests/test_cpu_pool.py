@@ -0,0 +1,117 @@
+"""Tests for running CPU-heavy sync work on the CPU pool."""
+
+import threading
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from app.config import Settings
+from app.services.cpu_pool import (
+    JSON_OFFLOAD_MIN_BYTES,
+    decode_json_response,
+    run_cpu_bound,
+    shutdown_cpu_executor,
+)
+from app.services.sync import check_episodes_languages, merge_user_items
+
+
+@pytest.fixture
+def cpu_pool() -> Iterator[Settings]:
+    """Settings for the CPU pool, with a fresh executor per test."""
+    settings = Settings()
+    shutdown_cpu_executor()
+    with patch("app.services.cpu_pool.get_settings", return_value=settings):
+        yield settings
+        shutdown_cpu_executor()
+
+
+def _items(user: str, played: bool) -> list[dict[str, Any]]:
+    user_data = {"Played": played, "PlayCount": int(played), "LastPlayedDate": None}
+    if played:
+        user_data["LastPlayedDate"] = f"2024-01-0{len(user)}T00:00:00Z"
+    return [
+        {"Id": "shared", "Name": "Shared", "UserData": user_data},
+        {"Id": f"only-{user}", "Name": user, "UserData": user_data},
+    ]
+
+
+class TestRunCpuBound:
+    """Test the executor kinds."""
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_runs_off_the_event_loop_thread(self, cpu_pool: Settings) -> None:
+        """The default pool runs work on another thread."""
+        worker_thread = await run_cpu_bound(threading.get_ident)
+        assert worker_thread != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_inline_runs_on_the_caller_thread(self, cpu_pool: Settings) -> None:
+        """CPU_POOL=inline runs work directly."""
+        cpu_pool.cpu_pool = "inline"
+        assert await run_cpu_bound(threading.get_ident) == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_is_rejected(self, cpu_pool: Settings) -> None:
+        """A misspelled CPU_POOL fails loudly."""
+        cpu_pool.cpu_pool = "greenlet"
+        with pytest.raises(ValueError, match="CPU_POOL"):
+            await run_cpu_bound(threading.get_ident)
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_sync_functions(self, cpu_pool: Settings) -> None:
+        """Sync work crosses the process boundary as plain data."""
+        cpu_pool.cpu_pool = "process"
+        cpu_pool.cpu_pool_workers = 1
+        user_item_lists = [_items("ann", True), _items("bo", False)]
+        episodes = [
+            {
+                "ParentIndexNumber": 1,
+                "IndexNumber": 1,
+                "Name": "Pilot",
+                "MediaSources": [{"MediaStreams": [{"Type": "Audio", "Language": "eng"}]}],
+            }
+        ]
+
+        merged = await run_cpu_bound(merge_user_items, user_item_lists)
+        languages = await run_cpu_bound(check_episodes_languages, episodes, "series", None)
+
+        assert merged == merge_user_items(user_item_lists)
+        assert languages == check_episodes_languages(episodes, "series")
+
+
+class TestMergeUserItems:
+    """Test merging the per-user libraries."""
+
+    def test_items_are_kept_once_with_aggregated_watch_data(self) -> None:
+        """Shared items appear once; input items are left untouched."""
+        user_item_lists = [_items("ann", True), _items("bo", True)]
+
+        merged = {item["Id"]: item for item in merge_user_items(user_item_lists)}
+
+        assert list(merged) == ["only-ann", "only-bo", "shared"]
+        assert merged["shared"]["UserData"] == {
+            "Played": True,
+            "PlayCount": 2,
+            "LastPlayedDate": "2024-01-03T00:00:00Z",
+        }
+        assert user_item_lists[0][0]["UserData"]["PlayCount"] == 1
+
+
+class TestDecodeJsonResponse:
+    """Test decoding of Jellyfin responses."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("padding", [0, JSON_OFFLOAD_MIN_BYTES])
+    async def test_small_and_large_bodies(self, cpu_pool: Settings, padding: int) -> None:
+        """Small bodies are decoded inline, large ones on the pool, with the same result."""
+        body = {"Items": [{"Id": "1", "Overview": "x" * padding}]}
+        response = httpx.Response(200, content=orjson.dumps(body))
+
+        with patch("app.services.cpu_pool.run_cpu_bound", wraps=run_cpu_bound) as offload:
+            assert await decode_json_response(response) == body
+
+        assert offload.called is (padding > 0)
@@ -0,0 +1,171 @@
+"""Tests for ETag / conditional GET support on content endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import CachedMediaItem
+from app.services.etag import etag_matches
+from tests.conftest import TestingAsyncSessionLocal
+
+ETAG_ENDPOINTS = [
+    "/api/content/summary",
+    "/api/content/issues",
+    "/api/content/issues?filter=requests",
+    "/api/library",
+    "/api/info/recent",
+]
+
+
+class TestEtagMatches:
+    """Test If-None-Match header parsing."""
+
+    def test_missing_header_does_not_match(self) -> None:
+        """No header means no match."""
+        assert etag_matches(None, '"abc"') is False
+        assert etag_matches("", '"abc"') is False
+
+    def test_exact_match(self) -> None:
+        """Identical tag matches."""
+        assert etag_matches('"abc"', '"abc"') is True
+
+    def test_list_and_weak_match(self) -> None:
+        """Any tag of a comma-separated list matches, weak prefix ignored."""
+        assert etag_matches('"xyz", W/"abc"', '"abc"') is True
+        assert etag_matches('"xyz", "def"', '"abc"') is False
+
+    def test_wildcard_matches(self) -> None:
+        """The * wildcard matches any current representation."""
+        assert etag_matches("*", '"abc"') is True
+
+
+class TestConditionalGet:
+    """Test ETag headers and 304 responses on read endpoints."""
+
+    def _get_auth_headers(self, client: TestClient, email: str) -> dict[str, str]:
+        """Helper to register and login a user, returning auth headers."""
+        client.post(
+            "/api/auth/register",
+            json={"email": email, "password": "SecurePassword123!"},
+        )
+        login_response = client.post(
+            "/api/auth/login",
+            json={"email": email, "password": "SecurePassword123!"},
+        )
+        return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    async def _add_cached_item(self, user_id: int, jellyfin_id: str) -> None:
+        """Helper to insert a cached media item for a user."""
+        async with TestingAsyncSessionLocal() as session:
+            session.add(
+                CachedMediaItem(
+                    user_id=user_id,
+                    jellyfin_id=jellyfin_id,
+                    name=f"Movie {jellyfin_id}",
+                    media_type="Movie",
+                    production_year=2020,
+                    date_created="2020-01-15T00:00:00Z",
+                    size_bytes=20_000_000_000,
+                    played=False,
+                    play_count=0,
+                )
+            )
+            await session.commit()
+
+    @pytest.mark.parametrize("url", ETAG_ENDPOINTS)
+    def test_returns_etag_and_cache_control(self, client: TestClient, url: str) -> None:
+        """Full responses carry an ETag and require revalidation."""
+        headers = self._get_auth_headers(client, "etag_headers@example.com")
+
+        response = client.get(url, headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    @pytest.mark.parametrize("url", ETAG_ENDPOINTS)
+    def test_matching_if_none_match_returns_304(self, client: TestClient, url: str) -> None:
+        """A matching If-None-Match returns 304 with an empty body."""
+        headers = self._get_auth_headers(client, "etag_304@example.com")
+        etag = client.get(url, headers=headers).headers["etag"]
+
+        response = client.get(url, headers={**headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_full_response(self, client: TestClient) -> None:
+        """A non-matching If-None-Match returns the full response."""
+        headers = self._get_auth_headers(client, "etag_stale@example.com")
+
+        response = client.get(
+            "/api/content/summary", headers={**headers, "If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert "old_content" in response.json()
+
+    def test_query_params_change_etag(self, client: TestClient) -> None:
+        """Different filters produce different ETags."""
+        headers = self._get_auth_headers(client, "etag_params@example.com")
+
+        etag_all = client.get("/api/library", headers=headers).headers["etag"]
+        etag_movies = client.get("/api/library?type=movie", headers=headers).headers["etag"]
+
+        assert etag_all != etag_movies
+
+    async def test_cache_change_invalidates_etag(self, client: TestClient) -> None:
+        """New cached media (e.g. after a sync) changes the ETag."""
+        headers = self._get_auth_headers(client, "etag_cache@example.com")
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+        etag = client.get("/api/content/summary", headers=headers).headers["etag"]
+
+        await self._add_cached_item(user_id, "movie-1")
+
+        response = client.get("/api/content/summary", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_whitelist_change_invalidates_etag(self, client: TestClient) -> None:
+        """Adding and removing a whitelist entry changes the ETag."""
+        headers = self._get_auth_headers(client, "etag_whitelist@example.com")
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+        await self._add_cached_item(user_id, "movie-1")
+        etag_before = client.get("/api/content/issues", headers=headers).headers["etag"]
+
+        client.post(
+            "/api/whitelist/content",
+            headers=headers,
+            json={"jellyfin_id": "movie-1", "name": "Movie movie-1", "media_type": "Movie"},
+        )
+        etag_added = client.get("/api/content/issues", headers=headers).headers["etag"]
+        assert etag_added != etag_before
+
+        whitelist_id = client.get("/api/whitelist/content", headers=headers).json()["items"][0][
+            "id"
+        ]
+        client.delete(f"/api/whitelist/content/{whitelist_id}", headers=headers)
+        etag_removed = client.get("/api/content/issues", headers=headers).headers["etag"]
+        assert etag_removed != etag_added
+
+    def test_settings_change_invalidates_etag(self, client: TestClient) -> None:
+        """Changing analysis thresholds changes the ETag."""
+        headers = self._get_auth_headers(client, "etag_settings@example.com")
+        client.post("/api/settings/analysis", headers=headers, json={"old_content_months": 4})
+        etag = client.get("/api/content/summary", headers=headers).headers["etag"]
+
+        client.post("/api/settings/analysis", headers=headers, json={"old_content_months": 6})
+
+        response = client.get("/api/content/summary", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_etag_is_per_user(self, client: TestClient) -> None:
+        """Two users never share an ETag for the same URL."""
+        headers_a = self._get_auth_headers(client, "etag_user_a@example.com")
+        headers_b = self._get_auth_headers(client, "etag_user_b@example.com")
+
+        etag_a = client.get("/api/content/summary", headers=headers_a).headers["etag"]
+        etag_b = client.get("/api/content/summary", headers=headers_b).headers["etag"]
+
+        assert etag_a != etag_b
@@ -0,0 +1,178 @@
+"""Tests for streaming NDJSON/CSV export of issues and library."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import CachedMediaItem, ContentWhitelist
+from app.services import content_export
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def _get_auth_headers(client: TestClient, email: str) -> tuple[dict[str, str], int]:
+    """Helper to register and login a user, returning auth headers and user ID."""
+    client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+    login_response = client.post(
+        "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+    return headers, user_id
+
+
+async def _add_items(user_id: int) -> None:
+    """Helper to insert a small library: one old large movie, one recent series."""
+    async with TestingAsyncSessionLocal() as session:
+        session.add_all(
+            [
+                CachedMediaItem(
+                    user_id=user_id,
+                    jellyfin_id="movie-old",
+                    name="Old Movie",
+                    media_type="Movie",
+                    production_year=2010,
+                    date_created="2020-01-15T00:00:00Z",
+                    size_bytes=20_000_000_000,
+                    played=False,
+                    play_count=0,
+                    raw_data={"ProviderIds": {"Tmdb": "123"}},
+                ),
+                CachedMediaItem(
+                    user_id=user_id,
+                    jellyfin_id="movie-whitelisted",
+                    name="Protected Movie",
+                    media_type="Movie",
+                    production_year=2011,
+                    date_created="2020-01-15T00:00:00Z",
+                    size_bytes=30_000_000_000,
+                    played=False,
+                    play_count=0,
+                ),
+                CachedMediaItem(
+                    user_id=user_id,
+                    jellyfin_id="series-new",
+                    name="New Series",
+                    media_type="Series",
+                    production_year=2024,
+                    date_created="2099-01-15T00:00:00Z",
+                    size_bytes=5_000_000_000,
+                    played=True,
+                    play_count=1,
+                    last_played_date="2099-01-20T00:00:00Z",
+                ),
+            ]
+        )
+        session.add(
+            ContentWhitelist(
+                user_id=user_id,
+                jellyfin_id="movie-whitelisted",
+                name="Protected Movie",
+                media_type="Movie",
+            )
+        )
+        await session.commit()
+
+
+class TestLibraryExport:
+    """Test GET /api/library/export."""
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Export should require authentication."""
+        assert client.get("/api/library/export").status_code == 401
+
+    def test_rejects_unknown_format(self, client: TestClient) -> None:
+        """Only ndjson and csv are supported."""
+        headers, _ = _get_auth_headers(client, "export_format@example.com")
+        response = client.get("/api/library/export?format=xml", headers=headers)
+        assert response.status_code == 422
+
+    async def test_ndjson_export_streams_all_items(self, client: TestClient) -> None:
+        """NDJSON export returns one JSON object per line in the requested order."""
+        headers, user_id = _get_auth_headers(client, "export_ndjson@example.com")
+        await _add_items(user_id)
+
+        response = client.get("/api/library/export?sort=size&order=desc", headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="library.ndjson"' in response.headers["content-disposition"]
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["jellyfin_id"] for row in rows] == [
+            "movie-whitelisted",
+            "movie-old",
+            "series-new",
+        ]
+        assert rows[1]["tmdb_id"] == "123"
+
+    async def test_csv_export_applies_filters(self, client: TestClient) -> None:
+        """CSV export has a header and honours library filters."""
+        headers, user_id = _get_auth_headers(client, "export_csv@example.com")
+        await _add_items(user_id)
+
+        response = client.get("/api/library/export?format=csv&type=series", headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["jellyfin_id"] == "series-new"
+        assert rows[0]["size_formatted"] == "4.7 GB"
+
+    def test_empty_csv_export_has_header(self, client: TestClient) -> None:
+        """An empty export still returns the CSV header line."""
+        headers, _ = _get_auth_headers(client, "export_empty@example.com")
+
+        response = client.get("/api/library/export?format=csv", headers=headers)
+
+        assert response.status_code == 200
+        assert response.text.strip() == ",".join(content_export.LIBRARY_EXPORT_FIELDS)
+
+    async def test_export_is_chunked_by_batch(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rows are streamed across multiple batches without losing any."""
+        monkeypatch.setattr(content_export, "EXPORT_BATCH_SIZE", 1)
+        headers, user_id = _get_auth_headers(client, "export_batches@example.com")
+        await _add_items(user_id)
+
+        response = client.get("/api/library/export", headers=headers)
+
+        assert len(response.text.splitlines()) == 3
+
+
+class TestIssuesExport:
+    """Test GET /api/content/issues/export."""
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Export should require authentication."""
+        assert client.get("/api/content/issues/export").status_code == 401
+
+    async def test_ndjson_matches_issues_endpoint(self, client: TestClient) -> None:
+        """Exported items match the JSON issues endpoint (whitelist applied)."""
+        headers, user_id = _get_auth_headers(client, "export_issues@example.com")
+        await _add_items(user_id)
+
+        issues = client.get("/api/content/issues", headers=headers).json()["items"]
+        response = client.get("/api/content/issues/export", headers=headers)
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["jellyfin_id"] for row in rows] == [item["jellyfin_id"] for item in issues]
+        assert [row["issues"] for row in rows] == [item["issues"] for item in issues]
+        whitelisted = next(row for row in rows if row["jellyfin_id"] == "movie-whitelisted")
+        assert "old" not in whitelisted["issues"]
+
+    async def test_csv_flattens_issue_lists(self, client: TestClient) -> None:
+        """CSV export joins list values and filters by issue type."""
+        headers, user_id = _get_auth_headers(client, "export_issues_csv@example.com")
+        await _add_items(user_id)
+
+        response = client.get("/api/content/issues/export?format=csv&filter=old", headers=headers)
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["jellyfin_id"] for row in rows] == ["movie-old"]
+        assert set(rows[0]["issues"].split(";")) == {"old", "large"}
+        assert "problematic_episodes" not in rows[0]
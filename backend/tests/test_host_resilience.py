@@ -0,0 +1,208 @@
+"""Tests for the per-host circuit breaker and adaptive concurrency limit."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.host_resilience import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    INITIAL_CONCURRENCY_LIMIT,
+    MIN_CONCURRENCY_LIMIT,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitOpenError,
+    HostResilience,
+    get_host_resilience,
+    host_resilience_snapshot,
+)
+from app.services.retry import retry_with_backoff
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    fake = FakeClock()
+    with patch("app.services.host_resilience.time.monotonic", fake):
+        yield fake
+
+
+class TestCircuitBreaker:
+    """Test breaker transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock: FakeClock) -> None:
+        """The circuit opens once failures reach the threshold, then fails fast."""
+        host = HostResilience("jf.local")
+        for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+            host.record_failure(overloaded=False)
+        host.before_call()
+        host.record_failure(overloaded=False)
+
+        assert host.state == STATE_OPEN
+        with pytest.raises(CircuitOpenError, match="jf.local"):
+            host.before_call()
+
+    def test_success_resets_failure_count(self, clock: FakeClock) -> None:
+        """Only consecutive failures count."""
+        host = HostResilience("jf.local")
+        for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+            host.record_failure(overloaded=False)
+        host.record_success()
+        host.record_failure(overloaded=False)
+
+        assert host.state == STATE_CLOSED
+
+    def test_half_open_probe_closes_or_reopens(self, clock: FakeClock) -> None:
+        """After the reset period one probe is let through; its outcome decides."""
+        host = HostResilience("jf.local")
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            host.record_failure(overloaded=False)
+
+        clock.now += BREAKER_RESET_SECONDS
+        host.before_call()
+        assert host.state == STATE_HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            host.before_call()  # Only one probe at a time
+        host.record_failure(overloaded=False)
+        assert host.state == STATE_OPEN
+
+        clock.now += BREAKER_RESET_SECONDS
+        host.before_call()
+        host.record_success()
+        assert host.state == STATE_CLOSED
+        host.before_call()
+
+
+class TestAdaptiveConcurrency:
+    """Test the AIMD concurrency limit."""
+
+    def test_overload_halves_limit_once_per_interval(self, clock: FakeClock) -> None:
+        """Concurrent failures of one episode shrink the limit once."""
+        host = HostResilience("jf.local")
+        host.record_failure(overloaded=True)
+        host.record_failure(overloaded=True)
+        assert host.limit == INITIAL_CONCURRENCY_LIMIT / 2
+
+        clock.now += 5
+        host.record_throttled()
+        assert host.limit == INITIAL_CONCURRENCY_LIMIT / 4
+
+    def test_limit_grows_on_success_and_keeps_a_floor(self, clock: FakeClock) -> None:
+        """Successes add about one slot per window; the limit never drops below the floor."""
+        host = HostResilience("jf.local")
+        for _ in range(10):
+            host.record_failure(overloaded=True)
+            clock.now += 5
+        assert host.limit == MIN_CONCURRENCY_LIMIT
+
+        for _ in range(3):
+            host.record_success()
+        assert 2 <= host.limit < 3
+
+    @pytest.mark.asyncio
+    async def test_calls_beyond_the_limit_wait(self) -> None:
+        """Only `limit` calls run at once; a released slot goes to a waiter."""
+        host = HostResilience("jf.local")
+        host.limit = 1
+        await host.acquire()
+
+        waiter = asyncio.create_task(host.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        host.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert host.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_gives_its_slot_back(self) -> None:
+        """A call cancelled while running or waiting doesn't keep a slot."""
+        request_started = asyncio.Event()
+
+        async def hang() -> None:
+            request_started.set()
+            await asyncio.Event().wait()
+
+        host = get_host_resilience("http://jf.local")
+        host.limit = 1
+        running = asyncio.create_task(retry_with_backoff(hang, "Jellyfin", host="http://jf.local"))
+        await request_started.wait()
+        waiting = asyncio.create_task(retry_with_backoff(hang, "Jellyfin", host="http://jf.local"))
+        await asyncio.sleep(0)
+
+        for task in (waiting, running):
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert host.in_flight == 0
+
+
+class TestRetryWithHost:
+    """Test retry_with_backoff through a host's resilience layer."""
+
+    @pytest.mark.asyncio
+    async def test_down_host_fails_fast(self) -> None:
+        """Once the circuit opens, further calls are refused without being made."""
+        request = httpx.Request("GET", "http://jf.local/Items")
+        func = AsyncMock(side_effect=httpx.ConnectError("down", request=request))
+
+        with patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock):
+            with pytest.raises(httpx.ConnectError):
+                await retry_with_backoff(func, "Jellyfin", host="http://jf.local")
+            with pytest.raises(CircuitOpenError):
+                await retry_with_backoff(func, "Jellyfin", host="http://jf.local/jellyfin")
+            calls = func.await_count
+            with pytest.raises(CircuitOpenError):
+                await retry_with_backoff(func, "Jellyfin", host="http://jf.local")
+
+        assert calls == BREAKER_FAILURE_THRESHOLD
+        assert func.await_count == calls
+        assert host_resilience_snapshot()["jf.local"]["state"] == STATE_OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_keep_the_circuit_closed(self) -> None:
+        """A 404 proves the server is up."""
+        request = httpx.Request("GET", "http://jf.local/Items")
+        response = httpx.Response(404, request=request)
+        func = AsyncMock(
+            side_effect=httpx.HTTPStatusError("Not found", request=request, response=response)
+        )
+        host = get_host_resilience("http://jf.local")
+        host.consecutive_failures = BREAKER_FAILURE_THRESHOLD - 1
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await retry_with_backoff(func, "Jellyfin", host="http://jf.local")
+
+        assert host.snapshot() == {
+            "state": STATE_CLOSED,
+            "consecutive_failures": 0,
+            "concurrency_limit": int(INITIAL_CONCURRENCY_LIMIT),
+            "in_flight": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_non_http_errors_count_as_failures(self) -> None:
+        """An error that isn't a server response counts toward opening the circuit."""
+        func = AsyncMock(side_effect=ValueError("invalid JSON"))
+        host = get_host_resilience("http://jf.local")
+        host.consecutive_failures = BREAKER_FAILURE_THRESHOLD - 1
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(func, "Jellyfin", host="http://jf.local")
+
+        assert host.state == STATE_OPEN
+        assert host.in_flight == 0
@@ -0,0 +1,272 @@
+"""Tests for the integration read cache (TTL, stale-while-revalidate, LRU)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.integration_cache import (
+    CachePolicy,
+    IntegrationCache,
+    cached_integration_read,
+    make_cache_key,
+    shared_read_window,
+    shared_server_read,
+)
+
+POLICY = CachePolicy(ttl_seconds=10, stale_seconds=20)
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    fake = FakeClock()
+    with patch("app.services.integration_cache.time.monotonic", fake):
+        yield fake
+
+
+def _key(name: str = "a") -> tuple[str, str, str, str, str]:
+    return make_cache_key("jellyfin", "https://jf.example.com", f"/{name}", "key")
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+
+    def test_key_normalizes_url_and_params(self) -> None:
+        """Trailing slashes and param order don't change the key."""
+        assert make_cache_key(
+            "jellyfin", "https://jf.example.com/", "/Users", "k", {"b": 1, "a": 2}
+        ) == make_cache_key("jellyfin", "https://jf.example.com", "/Users", "k", {"a": 2, "b": 1})
+
+    def test_key_separates_credentials_without_storing_them(self) -> None:
+        """Different API keys never share entries, and the key doesn't contain the secret."""
+        key_a = make_cache_key("jellyfin", "https://jf.example.com", "/Users", "secret-a")
+        key_b = make_cache_key("jellyfin", "https://jf.example.com", "/Users", "secret-b")
+        assert key_a != key_b
+        assert "secret-a" not in "".join(key_a)
+
+
+class TestIntegrationCache:
+    """Test freshness handling of IntegrationCache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_from_cache(self, clock: FakeClock) -> None:
+        """Within the TTL the fetcher is called once."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(return_value=["alice"])
+
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["alice"]
+        clock.now += 5
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["alice"]
+
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_revalidating(self, clock: FakeClock) -> None:
+        """A stale entry is returned immediately and refreshed in the background."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(side_effect=[["old"], ["new"]])
+
+        await cache.get_or_fetch(_key(), fetch, POLICY)
+        clock.now += 15  # stale, not expired
+
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["old"]
+        await asyncio.sleep(0)  # let the background refresh run
+
+        assert fetch.await_count == 2
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_stale_entry(self, clock: FakeClock) -> None:
+        """Background refresh errors are swallowed and the stale value remains."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(side_effect=[["old"], RuntimeError("seedbox down")])
+
+        await cache.get_or_fetch(_key(), fetch, POLICY)
+        clock.now += 15
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["old"]
+        await asyncio.sleep(0)
+
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["old"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_fetched_inline(self, clock: FakeClock) -> None:
+        """Past ttl + stale, callers wait for a fresh value."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(side_effect=[["old"], ["new"]])
+
+        await cache.get_or_fetch(_key(), fetch, POLICY)
+        clock.now += 31
+
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, clock: FakeClock) -> None:
+        """Concurrent callers for the same key trigger a single remote call."""
+        cache = IntegrationCache()
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_fetch() -> list[str]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ["alice"]
+
+        waiters = [
+            asyncio.create_task(cache.get_or_fetch(_key(), slow_fetch, POLICY)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [["alice"]] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_propagate_and_are_not_cached(self, clock: FakeClock) -> None:
+        """Inline fetch failures reach the caller; the next call retries."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), ["alice"]])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch(_key(), fetch, POLICY)
+        assert await cache.get_or_fetch(_key(), fetch, POLICY) == ["alice"]
+
+    @pytest.mark.asyncio
+    async def test_should_cache_rejects_results(self, clock: FakeClock) -> None:
+        """Rejected results are returned but not stored."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(side_effect=[[], ["alice"]])
+
+        assert await cache.get_or_fetch(_key(), fetch, POLICY, should_cache=bool) == []
+        assert await cache.get_or_fetch(_key(), fetch, POLICY, should_cache=bool) == ["alice"]
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, clock: FakeClock) -> None:
+        """The least recently used entry is evicted when full."""
+        cache = IntegrationCache(max_entries=2)
+        fetch = AsyncMock(return_value="value")
+
+        await cache.get_or_fetch(_key("a"), fetch, POLICY)
+        await cache.get_or_fetch(_key("b"), fetch, POLICY)
+        await cache.get_or_fetch(_key("a"), fetch, POLICY)  # a is now most recent
+        await cache.get_or_fetch(_key("c"), fetch, POLICY)  # evicts b
+        assert fetch.await_count == 3
+
+        await cache.get_or_fetch(_key("a"), fetch, POLICY)
+        assert fetch.await_count == 3
+        await cache.get_or_fetch(_key("b"), fetch, POLICY)
+        assert fetch.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_integration(self, clock: FakeClock) -> None:
+        """Invalidation drops only the matching integration's entries."""
+        cache = IntegrationCache()
+        fetch = AsyncMock(return_value="value")
+        ultra_key = make_cache_key("ultra", "https://ultra.example.com", "/total-stats", "k")
+
+        await cache.get_or_fetch(_key(), fetch, POLICY)
+        await cache.get_or_fetch(ultra_key, fetch, POLICY)
+        cache.invalidate("jellyfin")
+
+        assert len(cache) == 1
+
+
+class TestCachedIntegrationReads:
+    """Test the cached integration wrappers."""
+
+    @pytest.mark.asyncio
+    async def test_jellyfin_users_are_cached(self) -> None:
+        """Repeated Jellyfin user reads for the same server and key hit Jellyfin once."""
+        from app.services.sync import get_cached_jellyfin_users
+
+        with patch(
+            "app.services.sync.fetch_jellyfin_users",
+            new_callable=AsyncMock,
+            return_value=[{"Id": "1", "Name": "Alice"}],
+        ) as mock_fetch:
+            first = await get_cached_jellyfin_users("https://jf.example.com", "key")
+            second = await get_cached_jellyfin_users("https://jf.example.com/", "key")
+            await get_cached_jellyfin_users("https://jf.example.com", "other-key")
+
+        assert first == second == [{"Id": "1", "Name": "Alice"}]
+        assert mock_fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_ultra_stats_are_not_cached(self) -> None:
+        """A failed Ultra call (None) is retried on the next read."""
+        from app.services.ultra import get_cached_ultra_stats
+
+        stats = {"free_storage_gb": 100.0, "traffic_available_percentage": 50.0}
+        with patch(
+            "app.services.ultra.fetch_ultra_stats",
+            new_callable=AsyncMock,
+            side_effect=[None, stats],
+        ):
+            assert await get_cached_ultra_stats("https://ultra.example.com", "key") is None
+            assert await get_cached_ultra_stats("https://ultra.example.com", "key") == stats
+
+    @pytest.mark.asyncio
+    async def test_policy_lookup_uses_endpoint(self) -> None:
+        """cached_integration_read applies the endpoint's configured policy."""
+        fetch = AsyncMock(return_value=["user"])
+        await cached_integration_read(
+            "jellyseerr", "https://js.example.com", "/api/v1/user", fetch, credential="k"
+        )
+        await cached_integration_read(
+            "jellyseerr", "https://js.example.com", "/api/v1/user", fetch, credential="k"
+        )
+        assert fetch.await_count == 1
+
+
+async def _shared_items(fetch: AsyncMock, credential: str) -> object:
+    return await shared_server_read(
+        "jellyfin", "https://jf.example.com", "/Users/Items", fetch, credential=credential
+    )
+
+
+class TestSharedServerReads:
+    """Test reads shared by tenants of the same server."""
+
+    @pytest.mark.asyncio
+    async def test_reads_outside_window_are_not_shared(self) -> None:
+        """Without a window every call reaches the server."""
+        fetch = AsyncMock(return_value=["movie"])
+
+        for _ in range(2):
+            await _shared_items(fetch, "k")
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_inside_window_are_shared_per_credential(self, clock: FakeClock) -> None:
+        """Inside a window the same server and key are read once."""
+        fetch = AsyncMock(return_value=["movie"])
+
+        with shared_read_window(60):
+            for credential in ("k", "k", "other"):
+                await _shared_items(fetch, credential)
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_reads_expire_after_window_ttl(self, clock: FakeClock) -> None:
+        """Results older than the window TTL are fetched again."""
+        fetch = AsyncMock(return_value=["movie"])
+
+        with shared_read_window(60):
+            await _shared_items(fetch, "k")
+            clock.now += 61
+            await _shared_items(fetch, "k")
+
+        assert fetch.await_count == 2
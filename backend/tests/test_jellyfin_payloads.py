@@ -0,0 +1,113 @@
+"""Tests for the schema-driven decoding of Jellyfin item payloads."""
+
+import httpx
+import msgspec
+import orjson
+import pytest
+import respx
+
+from app.services.jellyfin_payloads import decode_items_page
+from app.services.sync import (
+    check_episodes_languages,
+    extract_size_from_item,
+    fetch_user_items,
+)
+
+MOVIE = {
+    "Id": "abc",
+    "Name": "Inception",
+    "Type": "Movie",
+    "ProductionYear": 2010,
+    "DateCreated": "2023-05-20T14:30:00.0000000Z",
+    "Path": "/media/movies/Inception.mkv",
+    "Overview": "A thief who steals corporate secrets...",
+    "People": [{"Name": "Christopher Nolan", "Type": "Director"}],
+    "Studios": [{"Name": "Warner Bros. Pictures"}],
+    "ProviderIds": {"Tmdb": "27205", "Imdb": "tt1375666"},
+    "UserData": {"Played": True, "PlayCount": 3, "IsFavorite": True, "Key": "k"},
+    "MediaSources": [
+        {
+            "Size": 12500000000,
+            "Container": "mkv",
+            "MediaStreams": [
+                {"Type": "Video", "Codec": "h264", "Width": 1920},
+                {"Type": "Audio", "Language": "eng", "Channels": 6},
+                {"Type": "Subtitle", "Language": "fre", "IsExternal": False},
+            ],
+        }
+    ],
+}
+
+
+class TestDecodeItemsPage:
+    """Test decoding items responses into trimmed dicts."""
+
+    def test_only_used_fields_are_kept(self) -> None:
+        """Unused fields are dropped; used ones keep Jellyfin's key names."""
+        body = orjson.dumps({"Items": [MOVIE], "TotalRecordCount": 1})
+
+        (item,) = decode_items_page(body)
+
+        assert item == {
+            "Id": "abc",
+            "Name": "Inception",
+            "Type": "Movie",
+            "ProductionYear": 2010,
+            "DateCreated": "2023-05-20T14:30:00.0000000Z",
+            "Path": "/media/movies/Inception.mkv",
+            "ProviderIds": {"Tmdb": "27205", "Imdb": "tt1375666"},
+            "UserData": {"Played": True, "PlayCount": 3},
+            "MediaSources": [
+                {
+                    "Size": 12500000000,
+                    "MediaStreams": [
+                        {"Type": "Video"},
+                        {"Type": "Audio", "Language": "eng"},
+                        {"Type": "Subtitle", "Language": "fre"},
+                    ],
+                }
+            ],
+        }
+
+    def test_sync_helpers_read_trimmed_items_like_full_ones(self) -> None:
+        """Sizes and language checks are the same on trimmed and full episodes."""
+        episode = {**MOVIE, "Type": "Episode", "ParentIndexNumber": 1, "IndexNumber": 2}
+        (trimmed,) = decode_items_page(orjson.dumps({"Items": [episode]}))
+
+        assert extract_size_from_item(trimmed) == extract_size_from_item(episode)
+        assert check_episodes_languages([trimmed], "s") == check_episodes_languages([episode], "s")
+
+    def test_series_change_detection_fields_are_kept(self) -> None:
+        """DateLastMediaAdded and ChildCount feed the series scan fingerprint."""
+        series = {"Id": "s", "Type": "Series", "DateLastMediaAdded": "2026-10-01", "ChildCount": 2}
+
+        (item,) = decode_items_page(orjson.dumps({"Items": [series]}))
+
+        assert item == series
+
+    def test_missing_items_and_wrong_types(self) -> None:
+        """An empty page decodes to no items; malformed items are rejected."""
+        assert decode_items_page(b'{"TotalRecordCount": 0}') == []
+        with pytest.raises(msgspec.ValidationError, match="ProductionYear"):
+            decode_items_page(b'{"Items": [{"Id": "x", "ProductionYear": "2010"}]}')
+
+
+class TestFetchUserItems:
+    """Test the trimmed user library request."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_requests_and_returns_only_used_fields(self) -> None:
+        """Unused fields are neither requested nor returned."""
+        route = respx.get("http://jellyfin.local/Users/u1/Items").mock(
+            return_value=httpx.Response(200, json={"Items": [MOVIE]})
+        )
+
+        async with httpx.AsyncClient() as client:
+            items = await fetch_user_items(client, "http://jellyfin.local", "key", "u1", "A", 1, 1)
+
+        fields = route.calls.last.request.url.params["Fields"].split(",")
+        assert "People" not in fields and "Overview" not in fields
+        assert "MediaSources" in fields and "ProviderIds" in fields
+        assert "DateLastMediaAdded" in fields and "ChildCount" in fields
+        assert "People" not in items[0] and items[0]["Name"] == "Inception"
@@ -667,8 +667,10 @@ class TestLibraryEndpoint:
 
     @pytest.mark.asyncio
     async def test_series_includes_sonarr_title_slug(self, client: TestClient) -> None:
-        """Series items should include sonarr_title_slug when Sonarr is configured."""
-        from unittest.mock import AsyncMock, patch
+        """Series items should include sonarr_title_slug from the arr index built during sync."""
+        from unittest.mock import patch
+
+        from app.database import ArrIndexEntry
 
         token = self._get_auth_token(client, "library_sonarr_slug@example.com")
         headers = {"Authorization": f"Bearer {token}"}
@@ -701,33 +703,34 @@ class TestLibraryEndpoint:
                 sonarr_server_url="https://sonarr.example.com",
                 sonarr_api_key_encrypted="encrypted_key",
             )
-            session.add_all([series, movie, settings])
+            # Sonarr index entry (built during sync)
+            index_entry = ArrIndexEntry(
+                user_id=user_id,
+                service="sonarr",
+                tmdb_id=94605,
+                arr_id=7,
+                title_slug="arcane",
+            )
+            session.add_all([series, movie, settings, index_entry])
             await session.commit()
 
-        # Mock the Sonarr API call to return the slug map
-        # Patch at app.services.sonarr since the import is inside get_library()
-        mock_slug_map = {94605: "arcane"}  # TMDB ID -> titleSlug mapping
-        with patch(
-            "app.services.sonarr.get_sonarr_tmdb_to_slug_map", new_callable=AsyncMock
-        ) as mock_sonarr:
-            mock_sonarr.return_value = mock_slug_map
-            with patch("app.services.sonarr.get_decrypted_sonarr_api_key") as mock_key:
-                mock_key.return_value = "test_api_key"
-
-                response = client.get("/api/library", headers=headers)
-                assert response.status_code == 200
-                data = response.json()
-
-                # Find the series and movie in response
-                items_by_name = {item["name"]: item for item in data["items"]}
-
-                # Series should have sonarr_title_slug
-                assert "Arcane" in items_by_name
-                assert items_by_name["Arcane"]["sonarr_title_slug"] == "arcane"
-
-                # Movie should have sonarr_title_slug as null
-                assert "Test Movie" in items_by_name
-                assert items_by_name["Test Movie"]["sonarr_title_slug"] is None
+        # Served from the index without calling Sonarr
+        with patch("app.services.sonarr.httpx.AsyncClient") as mock_client:
+            response = client.get("/api/library", headers=headers)
+        mock_client.assert_not_called()
+        assert response.status_code == 200
+        data = response.json()
+
+        # Find the series and movie in response
+        items_by_name = {item["name"]: item for item in data["items"]}
+
+        # Series should have sonarr_title_slug
+        assert "Arcane" in items_by_name
+        assert items_by_name["Arcane"]["sonarr_title_slug"] == "arcane"
+
+        # Movie should have sonarr_title_slug as null
+        assert "Test Movie" in items_by_name
+        assert items_by_name["Test Movie"]["sonarr_title_slug"] is None
 
     @pytest.mark.asyncio
     async def test_series_sonarr_title_slug_null_when_sonarr_not_configured(
@@ -135,6 +135,21 @@ class TestHealthEndpoint:
                 assert data["status"] == "unhealthy"
                 assert "error" in data["dependencies"]["database"]
 
+    def test_health_reports_integration_hosts(self, client: TestClient) -> None:
+        """Circuit state of called hosts is reported without affecting health."""
+        from app.services.host_resilience import STATE_OPEN, get_host_resilience
+
+        host = get_host_resilience("http://jf.local:8096")
+        for _ in range(5):
+            host.record_failure(overloaded=False)
+
+        with patch("app.main.check_redis_health", new_callable=AsyncMock) as mock_redis:
+            mock_redis.return_value = (True, "ok")
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["integration_hosts"]["jf.local:8096"]["state"] == STATE_OPEN
+
 
 def test_cors_allows_localhost(client: TestClient) -> None:
     """Test CORS allows localhost origins."""
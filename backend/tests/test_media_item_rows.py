@@ -0,0 +1,127 @@
+"""Tests for the MediaItemRow projections used by the analysis queries."""
+
+import re
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import CachedMediaItem, User
+from app.services.content_analysis import MediaItemRow
+from app.services.content_queries import get_content_issues, load_media_item_rows
+from tests.conftest import TestingAsyncSessionLocal, async_engine
+
+# raw_data read as a whole column rather than through a JSON path lookup
+FULL_RAW_DATA = re.compile(r"cached_media_items\.raw_data(?!, \?\))")
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    """Record every statement sent to the database."""
+    recorded: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        recorded.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+def _streams(*languages: str) -> dict[str, Any]:
+    return {
+        "MediaSources": [
+            {"MediaStreams": [{"Type": "Audio", "Language": lang} for lang in languages]}
+        ]
+    }
+
+
+async def _create_items() -> int:
+    async with TestingAsyncSessionLocal() as session:
+        user = User(email="rows@example.com", hashed_password="fakehash")
+        session.add(user)
+        await session.flush()
+        session.add_all(
+            [
+                # Checked during sync: the cached result is used
+                CachedMediaItem(
+                    user_id=user.id,
+                    jellyfin_id="checked",
+                    name="Checked",
+                    media_type="Movie",
+                    date_created="2020-01-01T00:00:00.0000000Z",
+                    size_bytes=2,
+                    raw_data={"ProviderIds": {"Tmdb": "550", "Imdb": "tt0137523"}},
+                    language_check_result={
+                        "has_english": True,
+                        "has_french": False,
+                        "missing_languages": ["missing_fr_audio"],
+                    },
+                ),
+                # Synced before language checks were cached: MediaSources fallback
+                CachedMediaItem(
+                    user_id=user.id,
+                    jellyfin_id="legacy",
+                    name="Legacy",
+                    media_type="Movie",
+                    date_created="2020-01-01T00:00:00.0000000Z",
+                    size_bytes=1,
+                    raw_data={"ProviderIds": {"Tmdb": "13"}, **_streams("eng")},
+                ),
+                CachedMediaItem(
+                    user_id=user.id,
+                    jellyfin_id="series",
+                    name="Series",
+                    media_type="Series",
+                    date_created="2020-01-01T00:00:00.0000000Z",
+                    size_bytes=3,
+                    language_check_result={"has_english": True, "has_french": False},
+                    problematic_episodes=[
+                        {"identifier": "S01E01", "name": "Pilot", "season": 1, "episode": 1}
+                    ],
+                ),
+            ]
+        )
+        await session.commit()
+        return user.id
+
+
+class TestMediaItemRows:
+    """Test loading cached media items as lightweight rows."""
+
+    @pytest.mark.asyncio
+    async def test_rows_skip_json_columns(self, client: TestClient) -> None:
+        """Only legacy rows get MediaSources; result details are not loaded."""
+        user_id = await _create_items()
+
+        async with TestingAsyncSessionLocal() as session:
+            rows = {row.jellyfin_id: row for row in await load_media_item_rows(session, user_id)}
+
+        assert all(isinstance(row, MediaItemRow) for row in rows.values())
+        assert rows["checked"].raw_data is None
+        assert rows["legacy"].raw_data == _streams("eng")
+        assert rows["series"].problematic_episodes is None
+        assert rows["checked"].tmdb_id is None
+
+    @pytest.mark.asyncio
+    async def test_issues_read_json_for_results_only(
+        self, client: TestClient, statements: list[str]
+    ) -> None:
+        """Issues match entity-based analysis without selecting raw_data as a whole."""
+        user_id = await _create_items()
+        statements.clear()
+
+        async with TestingAsyncSessionLocal() as session:
+            response = await get_content_issues(session, user_id, filter_type="language")
+
+        items = {item.jellyfin_id: item for item in response.items}
+        assert list(items) == ["series", "checked", "legacy"]
+        assert (items["checked"].tmdb_id, items["checked"].imdb_id) == ("550", "tt0137523")
+        assert items["legacy"].language_issues == ["missing_fr_audio"]
+        assert items["legacy"].tmdb_id == "13"
+        episodes = items["series"].problematic_episodes
+        assert episodes is not None and episodes[0].identifier == "S01E01"
+
+        assert not [s for s in statements if FULL_RAW_DATA.search(s)]
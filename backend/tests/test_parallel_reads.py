@@ -0,0 +1,114 @@
+"""Tests for running independent read queries on parallel sessions."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.database import Base, CachedMediaItem, ContentWhitelist, User
+from app.services.content_queries import get_content_issues, get_content_summary
+from app.services.parallel_reads import run_parallel_reads, supports_parallel_sessions
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.fixture
+async def file_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """File-backed SQLite engine with a regular connection pool."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'parallel.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+class TestRunParallelReads:
+    """Test the parallel read executor."""
+
+    @pytest.mark.asyncio
+    async def test_queries_overlap_on_distinct_sessions(self, file_engine: AsyncEngine) -> None:
+        """Each query gets its own session and they run concurrently."""
+        active = 0
+        max_active = 0
+        sessions: list[AsyncSession] = []
+
+        async def query(session: AsyncSession) -> int:
+            nonlocal active, max_active
+            sessions.append(session)
+            active += 1
+            max_active = max(max_active, active)
+            value = (await session.execute(text("SELECT 1"))).scalar_one()
+            await asyncio.sleep(0.01)
+            active -= 1
+            return int(value)
+
+        async with AsyncSession(file_engine) as db:
+            assert supports_parallel_sessions(db)
+            results = await run_parallel_reads(db, query, query, query)
+
+        assert results == [1, 1, 1]
+        assert max_active == 3
+        assert len({id(session) for session in sessions}) == 3
+        assert all(session is not db for session in sessions)
+
+    @pytest.mark.asyncio
+    async def test_static_pool_runs_on_caller_session(self, client: TestClient) -> None:
+        """With a single shared connection, queries run one at a time on the caller's session."""
+        active = 0
+        max_active = 0
+        sessions: list[AsyncSession] = []
+
+        async def query(session: AsyncSession) -> None:
+            nonlocal active, max_active
+            sessions.append(session)
+            active += 1
+            max_active = max(max_active, active)
+            await session.execute(text("SELECT 1"))
+            await asyncio.sleep(0)
+            active -= 1
+
+        async with TestingAsyncSessionLocal() as db:
+            assert not supports_parallel_sessions(db)
+            await run_parallel_reads(db, query, query)
+
+        assert max_active == 1
+        assert all(session is db for session in sessions)
+
+
+class TestContentQueriesInParallel:
+    """Content queries give the same results on a pooled engine."""
+
+    @pytest.mark.asyncio
+    async def test_summary_and_issues(self, file_engine: AsyncEngine) -> None:
+        """Whitelists read on parallel sessions are applied to the results."""
+        async with AsyncSession(file_engine, expire_on_commit=False) as db:
+            user = User(email="parallel@example.com", hashed_password="fakehash")
+            db.add(user)
+            await db.flush()
+            for jellyfin_id in ("old-1", "old-2"):
+                db.add(
+                    CachedMediaItem(
+                        user_id=user.id,
+                        jellyfin_id=jellyfin_id,
+                        name=jellyfin_id,
+                        media_type="Movie",
+                        date_created="2020-01-01T00:00:00.0000000Z",
+                        size_bytes=1024,
+                        played=False,
+                    )
+                )
+            db.add(
+                ContentWhitelist(
+                    user_id=user.id, jellyfin_id="old-2", name="old-2", media_type="Movie"
+                )
+            )
+            await db.commit()
+
+            summary = await get_content_summary(db, user.id)
+            issues = await get_content_issues(db, user.id, filter_type="old")
+
+        assert summary.old_content.count == 1
+        assert [item.jellyfin_id for item in issues.items] == ["old-1"]
@@ -0,0 +1,98 @@
+"""Tests for PostgreSQL support (URL mapping, JSONB columns, dialect-aware SQL)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.database import (
+    ArrIndexEntry,
+    CachedMediaItem,
+    dialect_insert,
+    to_async_database_url,
+    to_sync_database_url,
+)
+from app.services.content_cache import _tmdb_id_match
+
+
+def _session_for(dialect: object) -> MagicMock:
+    db = MagicMock()
+    db.get_bind.return_value.dialect = dialect
+    return db
+
+
+class TestDatabaseUrls:
+    """Test database URL to driver mapping."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("sqlite:///./plex_dashboard.db", "sqlite+aiosqlite:///./plex_dashboard.db"),
+            ("postgresql://u:p@db/mj", "postgresql+asyncpg://u:p@db/mj"),
+            ("postgres://u:p@db/mj", "postgresql+asyncpg://u:p@db/mj"),
+            ("postgresql+asyncpg://u:p@db/mj", "postgresql+asyncpg://u:p@db/mj"),
+        ],
+    )
+    def test_async_url(self, url: str, expected: str) -> None:
+        """Plain URLs are mapped to the async drivers."""
+        assert to_async_database_url(url) == expected
+
+    def test_sync_url(self) -> None:
+        """Sync URLs drop the async driver."""
+        assert to_sync_database_url("sqlite+aiosqlite:///x.db") == "sqlite:///x.db"
+        assert to_sync_database_url("postgres://u:p@db/mj") == "postgresql://u:p@db/mj"
+
+
+class TestPostgresSchema:
+    """Test PostgreSQL-specific DDL."""
+
+    def test_json_columns_are_jsonb(self) -> None:
+        """JSON columns are JSONB on PostgreSQL and JSON elsewhere."""
+        pg_ddl = str(CreateTable(CachedMediaItem.__table__).compile(dialect=postgresql.dialect()))
+        sqlite_ddl = str(CreateTable(CachedMediaItem.__table__).compile(dialect=sqlite.dialect()))
+        assert "raw_data JSONB" in pg_ddl
+        assert "raw_data JSON" in sqlite_ddl and "JSONB" not in sqlite_ddl
+
+    def test_gin_index_on_raw_data(self) -> None:
+        """The GIN index uses jsonb_path_ops for containment lookups."""
+        index = next(
+            i
+            for i in CachedMediaItem.__table__.indexes
+            if i.name == "ix_cached_media_items_raw_data_gin"
+        )
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert "USING gin (raw_data jsonb_path_ops)" in ddl
+
+
+class TestDialectAwareStatements:
+    """Test statements that differ per backend."""
+
+    def test_tmdb_match_uses_containment_on_postgres(self) -> None:
+        """PostgreSQL uses JSONB containment, SQLite json_extract."""
+        pg = postgresql.dialect()
+        lite = sqlite.dialect()
+        pg_sql = str(
+            delete(CachedMediaItem)
+            .where(_tmdb_id_match(_session_for(pg), ["550"]))
+            .compile(dialect=pg)
+        )
+        sqlite_sql = str(
+            delete(CachedMediaItem)
+            .where(_tmdb_id_match(_session_for(lite), ["550"]))
+            .compile(dialect=lite)
+        )
+        assert "raw_data @>" in pg_sql
+        assert "JSON_EXTRACT" in sqlite_sql
+
+    @pytest.mark.parametrize("dialect", [postgresql.dialect(), sqlite.dialect()])
+    def test_dialect_insert_supports_on_conflict(self, dialect: object) -> None:
+        """Both backends render INSERT ... ON CONFLICT DO UPDATE."""
+        stmt = dialect_insert(_session_for(dialect), ArrIndexEntry)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "service", "tmdb_id"],
+            set_={"arr_id": stmt.excluded.arr_id},
+        )
+        sql = str(stmt.compile(dialect=dialect))  # type: ignore[arg-type]
+        assert "ON CONFLICT (user_id, service, tmdb_id) DO UPDATE" in sql
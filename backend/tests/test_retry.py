@@ -8,11 +8,20 @@ import pytest
 from app.services.retry import (
     INITIAL_DELAY,
     MAX_RETRIES,
+    MAX_RETRY_AFTER,
+    backoff_delay,
+    get_retry_after,
     is_transient_error,
     retry_with_backoff,
 )
 
 
+def _status_error(status_code: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://example.com")
+    response = httpx.Response(status_code, request=request, headers=headers)
+    return httpx.HTTPStatusError("HTTP error", request=request, response=response)
+
+
 class TestIsTransientError:
     """Test identification of transient vs permanent errors."""
 
@@ -52,6 +61,10 @@ class TestIsTransientError:
         error = httpx.HTTPStatusError("Service unavailable", request=request, response=response)
         assert is_transient_error(error) is True
 
+    def test_429_error_is_transient(self) -> None:
+        """429 Too Many Requests should be retried."""
+        assert is_transient_error(_status_error(429)) is True
+
     def test_401_error_is_not_transient(self) -> None:
         """401 Unauthorized should NOT be retried."""
         request = httpx.Request("GET", "http://example.com")
@@ -105,17 +118,20 @@ class TestRetryWithBackoff:
             ]
         )
 
-        with patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with (
+            patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("app.services.retry.random.uniform", side_effect=lambda low, high: high),
+        ):
             result = await retry_with_backoff(mock_func, "Jellyfin")
 
         assert result == "success"
         assert mock_func.call_count == 2
-        # Should have slept with initial delay (1 second)
+        # Should have slept at most the initial delay (1 second)
         mock_sleep.assert_called_once_with(INITIAL_DELAY)
 
     @pytest.mark.asyncio
     async def test_exponential_backoff_delays(self) -> None:
-        """Should use exponential backoff: 1s, 2s, 4s between retries."""
+        """Should cap jittered delays with exponential backoff: 1s, 2s, 4s."""
         # Fail 3 times, succeed on 4th
         mock_func = AsyncMock(
             side_effect=[
@@ -126,7 +142,10 @@ class TestRetryWithBackoff:
             ]
         )
 
-        with patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with (
+            patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            patch("app.services.retry.random.uniform", side_effect=lambda low, high: high),
+        ):
             result = await retry_with_backoff(mock_func, "Jellyfin")
 
         assert result == "success"
@@ -241,6 +260,44 @@ class TestRetryWithBackoff:
         # The original error is raised after all retries
 
 
+class TestBackoffDelay:
+    """Test full-jitter delays and Retry-After."""
+
+    def test_delays_are_jittered_below_the_cap(self) -> None:
+        """Delays are random between 0 and the exponential cap."""
+        delays = [backoff_delay(2, 1) for _ in range(100)]
+        assert all(0 <= delay <= 4 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_delay_cap_is_bounded(self) -> None:
+        """Late retries don't wait for ever."""
+        assert backoff_delay(20, 1) <= 30
+
+    def test_retry_after_seconds(self) -> None:
+        """Retry-After in seconds is honoured on 429 and 503, capped."""
+        assert get_retry_after(_status_error(429, {"Retry-After": "7"})) == 7
+        assert get_retry_after(_status_error(503, {"Retry-After": "7"})) == 7
+        assert get_retry_after(_status_error(429, {"Retry-After": "3600"})) == MAX_RETRY_AFTER
+
+    def test_retry_after_is_ignored_elsewhere(self) -> None:
+        """Other statuses, missing or malformed headers fall back to backoff."""
+        assert get_retry_after(_status_error(500, {"Retry-After": "7"})) is None
+        assert get_retry_after(_status_error(429)) is None
+        assert get_retry_after(_status_error(429, {"Retry-After": "soon"})) is None
+        assert get_retry_after(httpx.TimeoutException("Timeout")) is None
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_retry_after(self) -> None:
+        """A throttled call is retried after the requested delay."""
+        mock_func = AsyncMock(side_effect=[_status_error(429, {"Retry-After": "12"}), "success"])
+
+        with patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await retry_with_backoff(mock_func, "Jellyfin")
+
+        assert result == "success"
+        mock_sleep.assert_called_once_with(12)
+
+
 class TestRetryConstants:
     """Test retry configuration constants."""
 
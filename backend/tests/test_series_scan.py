@@ -0,0 +1,160 @@
+"""Tests for skipping the deep scan of unchanged series."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from app.database import CachedMediaItem, User
+from app.services.sync import (
+    SeriesScan,
+    calculate_season_sizes,
+    load_series_scans,
+    series_scan_fingerprint,
+)
+from tests.conftest import TestingAsyncSessionLocal
+
+SERIES: dict[str, Any] = {
+    "Id": "s1",
+    "Type": "Series",
+    "DateLastMediaAdded": "2026-10-01T00:00:00Z",
+    "ChildCount": 2,
+    "UserData": {"Played": False, "PlayCount": 3, "LastPlayedDate": "2026-10-02T00:00:00Z"},
+}
+
+
+def _stats(size: int) -> dict[str, object]:
+    return {
+        "largest_season_size": size,
+        "total_size": size,
+        "episodes": [],
+        "last_played_date": None,
+    }
+
+
+async def _create_user_with_series(raw_data: dict[str, Any]) -> int:
+    async with TestingAsyncSessionLocal() as session:
+        user = User(email="scan@example.com", hashed_password="fakehash")
+        session.add(user)
+        await session.flush()
+        session.add(
+            CachedMediaItem(
+                user_id=user.id,
+                jellyfin_id=raw_data["Id"],
+                name=raw_data["Id"],
+                media_type="Series",
+                raw_data=raw_data,
+            )
+        )
+        await session.commit()
+        return user.id
+
+
+async def _replace_series(user_id: int, raw_data: dict[str, Any]) -> None:
+    """Re-create the series row without its scan results."""
+    async with TestingAsyncSessionLocal() as session:
+        result = await session.execute(
+            select(CachedMediaItem).where(CachedMediaItem.user_id == user_id)
+        )
+        await session.delete(result.scalar_one())
+        session.add(
+            CachedMediaItem(
+                user_id=user_id,
+                jellyfin_id=raw_data["Id"],
+                name=raw_data["Id"],
+                media_type="Series",
+                raw_data=raw_data,
+            )
+        )
+        await session.commit()
+
+
+async def _sync_sizes(
+    user_id: int,
+    fetch_stats: AsyncMock,
+    previous_scans: dict[str, SeriesScan],
+    exempt: set[tuple[str, int, int]] | None = None,
+) -> None:
+    async with TestingAsyncSessionLocal() as session:
+        with (
+            patch("app.services.sync.fetch_series_stats", fetch_stats),
+            patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+            patch(
+                "app.services.content.get_episode_exempt_set",
+                AsyncMock(return_value=exempt or set()),
+            ),
+        ):
+            await calculate_season_sizes(
+                session, user_id, "http://jf.local", "key", previous_scans=previous_scans
+            )
+
+
+async def _load_scans(user_id: int) -> dict[str, SeriesScan]:
+    async with TestingAsyncSessionLocal() as session:
+        return await load_series_scans(session, user_id)
+
+
+class TestSeriesScanFingerprint:
+    """Test what invalidates a series' previous deep scan."""
+
+    def test_new_episodes_change_fingerprint(self) -> None:
+        """Added media changes DateLastMediaAdded."""
+        changed = {**SERIES, "DateLastMediaAdded": "2026-10-05T00:00:00Z"}
+        assert series_scan_fingerprint(SERIES) != series_scan_fingerprint(changed)
+
+    def test_watch_activity_changes_fingerprint(self) -> None:
+        """Any user watching an episode changes the aggregated UserData."""
+        changed = {**SERIES, "UserData": {**SERIES["UserData"], "PlayCount": 4}}
+        assert series_scan_fingerprint(SERIES) != series_scan_fingerprint(changed)
+
+    def test_exemptions_change_fingerprint_regardless_of_order(self) -> None:
+        """Exempting an episode invalidates the language check, not its order."""
+        assert series_scan_fingerprint(SERIES) != series_scan_fingerprint(SERIES, [(1, 2)])
+        assert series_scan_fingerprint(SERIES, [(1, 2), (1, 1)]) == series_scan_fingerprint(
+            SERIES, [(1, 1), (1, 2)]
+        )
+
+
+class TestUnchangedSeriesSkip:
+    """Test carry-forward of deep-scan results in calculate_season_sizes."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_series_is_not_rescanned(self) -> None:
+        """An unchanged series keeps its previous results without API calls."""
+        user_id = await _create_user_with_series(SERIES)
+        await _sync_sizes(user_id, AsyncMock(return_value=_stats(100)), {})
+        previous_scans = await _load_scans(user_id)
+        assert previous_scans["s1"].size_bytes == 100
+
+        await _replace_series(user_id, SERIES)
+        fetch_stats = AsyncMock(return_value=_stats(999))
+        await _sync_sizes(user_id, fetch_stats, previous_scans)
+
+        fetch_stats.assert_not_awaited()
+        assert (await _load_scans(user_id))["s1"] == previous_scans["s1"]
+
+    @pytest.mark.asyncio
+    async def test_changed_series_is_rescanned(self) -> None:
+        """New episodes trigger a fresh scan."""
+        user_id = await _create_user_with_series(SERIES)
+        await _sync_sizes(user_id, AsyncMock(return_value=_stats(100)), {})
+        previous_scans = await _load_scans(user_id)
+
+        await _replace_series(user_id, {**SERIES, "ChildCount": 3})
+        await _sync_sizes(user_id, AsyncMock(return_value=_stats(150)), previous_scans)
+
+        assert (await _load_scans(user_id))["s1"].size_bytes == 150
+
+    @pytest.mark.asyncio
+    async def test_new_exemption_forces_rescan(self) -> None:
+        """Exempting an episode of an unchanged series rescans it."""
+        user_id = await _create_user_with_series(SERIES)
+        await _sync_sizes(user_id, AsyncMock(return_value=_stats(100)), {})
+        previous_scans = await _load_scans(user_id)
+
+        await _replace_series(user_id, SERIES)
+        fetch_stats = AsyncMock(return_value=_stats(100))
+        await _sync_sizes(user_id, fetch_stats, previous_scans, exempt={("s1", 1, 1)})
+
+        fetch_stats.assert_awaited_once()
@@ -1577,8 +1577,8 @@ class TestNicknameSettings:
         assert "jellyfin" in response.json()["detail"].lower()
 
     @patch("app.routers.settings.validate_jellyfin_connection", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyfin_users", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyseerr_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyfin_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyseerr_users", new_callable=AsyncMock)
     def test_refresh_nicknames_success(
         self,
         mock_jellyseerr_users: AsyncMock,
@@ -1627,8 +1627,8 @@ class TestNicknameSettings:
         assert list_response.json()["total_count"] == 2
 
     @patch("app.routers.settings.validate_jellyfin_connection", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyfin_users", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyseerr_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyfin_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyseerr_users", new_callable=AsyncMock)
     def test_refresh_nicknames_no_new_users(
         self,
         mock_jellyseerr_users: AsyncMock,
@@ -1674,8 +1674,8 @@ class TestNicknameSettings:
         assert "no new users" in data["message"].lower()
 
     @patch("app.routers.settings.validate_jellyfin_connection", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyfin_users", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyseerr_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyfin_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyseerr_users", new_callable=AsyncMock)
     def test_refresh_nicknames_single_new_user_message(
         self,
         mock_jellyseerr_users: AsyncMock,
@@ -1713,7 +1713,7 @@ class TestNicknameSettings:
         assert "1 new user added" in data["message"]
 
     @patch("app.routers.settings.validate_jellyfin_connection", new_callable=AsyncMock)
-    @patch("app.routers.settings.fetch_jellyfin_users", new_callable=AsyncMock)
+    @patch("app.services.sync.fetch_jellyfin_users", new_callable=AsyncMock)
     def test_refresh_nicknames_jellyfin_error(
         self,
         mock_jellyfin_users: AsyncMock,
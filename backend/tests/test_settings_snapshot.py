@@ -0,0 +1,172 @@
+"""Tests for the request-scoped settings snapshot and the cached cipher."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import User, UserSettings
+from app.services.content_analysis import OLD_CONTENT_MONTHS_CUTOFF, get_user_thresholds
+from app.services.content_queries import (
+    _get_user_settings,
+    get_user_recently_available_days,
+    get_user_show_unreleased_setting,
+)
+from app.services.encryption import _fernet_for_key, decrypt_value, encrypt_value
+from app.services.settings_snapshot import SettingsSnapshot, get_settings_snapshot
+from tests.conftest import TestingAsyncSessionLocal, async_engine
+
+
+@pytest.fixture
+def settings_queries() -> Iterator[list[str]]:
+    """Record every statement that loads a full UserSettings row."""
+    statements: list[str] = []
+
+    def record(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if statement.startswith("SELECT user_settings.id"):
+            statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+
+async def _create_user(email: str, **settings: Any) -> int:
+    async with TestingAsyncSessionLocal() as session:
+        user = User(email=email, hashed_password="fakehash")
+        session.add(user)
+        await session.flush()
+        session.add(UserSettings(user_id=user.id, **settings))
+        await session.commit()
+        return user.id
+
+
+class TestSettingsSnapshot:
+    """Test loading and memoization of the settings snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_settings_loaded_once_per_session(
+        self, client: TestClient, settings_queries: list[str]
+    ) -> None:
+        """All settings helpers share one query within a session."""
+        user_id = await _create_user(
+            "snapshot_once@example.com",
+            old_content_months=6,
+            recently_available_days=14,
+            show_unreleased_requests=True,
+        )
+
+        async with TestingAsyncSessionLocal() as session:
+            thresholds = await get_user_thresholds(session, user_id)
+            settings = await _get_user_settings(session, user_id)
+            days = await get_user_recently_available_days(session, user_id)
+            show_unreleased = await get_user_show_unreleased_setting(session, user_id)
+
+        assert thresholds.old_content_months == 6
+        assert settings is not None and settings.user_id == user_id
+        assert days == 14
+        assert show_unreleased is True
+        assert len(settings_queries) == 1
+
+        # A new session (= a new request) loads fresh settings
+        async with TestingAsyncSessionLocal() as session:
+            await get_user_thresholds(session, user_id)
+        assert len(settings_queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_settings_use_defaults(self, client: TestClient) -> None:
+        """Users without a settings row get default values."""
+        async with TestingAsyncSessionLocal() as session:
+            snapshot = await get_settings_snapshot(session, 999_999)
+
+        assert snapshot.settings is None
+        assert snapshot.thresholds.old_content_months == OLD_CONTENT_MONTHS_CUTOFF
+        assert snapshot.recently_available_days == 7
+        assert snapshot.show_unreleased_requests is False
+        assert snapshot.api_key("radarr") is None
+
+    def test_api_keys_are_decrypted_once(self) -> None:
+        """Decrypted keys are memoized per ciphertext."""
+        settings = UserSettings(user_id=1, radarr_api_key_encrypted=encrypt_value("radarr-key"))
+        snapshot = SettingsSnapshot(1, settings)
+
+        with patch(
+            "app.services.settings_snapshot.decrypt_value", wraps=decrypt_value
+        ) as mock_decrypt:
+            assert snapshot.api_key("radarr") == "radarr-key"
+            assert snapshot.api_key("radarr") == "radarr-key"
+            assert snapshot.api_key("sonarr") is None
+            assert mock_decrypt.call_count == 1
+
+            # A changed key is decrypted again
+            settings.radarr_api_key_encrypted = encrypt_value("new-key")
+            assert snapshot.api_key("radarr") == "new-key"
+            assert mock_decrypt.call_count == 2
+
+    def test_issues_endpoint_loads_settings_once(
+        self, client: TestClient, settings_queries: list[str]
+    ) -> None:
+        """GET /api/content/issues runs a single UserSettings query."""
+        client.post(
+            "/api/auth/register",
+            json={"email": "snapshot_issues@example.com", "password": "SecurePassword123!"},
+        )
+        login_response = client.post(
+            "/api/auth/login",
+            json={"email": "snapshot_issues@example.com", "password": "SecurePassword123!"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        settings_queries.clear()
+
+        response = client.get("/api/content/issues", headers=headers)
+
+        assert response.status_code == 200
+        assert len(settings_queries) == 1
+
+    def test_library_endpoint_loads_settings_once(
+        self, client: TestClient, settings_queries: list[str]
+    ) -> None:
+        """GET /api/library reads service URLs from the snapshot get_library loaded."""
+        client.post(
+            "/api/auth/register",
+            json={"email": "snapshot_library@example.com", "password": "SecurePassword123!"},
+        )
+        login_response = client.post(
+            "/api/auth/login",
+            json={"email": "snapshot_library@example.com", "password": "SecurePassword123!"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        with patch(
+            "app.routers.settings.validate_radarr_connection", new_callable=AsyncMock
+        ) as mock_validate:
+            mock_validate.return_value = True
+            client.post(
+                "/api/settings/radarr",
+                json={"server_url": "http://radarr.local", "api_key": "radarr-key"},
+                headers=headers,
+            )
+        settings_queries.clear()
+
+        response = client.get("/api/library", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["service_urls"]["radarr_url"].startswith("http://radarr.local")
+        assert len(settings_queries) == 1
+
+
+class TestCachedCipher:
+    """Test that the Fernet cipher is built once."""
+
+    def test_fernet_is_reused(self) -> None:
+        """Encrypt/decrypt round-trips reuse the cached cipher."""
+        _fernet_for_key.cache_clear()
+
+        for value in ("a", "b", "c"):
+            assert decrypt_value(encrypt_value(value)) == value
+
+        info = _fernet_for_key.cache_info()
+        assert info.misses == 1
+        assert info.hits == 5
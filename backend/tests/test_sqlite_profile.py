@@ -0,0 +1,63 @@
+"""Tests for the per-connection SQLite profile and read-only sessions."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.database import _install_sqlite_pragmas, sqlite_connection_pragmas
+
+
+@pytest.fixture
+async def db_path(tmp_path: Path) -> AsyncGenerator[Path, None]:
+    """SQLite database file with one table."""
+    path = tmp_path / "profile.db"
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+    await engine.dispose()
+    yield path
+
+
+def _engine(path: Path, read_only: bool = False) -> AsyncEngine:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    _install_sqlite_pragmas(engine, read_only=read_only)
+    return engine
+
+
+class TestSqliteProfile:
+    """Test that the storage profile is applied to every connection."""
+
+    def test_pragmas_include_read_only_flag(self) -> None:
+        """Only the reader profile sets query_only."""
+        assert "PRAGMA query_only=ON" not in sqlite_connection_pragmas()
+        assert "PRAGMA query_only=ON" in sqlite_connection_pragmas(read_only=True)
+
+    @pytest.mark.asyncio
+    async def test_every_pooled_connection_is_tuned(self, db_path: Path) -> None:
+        """Two simultaneously checked-out connections both get the profile."""
+        engine = _engine(db_path)
+        try:
+            async with engine.connect() as first, engine.connect() as second:
+                for conn in (first, second):
+                    assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+                    assert (await conn.execute(text("PRAGMA temp_store"))).scalar() == 2
+                    assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() == 30000
+                    assert (await conn.execute(text("PRAGMA cache_size"))).scalar() < 0
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_read_only_connections_reject_writes(self, db_path: Path) -> None:
+        """Reader connections can query but never write."""
+        engine = _engine(db_path, read_only=True)
+        try:
+            async with engine.connect() as conn:
+                assert (await conn.execute(text("SELECT COUNT(*) FROM items"))).scalar() == 0
+                with pytest.raises(OperationalError, match="readonly"):
+                    await conn.execute(text("INSERT INTO items (id) VALUES (1)"))
+        finally:
+            await engine.dispose()
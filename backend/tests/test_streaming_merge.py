@@ -0,0 +1,160 @@
+"""Tests for fetching Jellyfin user libraries with a bounded window and merging as they arrive."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.sync import (
+    USER_FETCH_CONCURRENCY,
+    UserItemsMerger,
+    aggregate_user_watch_data,
+    fetch_jellyfin_media_with_progress,
+    stream_user_libraries,
+)
+
+USERS = [{"Id": f"u{i}", "Name": f"User {i}"} for i in range(6)]
+
+
+def _movie(user_data: dict[str, Any]) -> dict[str, Any]:
+    return {"Id": "m1", "Name": "Movie", "UserData": user_data}
+
+
+class TestUserItemsMerger:
+    """Test folding user libraries into a running aggregate."""
+
+    def test_matches_aggregate_user_watch_data(self) -> None:
+        """Running aggregation gives the same watch data as the batch helper."""
+        user_datas = [
+            {"Played": True, "PlayCount": 1, "LastPlayedDate": "2024-01-01T10:00:00Z"},
+            {"Played": False, "PlayCount": 0},
+            {"Played": True, "PlayCount": 3, "LastPlayedDate": "2024-01-15T14:30:00Z"},
+            {"Played": False, "PlayCount": 2, "LastPlayedDate": "2023-12-01T00:00:00Z"},
+        ]
+        merger = UserItemsMerger()
+        for user_data in user_datas:
+            merger.add([_movie(user_data)])
+
+        (item,) = merger.items()
+        expected = aggregate_user_watch_data(user_datas)
+        assert item["UserData"] == {
+            "Played": expected["played"],
+            "PlayCount": expected["play_count"],
+            "LastPlayedDate": expected["last_played_date"],
+        }
+
+    def test_order_does_not_depend_on_completion_order(self) -> None:
+        """Libraries merged in any order give the same list, sorted by Id."""
+        first = [{"Id": "b", "Name": "B"}, {"Id": "a", "Name": "A"}]
+        second = [{"Id": "c", "Name": "C"}, {"Id": "a", "Name": "A"}]
+        merged = []
+        for libraries in ([first, second], [second, first]):
+            merger = UserItemsMerger()
+            for library in libraries:
+                merger.add(library)
+            merged.append(merger.items())
+
+        assert merged[0] == merged[1]
+        assert [item["Id"] for item in merged[0]] == ["a", "b", "c"]
+
+    def test_unwatched_items_get_empty_watch_data(self) -> None:
+        """Items nobody watched still carry UserData."""
+        merger = UserItemsMerger()
+        merger.add([{"Id": "m1", "Name": "Movie"}, {"Name": "No id"}])
+
+        assert merger.items() == [
+            {
+                "Id": "m1",
+                "Name": "Movie",
+                "UserData": {"Played": False, "PlayCount": 0, "LastPlayedDate": None},
+            }
+        ]
+
+
+class TestStreamUserLibraries:
+    """Test the bounded fetch window."""
+
+    @pytest.mark.asyncio
+    async def test_window_is_bounded_and_results_arrive_by_completion(self) -> None:
+        """A slow user does not hold back the others, and the window never overflows."""
+        active = 0
+        max_active = 0
+
+        async def fake_fetch(*args: Any) -> list[dict[str, Any]]:
+            nonlocal active, max_active
+            jellyfin_user_id = args[3]
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.05 if jellyfin_user_id == "u0" else 0.001)
+            active -= 1
+            if jellyfin_user_id == "u1":
+                raise httpx.ConnectError("down")
+            return [{"Id": jellyfin_user_id}]
+
+        with patch("app.services.sync.fetch_user_items", side_effect=fake_fetch):
+            async with httpx.AsyncClient() as client:
+                results = [
+                    (user["Id"], result)
+                    async for user, result in stream_user_libraries(client, "http://jf", "k", USERS)
+                ]
+
+        assert max_active == USER_FETCH_CONCURRENCY
+        assert [user_id for user_id, _ in results][-1] == "u0"
+        errors = {user_id for user_id, result in results if isinstance(result, Exception)}
+        assert errors == {"u1"}
+
+
+class TestFetchWithProgress:
+    """Test progress reporting while merging."""
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported_per_completed_user(self) -> None:
+        """Each completed user advances the progress; items are merged across users."""
+        users = USERS[:2]
+
+        async def fake_fetch(*args: Any) -> list[dict[str, Any]]:
+            return [_movie({"Played": True, "PlayCount": 1})]
+
+        with (
+            patch("app.services.sync.get_cached_jellyfin_users", return_value=users),
+            patch("app.services.sync.fetch_user_items", side_effect=fake_fetch),
+            patch(
+                "app.services.sync.update_sync_progress", new_callable=AsyncMock
+            ) as mock_progress,
+        ):
+            items = await fetch_jellyfin_media_with_progress("http://jf", "k", AsyncMock(), 1)
+
+        assert [item["UserData"]["PlayCount"] for item in items] == [2]
+        steps = [call.kwargs.get("current_step_progress") for call in mock_progress.call_args_list]
+        assert steps == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_eta_counts_completed_users(self) -> None:
+        """Progress events extrapolate the ETA from the users fetched so far."""
+        users = USERS[:3]
+        store: dict[str, Any] = {"total_steps": 2}
+        now = [0.0]
+
+        async def fake_update(user_id: int, fields: dict[str, Any]) -> dict[str, Any]:
+            if fields.get("current_step_progress"):
+                now[0] += 10  # Each user library takes 10s
+            store.update(fields)
+            return dict(store)
+
+        async def fake_fetch(*args: Any) -> list[dict[str, Any]]:
+            return [_movie({"Played": False, "PlayCount": 0})]
+
+        with (
+            patch("app.services.sync.get_cached_jellyfin_users", return_value=users),
+            patch("app.services.sync.fetch_user_items", side_effect=fake_fetch),
+            patch("app.services.sync.update_sync_progress_fields", side_effect=fake_update),
+            patch("app.services.sync.publish_sync_event", new_callable=AsyncMock) as mock_publish,
+            patch("app.services.sync_events.time.monotonic", side_effect=lambda: now[0]),
+        ):
+            await fetch_jellyfin_media_with_progress("http://jf", "k", AsyncMock(), 4242)
+
+        progress = [call.args[1]["progress"] for call in mock_publish.call_args_list]
+        assert [p["current_step_progress"] for p in progress] == [0, 1, 2, 3]
+        assert [p["eta_seconds"] for p in progress] == [None, 20, 10, 0]
@@ -437,8 +437,9 @@ class TestSyncEndpoints:
         response = client.post("/api/sync", headers=headers)
         assert response.status_code == 200
         assert response.json()["status"] == "sync_started"
-        # Verify Celery task was dispatched
-        mock_sync_task.delay.assert_called_once()
+        # Verify Celery task was dispatched on the interactive queue
+        mock_sync_task.apply_async.assert_called_once()
+        assert mock_sync_task.apply_async.call_args.kwargs["queue"] == "interactive"
 
     def test_get_sync_status_requires_auth(self, client: TestClient) -> None:
         """GET /api/sync/status should require authentication."""
@@ -2344,9 +2345,12 @@ class TestSyncRetryWithBackoff:
         assert request_call_count == 2  # Failed once, succeeded on retry
 
     @pytest.mark.asyncio
+    @patch("app.services.retry.random.uniform", side_effect=lambda low, high: high)
     @patch("app.services.retry.asyncio.sleep", new_callable=AsyncMock)
-    async def test_exponential_backoff_delays_1_2_4_seconds(self, mock_sleep: AsyncMock) -> None:
-        """Retry delays should follow exponential backoff: 1s, 2s, 4s."""
+    async def test_exponential_backoff_delays_1_2_4_seconds(
+        self, mock_sleep: AsyncMock, mock_uniform: MagicMock
+    ) -> None:
+        """Retry delays are jittered below an exponential cap: 1s, 2s, 4s."""
         import httpx
 
         from app.services.sync import fetch_jellyfin_users
@@ -2366,7 +2370,8 @@ class TestSyncRetryWithBackoff:
             await fetch_jellyfin_users("http://jellyfin.local", "api-key")
 
         assert mock_sleep.call_count == 3
-        # Verify exponential backoff: 1, 2, 4 seconds
+        # Verify exponential backoff caps: 1, 2, 4 seconds
+        mock_uniform.assert_any_call(0, 1)
         mock_sleep.assert_any_call(1)
         mock_sleep.assert_any_call(2)
         mock_sleep.assert_any_call(4)
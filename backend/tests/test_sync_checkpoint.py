@@ -0,0 +1,238 @@
+"""Tests for chunked, resumable season size calculation."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from app.database import CachedMediaItem, SyncStatus, User, UserSettings
+from app.services.encryption import encrypt_value
+from app.services.sync import cache_media_items, calculate_season_sizes, run_user_sync
+from app.services.sync_checkpoint import (
+    STAGE_CALCULATING_SIZES,
+    SyncCheckpoint,
+    clear_sync_checkpoint,
+    get_sync_checkpoint,
+    set_sync_checkpoint,
+    snapshot_fingerprint,
+)
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def _stats(size: int) -> dict[str, object]:
+    return {
+        "largest_season_size": size,
+        "total_size": size,
+        "episodes": [],
+        "last_played_date": None,
+    }
+
+
+async def _create_user_with_series(series_ids: list[str]) -> int:
+    async with TestingAsyncSessionLocal() as session:
+        user = User(email="checkpoint@example.com", hashed_password="fakehash")
+        session.add(user)
+        await session.flush()
+        session.add(SyncStatus(user_id=user.id))
+        for series_id in series_ids:
+            session.add(
+                CachedMediaItem(
+                    user_id=user.id, jellyfin_id=series_id, name=series_id, media_type="Series"
+                )
+            )
+        await session.commit()
+        return user.id
+
+
+async def _sizes(user_id: int) -> dict[str, int | None]:
+    async with TestingAsyncSessionLocal() as session:
+        result = await session.execute(
+            select(CachedMediaItem).where(CachedMediaItem.user_id == user_id)
+        )
+        return {item.jellyfin_id: item.size_bytes for item in result.scalars().all()}
+
+
+class TestSnapshotFingerprint:
+    """Test the library fingerprint."""
+
+    def test_key_order_does_not_matter(self) -> None:
+        """Equal items fingerprint equally."""
+        assert snapshot_fingerprint([{"Id": "1", "Name": "A"}]) == snapshot_fingerprint(
+            [{"Name": "A", "Id": "1"}]
+        )
+
+    def test_item_order_does_not_matter(self) -> None:
+        """Libraries merged in another order fingerprint equally."""
+        items = [{"Id": f"s{index}", "Name": f"Series {index}"} for index in range(20)]
+        shuffled = items.copy()
+        random.Random(4).shuffle(shuffled)
+
+        assert snapshot_fingerprint(shuffled) == snapshot_fingerprint(items)
+
+    def test_changed_play_state_changes_fingerprint(self) -> None:
+        """Any change to the library invalidates the checkpoint."""
+        before = [{"Id": "1", "UserData": {"Played": False}}]
+        after = [{"Id": "1", "UserData": {"Played": True}}]
+        assert snapshot_fingerprint(before) != snapshot_fingerprint(after)
+
+
+class TestChunkedSeasonSizes:
+    """Test chunked commits and checkpoints of calculate_season_sizes."""
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_keeps_committed_chunks(self) -> None:
+        """Work committed before an interruption survives, with a checkpoint."""
+        user_id = await _create_user_with_series(["s1", "s2", "s3"])
+        fetch_stats = AsyncMock(side_effect=[_stats(10), _stats(20), RuntimeError("time limit")])
+
+        async with TestingAsyncSessionLocal() as session:
+            with (
+                patch("app.services.sync.SEASON_SIZES_COMMIT_CHUNK", 1),
+                patch("app.services.sync.fetch_series_stats", fetch_stats),
+                patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+                pytest.raises(RuntimeError),
+            ):
+                await calculate_season_sizes(
+                    session, user_id, "http://jf.local", "key", checkpoint_snapshot="snap"
+                )
+
+        assert await _sizes(user_id) == {"s1": 10, "s2": 20, "s3": None}
+        async with TestingAsyncSessionLocal() as session:
+            checkpoint = await get_sync_checkpoint(session, user_id)
+        assert checkpoint == SyncCheckpoint(STAGE_CALCULATING_SIZES, "snap", "s2")
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_committed_series(self) -> None:
+        """Resuming only visits series after the checkpoint."""
+        user_id = await _create_user_with_series(["s1", "s2", "s3"])
+        fetch_stats = AsyncMock(return_value=_stats(30))
+
+        async with TestingAsyncSessionLocal() as session:
+            with (
+                patch("app.services.sync.fetch_series_stats", fetch_stats),
+                patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+            ):
+                await calculate_season_sizes(
+                    session,
+                    user_id,
+                    "http://jf.local",
+                    "key",
+                    resume_after="s2",
+                    checkpoint_snapshot="snap",
+                )
+            checkpoint = await get_sync_checkpoint(session, user_id)
+            await clear_sync_checkpoint(session, user_id)
+            await session.commit()
+            cleared = await get_sync_checkpoint(session, user_id)
+
+        assert fetch_stats.await_count == 1
+        assert await _sizes(user_id) == {"s1": None, "s2": None, "s3": 30}
+        assert checkpoint is not None and checkpoint.position == "s3"
+        assert cleared is None
+
+
+class TestRunUserSyncResume:
+    """Test that run_user_sync resumes from a matching checkpoint."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_when_library_arrives_in_another_order(self) -> None:
+        """Only the library's content decides whether the checkpoint matches."""
+        items = [
+            {"Id": f"s{index}", "Name": f"Series {index}", "Type": "Series"} for index in range(5)
+        ]
+        shuffled = items.copy()
+        random.Random(7).shuffle(shuffled)
+        async with TestingAsyncSessionLocal() as session:
+            user = User(email="resume@example.com", hashed_password="fakehash")
+            session.add(user)
+            await session.flush()
+            session.add(
+                UserSettings(
+                    user_id=user.id,
+                    jellyfin_server_url="http://jf.local",
+                    jellyfin_api_key_encrypted=encrypt_value("key"),
+                )
+            )
+            session.add(
+                SyncStatus(
+                    user_id=user.id,
+                    checkpoint_stage=STAGE_CALCULATING_SIZES,
+                    checkpoint_snapshot=snapshot_fingerprint(items),
+                    checkpoint_position="s1",
+                )
+            )
+            await session.commit()
+            user_id = user.id
+
+        cache_items = AsyncMock(return_value=len(items))
+        calculate_sizes = AsyncMock()
+        async with TestingAsyncSessionLocal() as session:
+            with (
+                patch("app.services.sync.trigger_jellyfin_library_refresh", return_value=False),
+                patch(
+                    "app.services.sync.fetch_jellyfin_media_with_progress", return_value=shuffled
+                ),
+                patch("app.services.sync.cache_media_items", cache_items),
+                patch("app.services.sync.calculate_season_sizes", calculate_sizes),
+                patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+            ):
+                result = await run_user_sync(session, user_id)
+
+        assert result["status"] == "success"
+        cache_items.assert_not_awaited()
+        assert calculate_sizes.await_args.kwargs["resume_after"] == "s1"
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_rescan_unchanged_series(self) -> None:
+        """Series after the checkpoint keep the scans of the sync before the interrupted one."""
+        series = [
+            {"Id": f"s{index}", "Name": f"Series {index}", "Type": "Series", "ChildCount": 1}
+            for index in range(4)
+        ]
+        # A new movie changes the library snapshot, not the series
+        library = [*series, {"Id": "m1", "Name": "Movie", "Type": "Movie"}]
+        async with TestingAsyncSessionLocal() as session:
+            user = User(email="rescan@example.com", hashed_password="fakehash")
+            session.add(user)
+            await session.flush()
+            session.add(
+                UserSettings(
+                    user_id=user.id,
+                    jellyfin_server_url="http://jf.local",
+                    jellyfin_api_key_encrypted=encrypt_value("key"),
+                )
+            )
+            session.add(SyncStatus(user_id=user.id))
+            await session.commit()
+            user_id = user.id
+
+        async with TestingAsyncSessionLocal() as session:
+            with (
+                patch("app.services.sync.fetch_series_stats", AsyncMock(return_value=_stats(10))),
+                patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+            ):
+                # Completed sync: every series is scanned
+                await cache_media_items(session, user_id, series)
+                await calculate_season_sizes(session, user_id, "http://jf.local", "key")
+                # Sync interrupted after re-caching the library and committing s0-s1
+                await cache_media_items(session, user_id, library)
+                await set_sync_checkpoint(
+                    session, user_id, STAGE_CALCULATING_SIZES, snapshot_fingerprint(library), "s1"
+                )
+                await session.commit()
+
+        fetch_stats = AsyncMock(return_value=_stats(99))
+        async with TestingAsyncSessionLocal() as session:
+            with (
+                patch("app.services.sync.trigger_jellyfin_library_refresh", return_value=False),
+                patch("app.services.sync.fetch_jellyfin_media_with_progress", return_value=library),
+                patch("app.services.sync.fetch_series_stats", fetch_stats),
+                patch("app.services.sync.get_cached_jellyfin_users", return_value=[]),
+            ):
+                result = await run_user_sync(session, user_id)
+
+        assert result["status"] == "success"
+        fetch_stats.assert_not_awaited()
+        sizes = await _sizes(user_id)
+        assert {series_id: sizes[series_id] for series_id in ("s2", "s3")} == {"s2": 10, "s3": 10}
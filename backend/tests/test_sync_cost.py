@@ -0,0 +1,78 @@
+"""Tests for per-user sync cost history."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.database import SyncStatus
+from app.services.retry import retry_with_backoff
+from app.services.sync import _record_sync_cost
+from app.services.sync_cost import (
+    current_api_call_count,
+    start_api_call_count,
+    update_expected_duration,
+)
+
+
+class TestExpectedDuration:
+    """Test the moving average of sync durations."""
+
+    def test_first_observation_is_taken_as_is(self) -> None:
+        """Without history the observed duration becomes the expectation."""
+        assert update_expected_duration(None, 420) == 420
+
+    def test_observations_are_smoothed(self) -> None:
+        """One slow sync moves the expectation only part of the way."""
+        assert update_expected_duration(100, 1100) == pytest.approx(400)
+
+
+class TestApiCallCount:
+    """Test API call counting through retry_with_backoff."""
+
+    @pytest.mark.asyncio
+    async def test_every_attempt_is_counted(self) -> None:
+        """Retries count as separate API calls."""
+        request = httpx.Request("GET", "https://jf.example.com")
+        func = AsyncMock(side_effect=[httpx.ConnectError("down", request=request), "ok"])
+
+        start_api_call_count()
+        await retry_with_backoff(func, "Jellyfin", initial_delay=0)
+        await retry_with_backoff(AsyncMock(return_value="ok"), "Jellyfin")
+
+        assert current_api_call_count() == 3
+
+
+class TestRecordSyncCost:
+    """Test recording of sync durations on SyncStatus."""
+
+    def test_successful_sync_updates_expectation(self) -> None:
+        """Duration and API calls are stored, and fold into the expectation."""
+        completed = datetime.now(UTC)
+        sync_status = SyncStatus(
+            user_id=1,
+            last_sync_started=(completed - timedelta(seconds=600)).replace(tzinfo=None),
+            expected_sync_seconds=None,
+        )
+
+        start_api_call_count()
+        _record_sync_cost(sync_status, "success", completed)
+
+        assert sync_status.last_sync_duration_seconds == pytest.approx(600)
+        assert sync_status.last_sync_api_calls == 0
+        assert sync_status.expected_sync_seconds == pytest.approx(600)
+
+    def test_failed_sync_keeps_expectation(self) -> None:
+        """A sync that stopped early doesn't lower the expectation."""
+        completed = datetime.now(UTC)
+        sync_status = SyncStatus(
+            user_id=1,
+            last_sync_started=completed - timedelta(seconds=5),
+            expected_sync_seconds=900.0,
+        )
+
+        _record_sync_cost(sync_status, "failed", completed)
+
+        assert sync_status.last_sync_duration_seconds == pytest.approx(5)
+        assert sync_status.expected_sync_seconds == 900.0
@@ -0,0 +1,206 @@
+"""Tests for push-based sync progress (Server-Sent Events over Redis pub/sub)."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import User
+from app.services.sync_events import estimate_eta_seconds, format_sse, sync_events_channel
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class TestSyncEventHelpers:
+    """Test event formatting and ETA estimation."""
+
+    def test_channel_is_per_user(self) -> None:
+        """Each user has their own channel."""
+        assert sync_events_channel(1) != sync_events_channel(2)
+
+    def test_eta_extrapolates_from_completed_items(self) -> None:
+        """ETA uses the average time of completed items."""
+        # 2 of 10 done in 20s -> 8 remaining at 10s each
+        assert estimate_eta_seconds(20.0, 2, 10) == 80
+        assert estimate_eta_seconds(30.0, 3, 3) == 0
+
+    def test_eta_unknown_without_progress(self) -> None:
+        """No ETA before the first item completes or without totals."""
+        assert estimate_eta_seconds(5.0, 0, 10) is None
+        assert estimate_eta_seconds(5.0, None, 10) is None
+        assert estimate_eta_seconds(5.0, 3, None) is None
+
+    def test_format_sse(self) -> None:
+        """Events are framed as SSE messages with the type as event name."""
+        message = format_sse({"type": "progress", "is_syncing": True})
+        assert message == b'event: progress\ndata: {"type":"progress","is_syncing":true}\n\n'
+
+
+class TestSyncEventPublishing:
+    """Test that sync status updates are published."""
+
+    async def _create_user(self) -> int:
+        async with TestingAsyncSessionLocal() as session:
+            user = User(email="events_publish@example.com", hashed_password="fakehash")
+            session.add(user)
+            await session.commit()
+            return user.id
+
+    @pytest.mark.asyncio
+    async def test_progress_updates_are_published(self, client: TestClient) -> None:
+        """update_sync_progress publishes the full progress state."""
+        from app.services.sync import update_sync_progress, update_sync_status
+
+        user_id = await self._create_user()
+        with patch("app.services.sync.publish_sync_event", new_callable=AsyncMock) as mock_publish:
+            async with TestingAsyncSessionLocal() as session:
+                await update_sync_status(
+                    session,
+                    user_id,
+                    "in_progress",
+                    started=True,
+                    current_step="syncing_media",
+                    total_steps=2,
+                )
+                await update_sync_progress(
+                    session,
+                    user_id,
+                    current_step_progress=2,
+                    current_step_total=5,
+                    current_user_name="Alice",
+                )
+
+        assert mock_publish.call_count == 2
+        published_user_id, event = mock_publish.call_args.args
+        assert published_user_id == user_id
+        assert event["type"] == "progress"
+        assert event["is_syncing"] is True
+        assert event["progress"]["current_step"] == "syncing_media"
+        assert event["progress"]["total_steps"] == 2
+        assert event["progress"]["current_step_progress"] == 2
+        assert event["progress"]["current_user_name"] == "Alice"
+        assert "eta_seconds" in event["progress"]
+
+    @pytest.mark.asyncio
+    async def test_completion_is_published(self, client: TestClient) -> None:
+        """Finishing a sync publishes a completed event with the final status."""
+        from app.services.sync import update_sync_status
+
+        user_id = await self._create_user()
+        with patch("app.services.sync.publish_sync_event", new_callable=AsyncMock) as mock_publish:
+            async with TestingAsyncSessionLocal() as session:
+                await update_sync_status(
+                    session, user_id, "success", media_count=42, requests_count=3
+                )
+
+        event = mock_publish.call_args.args[1]
+        assert event["type"] == "completed"
+        assert event["status"] == "success"
+        assert event["media_items_count"] == 42
+        assert event["requests_count"] == 3
+
+
+class FakeSubscription:
+    """In-process stand-in for SyncEventSubscription."""
+
+    events: list[dict[str, Any]] = []
+    closed = False
+
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+        self._queue = list(self.events)
+
+    async def subscribe(self) -> None:
+        pass
+
+    async def get_event(self, timeout: float) -> dict[str, Any] | None:
+        return self._queue.pop(0) if self._queue else None
+
+    async def close(self) -> None:
+        FakeSubscription.closed = True
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict[str, Any]]]:
+    """Parse an SSE body into (event, data) pairs, skipping comments."""
+    events = []
+    for message in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in message.split("\n") if ": " in line)
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestSyncEventsEndpoint:
+    """Test GET /api/sync/events."""
+
+    def _get_auth_headers(self, client: TestClient, email: str) -> dict[str, str]:
+        client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+        login_response = client.post(
+            "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+        )
+        return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """The event stream requires authentication."""
+        assert client.get("/api/sync/events").status_code == 401
+
+    def test_returns_503_when_redis_unavailable(self, client: TestClient) -> None:
+        """Clients get 503 (and fall back to polling) when pub/sub is unavailable."""
+        headers = self._get_auth_headers(client, "events_503@example.com")
+
+        with patch(
+            "app.routers.sync.SyncEventSubscription.subscribe",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("Redis down"),
+        ):
+            response = client.get("/api/sync/events", headers=headers)
+
+        assert response.status_code == 503
+
+    def test_streams_snapshot_progress_and_completion(self, client: TestClient) -> None:
+        """Stream sends a status snapshot, relays events and closes on completion."""
+        headers = self._get_auth_headers(client, "events_stream@example.com")
+        FakeSubscription.events = [
+            {
+                "type": "progress",
+                "is_syncing": True,
+                "progress": {"current_step": "syncing_media", "eta_seconds": 30},
+            },
+            {"type": "completed", "is_syncing": False, "status": "success"},
+            {"type": "progress", "is_syncing": True, "progress": {}},  # never sent
+        ]
+        FakeSubscription.closed = False
+
+        with patch("app.routers.sync.SyncEventSubscription", FakeSubscription):
+            response = client.get("/api/sync/events", headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["status", "progress", "completed"]
+        assert events[0][1]["is_syncing"] is False
+        assert events[1][1]["progress"]["eta_seconds"] == 30
+        assert FakeSubscription.closed is True
+
+    def test_sends_keepalive_while_idle(self, client: TestClient) -> None:
+        """Idle periods produce SSE comments so proxies keep the connection open."""
+        headers = self._get_auth_headers(client, "events_keepalive@example.com")
+        FakeSubscription.events = []
+
+        async def idle_then_complete(
+            self: FakeSubscription, timeout: float
+        ) -> dict[str, Any] | None:
+            if not getattr(self, "_idled", False):
+                self._idled = True
+                return None
+            return {"type": "completed", "is_syncing": False}
+
+        with (
+            patch("app.routers.sync.SyncEventSubscription", FakeSubscription),
+            patch.object(FakeSubscription, "get_event", idle_then_complete),
+        ):
+            response = client.get("/api/sync/events", headers=headers)
+
+        assert ": keepalive" in response.text
+        assert [name for name, _ in _parse_sse(response.text)] == ["status", "completed"]
@@ -0,0 +1,149 @@
+"""Tests for the per-user sync lease lock."""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.services.sync_lock import (
+    _RELEASE_SCRIPT,
+    _RENEW_SCRIPT,
+    acquire_sync_lock,
+    get_sync_lock_holder,
+    release_sync_lock,
+    renew_sync_lock,
+    sync_lease,
+    sync_lock_key,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the string commands and scripts used by the lock."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        if ex is not None:
+            self.ttls[key] = ex
+        return True
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def eval(self, script: str, numkeys: int, key: str, *args: Any) -> int:
+        if self.values.get(key) != args[0]:
+            return 0
+        if script == _RENEW_SCRIPT:
+            self.ttls[key] = args[1]
+        elif script == _RELEASE_SCRIPT:
+            del self.values[key]
+        return 1
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    fake = FakeRedis()
+    with patch("app.services.sync_lock.get_redis_client", return_value=fake):
+        yield fake
+
+
+class TestSyncLock:
+    """Test lease acquisition, renewal and release."""
+
+    @pytest.mark.asyncio
+    async def test_second_holder_is_refused(self, fake_redis: FakeRedis) -> None:
+        """Only one sync of a user holds the lease."""
+        assert await acquire_sync_lock(1, "task-a")
+        assert not await acquire_sync_lock(1, "task-b")
+        assert await acquire_sync_lock(2, "task-b")
+        assert await get_sync_lock_holder(1) == "task-a"
+
+    @pytest.mark.asyncio
+    async def test_only_the_holder_renews_and_releases(self, fake_redis: FakeRedis) -> None:
+        """Another sync can't extend or drop a lease it doesn't hold."""
+        await acquire_sync_lock(1, "task-a")
+
+        assert not await renew_sync_lock(1, "task-b")
+        await release_sync_lock(1, "task-b")
+        assert await get_sync_lock_holder(1) == "task-a"
+
+        assert await renew_sync_lock(1, "task-a")
+        await release_sync_lock(1, "task-a")
+        assert await get_sync_lock_holder(1) is None
+
+    @pytest.mark.asyncio
+    async def test_lease_is_released_after_block(self, fake_redis: FakeRedis) -> None:
+        """sync_lease releases on exit and reports a held lease as not acquired."""
+        async with sync_lease(1, "task-a") as acquired:
+            assert acquired
+            async with sync_lease(1, "task-b") as duplicate:
+                assert not duplicate
+            assert sync_lock_key(1) in fake_redis.values
+
+        assert sync_lock_key(1) not in fake_redis.values
+
+    @pytest.mark.asyncio
+    async def test_lease_is_granted_without_redis(self) -> None:
+        """When Redis is down, syncs are not blocked."""
+        with patch(
+            "app.services.sync_lock.get_redis_client",
+            side_effect=ConnectionError("redis down"),
+        ):
+            async with sync_lease(1, "task-a") as acquired:
+                assert acquired
+
+
+class TestSyncCoalescing:
+    """Test that duplicate syncs are coalesced onto the running one."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_sync_is_skipped(self, fake_redis: FakeRedis) -> None:
+        """A sync started while another holds the lease doesn't run."""
+        from app.tasks import _run_sync_for_user
+
+        await acquire_sync_lock(7, "running-task")
+        with patch("app.tasks.run_user_sync", new_callable=AsyncMock) as mock_run:
+            result = await _run_sync_for_user(7)
+
+        assert result == {"status": "already_syncing", "user_id": 7}
+        mock_run.assert_not_awaited()
+
+    @patch("app.routers.sync.sync_user")
+    def test_api_reports_running_sync(self, mock_sync_task: MagicMock, client: TestClient) -> None:
+        """POST /api/sync returns the running sync's progress instead of queueing."""
+        client.post(
+            "/api/auth/register",
+            json={"email": "locked@example.com", "password": "SecurePassword123!"},
+        )
+        login = client.post(
+            "/api/auth/login",
+            json={"email": "locked@example.com", "password": "SecurePassword123!"},
+        )
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        progress = {
+            "current_step": "syncing_media",
+            "total_steps": 3,
+            "current_step_progress": 2,
+            "current_step_total": 5,
+            "current_user_name": "Alice",
+        }
+
+        with (
+            patch("app.routers.sync.get_sync_lock_holder", return_value="running-task"),
+            patch("app.routers.sync.get_sync_progress", return_value=progress),
+        ):
+            response = client.post("/api/sync", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "already_syncing"
+        assert response.json()["progress"]["current_step"] == "syncing_media"
+        mock_sync_task.apply_async.assert_not_called()
@@ -0,0 +1,261 @@
+"""Tests for the Redis-backed live sync progress store."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import User
+from app.services.sync_progress import (
+    SYNC_PROGRESS_TTL_SECONDS,
+    clear_sync_progress,
+    get_sync_progress,
+    start_sync_progress,
+    sync_progress_key,
+    update_sync_progress_fields,
+)
+from tests.conftest import TestingAsyncSessionLocal
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis hash commands used by the store."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+        self.ttls.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        results: list[Any] = []
+        for name, args, kwargs in self.commands:
+            key = args[0]
+            if name == "delete":
+                await self.redis.delete(key)
+                results.append(1)
+            elif name == "hset":
+                self.redis.hashes.setdefault(key, {}).update(kwargs["mapping"])
+                results.append(len(kwargs["mapping"]))
+            elif name == "expire":
+                self.redis.ttls[key] = args[1]
+                results.append(True)
+            elif name == "hgetall":
+                results.append(await self.redis.hgetall(key))
+        return results
+
+
+@pytest.fixture
+def fake_redis() -> Any:
+    """Route the progress store to an in-memory fake."""
+    redis = FakeRedis()
+    with patch("app.services.sync_progress.get_redis_client", return_value=redis):
+        yield redis
+
+
+@pytest.fixture
+def redis_down() -> Any:
+    """Simulate an unreachable Redis."""
+    with patch(
+        "app.services.sync_progress.get_redis_client",
+        side_effect=ConnectionError("Redis down"),
+    ):
+        yield
+
+
+class TestSyncProgressStore:
+    """Test the progress store functions."""
+
+    async def test_progress_round_trip(self, fake_redis: FakeRedis) -> None:
+        """Progress is stored with types preserved and a TTL."""
+        assert await start_sync_progress(1, "syncing_media", 3) is True
+        progress = await update_sync_progress_fields(
+            1, {"current_step_progress": 2, "current_step_total": 5, "current_user_name": "Bob"}
+        )
+
+        assert progress == {
+            "current_step": "syncing_media",
+            "total_steps": 3,
+            "current_step_progress": 2,
+            "current_step_total": 5,
+            "current_user_name": "Bob",
+        }
+        assert await get_sync_progress(1) == progress
+        assert fake_redis.ttls[sync_progress_key(1)] == SYNC_PROGRESS_TTL_SECONDS
+
+    async def test_start_resets_previous_progress(self, fake_redis: FakeRedis) -> None:
+        """Starting a sync clears progress left from a previous run."""
+        await start_sync_progress(1, "syncing_media", 3)
+        await update_sync_progress_fields(1, {"current_step_progress": 4})
+
+        await start_sync_progress(1, "refreshing_libraries", 2)
+
+        progress = await get_sync_progress(1)
+        assert progress is not None
+        assert progress["current_step"] == "refreshing_libraries"
+        assert progress["current_step_progress"] is None
+
+    async def test_clear_removes_progress(self, fake_redis: FakeRedis) -> None:
+        """Clearing removes the user's progress."""
+        await start_sync_progress(1, "syncing_media", 3)
+        await clear_sync_progress(1)
+        assert await get_sync_progress(1) is None
+
+    async def test_unavailable_redis_degrades(self, redis_down: None) -> None:
+        """Store functions report unavailability instead of raising."""
+        assert await start_sync_progress(1, "syncing_media", 3) is False
+        assert await update_sync_progress_fields(1, {"current_step_progress": 1}) is None
+        assert await get_sync_progress(1) is None
+        await clear_sync_progress(1)
+
+
+class TestSyncStatusWithProgressStore:
+    """Test that sync status uses Redis for progress and the DB for terminal states."""
+
+    async def _create_user(self, email: str) -> int:
+        async with TestingAsyncSessionLocal() as session:
+            user = User(email=email, hashed_password="fakehash")
+            session.add(user)
+            await session.commit()
+            return user.id
+
+    async def test_progress_not_written_to_database(
+        self, client: TestClient, fake_redis: FakeRedis
+    ) -> None:
+        """With Redis available, progress updates do not touch SyncStatus columns."""
+        from app.services.sync import get_sync_status, update_sync_progress, update_sync_status
+
+        user_id = await self._create_user("progress_redis@example.com")
+        async with TestingAsyncSessionLocal() as session:
+            await update_sync_status(
+                session,
+                user_id,
+                "in_progress",
+                started=True,
+                current_step="syncing_media",
+                total_steps=2,
+            )
+            await update_sync_progress(
+                session, user_id, current_step_progress=3, current_step_total=10
+            )
+
+            status = await get_sync_status(session, user_id)
+            assert status is not None
+            assert status.last_sync_started is not None
+            assert status.current_step is None
+            assert status.current_step_progress is None
+
+        progress = await get_sync_progress(user_id)
+        assert progress is not None
+        assert progress["current_step"] == "syncing_media"
+        assert progress["current_step_progress"] == 3
+
+    async def test_falls_back_to_database_without_redis(
+        self, client: TestClient, redis_down: None
+    ) -> None:
+        """Without Redis, progress is persisted to SyncStatus as before."""
+        from app.services.sync import get_sync_status, update_sync_progress, update_sync_status
+
+        user_id = await self._create_user("progress_fallback@example.com")
+        async with TestingAsyncSessionLocal() as session:
+            await update_sync_status(
+                session,
+                user_id,
+                "in_progress",
+                started=True,
+                current_step="syncing_media",
+                total_steps=2,
+            )
+            await update_sync_progress(session, user_id, current_step_progress=3)
+
+            status = await get_sync_status(session, user_id)
+            assert status is not None
+            assert status.current_step == "syncing_media"
+            assert status.current_step_progress == 3
+
+    async def test_completion_persists_and_clears_progress(
+        self, client: TestClient, fake_redis: FakeRedis
+    ) -> None:
+        """Terminal states are persisted and live progress is removed."""
+        from app.services.sync import get_sync_status, update_sync_status
+
+        user_id = await self._create_user("progress_done@example.com")
+        async with TestingAsyncSessionLocal() as session:
+            await update_sync_status(
+                session, user_id, "in_progress", started=True, current_step="syncing_media"
+            )
+            await update_sync_status(session, user_id, "success", media_count=7)
+
+            status = await get_sync_status(session, user_id)
+            assert status is not None
+            assert status.last_sync_status == "success"
+            assert status.media_items_count == 7
+
+        assert await get_sync_progress(user_id) is None
+
+    def test_status_endpoint_reads_live_progress(
+        self, client: TestClient, fake_redis: FakeRedis
+    ) -> None:
+        """GET /api/sync/status reports progress from Redis."""
+        email = "progress_endpoint@example.com"
+        client.post("/api/auth/register", json={"email": email, "password": "SecurePassword123!"})
+        login_response = client.post(
+            "/api/auth/login", json={"email": email, "password": "SecurePassword123!"}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+
+        async def start_sync() -> None:
+            from app.services.sync import update_sync_progress, update_sync_status
+
+            async with TestingAsyncSessionLocal() as session:
+                await update_sync_status(
+                    session,
+                    user_id,
+                    "in_progress",
+                    started=True,
+                    current_step="syncing_media",
+                    total_steps=3,
+                )
+                await update_sync_progress(
+                    session, user_id, current_step_progress=1, current_user_name="Carol"
+                )
+
+        client.portal.call(start_sync)  # type: ignore[union-attr]
+
+        data = client.get("/api/sync/status", headers=headers).json()
+        assert data["is_syncing"] is True
+        assert data["progress"]["current_step"] == "syncing_media"
+        assert data["progress"]["total_steps"] == 3
+        assert data["progress"]["current_user_name"] == "Carol"
@@ -0,0 +1,203 @@
+"""Tests for host-aware scheduling of the nightly sync fan-out."""
+
+import random
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from app.services.sync_schedule import (
+    ScheduledSync,
+    SyncJob,
+    acquire_host_slot,
+    build_sync_schedule,
+    estimate_makespan,
+    release_host_slot,
+    sync_host,
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the sorted-set commands used for host slots."""
+
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakePipeline:
+    """Runs the queued host slot commands on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any) -> None:
+            self.commands.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        results: list[Any] = []
+        for name, args in self.commands:
+            zset = self.redis.zsets.setdefault(args[0], {})
+            if name == "zremrangebyscore":
+                for member, score in list(zset.items()):
+                    if args[1] <= score <= args[2]:
+                        del zset[member]
+                results.append(None)
+            elif name == "zadd":
+                zset.update(args[1])
+                results.append(None)
+            elif name == "zrank":
+                ranked = sorted(zset, key=lambda member: (zset[member], member))
+                results.append(ranked.index(args[1]) if args[1] in zset else None)
+            else:
+                results.append(True)
+        return results
+
+
+class TestSyncHost:
+    """Test host extraction from server URLs."""
+
+    def test_host_ignores_scheme_path_and_case(self) -> None:
+        """URLs on the same host map to the same host, ports are kept."""
+        assert sync_host("https://Media.example.com/jellyfin/") == "media.example.com"
+        assert sync_host("http://10.0.0.5:8096") == "10.0.0.5:8096"
+
+
+class TestBuildSyncSchedule:
+    """Test the planned fan-out."""
+
+    def test_jobs_are_spread_across_the_window(self) -> None:
+        """Waves of one host are spaced evenly and start within the window."""
+        jobs = [SyncJob("jf.local", [user_id]) for user_id in range(1, 5)]
+
+        schedule = build_sync_schedule(jobs, window_seconds=3600, max_per_host=1)
+
+        assert [entry.countdown_seconds for entry in schedule] == [0, 900, 1800, 2700]
+        assert [entry.user_ids for entry in schedule] == [[1], [2], [3], [4]]
+
+    def test_at_most_max_per_host_jobs_start_together(self) -> None:
+        """Jobs against one host start in waves of max_per_host."""
+        jobs = [SyncJob("jf.local", [user_id]) for user_id in range(1, 6)]
+
+        schedule = build_sync_schedule(jobs, window_seconds=3000, max_per_host=2)
+
+        starts = [entry.countdown_seconds for entry in schedule]
+        assert starts == [0, 0, 1000, 1000, 2000]
+
+    def test_hosts_are_staggered(self) -> None:
+        """Different hosts don't all start at the same moment."""
+        jobs = [SyncJob("a.local", [1]), SyncJob("b.local", [2]), SyncJob("c.local", [3])]
+
+        schedule = build_sync_schedule(jobs, window_seconds=3000, max_per_host=1)
+
+        assert {entry.host: entry.countdown_seconds for entry in schedule} == {
+            "a.local": 0,
+            "b.local": 1000,
+            "c.local": 2000,
+        }
+
+    def test_jitter_stays_within_wave(self) -> None:
+        """Jitter delays jobs but never into the host's next wave."""
+        jobs = [SyncJob("jf.local", [user_id]) for user_id in range(1, 5)]
+
+        schedule = build_sync_schedule(
+            jobs, window_seconds=400, max_per_host=1, jitter_seconds=500, rng=random.Random(1)
+        )
+
+        for wave, entry in enumerate(schedule):
+            assert wave * 100 <= entry.countdown_seconds <= (wave + 1) * 100
+
+    def test_longest_jobs_take_the_first_wave(self) -> None:
+        """Within a host, the longest expected jobs start first."""
+        jobs = [
+            SyncJob("jf.local", [1], expected_seconds=30),
+            SyncJob("jf.local", [2], expected_seconds=1200),
+            SyncJob("jf.local", [3], expected_seconds=300),
+        ]
+
+        schedule = build_sync_schedule(jobs, window_seconds=900, max_per_host=1)
+
+        assert [entry.user_ids for entry in schedule] == [[2], [3], [1]]
+
+    def test_busiest_host_starts_first(self) -> None:
+        """Hosts with the most expected work get the earliest offset."""
+        jobs = [
+            SyncJob("a.local", [1], expected_seconds=60),
+            SyncJob("b.local", [2], expected_seconds=1800),
+        ]
+
+        schedule = build_sync_schedule(jobs, window_seconds=1000, max_per_host=1)
+
+        assert [(entry.host, entry.countdown_seconds) for entry in schedule] == [
+            ("b.local", 0),
+            ("a.local", 500),
+        ]
+
+    def test_empty_job_list(self) -> None:
+        """No configured users means an empty schedule."""
+        assert build_sync_schedule([], window_seconds=3600, max_per_host=2) == []
+
+
+class TestEstimateMakespan:
+    """Test the makespan estimate of a schedule."""
+
+    def test_jobs_share_workers(self) -> None:
+        """Jobs queue behind busy workers."""
+        schedule = [
+            ScheduledSync("jf.local", [1], 0, expected_seconds=600),
+            ScheduledSync("jf.local", [2], 0, expected_seconds=300),
+            ScheduledSync("jf.local", [3], 0, expected_seconds=300),
+        ]
+
+        assert estimate_makespan(schedule, workers=2) == 600
+        assert estimate_makespan(schedule, workers=1) == 1200
+
+    def test_jobs_wait_for_their_countdown(self) -> None:
+        """An idle worker doesn't start a job before its countdown."""
+        schedule = [ScheduledSync("jf.local", [1], 900, expected_seconds=100)]
+
+        assert estimate_makespan(schedule, workers=4) == 1000
+
+
+class TestHostSlots:
+    """Test the runtime per-host concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_slots_are_capped_and_released(self) -> None:
+        """Holders beyond the limit are refused until a slot is released."""
+        fake = FakeRedis()
+        with patch("app.services.sync_schedule.get_redis_client", return_value=fake):
+            assert await acquire_host_slot("jf.local", "task-1", limit=2)
+            assert await acquire_host_slot("jf.local", "task-2", limit=2)
+            assert not await acquire_host_slot("jf.local", "task-3", limit=2)
+            assert await acquire_host_slot("other.local", "task-4", limit=2)
+
+            await release_host_slot("jf.local", "task-1")
+            assert await acquire_host_slot("jf.local", "task-3", limit=2)
+
+    @pytest.mark.asyncio
+    async def test_slots_are_granted_without_redis(self) -> None:
+        """When Redis is down, syncs are not blocked."""
+        with patch(
+            "app.services.sync_schedule.get_redis_client",
+            side_effect=ConnectionError("redis down"),
+        ):
+            assert await acquire_host_slot("jf.local", "task-1", limit=1)
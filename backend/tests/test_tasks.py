@@ -1,7 +1,7 @@
 """Unit tests for tasks module functions (US-60.7).
 
 Tests for:
-- get_configured_user_ids() database query
+- the configured-user filter of get_configured_sync_groups()
 - send_sync_failure_notification_for_celery() error handling path
 - sync_user() exception handling and notification
 """
@@ -14,8 +14,8 @@ from app.database import User, UserSettings
 from tests.conftest import TestingAsyncSessionLocal
 
 
-class TestGetConfiguredUserIds:
-    """Tests for get_configured_user_ids function."""
+class TestConfiguredUsersFilter:
+    """Tests for the Jellyfin-configured filter used by get_configured_sync_groups."""
 
     @pytest.mark.asyncio
     async def test_returns_empty_list_when_no_users_configured(self) -> None:
@@ -445,6 +445,7 @@ class TestSyncAllUsersTask:
     def test_sync_all_users_queues_each_user(self) -> None:
         """Should queue sync for each configured user."""
         from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
         from app.tasks import sync_all_users, sync_user
 
         # Set eager mode for testing
@@ -453,18 +454,24 @@ class TestSyncAllUsersTask:
 
         try:
             with (
-                patch("app.tasks.get_configured_user_ids") as mock_get_users,
-                patch.object(sync_user, "delay") as mock_sync,
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async") as mock_sync,
             ):
-                mock_get_users.return_value = [1, 2, 3]
+                mock_get_groups.return_value = [
+                    SyncJob("jf1.local", [1]),
+                    SyncJob("jf2.local", [2]),
+                    SyncJob("jf3.local", [3]),
+                ]
 
                 result = sync_all_users()
 
                 assert mock_sync.call_count == 3
-                mock_sync.assert_any_call(1)
-                mock_sync.assert_any_call(2)
-                mock_sync.assert_any_call(3)
-                assert result == {"users_synced": 3, "status": "completed"}
+                queued = {call.args[0] for call in mock_sync.call_args_list}
+                assert queued == {(1,), (2,), (3,)}
+                assert result["users_synced"] == 3
+                assert result["status"] == "completed"
+                assert len(result["schedule"]) == 3
         finally:
             celery_app.conf.task_always_eager = False
             celery_app.conf.task_eager_propagates = False
@@ -479,15 +486,21 @@ class TestSyncAllUsersTask:
 
         try:
             with (
-                patch("app.tasks.get_configured_user_ids") as mock_get_users,
-                patch.object(sync_user, "delay") as mock_sync,
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async") as mock_sync,
             ):
-                mock_get_users.return_value = []
+                mock_get_groups.return_value = []
 
                 result = sync_all_users()
 
                 mock_sync.assert_not_called()
-                assert result == {"users_synced": 0, "status": "completed"}
+                assert result == {
+                    "users_synced": 0,
+                    "status": "completed",
+                    "estimated_makespan_seconds": 0.0,
+                    "schedule": [],
+                }
         finally:
             celery_app.conf.task_always_eager = False
             celery_app.conf.task_eager_propagates = False
@@ -495,6 +508,7 @@ class TestSyncAllUsersTask:
     def test_sync_all_users_logs_info_messages(self) -> None:
         """Should log info about starting and number of users."""
         from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
         from app.tasks import sync_all_users, sync_user
 
         celery_app.conf.task_always_eager = True
@@ -502,11 +516,15 @@ class TestSyncAllUsersTask:
 
         try:
             with (
-                patch("app.tasks.get_configured_user_ids") as mock_get_users,
-                patch.object(sync_user, "delay"),
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async"),
                 patch("app.tasks.logger") as mock_logger,
             ):
-                mock_get_users.return_value = [1, 2]
+                mock_get_groups.return_value = [
+                    SyncJob("jf1.local", [1]),
+                    SyncJob("jf2.local", [2]),
+                ]
 
                 sync_all_users()
 
@@ -520,6 +538,203 @@ class TestSyncAllUsersTask:
             celery_app.conf.task_always_eager = False
             celery_app.conf.task_eager_propagates = False
 
+    def test_sync_all_users_groups_users_sharing_a_server(self) -> None:
+        """Users sharing a server are queued as one group sync."""
+        from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
+        from app.tasks import sync_all_users, sync_user, sync_user_group
+
+        celery_app.conf.task_always_eager = True
+        celery_app.conf.task_eager_propagates = True
+
+        try:
+            with (
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async") as mock_sync,
+                patch.object(sync_user_group, "apply_async") as mock_group_sync,
+            ):
+                mock_get_groups.return_value = [
+                    SyncJob("jf.local", [1, 2]),
+                    SyncJob("other.local", [3]),
+                ]
+
+                result = sync_all_users()
+
+                assert mock_group_sync.call_args.args[:2] == (([1, 2],), {"host": "jf.local"})
+                assert mock_sync.call_args.args[:2] == ((3,), {"host": "other.local"})
+                assert result["users_synced"] == 3
+        finally:
+            celery_app.conf.task_always_eager = False
+            celery_app.conf.task_eager_propagates = False
+
+    def test_sync_all_users_spreads_syncs_per_host(self) -> None:
+        """Syncs against one host are delayed according to the schedule."""
+        from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
+        from app.tasks import sync_all_users, sync_user
+
+        celery_app.conf.task_always_eager = True
+        celery_app.conf.task_eager_propagates = True
+
+        try:
+            with (
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery") as mock_store,
+                patch.object(sync_user, "apply_async") as mock_sync,
+                patch("app.tasks.get_settings") as mock_settings,
+            ):
+                mock_settings.return_value.sync_schedule_window_seconds = 600
+                mock_settings.return_value.sync_max_concurrent_per_host = 1
+                mock_settings.return_value.sync_schedule_jitter_seconds = 0
+                mock_settings.return_value.sync_worker_count = 2
+                mock_get_groups.return_value = [SyncJob("jf.local", [1]), SyncJob("jf.local", [2])]
+
+                sync_all_users()
+
+                countdowns = [call.kwargs["countdown"] for call in mock_sync.call_args_list]
+                assert countdowns == [0, 300]
+                mock_store.assert_called_once()
+        finally:
+            celery_app.conf.task_always_eager = False
+            celery_app.conf.task_eager_propagates = False
+
+    def test_sync_all_users_dispatches_longest_jobs_first(self) -> None:
+        """Jobs due together are queued longest expected first, with a makespan estimate."""
+        from app.celery_app import celery_app
+        from app.services.sync_schedule import SyncJob
+        from app.tasks import sync_all_users, sync_user
+
+        celery_app.conf.task_always_eager = True
+        celery_app.conf.task_eager_propagates = True
+
+        try:
+            with (
+                patch("app.tasks.get_configured_sync_groups") as mock_get_groups,
+                patch("app.tasks._store_schedule_for_celery"),
+                patch.object(sync_user, "apply_async") as mock_sync,
+                patch("app.tasks.get_settings") as mock_settings,
+            ):
+                mock_settings.return_value.sync_schedule_window_seconds = 0
+                mock_settings.return_value.sync_max_concurrent_per_host = 3
+                mock_settings.return_value.sync_schedule_jitter_seconds = 0
+                mock_settings.return_value.sync_worker_count = 2
+                mock_get_groups.return_value = [
+                    SyncJob("jf.local", [1], expected_seconds=60),
+                    SyncJob("jf.local", [2], expected_seconds=1500),
+                    SyncJob("jf.local", [3], expected_seconds=600),
+                ]
+
+                result = sync_all_users()
+
+                queued = [call.args[0] for call in mock_sync.call_args_list]
+                assert queued == [(2,), (3,), (1,)]
+                assert result["estimated_makespan_seconds"] == 1500
+        finally:
+            celery_app.conf.task_always_eager = False
+            celery_app.conf.task_eager_propagates = False
+
+
+class TestSyncUserGroupTask:
+    """Tests for sync_user_group task."""
+
+    def test_group_sync_shares_server_reads(self) -> None:
+        """Server-level reads run once for all users of the group."""
+        from app.services.integration_cache import shared_server_read
+        from app.tasks import sync_user_group
+
+        fetch = AsyncMock(return_value=["movie"])
+
+        async def fake_sync(user_id: int) -> dict[str, object]:
+            items = await shared_server_read(
+                "jellyfin", "http://jf.local", "/Users/Items", fetch, credential="key"
+            )
+            return {"status": "success", "user_id": user_id, "items": items}
+
+        with patch("app.tasks._run_sync_for_user", side_effect=fake_sync):
+            result = sync_user_group([1, 2])
+
+        assert fetch.await_count == 1
+        assert result["results"][1]["items"] == result["results"][2]["items"] == ["movie"]
+
+    def test_group_sync_retries_when_host_is_busy(self) -> None:
+        """A scheduled group sync whose host is full is retried, not run."""
+        from celery.exceptions import Retry
+
+        from app.tasks import sync_user_group
+
+        with (
+            patch("app.tasks.acquire_host_slot", new_callable=AsyncMock, return_value=False),
+            patch("app.tasks._run_sync_for_group", new_callable=AsyncMock) as mock_run,
+            patch.object(sync_user_group, "retry", side_effect=Retry()) as mock_retry,
+        ):
+            with pytest.raises(Retry):
+                sync_user_group([1, 2], host="jf.local")
+
+        mock_run.assert_not_awaited()
+        mock_retry.assert_called_once()
+        assert mock_retry.call_args.kwargs["max_retries"] == 30
+
+    def test_group_sync_gives_up_when_host_stays_busy(self) -> None:
+        """Once its retries are spent, a sync whose host is still full fails."""
+        from app.tasks import sync_user_group
+
+        with (
+            patch("app.tasks.acquire_host_slot", new_callable=AsyncMock, return_value=False),
+            patch("app.tasks._run_sync_for_group", new_callable=AsyncMock) as mock_run,
+            patch.object(sync_user_group, "retry") as mock_retry,
+            patch("app.tasks.get_settings") as mock_settings,
+        ):
+            mock_settings.return_value.sync_host_busy_max_retries = 0
+            result = sync_user_group([1, 2], host="jf.local")
+
+        assert result["status"] == "failed"
+        assert "jf.local" in result["error"]
+        mock_run.assert_not_awaited()
+        mock_retry.assert_not_called()
+
+    def test_user_sync_gives_up_when_host_stays_busy(self) -> None:
+        """sync_user stops retrying a full host the same way."""
+        from app.tasks import sync_user
+
+        with (
+            patch("app.tasks.acquire_host_slot", new_callable=AsyncMock, return_value=False),
+            patch("app.tasks._run_sync_for_user", new_callable=AsyncMock) as mock_run,
+            patch.object(sync_user, "retry") as mock_retry,
+            patch("app.tasks.get_settings") as mock_settings,
+        ):
+            mock_settings.return_value.sync_host_busy_max_retries = 0
+            result = sync_user(7, host="jf.local")
+
+        assert result == {
+            "status": "failed",
+            "error": "Jellyfin host jf.local has no free sync slot",
+            "user_id": 7,
+        }
+        mock_run.assert_not_awaited()
+        mock_retry.assert_not_called()
+
+    def test_group_sync_continues_after_user_failure(self) -> None:
+        """A failing user is reported without stopping the rest of the group."""
+        from app.tasks import sync_user_group
+
+        with (
+            patch(
+                "app.tasks._run_sync_for_user",
+                new_callable=AsyncMock,
+                side_effect=[RuntimeError("boom"), {"status": "success", "user_id": 2}],
+            ),
+            patch("app.tasks._get_user_email", new_callable=AsyncMock, return_value="a@b.c"),
+            patch(
+                "app.tasks.send_sync_failure_notification", new_callable=AsyncMock
+            ) as mock_notify,
+        ):
+            result = sync_user_group([1, 2])
+
+        assert result["results"][1]["status"] == "failed"
+        assert result["results"][2]["status"] == "success"
+        mock_notify.assert_awaited_once()
+
 
 class TestTestTask:
     """Tests for test_task."""
@@ -0,0 +1,209 @@
+"""Tests for per-tenant SQLite shards of the cache tables."""
+
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.database import (
+    ALEMBIC_DIR,
+    Base,
+    CachedMediaItem,
+    ContentWhitelist,
+    TenantRoutingSession,
+    TenantShards,
+    User,
+)
+from app.services.content_queries import get_content_summary
+from app.services.sync import cache_media_items
+
+
+@pytest.fixture
+async def shared_engine(tmp_path: Path) -> AsyncGenerator[AsyncEngine, None]:
+    """File-backed shared database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def shards(tmp_path: Path) -> AsyncGenerator[TenantShards, None]:
+    """Shard directory next to the shared database."""
+    tenant_shards = TenantShards(tmp_path / "shards")
+    yield tenant_shards
+    await tenant_shards.dispose()
+
+
+@pytest.fixture
+def session_maker(
+    shared_engine: AsyncEngine, shards: TenantShards
+) -> async_sessionmaker[AsyncSession]:
+    """Session factory routing cache tables to the tenant shards."""
+    return async_sessionmaker(
+        shared_engine,
+        expire_on_commit=False,
+        sync_session_class=TenantRoutingSession,
+        info={"tenant_shards": shards},
+    )
+
+
+async def _create_users(session_maker: async_sessionmaker[AsyncSession], count: int) -> list[int]:
+    async with session_maker() as db:
+        users = [User(email=f"tenant{i}@example.com", hashed_password="x") for i in range(count)]
+        db.add_all(users)
+        await db.commit()
+        return [user.id for user in users]
+
+
+async def _count_rows(path: Path) -> int:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.connect() as conn:
+            result = await conn.execute(text("SELECT COUNT(*) FROM cached_media_items"))
+            return int(result.scalar_one())
+    finally:
+        await engine.dispose()
+
+
+def _movie(jellyfin_id: str) -> dict[str, object]:
+    return {
+        "Id": jellyfin_id,
+        "Name": jellyfin_id,
+        "Type": "Movie",
+        "DateCreated": "2020-01-01T00:00:00.0000000Z",
+        "UserData": {"Played": False},
+    }
+
+
+class TestTenantRouting:
+    """Test that cache tables are routed to one shard per tenant."""
+
+    @pytest.mark.asyncio
+    async def test_cache_rows_land_in_tenant_shard(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        shards: TenantShards,
+        tmp_path: Path,
+    ) -> None:
+        """Synced items are written to the user's shard, not the shared database."""
+        alice, bob = await _create_users(session_maker, 2)
+
+        async with session_maker() as db:
+            await cache_media_items(db, alice, [_movie("a1"), _movie("a2")])
+            await cache_media_items(db, bob, [_movie("b1")])
+
+        assert shards.paths() == [shards.path(alice), shards.path(bob)]
+        assert await _count_rows(shards.path(alice)) == 2
+        assert await _count_rows(shards.path(bob)) == 1
+        assert await _count_rows(tmp_path / "shared.db") == 0
+
+        async with session_maker() as db:
+            count = await db.execute(
+                select(func.count(CachedMediaItem.id)).where(CachedMediaItem.user_id == alice)
+            )
+            assert count.scalar_one() == 2
+
+    @pytest.mark.asyncio
+    async def test_equal_primary_keys_stay_distinct(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Rows with the same ID in two shards are separate objects in one session."""
+        alice, bob = await _create_users(session_maker, 2)
+        async with session_maker() as db:
+            db.add_all(
+                [
+                    CachedMediaItem(user_id=alice, jellyfin_id="a", name="A", media_type="Movie"),
+                    CachedMediaItem(user_id=bob, jellyfin_id="b", name="B", media_type="Movie"),
+                ]
+            )
+            await db.commit()
+
+        async with session_maker() as db:
+            alice_item = (
+                await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == alice))
+            ).scalar_one()
+            bob_item = (
+                await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == bob))
+            ).scalar_one()
+
+            assert alice_item.id == bob_item.id == 1
+            assert (alice_item.name, bob_item.name) == ("A", "B")
+
+            bob_item.name = "B2"
+            await db.commit()
+            await db.refresh(alice_item)
+            assert alice_item.name == "A"
+
+    @pytest.mark.asyncio
+    async def test_shared_tables_stay_in_shared_database(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Whitelists are read from the shared database alongside sharded cache rows."""
+        (user_id,) = await _create_users(session_maker, 1)
+        async with session_maker() as db:
+            await cache_media_items(db, user_id, [_movie("old-1"), _movie("old-2")])
+            db.add(
+                ContentWhitelist(
+                    user_id=user_id, jellyfin_id="old-2", name="old-2", media_type="Movie"
+                )
+            )
+            await db.commit()
+
+            summary = await get_content_summary(db, user_id)
+
+        assert summary.old_content.count == 1
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_statements_are_rejected(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Statements must name one tenant and must not join shared tables."""
+        async with session_maker() as db:
+            with pytest.raises(RuntimeError, match="No tenant"):
+                await db.execute(select(CachedMediaItem))
+            with pytest.raises(RuntimeError, match="one tenant shard"):
+                await db.execute(
+                    select(CachedMediaItem).where(
+                        CachedMediaItem.user_id == 1, CachedMediaItem.user_id == 2
+                    )
+                )
+            with pytest.raises(RuntimeError, match="cannot mix"):
+                await db.execute(
+                    select(CachedMediaItem.id, ContentWhitelist.id).where(
+                        CachedMediaItem.user_id == 1
+                    )
+                )
+
+
+class TestShardCreation:
+    """Test the schema of new shards."""
+
+    @pytest.mark.asyncio
+    async def test_new_shard_is_stamped_with_alembic_head(
+        self, session_maker: async_sessionmaker[AsyncSession], shards: TenantShards
+    ) -> None:
+        """New shards record the current migration so `alembic upgrade` can update them."""
+        from alembic.script import ScriptDirectory
+
+        (user_id,) = await _create_users(session_maker, 1)
+        async with session_maker() as db:
+            await db.execute(select(CachedMediaItem).where(CachedMediaItem.user_id == user_id))
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{shards.path(user_id)}")
+        try:
+            async with engine.connect() as conn:
+                version = await conn.execute(text("SELECT version_num FROM alembic_version"))
+                journal_mode = await conn.execute(text("PRAGMA journal_mode"))
+                assert version.scalar_one() == ScriptDirectory(str(ALEMBIC_DIR)).get_current_head()
+                assert journal_mode.scalar_one() == "wal"
+        finally:
+            await engine.dispose()
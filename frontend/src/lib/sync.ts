@@ -0,0 +1,59 @@
+/**
+ * Handling of POST /api/sync responses on the dashboard.
+ */
+
+export interface SyncProgressInfo {
+	current_step: string | null;
+	total_steps: number | null;
+	current_step_progress: number | null;
+	current_step_total: number | null;
+	current_user_name: string | null;
+	eta_seconds?: number | null;
+}
+
+export interface SyncResponse {
+	status: string;
+	media_items_synced?: number;
+	requests_synced?: number;
+	error?: string | null;
+	message?: string;
+	progress?: SyncProgressInfo | null;
+}
+
+export interface SyncTriggerOutcome {
+	/** Keep following live progress; completion arrives through sync events */
+	follow: boolean;
+	toastMessage: string;
+	toastType: 'success' | 'error' | 'info';
+}
+
+/**
+ * Decide how the dashboard reacts to a POST /api/sync response.
+ *
+ * "sync_started" and "already_syncing" (another sync, e.g. the scheduled one,
+ * holds the user's lease) both keep following progress; any other status is a
+ * synchronous result.
+ */
+export function getSyncTriggerOutcome(data: SyncResponse): SyncTriggerOutcome {
+	if (data.status === 'sync_started') {
+		return { follow: true, toastMessage: 'Sync started in background...', toastType: 'success' };
+	}
+	if (data.status === 'already_syncing') {
+		return { follow: true, toastMessage: 'Sync already in progress', toastType: 'info' };
+	}
+	if (data.status === 'success') {
+		return {
+			follow: false,
+			toastMessage: `Synced ${data.media_items_synced ?? 0} media items and ${data.requests_synced ?? 0} requests`,
+			toastType: 'success'
+		};
+	}
+	if (data.status === 'partial') {
+		return {
+			follow: false,
+			toastMessage: `Sync completed with warnings: ${data.error}`,
+			toastType: 'success'
+		};
+	}
+	return { follow: false, toastMessage: data.error || 'Sync failed', toastType: 'error' };
+}
@@ -4,6 +4,7 @@
  * Tests verify the API contract for triggering and monitoring data sync.
  */
 import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { getSyncTriggerOutcome } from '../src/lib/sync';
 
 // Mock the fetch API
 const mockFetch = vi.fn();
@@ -293,3 +294,56 @@ describe('Sync API Integration', () => {
 		});
 	});
 });
+
+describe('Dashboard handling of POST /api/sync responses', () => {
+	it('follows a sync that was started in the background', () => {
+		const outcome = getSyncTriggerOutcome({
+			status: 'sync_started',
+			media_items_synced: 0,
+			requests_synced: 0,
+			error: null
+		});
+
+		expect(outcome).toEqual({
+			follow: true,
+			toastMessage: 'Sync started in background...',
+			toastType: 'success'
+		});
+	});
+
+	it('follows the running sync instead of failing when already syncing', () => {
+		const outcome = getSyncTriggerOutcome({
+			status: 'already_syncing',
+			media_items_synced: 0,
+			requests_synced: 0,
+			error: null,
+			progress: {
+				current_step: 'syncing_media',
+				total_steps: 2,
+				current_step_progress: 1,
+				current_step_total: 3,
+				current_user_name: 'Bob',
+				eta_seconds: 40
+			}
+		});
+
+		expect(outcome.follow).toBe(true);
+		expect(outcome.toastType).toBe('info');
+		expect(outcome.toastMessage).toBe('Sync already in progress');
+	});
+
+	it('reports synchronous results without following', () => {
+		expect(
+			getSyncTriggerOutcome({ status: 'success', media_items_synced: 5, requests_synced: 2 })
+		).toEqual({
+			follow: false,
+			toastMessage: 'Synced 5 media items and 2 requests',
+			toastType: 'success'
+		});
+		expect(getSyncTriggerOutcome({ status: 'failed', error: 'Jellyfin down' })).toEqual({
+			follow: false,
+			toastMessage: 'Jellyfin down',
+			toastType: 'error'
+		});
+	});
+});